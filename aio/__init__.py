@@ -0,0 +1,38 @@
+"""
+Async Module
+============
+asyncio API over direct CDP connections: many pages, answer streams and
+page loads wait on one event loop instead of one blocked thread per job.
+
+Components:
+- AsyncBrowser: One browser, a concurrency semaphore and warm pages
+- AsyncPage: One tab with its own flat-mode CDP session
+- AsyncConversion: Sidecar query/answer loop on a page
+- AsyncPipeline: PipelineResult-compatible workflow, run_many() for batches
+
+Usage:
+    import asyncio
+    from aio import AsyncBrowser, AsyncPipeline
+    from browser import BrowserType
+    from pipeline.base import PipelineConfig
+
+    async def main():
+        browser = await AsyncBrowser.launch(BrowserType.COMET, max_concurrency=8)
+        pipeline = AsyncPipeline(browser, PipelineConfig(target_url=SIDECAR_URL))
+        results = await pipeline.run_many(queries)
+        await browser.close(quit_browser=True)
+
+    asyncio.run(main())
+"""
+
+from .browser import AsyncBrowser
+from .conversion import AsyncConversion
+from .page import AsyncPage
+from .pipeline import AsyncPipeline
+
+__all__ = [
+    'AsyncBrowser',
+    'AsyncConversion',
+    'AsyncPage',
+    'AsyncPipeline',
+]
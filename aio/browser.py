@@ -0,0 +1,204 @@
+"""
+Async Browser
+=============
+One Chromium-based browser shared by many asyncio tasks.
+
+Launching stays synchronous (BrowserFactory + BaseBrowser.launch run in a
+worker thread); everything after that goes through one AsyncCDPConnection.
+A semaphore caps how many pages work concurrently in this browser, and
+finished pages are kept warm for the next job instead of being closed.
+
+Usage:
+    browser = await AsyncBrowser.launch(BrowserType.CHROMIUM_HEADLESS, max_concurrency=8)
+    async with browser.page("https://example.com") as page:
+        print(await page.evaluate("document.title"))
+    await browser.close(quit_browser=True)
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+
+from cdp import AsyncCDPConnection
+from logger import get_logger
+
+from .page import AsyncPage
+
+log = get_logger(__name__)
+
+
+class AsyncBrowser:
+    """
+    Async facade over a browser's DevTools endpoint.
+    """
+
+    def __init__(self, debug_port: int, max_concurrency: int = 4,
+                 host: str = "127.0.0.1", timeout: float = 10.0, browser=None):
+        """
+        Initialize async browser (await connect(), or use launch()).
+
+        Args:
+            debug_port: Browser remote debugging port
+            max_concurrency: Pages allowed to work at the same time
+            host: DevTools host
+            timeout: Default CDP command timeout (seconds)
+            browser: Launched BaseBrowser this wraps (quit by close(quit_browser=True))
+        """
+        self.debug_port = debug_port
+        self.host = host
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.browser = browser
+        self.conn: Optional[AsyncCDPConnection] = None
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._idle: List[AsyncPage] = []
+        self._pages: List[AsyncPage] = []
+        self.jobs_done = 0
+
+    @classmethod
+    async def launch(cls, browser_type, max_concurrency: int = 4, **kwargs) -> "AsyncBrowser":
+        """
+        Launch a browser through BrowserFactory and connect to it.
+
+        Args:
+            browser_type: BrowserType to launch
+            max_concurrency: Pages allowed to work at the same time
+            **kwargs: Other AsyncBrowser arguments
+
+        Returns:
+            Connected AsyncBrowser
+
+        Raises:
+            RuntimeError: If the browser did not launch
+        """
+        from browser import BrowserFactory
+
+        browser = BrowserFactory.create(browser_type)
+        if not await asyncio.to_thread(browser.launch):
+            raise RuntimeError(f"Failed to launch {browser_type.value}")
+        return await cls.from_browser(browser, max_concurrency, **kwargs).connect()
+
+    @classmethod
+    def from_browser(cls, browser, max_concurrency: int = 4, **kwargs) -> "AsyncBrowser":
+        """
+        Wrap an already launched BaseBrowser.
+
+        Args:
+            browser: Launched browser (its launcher provides the debug port)
+            max_concurrency: Pages allowed to work at the same time
+            **kwargs: Other AsyncBrowser arguments
+
+        Returns:
+            AsyncBrowser (not connected)
+        """
+        if browser._launcher is None:
+            raise RuntimeError("Browser not launched. Call launch() first.")
+        return cls(browser._launcher.config.debug_port, max_concurrency, browser=browser, **kwargs)
+
+    # ==================== Lifecycle ====================
+
+    async def connect(self) -> "AsyncBrowser":
+        """Open the DevTools connection."""
+        self.conn = await AsyncCDPConnection.from_port(self.debug_port, self.host, self.timeout)
+        log.info("[AIO] ✓ Connected to browser on port %s (max %s concurrent pages)",
+                 self.debug_port, self.max_concurrency)
+        return self
+
+    async def close(self, quit_browser: bool = False):
+        """
+        Close all pages opened here and disconnect.
+
+        Args:
+            quit_browser: Also quit the wrapped BaseBrowser
+        """
+        await asyncio.gather(*(page.close() for page in self._pages), return_exceptions=True)
+        self._pages.clear()
+        self._idle.clear()
+        if self.conn is not None:
+            await self.conn.close()
+            self.conn = None
+        if quit_browser and self.browser is not None:
+            await asyncio.to_thread(self.browser.quit)
+
+    # ==================== Pages ====================
+
+    async def new_page(self, url: Optional[str] = None) -> AsyncPage:
+        """
+        Open a new tab (not limited by the semaphore; caller closes it).
+
+        Args:
+            url: URL to load (None leaves about:blank)
+
+        Returns:
+            AsyncPage
+        """
+        if self.conn is None:
+            raise RuntimeError("AsyncBrowser not connected. Call connect() first.")
+        page = await AsyncPage.create(self.conn, url)
+        self._pages.append(page)
+        return page
+
+    @asynccontextmanager
+    async def page(self, url: Optional[str] = None) -> AsyncIterator[AsyncPage]:
+        """
+        Borrow a page for one job, waiting while max_concurrency are busy.
+
+        A warm page already showing `url` is preferred; otherwise any idle
+        page is reused, and a new tab is opened only when none is idle.
+        Crashed pages are closed instead of being returned to the pool.
+
+        Args:
+            url: URL the job needs (callers navigate if page.url differs)
+
+        Yields:
+            AsyncPage
+        """
+        async with self.semaphore:
+            page = self._take_idle(url)
+            if page is None:
+                page = await self.new_page()
+            try:
+                yield page
+            finally:
+                self.jobs_done += 1
+                if page.crashed or self.conn is None:
+                    await page.close()
+                    if page in self._pages:
+                        self._pages.remove(page)
+                else:
+                    self._idle.append(page)
+
+    def _take_idle(self, url: Optional[str]) -> Optional[AsyncPage]:
+        """Pop an idle page, preferring one already at `url`."""
+        for page in [p for p in self._idle if p.crashed]:
+            # Crashed while idle: drop it rather than failing the next job
+            self._idle.remove(page)
+            self._pages.remove(page)
+            asyncio.ensure_future(page.close())
+        for page in self._idle:
+            if page.url == url:
+                self._idle.remove(page)
+                return page
+        return self._idle.pop() if self._idle else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Page and job counters.
+
+        Returns:
+            Dictionary with open/idle/busy pages and completed jobs
+        """
+        return {
+            'debug_port': self.debug_port,
+            'max_concurrency': self.max_concurrency,
+            'open_pages': len(self._pages),
+            'idle_pages': len(self._idle),
+            'busy_pages': len(self._pages) - len(self._idle),
+            'jobs_done': self.jobs_done,
+        }
+
+    async def __aenter__(self):
+        return await self.connect() if self.conn is None else self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
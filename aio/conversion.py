@@ -0,0 +1,200 @@
+"""
+Async Conversion
+================
+Sidecar query/answer loop on an AsyncPage.
+
+Same flow as CometConversion (find the Lexical editor, type, press Enter,
+poll the newest `.prose` block until it stops changing), but every wait is
+an asyncio.sleep, so one event loop can stream many answers at once.
+
+Usage:
+    conversion = AsyncConversion(page)
+    result = await conversion.execute("What is the capital of France?")
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Optional
+import asyncio
+import time
+
+from browser.comet import scripts
+from browser.watchdog import BrowserCrashedError
+from cdp import CDPConnectionClosed, CDPError
+from conversion.base import ConversionResult
+from profiling.timer import StepTimer
+from logger import get_logger
+
+from .page import AsyncPage
+
+log = get_logger(__name__)
+
+
+class AsyncConversion:
+    """
+    Sends queries to and captures answers from a Sidecar page.
+    """
+
+    def __init__(self, page: AsyncPage, poll_interval: float = 0.25,
+                 stable_polls: int = 3, ready_timeout: float = 30.0):
+        """
+        Initialize conversion handler.
+
+        Args:
+            page: Page showing Sidecar
+            poll_interval: Seconds between answer polls
+            stable_polls: Unchanged polls after which an answer counts as complete
+            ready_timeout: Seconds to wait for the editor
+        """
+        self.page = page
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+        self.ready_timeout = ready_timeout
+        self.timer = StepTimer()  # Pipeline replaces this with its own timer
+        self.submitted_ns: Optional[int] = None  # perf_counter_ns() at the last Enter (first_token starts here)
+        self._baseline = 0
+
+    async def wait_ready(self) -> bool:
+        """
+        Wait until the Lexical editor is mounted.
+
+        Returns:
+            True if the editor appeared within ready_timeout
+        """
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            try:
+                if await self.page.evaluate(scripts.EDITOR_READY):
+                    return True
+            except (BrowserCrashedError, CDPConnectionClosed):
+                raise  # BrowserCrashedError is a RuntimeError: fail now, not after ready_timeout
+            except (RuntimeError, CDPError):
+                pass  # Page still navigating
+            await asyncio.sleep(self.poll_interval)
+        return False
+
+    async def send_query(self, query: str, submit: bool = True) -> bool:
+        """
+        Type a query into the editor and (optionally) press Enter.
+
+        Args:
+            query: The text to send
+            submit: If True, press Enter to submit
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self.timer.measure("editor_lookup"):
+            if not await self.wait_ready():
+                log.error("[AIO CONVERSION] ✗ Editor not ready after %ss", self.ready_timeout)
+                return False
+
+        self.submitted_ns = None
+        with self.timer.measure("send"):
+            self._baseline = await self.page.evaluate(scripts.PROSE_COUNT) or 0
+            if not await self.page.evaluate(scripts.SELECT_EDITOR):
+                log.error("[AIO CONVERSION] ✗ #ask-input not found")
+                return False
+
+            await self.page.insert_text(query)
+            if await self.page.evaluate(scripts.EDITOR_TEXT) != query.strip():
+                await self.page.evaluate(scripts.set_editor_text(query))
+
+            if submit:
+                await self.page.press_enter()
+                self.submitted_ns = time.perf_counter_ns()
+        log.debug("[AIO CONVERSION] ✓ Query sent: '%s'", query)
+        return True
+
+    async def capture_response(self, wait_for_completion: bool = True,
+                               max_wait: float = 60.0,
+                               on_text: Optional[Callable[[str], Any]] = None) -> Optional[str]:
+        """
+        Poll the newest answer block until its text stops changing.
+
+        Args:
+            wait_for_completion: Wait for the answer to finish streaming
+            max_wait: Maximum time to wait (seconds)
+            on_text: Called with the answer so far at each poll; a truthy return
+                     (e.g. PromptInjectionOracle.feed_snapshot's early verdict) stops waiting
+
+        Returns:
+            The response text, or None if no answer appeared
+        """
+        expression = scripts.last_prose_after(self._baseline)
+        start_ns = time.perf_counter_ns()
+        submitted_ns = self.submitted_ns or start_ns  # Time to first token counts from the submit
+        deadline = time.monotonic() + max_wait
+        previous_text = None
+        stable_count = 0
+        first_token_seen = False
+
+        while time.monotonic() < deadline:
+            current_text = await self.page.evaluate(expression)
+
+            if current_text and not first_token_seen:
+                first_token_seen = True
+                self.timer.record("first_token", time.perf_counter_ns() - submitted_ns, started_ns=submitted_ns)
+                if not wait_for_completion:
+                    return current_text
+
+            if current_text and on_text is not None and on_text(current_text):
+                previous_text = current_text
+                break
+
+            if current_text and current_text == previous_text:
+                stable_count += 1
+                if stable_count >= self.stable_polls:
+                    break
+            else:
+                stable_count = 0
+                previous_text = current_text
+
+            await asyncio.sleep(self.poll_interval)
+        else:
+            log.warning("[AIO CONVERSION] ⚠ Max wait reached")
+
+        self.timer.record("capture", time.perf_counter_ns() - start_ns, started_ns=start_ns)
+        return previous_text
+
+    async def execute(self, query: str, capture: bool = True,
+                      save_text: Optional[str] = None, max_wait: float = 60.0,
+                      on_text: Optional[Callable[[str], Any]] = None) -> ConversionResult:
+        """
+        Send a query and capture the answer.
+
+        Args:
+            query: The question/prompt to send
+            capture: Whether to capture the response
+            save_text: Optional filepath to save the response text
+            max_wait: Maximum wait time for the response (seconds)
+            on_text: Streamed-answer callback (see capture_response())
+
+        Returns:
+            ConversionResult with query and response
+        """
+        try:
+            if not await self.send_query(query, submit=True):
+                return ConversionResult(success=False, query=query, error="Failed to send query")
+
+            if not capture:
+                return ConversionResult(success=True, query=query)
+
+            response = await self.capture_response(max_wait=max_wait, on_text=on_text)
+            if response is None:
+                return ConversionResult(success=False, query=query, error="Could not capture response")
+
+            text_filepath = None
+            if save_text:
+                path = Path(save_text)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(response, encoding='utf-8')
+                text_filepath = str(path)
+
+            return ConversionResult(success=True, query=query, response=response,
+                                    text_filepath=text_filepath)
+
+        except (BrowserCrashedError, CDPConnectionClosed) as e:
+            return ConversionResult(success=False, query=query, error=f"Browser crashed: {e}")
+        except (CDPError, TimeoutError, RuntimeError) as e:
+            log.error("[AIO CONVERSION] ✗ %s", e)
+            return ConversionResult(success=False, query=query, error=str(e))
@@ -0,0 +1,169 @@
+"""
+Async Page
+==========
+One browser tab driven through its own flat-mode CDP session.
+
+Usage:
+    page = await AsyncPage.create(conn, "https://example.com")
+    title = await page.evaluate("document.title")
+    await page.close()
+"""
+
+from typing import Any, Dict, Optional
+import asyncio
+
+from browser.comet.scripts import ENTER_KEY_EVENTS
+from browser.watchdog import BrowserCrashedError
+from cdp import AsyncCDPConnection, CDPConnectionClosed, CDPError
+from logger import get_logger
+
+log = get_logger(__name__)
+
+
+class AsyncPage:
+    """
+    A page target plus its CDP session.
+    """
+
+    def __init__(self, conn: AsyncCDPConnection, target_id: str, session_id: str):
+        """
+        Initialize page (use AsyncPage.create()).
+
+        Args:
+            conn: Browser-level connection
+            target_id: Page target id
+            session_id: Flat-mode session attached to the target
+        """
+        self.conn = conn
+        self.target_id = target_id
+        self.session_id = session_id
+        self.url: Optional[str] = None
+        self.crashed = False
+        self.closed = False
+
+    @classmethod
+    async def create(cls, conn: AsyncCDPConnection, url: Optional[str] = None,
+                     load_timeout: float = 30.0) -> "AsyncPage":
+        """
+        Open a new tab and attach to it.
+
+        Args:
+            conn: Browser-level connection
+            url: URL to load (None leaves about:blank)
+            load_timeout: Seconds to wait for the load event
+
+        Returns:
+            AsyncPage
+        """
+        target = await conn.send("Target.createTarget", {'url': "about:blank", 'background': True})
+        session_id = await conn.attach(target['targetId'])
+        page = cls(conn, target['targetId'], session_id)
+        conn.on("Inspector.targetCrashed", page._on_crashed, session_id=session_id)
+        await asyncio.gather(
+            page.send("Inspector.enable"),
+            page.send("Page.enable"),
+            # Background tabs otherwise miss focus and keyboard events
+            page.send("Emulation.setFocusEmulationEnabled", {'enabled': True}),
+        )
+        if url:
+            await page.navigate(url, timeout=load_timeout)
+        return page
+
+    def _on_crashed(self, params: Dict[str, Any], session_id: Optional[str]):
+        log.error("[AIO] ✗ Page %s renderer crashed", self.target_id)
+        self.crashed = True
+
+    def check(self):
+        """
+        Raise if the page crashed.
+
+        Raises:
+            BrowserCrashedError: After Inspector.targetCrashed for this page
+        """
+        if self.crashed:
+            raise BrowserCrashedError(f"Page {self.target_id} renderer crashed")
+
+    # ==================== Commands ====================
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send a CDP command to this page's session."""
+        return await self.conn.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    async def navigate(self, url: str, timeout: float = 30.0) -> bool:
+        """
+        Navigate and wait for the load event.
+
+        Args:
+            url: URL to load
+            timeout: Seconds to wait for the load event
+
+        Returns:
+            True if the page loaded in time
+        """
+        self.check()
+        loaded = asyncio.ensure_future(
+            self.conn.wait_for("Page.loadEventFired", session_id=self.session_id, timeout=timeout)
+        )
+        try:
+            result = await self.send("Page.navigate", {'url': url})
+            if result.get('errorText'):
+                log.warning("[AIO] Navigation to %s failed: %s", url, result['errorText'])
+                return False
+            await loaded
+        except TimeoutError:
+            log.warning("[AIO] ⚠ Load event for %s not seen after %ss", url, timeout)
+            return False
+        finally:
+            loaded.cancel()
+        self.url = url
+        return True
+
+    async def evaluate(self, expression: str) -> Any:
+        """
+        Evaluate a JavaScript expression in the page.
+
+        Args:
+            expression: JavaScript expression (promises are awaited)
+
+        Returns:
+            The expression's value (returned by value)
+
+        Raises:
+            BrowserCrashedError: If the page crashed
+            RuntimeError: If the expression threw
+        """
+        self.check()
+        result = await self.send(
+            "Runtime.evaluate",
+            {'expression': expression, 'returnByValue': True, 'awaitPromise': True}
+        )
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise RuntimeError(details.get('exception', {}).get('description') or details.get('text'))
+        return result.get('result', {}).get('value')
+
+    async def insert_text(self, text: str):
+        """Insert text at the focused element (fires real input events)."""
+        self.check()
+        await self.send("Input.insertText", {'text': text})
+
+    async def press_enter(self):
+        """Press and release Enter in the focused element."""
+        self.check()
+        for event in ENTER_KEY_EVENTS:
+            await self.send("Input.dispatchKeyEvent", event)
+
+    async def close(self):
+        """Close the tab (ignores errors for a gone browser)."""
+        if self.closed:
+            return
+        self.closed = True
+        self.conn.off("Inspector.targetCrashed", self._on_crashed, session_id=self.session_id)
+        try:
+            await self.conn.send("Target.closeTarget", {'targetId': self.target_id})
+        except (CDPError, CDPConnectionClosed, TimeoutError):
+            pass
+
+    def __repr__(self):
+        return f"AsyncPage(target_id={self.target_id!r}, url={self.url!r})"
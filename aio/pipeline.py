@@ -0,0 +1,157 @@
+"""
+Async Pipeline
+==============
+Sidecar query workflow on an AsyncBrowser.
+
+Steps mirror BasePipeline.run (pre-workflow, then workflow) and
+return the same PipelineResult, so results from the async and threaded
+stacks can be compared directly. run_many() fans queries out over the
+browser's pages; the browser's semaphore bounds concurrency.
+
+Usage:
+    pipeline = AsyncPipeline(browser, PipelineConfig(target_url=SIDECAR_URL))
+    results = await pipeline.run_many(["query 1", "query 2"])
+"""
+
+from typing import Iterable, List, Optional
+import asyncio
+
+from browser.watchdog import BrowserCrashedError
+from cdp import CDPConnectionClosed
+from pipeline.base import PipelineConfig, PipelineResult
+from profiling.timer import StepTimer
+from logger import get_logger, job_context
+
+from .browser import AsyncBrowser
+from .conversion import AsyncConversion
+from .page import AsyncPage
+
+log = get_logger(__name__)
+
+
+class AsyncPipeline:
+    """
+    Runs Sidecar queries concurrently on one AsyncBrowser.
+    """
+
+    def __init__(self, browser: AsyncBrowser, config: PipelineConfig, **kwargs):
+        """
+        Initialize async pipeline.
+
+        Args:
+            browser: Connected AsyncBrowser
+            config: Pipeline configuration (target_url, timing_hooks)
+            **kwargs: Optional parameters (read_responses, save_text, reuse_page,
+                max_wait, poll_interval)
+        """
+        self.browser = browser
+        self.config = config
+        self.read_responses: bool = kwargs.get('read_responses', True)
+        self.save_text: Optional[str] = kwargs.get('save_text', None)
+        self.reuse_page: bool = kwargs.get('reuse_page', True)
+        self.max_wait: float = kwargs.get('max_wait', 60.0)
+        self.poll_interval: float = kwargs.get('poll_interval', 0.25)
+
+    def get_browser_name(self) -> str:
+        """Return the browser name."""
+        return "Async CDP"
+
+    async def pre_workflow_steps(self, page: AsyncPage) -> bool:
+        """
+        Pre-workflow: load the target URL unless the page already shows it.
+
+        Args:
+            page: Page borrowed for this job
+
+        Returns:
+            True if successful
+        """
+        target_url = self.config.target_url
+        if not target_url or target_url == "about:blank":
+            return True
+        if self.reuse_page and page.url == target_url:
+            return True
+        return await page.navigate(target_url, timeout=max(self.config.load_wait_time, 30))
+
+    async def run(self, query: str, save_text: Optional[str] = None) -> PipelineResult:
+        """
+        Run one query in a borrowed page.
+
+        Args:
+            query: The text to send
+            save_text: Optional filepath to save the response text
+
+        Returns:
+            PipelineResult (driver is None; metadata['conversion_result'] holds the answer).
+            Errors, including a crashed tab or a closed connection, give a failed
+            result instead of raising, so one job cannot abort run_many().
+        """
+        timer = StepTimer(hooks=self.config.timing_hooks)
+        steps: List[str] = []
+        metadata = {}
+
+        with job_context(query=query[:40]):
+            try:
+                return await self._run(query, save_text, timer, steps, metadata)
+            except (BrowserCrashedError, CDPConnectionClosed) as e:
+                log.error("[AIO PIPELINE] ✗ Browser crashed: %s", e)
+                message = f"Browser crashed: {e}"
+            except Exception as e:
+                log.error("[AIO PIPELINE] ✗ Workflow failed: %s", e, exc_info=True)
+                message = f"Pipeline error: {e}"
+        return PipelineResult(success=False, message=message, steps_completed=steps,
+                              metadata=metadata, timings=timer.totals())
+
+    async def _run(self, query: str, save_text: Optional[str], timer: StepTimer,
+                   steps: List[str], metadata: dict) -> PipelineResult:
+        async with self.browser.page(self.config.target_url) as page:
+            metadata['target_id'] = page.target_id
+
+            with timer.measure("pre_workflow"):
+                pre_result = await self.pre_workflow_steps(page)
+            if not pre_result:
+                return PipelineResult(success=False, message="Pre-workflow steps failed",
+                                      steps_completed=steps, metadata=metadata,
+                                      timings=timer.totals())
+            steps.append("Pre-workflow steps")
+
+            conversion = AsyncConversion(page, poll_interval=self.poll_interval)
+            conversion.timer = timer
+            with timer.measure("workflow"):
+                conversion_result = await conversion.execute(
+                    query=query,
+                    capture=self.read_responses,
+                    save_text=save_text or self.save_text,
+                    max_wait=self.max_wait
+                )
+
+        metadata['conversion_result'] = {
+            'success': conversion_result.success,
+            'query': conversion_result.query,
+            'response': conversion_result.response,
+            'text_filepath': conversion_result.text_filepath,
+            'error': conversion_result.error
+        }
+
+        if not conversion_result.success:
+            log.error("[AIO PIPELINE] ✗ Conversion failed: %s", conversion_result.error)
+            error = conversion_result.error or ""
+            message = error if error.startswith("Browser crashed") else "Workflow execution failed"
+            return PipelineResult(success=False, message=message, steps_completed=steps,
+                                  metadata=metadata, timings=timer.totals())
+        steps.append("Main workflow")
+
+        return PipelineResult(success=True, message="Pipeline workflow completed successfully",
+                              steps_completed=steps, metadata=metadata, timings=timer.totals())
+
+    async def run_many(self, queries: Iterable[str]) -> List[PipelineResult]:
+        """
+        Run many queries concurrently.
+
+        Args:
+            queries: Queries to send
+
+        Returns:
+            PipelineResults in query order
+        """
+        return await asyncio.gather(*(self.run(query) for query in queries))
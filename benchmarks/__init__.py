@@ -0,0 +1,42 @@
+"""
+Benchmarks Package
+==================
+Offline performance benchmarks for the automation hot path.
+
+Components:
+- FakeSidecarServer: Serves a local fake Sidecar page (Lexical-like
+  #ask-input, token-streamed .prose answers) on 127.0.0.1
+- bench_sidecar: Drives the real CometNavigator/CometConversion against
+  the fake page in headless Chromium and reports p50/p95 latencies and
+  queries/minute
+- FakeDriver: In-process WebDriver stand-in with configurable latency,
+  answer streaming and fault injection (stale elements, slow loads)
+- bench_pipeline: Runs the real CometPipeline against FakeDriver on a
+  VirtualClock to measure pipeline throughput without a browser
+
+Usage:
+    python -m benchmarks.bench_sidecar --queries 20
+    python -m benchmarks.bench_pipeline --jobs 2000
+"""
+
+from .server import FakeSidecarServer
+from .stats import LatencyStats, percentile, format_table
+from .fake_driver import (
+    FakeDriver,
+    FakeDriverConfig,
+    FakeElement,
+    VirtualClock,
+    use_virtual_clock,
+)
+
+__all__ = [
+    'FakeSidecarServer',
+    'LatencyStats',
+    'percentile',
+    'format_table',
+    'FakeDriver',
+    'FakeDriverConfig',
+    'FakeElement',
+    'VirtualClock',
+    'use_virtual_clock',
+]
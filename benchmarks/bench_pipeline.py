@@ -0,0 +1,143 @@
+"""
+Pipeline Throughput Benchmark
+=============================
+Runs the real CometPipeline (navigation, conversion, capture) against the
+in-process FakeDriver with a VirtualClock, so fixed sleeps cost nothing and
+the Python-side overhead of the pipeline is what gets measured.
+
+No browser, ChromeDriver or network is needed.
+
+Usage:
+    python -m benchmarks.bench_pipeline --jobs 2000
+    python -m benchmarks.bench_pipeline --jobs 500 --stale-rate 0.05 --slow-load-rate 0.1
+"""
+
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+import argparse
+import io
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.fake_driver import FakeDriver, FakeDriverConfig, VirtualClock, use_virtual_clock
+from benchmarks.stats import LatencyStats, format_table
+
+SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
+
+
+def run_jobs(jobs: int, config: FakeDriverConfig, quiet: bool = True) -> dict:
+    """
+    Run `jobs` pipeline runs against a fake driver.
+
+    Args:
+        jobs: Number of pipeline runs
+        config: Fake driver behavior
+        quiet: Suppress pipeline logging and stdout/stderr
+
+    Returns:
+        Dictionary with throughput, wall/virtual latency summaries and failures
+    """
+    import browser.comet.conversion as comet_conversion
+    import browser.comet.navigator as comet_navigator
+    import browser.comet.pipeline as comet_pipeline
+    import navigator.base as navigator_base
+    from browser.comet import CometNavigator, CometPipeline
+    from logger import configure_logging
+    from pipeline import PipelineConfig
+
+    clock = VirtualClock()
+    driver = FakeDriver(config, clock=clock)
+    navigator = CometNavigator(driver)
+    pipeline_config = PipelineConfig(target_url=SIDECAR_URL, keep_open=False)
+
+    wall = LatencyStats("job (wall)")
+    virtual = LatencyStats("job (virtual)")
+    failures = 0
+
+    sink = io.StringIO()
+    if quiet:
+        configure_logging(level="WARNING", stream=sink)
+    modules = [comet_conversion, comet_navigator, comet_pipeline, navigator_base]
+    with use_virtual_clock(clock, modules):
+        start = time.perf_counter()
+        for i in range(jobs):
+            job_start = time.perf_counter()
+            virtual_start = clock.time()
+            pipeline = CometPipeline(
+                driver=driver,
+                navigator=navigator,
+                config=pipeline_config,
+                query=f"Benchmark question {i + 1}?",
+                submit=True,
+                use_conversion=True,
+                read_responses=True
+            )
+            if quiet:
+                with redirect_stdout(sink), redirect_stderr(sink):
+                    result = pipeline.run()
+                sink.seek(0)
+                sink.truncate()
+            else:
+                result = pipeline.run()
+            wall.add(time.perf_counter() - job_start)
+            virtual.add(clock.time() - virtual_start)
+            if not result.success:
+                failures += 1
+        elapsed = time.perf_counter() - start
+
+    return {
+        'jobs': jobs,
+        'failures': failures,
+        'jobs_per_second': jobs / elapsed if elapsed else 0.0,
+        'commands_per_job': driver.command_count / jobs if jobs else 0.0,
+        'rows': {
+            wall.name: wall.summary(elapsed),
+            virtual.name: virtual.summary(),
+        },
+    }
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Pipeline throughput benchmark on a fake driver")
+    parser.add_argument("--jobs", type=int, default=1000, help="Number of pipeline runs")
+    parser.add_argument("--tokens", type=int, default=40, help="Tokens per streamed answer")
+    parser.add_argument("--command-latency", type=float, default=0.0, help="Virtual seconds per command")
+    parser.add_argument("--stale-rate", type=float, default=0.0, help="Probability of stale answer reads")
+    parser.add_argument("--slow-load-rate", type=float, default=0.0, help="Probability of slow page loads")
+    parser.add_argument("--seed", type=int, default=0, help="Fault injection seed")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline output")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    config = FakeDriverConfig(
+        command_latency=args.command_latency,
+        tokens=args.tokens,
+        stale_element_rate=args.stale_rate,
+        slow_load_rate=args.slow_load_rate,
+        seed=args.seed
+    )
+    results = run_jobs(args.jobs, config, quiet=not args.verbose)
+
+    print("=" * 72)
+    print("PIPELINE THROUGHPUT BENCHMARK (fake driver, virtual clock)")
+    print("=" * 72)
+    print(format_table(results['rows']))
+    print("-" * 72)
+    print(f"Jobs/second: {results['jobs_per_second']:.1f}   "
+          f"Commands/job: {results['commands_per_job']:.1f}   "
+          f"Failures: {results['failures']}")
+    print("=" * 72)
+
+    if args.json:
+        output_path = Path(args.json)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    return 0 if results['failures'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
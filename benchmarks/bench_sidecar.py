@@ -0,0 +1,164 @@
+"""
+Sidecar Hot-Path Benchmark
+==========================
+Drives the real CometNavigator and CometConversion against the local fake
+Sidecar page in headless Chromium (launched by the CHROMIUM_HEADLESS
+backend's launcher) and reports latency percentiles and queries per minute.
+
+No network access is needed: the page is served from 127.0.0.1,
+Chromium is taken from --chrome-binary, CHROMIUM_PATH or PATH, and
+ChromeDriver from --chromedriver or PATH.
+
+Usage:
+    python -m benchmarks.bench_sidecar --queries 20
+    python -m benchmarks.bench_sidecar --queries 50 --tokens 80 --token-delay 10 --json output/bench.json
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+import argparse
+import json
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.server import FakeSidecarServer
+from benchmarks.stats import LatencyStats, format_table
+from profiling.timer import StepTimer
+
+
+def create_headless_launcher(chromedriver: Optional[str] = None,
+                             chrome_binary: Optional[str] = None):
+    """
+    Create the headless Chromium launcher used as the benchmark target.
+
+    Args:
+        chromedriver: Path to chromedriver (defaults to PATH, then Selenium Manager)
+        chrome_binary: Path to the Chromium binary (defaults to CHROMIUM_PATH, then PATH)
+
+    Returns:
+        ChromiumHeadlessLauncher (call launch_and_attach() for the driver)
+    """
+    from browser.chromium import ChromiumHeadlessLauncher
+
+    launcher = ChromiumHeadlessLauncher(chromedriver_path=chromedriver)
+    if chrome_binary:
+        launcher.config.executable_path = Path(chrome_binary)
+    return launcher
+
+
+def run_benchmark(driver, sidecar_url: str, queries: int, reuse_page: bool = False,
+                  max_wait: float = 30.0) -> Dict[str, Dict[str, float]]:
+    """
+    Run `queries` query/answer round trips and collect latencies.
+
+    Args:
+        driver: Selenium WebDriver (headless Chromium)
+        sidecar_url: Fake Sidecar URL
+        queries: Number of queries to run
+        reuse_page: Navigate once instead of before every query
+        max_wait: Max wait per answer (seconds)
+
+    Returns:
+        Mapping of row name ("query" plus each timed step) to summary
+    """
+    from browser.comet.navigator import CometNavigator
+    from browser.comet.conversion import CometConversion
+
+    navigator = CometNavigator(driver)
+    conversion = CometConversion(driver, navigator)
+
+    step_stats: Dict[str, LatencyStats] = {}
+
+    def collect(timing):
+        step_stats.setdefault(timing.name, LatencyStats(timing.name)).add(timing.duration_ns / 1e9)
+
+    timer = StepTimer(hooks=[collect])
+    conversion.timer = timer
+    query_stats = LatencyStats("query")
+    failures = 0
+
+    if reuse_page:
+        with timer.measure("navigation"):
+            navigator.navigate_to_url(sidecar_url, wait_time=0.5)
+
+    wall_start = time.perf_counter()
+    for i in range(queries):
+        start = time.perf_counter()
+        if not reuse_page:
+            with timer.measure("navigation"):
+                navigator.navigate_to_url(sidecar_url, wait_time=0.5)
+        result = conversion.execute(
+            query=f"Benchmark question {i + 1}?",
+            capture=True,
+            max_wait=max_wait
+        )
+        query_stats.add(time.perf_counter() - start)
+        if not result.success:
+            failures += 1
+    wall_time = time.perf_counter() - wall_start
+
+    rows = {"query": query_stats.summary(wall_time)}
+    rows["query"]['failures'] = failures
+    for name, stats in step_stats.items():
+        rows[name] = stats.summary()
+    return rows
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Offline Sidecar hot-path benchmark")
+    parser.add_argument("--queries", type=int, default=10, help="Number of queries to run")
+    parser.add_argument("--tokens", type=int, default=40, help="Tokens per streamed answer")
+    parser.add_argument("--token-delay", type=int, default=25, help="Milliseconds between tokens")
+    parser.add_argument("--first-token-delay", type=int, default=300, help="Milliseconds before first token")
+    parser.add_argument("--reuse-page", action="store_true", help="Navigate once instead of per query")
+    parser.add_argument("--max-wait", type=float, default=30.0, help="Max wait per answer (seconds)")
+    parser.add_argument("--chromedriver", default=None, help="Path to chromedriver")
+    parser.add_argument("--chrome-binary", default=None, help="Path to Chromium binary")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    with FakeSidecarServer() as server:
+        url = server.sidecar_url(
+            tokens=args.tokens,
+            token_delay=args.token_delay,
+            first_token_delay=args.first_token_delay
+        )
+        print(f"[BENCH] Fake Sidecar: {url}")
+
+        launcher = create_headless_launcher(args.chromedriver, args.chrome_binary)
+        driver = launcher.launch_and_attach()
+        if not driver:
+            print("[BENCH] Could not start headless Chromium")
+            return 1
+        try:
+            rows = run_benchmark(
+                driver,
+                url,
+                queries=args.queries,
+                reuse_page=args.reuse_page,
+                max_wait=args.max_wait
+            )
+        finally:
+            launcher.quit()
+
+    print("\n" + "=" * 72)
+    print("SIDECAR HOT-PATH BENCHMARK")
+    print("=" * 72)
+    print(format_table(rows))
+    print("-" * 72)
+    print(f"Queries/minute: {rows['query']['per_minute']:.2f}   Failures: {rows['query']['failures']}")
+    print("=" * 72)
+
+    if args.json:
+        output_path = Path(args.json)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(rows, indent=2), encoding='utf-8')
+        print(f"[BENCH] Results written to: {output_path}")
+
+    return 0 if rows['query']['failures'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,523 @@
+"""
+Fake WebDriver
+==============
+In-process stand-in for a Selenium WebDriver attached to Comet.
+
+Implements the subset used by Navigator, CometConversion and BasePipeline:
+get, current_url, title, page_source, window_handles, switch_to,
+execute_script, execute_cdp_cmd, find_element(s) and the WebElement
+methods those call. Any URL containing "sidecar" renders a fake Sidecar
+(#ask-input Lexical editor plus streamed .prose answers).
+
+Behavior is configurable and deterministic:
+- Command and page-load latency (real or virtual time)
+- Answer streaming (token count, first-token delay, token interval)
+- Fault injection (stale elements, slow loads) driven by a seeded RNG
+
+With a VirtualClock patched into the modules under test, the fixed
+time.sleep() calls in the hot path cost nothing, so pipeline and scheduler
+throughput can be measured at thousands of jobs per second.
+
+Usage:
+    clock = VirtualClock()
+    driver = FakeDriver(FakeDriverConfig(tokens=20), clock=clock)
+
+    with use_virtual_clock(clock, [browser.comet.conversion, browser.comet.navigator]):
+        navigator = CometNavigator(driver)
+        conversion = CometConversion(driver, navigator)
+        result = conversion.execute("What is Python?")
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import random
+import re
+import time as _real_time
+
+try:
+    from selenium.common.exceptions import (
+        NoSuchElementException,
+        NoSuchWindowException,
+        StaleElementReferenceException,
+        TimeoutException,
+    )
+except ImportError:
+    class NoSuchElementException(Exception):
+        pass
+
+    class NoSuchWindowException(Exception):
+        pass
+
+    class StaleElementReferenceException(Exception):
+        pass
+
+    class TimeoutException(Exception):
+        pass
+
+
+# Selenium Keys codes used by the conversion code
+KEY_RETURN = '\ue006'
+KEY_ENTER = '\ue007'
+KEY_CONTROL = '\ue009'
+KEY_DELETE = '\ue017'
+
+ANSWER_WORDS = [
+    'the', 'capital', 'of', 'France', 'is', 'Paris', 'which', 'lies',
+    'along', 'Seine', 'river', 'and', 'is', 'known', 'for', 'art',
+    'history', 'culture', 'fashion', 'food', 'a', 'major', 'centre', 'in', 'Europe',
+]
+
+
+# ==================== Clock ====================
+
+class VirtualClock:
+    """
+    Drop-in replacement for the `time` module with virtual sleeps.
+
+    sleep() advances virtual time instantly; time()/perf_counter()/monotonic()
+    report virtual time. Everything else is forwarded to the real module.
+    """
+
+    def __init__(self, start: float = 1_700_000_000.0):
+        """
+        Initialize clock.
+
+        Args:
+            start: Initial virtual epoch time (seconds)
+        """
+        self._now = start
+
+    def sleep(self, seconds: float):
+        """Advance virtual time."""
+        if seconds > 0:
+            self._now += seconds
+
+    def advance(self, seconds: float):
+        """Alias of sleep(), for use by simulated latency."""
+        self.sleep(seconds)
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def perf_counter(self) -> float:
+        return self._now
+
+    def time_ns(self) -> int:
+        return int(self._now * 1_000_000_000)
+
+    def monotonic_ns(self) -> int:
+        return self.time_ns()
+
+    def perf_counter_ns(self) -> int:
+        return self.time_ns()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_real_time, name)
+
+
+@contextmanager
+def use_virtual_clock(clock: VirtualClock, modules: Iterable[Any]):
+    """
+    Temporarily replace the `time` global of the given modules with a clock.
+
+    Args:
+        clock: VirtualClock to install
+        modules: Modules that did `import time` (e.g., browser.comet.conversion)
+    """
+    modules = list(modules)
+    originals = [module.time for module in modules]
+    try:
+        for module in modules:
+            module.time = clock
+        yield clock
+    finally:
+        for module, original in zip(modules, originals):
+            module.time = original
+
+
+# ==================== Configuration ====================
+
+@dataclass
+class FakeDriverConfig:
+    """Behavior of the fake driver."""
+    command_latency: float = 0.0      # Seconds added to every command
+    page_load_latency: float = 0.0    # Seconds added to get()/navigation
+    tokens: int = 40                  # Tokens per streamed answer
+    first_token_delay: float = 0.3    # Seconds from submit to first token
+    token_interval: float = 0.025     # Seconds between tokens
+    stale_element_rate: float = 0.0   # Probability that element.text raises StaleElementReferenceException
+    slow_load_rate: float = 0.0       # Probability that a page load takes slow_load_extra longer
+    slow_load_extra: float = 5.0      # Extra seconds for a slow load
+    seed: int = 0                     # Seed for fault injection and answer words
+
+
+# ==================== Page Model ====================
+
+class _FakePage:
+    """State of one tab."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.title = ""
+        self.elements: List["FakeElement"] = []
+        self.answers: List["FakeElement"] = []
+
+
+class FakeElement:
+    """Minimal WebElement stand-in."""
+
+    def __init__(self, driver: "FakeDriver", page: _FakePage, element_id: str = "",
+                 classes: Iterable[str] = (), attributes: Optional[Dict[str, str]] = None,
+                 text: str = ""):
+        self._driver = driver
+        self._page = page
+        self.id = element_id or f"fake-{id(self)}"
+        self.element_id = element_id
+        self.classes = set(classes)
+        self.attributes = dict(attributes or {})
+        self._text = text
+        self._select_all = False
+        # Streaming answers compute text from the clock
+        self._stream_start: Optional[float] = None
+        self._stream_words: List[str] = []
+
+    @property
+    def text(self) -> str:
+        self._driver._command()
+        self._check_stale(inject=True)
+        if self._stream_start is not None:
+            return self._streamed_text()
+        return self._text
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        self._driver._command()
+        self._check_stale()
+        if name == 'id':
+            return self.element_id
+        if name in ('innerHTML', 'textContent', 'innerText'):
+            return self._streamed_text() if self._stream_start is not None else self._text
+        return self.attributes.get(name)
+
+    def is_displayed(self) -> bool:
+        self._driver._command()
+        self._check_stale()
+        return True
+
+    def is_enabled(self) -> bool:
+        self._driver._command()
+        return True
+
+    def click(self):
+        self._driver._command()
+        self._check_stale()
+
+    def send_keys(self, *values: str):
+        self._driver._command()
+        self._check_stale()
+        keys = "".join(values)
+        if keys.startswith(KEY_CONTROL):
+            self._select_all = keys[len(KEY_CONTROL):].lower() == 'a'
+            return
+        for key in keys:
+            if key in (KEY_RETURN, KEY_ENTER):
+                self._driver._submit(self._page, self)
+            elif key == KEY_DELETE:
+                if self._select_all:
+                    self._text = ""
+                    self._select_all = False
+                else:
+                    self._text = self._text[:-1]
+            else:
+                self._text += key
+
+    def clear(self):
+        self._driver._command()
+        self._text = ""
+
+    def _check_stale(self, inject: bool = False):
+        if self not in self._page.elements and self not in self._page.answers:
+            raise StaleElementReferenceException("Element is no longer attached to the DOM")
+        # Injected faults only hit reads, where real Sidecar re-renders answers
+        if inject and self._driver._roll(self._driver.config.stale_element_rate):
+            raise StaleElementReferenceException("Injected stale element")
+
+    def _streamed_text(self) -> str:
+        elapsed = self._driver.clock.time() - self._stream_start
+        config = self._driver.config
+        if elapsed < config.first_token_delay:
+            return ""
+        emitted = 1 + int((elapsed - config.first_token_delay) / max(config.token_interval, 1e-9))
+        if emitted >= len(self._stream_words):
+            return " ".join(self._stream_words) + "."
+        return " ".join(self._stream_words[:emitted])
+
+    def __repr__(self):
+        return f"<FakeElement id={self.element_id!r} classes={sorted(self.classes)}>"
+
+
+class _FakeSwitchTo:
+    """switch_to stand-in."""
+
+    def __init__(self, driver: "FakeDriver"):
+        self._driver = driver
+
+    def window(self, handle: str):
+        self._driver._command()
+        if handle not in self._driver._pages:
+            raise NoSuchWindowException(f"No window with handle {handle}")
+        self._driver._current = handle
+
+    @property
+    def active_element(self) -> Optional[FakeElement]:
+        page = self._driver._page()
+        return page.elements[0] if page.elements else None
+
+
+# ==================== Driver ====================
+
+class FakeDriver:
+    """
+    In-process fake WebDriver.
+
+    Attributes:
+        config: Behavior configuration
+        clock: Clock used for latency and streaming (real `time` module or VirtualClock)
+        command_count: Number of commands executed
+        cdp_commands: Log of (command, params) sent through execute_cdp_cmd
+        submitted_queries: Queries submitted through the fake Sidecar
+    """
+
+    def __init__(self, config: Optional[FakeDriverConfig] = None, clock: Any = None,
+                 start_url: str = "about:blank"):
+        """
+        Initialize fake driver.
+
+        Args:
+            config: Behavior configuration
+            clock: VirtualClock for deterministic virtual time (defaults to real time)
+            start_url: URL of the initial tab
+        """
+        self.config = config or FakeDriverConfig()
+        self.clock = clock or _real_time
+        self._rng = random.Random(self.config.seed)
+        self._pages: Dict[str, _FakePage] = {}
+        self._handle_counter = 0
+        self._current = self._open_page(start_url)
+        self.switch_to = _FakeSwitchTo(self)
+        self.capabilities = {'browserName': 'chrome', 'browserVersion': 'fake'}
+        self.command_count = 0
+        self.cdp_commands: List[tuple] = []
+        self.submitted_queries: List[str] = []
+        self._script_handlers: List[tuple] = []
+
+    # ---------- properties ----------
+
+    @property
+    def current_url(self) -> str:
+        self._command()
+        return self._page().url
+
+    @property
+    def title(self) -> str:
+        self._command()
+        return self._page().title
+
+    @property
+    def page_source(self) -> str:
+        self._command()
+        page = self._page()
+        answers = "".join(f'<div class="prose">{a._streamed_text()}</div>' for a in page.answers)
+        return f"<html><head><title>{page.title}</title></head><body>{answers}</body></html>"
+
+    @property
+    def window_handles(self) -> List[str]:
+        self._command()
+        return list(self._pages.keys())
+
+    @property
+    def current_window_handle(self) -> str:
+        self._command()
+        return self._current
+
+    # ---------- navigation ----------
+
+    def get(self, url: str):
+        """Load `url` in the current tab."""
+        self._command()
+        self._load(self._page(), url)
+
+    def refresh(self):
+        self.get(self._page().url)
+
+    def close(self):
+        """Close the current tab."""
+        self._command()
+        self._pages.pop(self._current, None)
+        self._current = next(iter(self._pages), None)
+
+    def quit(self):
+        self._pages.clear()
+        self._current = None
+
+    # ---------- elements ----------
+
+    def find_element(self, by: str = "id", value: str = "") -> FakeElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element for {by}={value!r}")
+        return elements[0]
+
+    def find_elements(self, by: str = "id", value: str = "") -> List[FakeElement]:
+        self._command()
+        page = self._page()
+        candidates = page.elements + page.answers
+        return [element for element in candidates if self._matches(element, by, value)]
+
+    # ---------- scripts / CDP ----------
+
+    def register_script(self, marker: str, handler: Callable[..., Any]):
+        """
+        Register a handler for scripts containing `marker`.
+
+        Args:
+            marker: Substring identifying the script
+            handler: Called as handler(driver, *args); its return value is returned
+        """
+        self._script_handlers.append((marker, handler))
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """Emulate the scripts the navigator and conversion code run."""
+        self._command()
+        for marker, handler in self._script_handlers:
+            if marker in script:
+                return handler(self, *args)
+
+        page = self._page()
+
+        if 'window.open' in script:
+            handle = self._open_page("about:blank")
+            self._load(self._pages[handle], args[0] if args else "about:blank")
+            return None
+
+        location = re.search(r"location(?:\.href\s*=\s*|\.replace\()\s*['\"]([^'\"]+)['\"]", script)
+        if location:
+            self._load(page, location.group(1))
+            return None
+
+        if 'document.readyState' in script:
+            return 'complete'
+
+        if 'data-lexical-editor' in script and 'getElementById' in script:
+            editor = self._find_by_id(page, 'ask-input')
+            return bool(editor and editor.attributes.get('data-lexical-editor') == 'true')
+
+        if args and isinstance(args[0], FakeElement):
+            element = args[0]
+            if len(args) > 1 and isinstance(args[1], str):
+                element._text = args[1]
+            elif 'innerHTML' in script:
+                element._text = ""
+            return None
+
+        return None
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Emulate the CDP commands used by the codebase."""
+        self._command()
+        self.cdp_commands.append((cmd, cmd_args))
+        if cmd == 'Page.navigate':
+            self._load(self._page(), cmd_args.get('url', 'about:blank'))
+            return {'frameId': self._current}
+        if cmd == 'Runtime.evaluate':
+            return {'result': {'type': 'undefined'}}
+        if cmd == 'Performance.getMetrics':
+            page = self._page()
+            return {'metrics': [
+                {'name': 'JSHeapUsedSize', 'value': 1_000_000 + 10_000 * len(page.answers)},
+                {'name': 'Nodes', 'value': 100 + 50 * len(page.answers)},
+            ]}
+        return {}
+
+    # ---------- internals ----------
+
+    def _command(self):
+        self.command_count += 1
+        if self.config.command_latency:
+            self.clock.sleep(self.config.command_latency)
+
+    def _roll(self, probability: float) -> bool:
+        return probability > 0 and self._rng.random() < probability
+
+    def _page(self) -> _FakePage:
+        if self._current is None or self._current not in self._pages:
+            raise NoSuchWindowException("No current window")
+        return self._pages[self._current]
+
+    def _open_page(self, url: str) -> str:
+        self._handle_counter += 1
+        handle = f"FAKE-WINDOW-{self._handle_counter}"
+        self._pages[handle] = _FakePage(url)
+        return handle
+
+    def _load(self, page: _FakePage, url: str):
+        latency = self.config.page_load_latency
+        if self._roll(self.config.slow_load_rate):
+            latency += self.config.slow_load_extra
+        if latency:
+            self.clock.sleep(latency)
+
+        page.url = url
+        page.answers = []
+        page.elements = []
+        if 'sidecar' in url:
+            page.title = "Perplexity"
+            page.elements.append(FakeElement(
+                self, page,
+                element_id='ask-input',
+                attributes={'contenteditable': 'true', 'data-lexical-editor': 'true'}
+            ))
+        else:
+            page.title = url.rsplit('/', 1)[-1]
+
+    def _submit(self, page: _FakePage, editor: FakeElement):
+        query = editor._text.strip()
+        if not query:
+            return
+        editor._text = ""
+        self.submitted_queries.append(query)
+        answer = FakeElement(self, page, classes=('prose',))
+        answer._stream_start = self.clock.time()
+        answer._stream_words = [
+            ANSWER_WORDS[self._rng.randrange(len(ANSWER_WORDS))]
+            for _ in range(max(self.config.tokens, 1))
+        ]
+        page.answers.append(answer)
+
+    @staticmethod
+    def _find_by_id(page: _FakePage, element_id: str) -> Optional[FakeElement]:
+        for element in page.elements:
+            if element.element_id == element_id:
+                return element
+        return None
+
+    @staticmethod
+    def _matches(element: FakeElement, by: str, value: str) -> bool:
+        if by == 'id':
+            return element.element_id == value
+        if by == 'class name':
+            return value in element.classes
+        if by == 'css selector':
+            if value.startswith('#'):
+                return element.element_id == value[1:]
+            if value.startswith('.'):
+                return value[1:] in element.classes
+            attribute = re.fullmatch(r"\[([\w-]+)(?:=['\"]?([^'\"\]]*)['\"]?)?\]", value)
+            if attribute:
+                name, expected = attribute.groups()
+                actual = element.attributes.get(name)
+                return actual is not None and (expected is None or actual == expected)
+        return False
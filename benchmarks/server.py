@@ -0,0 +1,103 @@
+"""
+Local Fake Sidecar Server
+=========================
+Serves benchmarks/fake_sidecar/ over HTTP on 127.0.0.1 so benchmarks can
+drive the real navigator/conversion code without network access.
+
+Usage:
+    with FakeSidecarServer() as server:
+        url = server.sidecar_url(tokens=40, token_delay=25)
+        navigator.navigate_to_url(url)
+"""
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
+import threading
+
+
+FAKE_SIDECAR_DIR = Path(__file__).parent / "fake_sidecar"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler without per-request logging."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSidecarServer:
+    """
+    Threaded static HTTP server for the fake Sidecar page.
+
+    Binds to an ephemeral port by default; the chosen port is available
+    as `port` once started.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 directory: Optional[Path] = None):
+        """
+        Initialize server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            directory: Directory to serve (defaults to fake_sidecar/)
+        """
+        self.host = host
+        self.port = port
+        self.directory = Path(directory or FAKE_SIDECAR_DIR)
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FakeSidecarServer":
+        """Start serving in a background thread."""
+        handler = partial(_QuietHandler, directory=str(self.directory))
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server (e.g., http://127.0.0.1:54321)."""
+        return f"http://{self.host}:{self.port}"
+
+    def sidecar_url(self, tokens: int = 40, token_delay: int = 25,
+                    first_token_delay: int = 300, seed: int = 1) -> str:
+        """
+        Build the fake Sidecar URL with a streaming script.
+
+        Args:
+            tokens: Tokens per answer
+            token_delay: Milliseconds between tokens
+            first_token_delay: Milliseconds before the first token
+            seed: Seed for the deterministic word sequence
+
+        Returns:
+            URL of the fake Sidecar page
+        """
+        query = urlencode({
+            'copilot': 'true',
+            'tokens': tokens,
+            'token_delay': token_delay,
+            'first_token_delay': first_token_delay,
+            'seed': seed,
+        })
+        return f"{self.base_url}/index.html?{query}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
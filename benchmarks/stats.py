@@ -0,0 +1,86 @@
+"""
+Benchmark Statistics
+====================
+Latency percentiles and throughput for benchmark runs.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = rank - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+@dataclass
+class LatencyStats:
+    """Collects latency samples (seconds) and summarizes them."""
+    name: str
+    samples: List[float] = field(default_factory=list)
+
+    def add(self, seconds: float):
+        """Add one sample."""
+        self.samples.append(seconds)
+
+    def summary(self, wall_time: float = 0.0) -> Dict[str, float]:
+        """
+        Summarize the samples.
+
+        Args:
+            wall_time: Total wall-clock time of the run, used for throughput
+                       (defaults to the sum of samples)
+
+        Returns:
+            Dictionary with count, mean, p50, p95, max (ms) and per_minute
+        """
+        count = len(self.samples)
+        total = wall_time or sum(self.samples)
+        return {
+            'count': count,
+            'mean_ms': (sum(self.samples) / count * 1000) if count else 0.0,
+            'p50_ms': percentile(self.samples, 50) * 1000,
+            'p95_ms': percentile(self.samples, 95) * 1000,
+            'max_ms': max(self.samples) * 1000 if count else 0.0,
+            'per_minute': (count / total * 60) if total else 0.0,
+        }
+
+
+def format_table(rows: Dict[str, Dict[str, float]]) -> str:
+    """
+    Format summaries as a fixed-width table.
+
+    Args:
+        rows: Mapping of row name to LatencyStats.summary() output
+
+    Returns:
+        Multi-line string
+    """
+    header = f"{'step':<20} {'count':>6} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}"
+    lines = [header, "-" * len(header)]
+    for name, row in rows.items():
+        lines.append(
+            f"{name:<20} {row['count']:>6} {row['mean_ms']:>10.1f} "
+            f"{row['p50_ms']:>10.1f} {row['p95_ms']:>10.1f} {row['max_ms']:>10.1f}"
+        )
+    return "\n".join(lines)
@@ -47,6 +47,7 @@ Usage:
 
 Available Browsers:
     - CometBrowser: Perplexity Comet with AI Assistant
+    - ChromiumHeadlessBrowser: Headless Chromium on Linux (--headless=new)
     - (Future) ChromeBrowser: Google Chrome
     - (Future) FirefoxBrowser: Mozilla Firefox
     - (Future) EdgeBrowser: Microsoft Edge
@@ -54,6 +55,7 @@ Available Browsers:
 
 from .base import BaseBrowser, BrowserInfo
 from .comet import CometBrowser
+from .chromium import ChromiumHeadlessBrowser
 from .factory import BrowserFactory, BrowserType, create_browser
 
 __all__ = [
@@ -63,6 +65,7 @@ __all__ = [
     
     # Concrete implementations
     "CometBrowser",
+    "ChromiumHeadlessBrowser",
     
     # Factory
     "BrowserFactory",
@@ -14,6 +14,12 @@ from abc import ABC, abstractmethod
 from typing import Optional, List, Any
 from dataclasses import dataclass
 
+from profiling.timer import StepTimer
+from profiling.driver_proxy import get_command_recorder
+from logger import get_logger
+
+log = get_logger(__name__)
+
 
 @dataclass
 class BrowserInfo:
@@ -43,6 +49,12 @@ class BaseBrowser(ABC):
         self._pipeline = None
         self._driver = None
         self._is_launched = False
+        self.timer = StepTimer()  # Shared with launcher and pipeline for per-step timings
+        self.instrument_driver = False  # Count/time every WebDriver command (set before launch)
+        self.reuse_existing = False  # Attach to an already running browser if healthy (set before launch)
+        self.enable_watchdog = False  # Detect crashes/hangs and respawn before the next run (set before launch)
+        self.command_timeout = 30.0  # Hard per-command WebDriver deadline when the watchdog is enabled
+        self.watchdog = None
     
     # ==================== Abstract Methods ====================
     
@@ -124,36 +136,59 @@ class BaseBrowser(ABC):
             True if launch successful, False otherwise
         """
         if self._is_launched:
-            print("[INFO] Browser already launched")
+            log.info("Browser already launched")
             return True
         
         try:
-            print(f"[INFO] Launching {self.get_browser_info().name}...")
+            log.info("Launching %s...", self.get_browser_info().name)
             
             # Create launcher if not exists
             if not self._launcher:
                 self._launcher = self.create_launcher()
+            self._launcher.timer = self.timer
+            if self.instrument_driver:
+                self._launcher.config.instrument_driver = True
+            if self.reuse_existing:
+                self._launcher.config.reuse_existing = True
             
             # Launch and attach
-            self._driver = self._launcher.launch_and_attach()
+            self._driver = self._launcher.launch_and_attach(kill_existing=kill_existing)
             
             if not self._driver:
-                print("[ERROR] Failed to launch browser")
+                log.error("Failed to launch browser")
                 return False
             
             # Create navigator
             self._navigator = self.create_navigator(self._driver)
             
+            if self.enable_watchdog:
+                self._start_watchdog()
+            
             self._is_launched = True
-            print(f"[SUCCESS] {self.get_browser_info().name} launched")
+            log.info("[SUCCESS] %s launched", self.get_browser_info().name)
             return True
             
         except Exception as e:
-            print(f"[ERROR] Launch failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Launch failed: %s", e, exc_info=True)
             return False
     
+    def _start_watchdog(self):
+        """Start crash/hang detection for the current launch."""
+        from .watchdog import BrowserWatchdog
+        
+        self.watchdog = BrowserWatchdog(
+            debug_port=self._launcher.config.debug_port,
+            process=self._launcher.process,
+            command_timeout=self.command_timeout
+        ).start()
+        self.watchdog.guard_driver(self._driver)
+    
+    def _stop_watchdog(self):
+        """Stop crash detection (before an intentional shutdown)."""
+        if self.watchdog:
+            self.watchdog.stop()
+            self.watchdog = None
+    
     def navigate_to(self, url: str, wait_time: int = 5):
         """
         Navigate to a URL.
@@ -209,59 +244,84 @@ class BaseBrowser(ABC):
         Returns:
             PipelineResult object
         """
-        print("=" * 60)
-        print(f"BROWSER FACADE - {self.get_browser_info().name}")
-        print("=" * 60)
+        log.info('=' * 60)
+        log.info("BROWSER FACADE - %s", self.get_browser_info().name)
+        log.info('=' * 60)
+        
+        # Fresh timer per run so PipelineResult.timings covers only this run
+        self.timer = StepTimer(hooks=config.timing_hooks)
+        if self._launcher:
+            self._launcher.timer = self.timer
+        recorder = get_command_recorder(self._driver)
+        if recorder:
+            recorder.reset()
         
         try:
+            # Respawn a browser the watchdog saw crash during the previous run
+            if self.watchdog and self.watchdog.crashed.is_set():
+                log.warning("[FACADE] Previous run crashed (%s) - respawning browser",
+                            self.watchdog.crash_reason)
+                if not self.restart():
+                    from pipeline.base import PipelineResult
+                    return PipelineResult(
+                        success=False,
+                        message="Failed to respawn browser after crash",
+                        steps_completed=[],
+                        timings=self.timer.totals()
+                    )
+            
             # Step 1: Launch browser (if not already launched)
             if not self._is_launched:
-                print("\n[FACADE] Step 1: Launching browser...")
+                log.info("\n[FACADE] Step 1: Launching browser...")
                 if not self.launch():
                     from pipeline.base import PipelineResult
                     return PipelineResult(
                         success=False,
                         message="Failed to launch browser",
-                        steps_completed=[]
+                        steps_completed=[],
+                        timings=self.timer.totals()
                     )
-                print(f"[FACADE] ✓ Browser launched")
+                log.info("[FACADE] ✓ Browser launched")
             else:
-                print(f"\n[FACADE] Browser already launched, reusing...")
+                log.info("\n[FACADE] Browser already launched, reusing...")
             
             # Step 2: Create and run pipeline workflow
             # Pipeline will handle navigation to target URL
-            print(f"\n[FACADE] Step 2: Creating and running pipeline...")
+            log.info("\n[FACADE] Step 2: Creating and running pipeline...")
             self._pipeline = self.create_pipeline(
                 driver=self._driver,
                 navigator=self._navigator,
                 config=config,
                 **kwargs
             )
+            self._pipeline.timer = self.timer
+            self._pipeline.watchdog = self.watchdog
             
             result = self._pipeline.run()
+            if not result.success and self.watchdog and self.watchdog.crashed.is_set():
+                result.message = f"Browser crashed: {self.watchdog.crash_reason}"
             
             # Step 4: Handle keep_open option
             if config.keep_open and result.success:
-                print("\n" + "=" * 60)
-                print(f"✓ FACADE COMPLETE - Browser remains open")
-                print("=" * 60)
-                print("[INFO] Press Enter to close browser and exit...")
+                log.info('\n' + '=' * 60)
+                log.info("✓ FACADE COMPLETE - Browser remains open")
+                log.info('=' * 60)
+                log.info("Press Enter to close browser and exit...")
                 input()
                 self.quit()
             
             return result
             
         except Exception as e:
-            print(f"[FACADE ERROR] Pipeline execution failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[FACADE ERROR] Pipeline execution failed: %s", e, exc_info=True)
             
             from pipeline.base import PipelineResult
             return PipelineResult(
                 success=False,
                 message=f"Facade error: {e}",
                 driver=self._driver,
-                steps_completed=[]
+                steps_completed=[],
+                timings=self.timer.totals()
             )
     
     def get_driver(self):
@@ -310,14 +370,47 @@ class BaseBrowser(ABC):
         """
         Close the browser and clean up resources.
         """
+        self._stop_watchdog()
         if self._driver:
             try:
-                print(f"[INFO] Closing {self.get_browser_info().name}...")
+                log.info("Closing %s...", self.get_browser_info().name)
                 self._driver.quit()
                 self._is_launched = False
-                print("[SUCCESS] Browser closed")
+                log.info("[SUCCESS] Browser closed")
             except Exception as e:
-                print(f"[WARNING] Error closing browser: {e}")
+                log.warning("Error closing browser: %s", e)
+    
+    def restart(self) -> bool:
+        """
+        Close the browser and launch a fresh one.
+        
+        Always does a full launch (attach-only reuse is skipped, since the
+        point is to get rid of the running process). The navigator is
+        re-created for the new driver.
+        
+        Returns:
+            True if the new browser launched
+        """
+        self._stop_watchdog()
+        if self._launcher:
+            self._launcher.quit()  # Quits the driver and terminates the process it started
+        else:
+            self.quit()
+        self._driver = None
+        self._navigator = None
+        self._pipeline = None
+        self._is_launched = False
+        
+        reuse_existing = self.reuse_existing
+        self.reuse_existing = False
+        if self._launcher:
+            self._launcher.config.reuse_existing = False
+        try:
+            return self.launch(kill_existing=True)
+        finally:
+            self.reuse_existing = reuse_existing
+            if self._launcher:
+                self._launcher.config.reuse_existing = reuse_existing
     
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,35 @@
+"""
+Headless Chromium Browser Package
+=================================
+Linux headless Chromium (--headless=new) execution backend.
+
+Components:
+- ChromiumHeadlessBrowser: Main browser class (facade)
+- ChromiumHeadlessLauncher: Launches Chromium headless with a private profile
+- ChromiumNavigator: Plain navigation (no app-mode fallbacks or fixed sleeps)
+- ChromiumPipeline: HTML corpus runs or Sidecar-compatible queries
+
+Usage:
+    from browser import BrowserFactory, BrowserType
+    from pipeline import PipelineConfig
+
+    browser = BrowserFactory.create(BrowserType.CHROMIUM_HEADLESS)
+    result = browser.run_pipeline(
+        PipelineConfig(target_url="about:blank"),
+        html_folder="htmls/XSS_DOM"
+    )
+    browser.quit()
+"""
+
+from .browser import ChromiumHeadlessBrowser
+from .launcher import ChromiumHeadlessLauncher, find_chromium_executable
+from .navigator import ChromiumNavigator
+from .pipeline import ChromiumPipeline
+
+__all__ = [
+    'ChromiumHeadlessBrowser',
+    'ChromiumHeadlessLauncher',
+    'find_chromium_executable',
+    'ChromiumNavigator',
+    'ChromiumPipeline'
+]
@@ -0,0 +1,117 @@
+from typing import List
+
+# Import base class from parent
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from browser.base import BaseBrowser, BrowserInfo
+
+# Import Chromium-specific components from same package
+from .launcher import ChromiumHeadlessLauncher, find_chromium_executable
+from .navigator import ChromiumNavigator
+from .pipeline import ChromiumPipeline
+
+
+class ChromiumHeadlessBrowser(BaseBrowser):
+    """
+    Headless Chromium browser implementation (Linux execution backend).
+    """
+
+    def get_browser_info(self) -> BrowserInfo:
+        """Get headless Chromium browser information."""
+        executable = find_chromium_executable()
+        return BrowserInfo(
+            name="Chromium (headless)",
+            version=None,
+            executable_path=str(executable) if executable else None,
+            supports_devtools=True,
+            supports_extensions=False  # Launched with --disable-extensions
+        )
+
+    def create_launcher(self):
+        """
+        Create ChromiumHeadlessLauncher.
+
+        Every launcher gets its own free debug port and temporary profile,
+        so several headless instances can run in one process or machine.
+
+        Returns:
+            ChromiumHeadlessLauncher instance
+        """
+        return ChromiumHeadlessLauncher()
+
+    def create_navigator(self, driver):
+        """
+        Create ChromiumNavigator.
+
+        Args:
+            driver: Selenium WebDriver instance
+
+        Returns:
+            ChromiumNavigator instance
+        """
+        return ChromiumNavigator(driver)
+
+    def create_pipeline(self, driver, navigator, config, **kwargs):
+        """
+        Create ChromiumPipeline.
+
+        Args:
+            driver: Selenium WebDriver (already attached to headless Chromium)
+            navigator: ChromiumNavigator instance (already created)
+            config: PipelineConfig instance
+            **kwargs: Optional parameters (html_folder, pattern, query)
+
+        Returns:
+            ChromiumPipeline instance
+        """
+        return ChromiumPipeline(
+            driver=driver,
+            navigator=navigator,
+            config=config,
+            **kwargs
+        )
+
+    def get_attack_names(self) -> List[str]:
+        """
+        Get attack/vulnerability names for plain Chromium.
+        Returns:
+            List of attack names for fuzzing/testing
+        """
+        return [
+            # Standard web attacks
+            "XSS_REFLECTED",
+            "XSS_STORED",
+            "XSS_DOM",
+            "CSRF",
+            "CLICKJACKING",
+            "OPEN_REDIRECT",
+            "PATH_TRAVERSAL",
+            "SQL_INJECTION",
+            "COMMAND_INJECTION",
+            "XXE",
+            "SSRF",
+
+            # Browser-specific attacks
+            "PROTOTYPE_POLLUTION",
+            "POSTMESSAGE_XSS",
+            "CORS_MISCONFIGURATION",
+            "CSP_BYPASS",
+            "SRI_BYPASS",
+            "DANGLING_MARKUP",
+            "MUTATION_XSS",
+            "DEVTOOLS_PROTOCOL_ABUSE",
+
+            # File handling (especially for file:// URLs)
+            "LOCAL_FILE_INCLUSION",
+            "FILE_URI_LEAK",
+            "SAME_ORIGIN_BYPASS",
+
+            # Chromium engine attacks
+            "V8_EXPLOITATION",
+            "RENDERER_RCE",
+            "SANDBOX_ESCAPE",
+            "USE_AFTER_FREE",
+            "TYPE_CONFUSION",
+            "BUFFER_OVERFLOW",
+        ]
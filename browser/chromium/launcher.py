@@ -0,0 +1,199 @@
+"""
+Headless Chromium Launcher
+==========================
+Launches Chromium (or Chrome) with --headless=new on Linux and attaches
+Selenium over the DevTools port.
+
+Unlike Comet, no window, Windows install path or Sidecar start page is
+needed, so this launcher is suited to high-throughput HTML-corpus runs,
+CI and benchmarks.
+"""
+
+from pathlib import Path
+from typing import List, Any, Optional
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+
+# Import from parent package's browser_launcher
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from browser_launcher.base import BrowserLauncher, BrowserConfig
+from logger import get_logger
+
+log = get_logger(__name__)
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+
+# Executable names tried (in order) when CHROMIUM_PATH is not set
+CHROMIUM_EXECUTABLES = [
+    "chromium",
+    "chromium-browser",
+    "google-chrome",
+    "google-chrome-stable",
+    "chrome",
+]
+
+
+
+def find_chromium_executable() -> Optional[Path]:
+    """
+    Locate a Chromium/Chrome binary.
+
+    Checks the CHROMIUM_PATH environment variable, then PATH.
+
+    Returns:
+        Path to the executable, or None if not found
+    """
+    env_path = os.environ.get("CHROMIUM_PATH")
+    if env_path:
+        return Path(env_path)
+
+    for name in CHROMIUM_EXECUTABLES:
+        found = shutil.which(name)
+        if found:
+            return Path(found)
+    return None
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """
+    Pick a currently unused TCP port.
+
+    Args:
+        host: Interface the port must be free on
+
+    Returns:
+        Port number chosen by the OS
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class ChromiumHeadlessLauncher(BrowserLauncher):
+    """
+    Launcher for headless Chromium.
+
+    Without an explicit config, each launcher picks its own free debug port
+    and a fresh temporary profile directory (removed again on quit). Only
+    processes started with that profile are killed on relaunch, so any
+    number of instances can run side by side.
+    """
+
+    def __init__(self, config: Optional[BrowserConfig] = None,
+                 chromedriver_path: Optional[str] = None):
+        """
+        Initialize headless Chromium launcher.
+
+        Args:
+            config: Browser configuration (auto-detected if not provided)
+            chromedriver_path: ChromeDriver to use (defaults to PATH, then Selenium Manager)
+        """
+        self._owns_profile = config is None
+        if config is None:
+            executable = find_chromium_executable()
+            if executable is None:
+                log.warning("No Chromium executable found (set CHROMIUM_PATH)")
+
+            debug_port = find_free_port()
+            config = BrowserConfig(
+                executable_path=executable or Path("chromium"),
+                debug_port=debug_port,
+                start_maximized=False,
+                allow_file_access=True,
+                disable_web_security=False,
+                user_data_dir=Path(tempfile.mkdtemp(prefix=f"chromium_headless_{debug_port}_"))
+            )
+
+        super().__init__(config)
+        self.chromedriver_path = chromedriver_path
+
+    def get_launch_args(self) -> List[str]:
+        """Get headless Chromium launch arguments"""
+        args = [
+            str(self.config.executable_path),
+            "--headless=new",
+            f"--remote-debugging-port={self.config.debug_port}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--mute-audio",
+            "--window-size=1280,900",
+        ]
+
+        # Chromium refuses to start sandboxed as root (containers, CI)
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            args.append("--no-sandbox")
+
+        if self.config.start_maximized:
+            args.append("--start-maximized")
+
+        if self.config.allow_file_access:
+            args.extend([
+                "--allow-file-access-from-files",
+                "--allow-file-access",
+            ])
+
+        if self.config.disable_web_security:
+            args.append("--disable-web-security")
+
+        if self.config.user_data_dir:
+            args.append(f"--user-data-dir={self.config.user_data_dir}")
+
+        # Add any extra custom arguments
+        args.extend(self.config.extra_args)
+
+        args.append("about:blank")
+
+        return args
+
+    def get_process_names(self) -> List[str]:
+        """
+        Get process match strings for this instance.
+
+        Matches on the profile argument rather than the executable name so
+        that other Chromium/Chrome processes on the machine are never killed.
+        """
+        if self.config.user_data_dir:
+            return [f"--user-data-dir={self.config.user_data_dir}"]
+        return [f"--remote-debugging-port={self.config.debug_port}"]
+
+    def attach_selenium(self) -> Any:
+        """Attach Selenium WebDriver to running headless Chromium"""
+        if not SELENIUM_AVAILABLE:
+            log.error("[!] Selenium not installed")
+            return None
+
+        opts = Options()
+        opts.debugger_address = f"127.0.0.1:{self.config.debug_port}"
+
+        # No path = let Selenium Manager resolve a matching ChromeDriver
+        driver_path = self.chromedriver_path or shutil.which("chromedriver")
+        service = Service(driver_path) if driver_path else Service()
+        return webdriver.Chrome(service=service, options=opts)
+
+    def quit(self):
+        """Clean up resources and remove the launcher's own temporary profile"""
+        super().quit()
+        if not self._owns_profile or not self.config.user_data_dir:
+            return
+        if self.process:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.config.user_data_dir, ignore_errors=True)
@@ -0,0 +1,135 @@
+"""
+Headless Chromium Navigator
+===========================
+Navigation implementation for headless Chromium.
+
+Headless Chromium has none of Comet's app-mode quirks: driver.get() blocks
+until the page load event, so there are no JavaScript/CDP fallbacks and
+no fixed post-navigation sleep unless one is requested.
+"""
+
+from pathlib import Path
+from typing import Any, List
+import time
+
+# Import from parent package's navigator
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from navigator.base import Navigator, NavigationResult
+from corpus.reader import scan_files
+from logger import get_logger
+
+log = get_logger(__name__)
+
+
+class ChromiumNavigator(Navigator):
+    """
+    Navigator implementation for headless Chromium.
+    """
+
+    def __init__(self, driver: Any):
+        """
+        Initialize headless Chromium navigator.
+
+        Args:
+            driver: Selenium WebDriver attached to headless Chromium
+        """
+        super().__init__(driver)
+
+    def navigate_to_url(self, url: str, wait_time: float = 0.0) -> NavigationResult:
+        """
+        Navigate to a URL.
+
+        Args:
+            url: Target URL
+            wait_time: Extra seconds to wait after the load event
+
+        Returns:
+            NavigationResult with success status
+        """
+        log.debug("Target: %s", url)
+
+        try:
+            self.driver.get(url)
+        except Exception as e:
+            log.error("Navigation failed: %s", e)
+            return NavigationResult(False, url, f"Navigation failed: {e}", e)
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        current_url = self.get_current_url()
+        log.debug("Current URL after driver.get(): %s", current_url)
+
+        if url.startswith('file://'):
+            if current_url.lower().startswith('file://'):
+                return NavigationResult(True, current_url, "File URL loaded successfully")
+            log.error("File URL did not load: %s", url)
+            return NavigationResult(False, current_url, "File URL did not load")
+
+        # Redirects are fine as long as something other than the blank page loaded
+        if current_url and current_url != "about:blank":
+            return NavigationResult(True, current_url, "Navigation successful")
+
+        log.error("Navigation failed - still on %s", current_url or "no page")
+        return NavigationResult(False, current_url, "Navigation failed")
+
+    def open_local_html_files(
+        self,
+        folder_path: Path,
+        pattern: str = "*.html",
+        new_tabs: bool = False,
+        wait_per_page: float = 0.0,
+        recursive: bool = False,
+        shard: int = 0,
+        num_shards: int = 1
+    ) -> List[str]:
+        """
+        Open multiple local HTML files.
+
+        Defaults to loading each file in the current tab, one after another,
+        which is the fast path for corpus runs.
+
+        Args:
+            folder_path: Directory containing HTML files
+            pattern: Glob pattern for files
+            new_tabs: Open in new tabs (True) or reuse tab (False)
+            wait_per_page: Wait time between files
+            recursive: Also open files in subdirectories
+            shard: Shard of the files to open (with num_shards, for parallel workers)
+            num_shards: Number of shards (1 = all files)
+
+        Returns:
+            List of file:// URLs opened
+        """
+        folder = Path(folder_path)
+        if not folder.exists():
+            log.error("HTML folder not found: %s", folder)
+            return []
+
+        opened = []
+        total = 0
+        for file_path in scan_files(folder, pattern, recursive=recursive, shard=shard, num_shards=num_shards):
+            total += 1
+            file_url = Path(file_path).resolve().as_uri()
+
+            if new_tabs:
+                try:
+                    self.driver.switch_to.new_window('tab')
+                    self.driver.get(file_url)
+                    opened.append(file_url)
+                except Exception as e:
+                    log.error("Failed to open %s: %s", file_url, e)
+            else:
+                result = self.navigate_to_url(file_url)
+                if result.success:
+                    opened.append(file_url)
+
+            if wait_per_page > 0:
+                time.sleep(wait_per_page)
+
+        if not total:
+            log.info("No files matching %s in %s", pattern, folder)
+            return []
+        log.info("Opened %s/%s files", len(opened), total)
+        return opened
@@ -0,0 +1,140 @@
+"""
+Headless Chromium Pipeline
+==========================
+Pipeline implementation for headless Chromium.
+
+Workflow (after Browser facade has launched headless Chromium):
+1. Pre-workflow: Navigate to config.target_url (unless already there)
+2. Execute workflow, one of:
+   - HTML corpus mode: load every file in `html_folder` in turn
+   - Query mode: send `query` through the Sidecar conversion handler
+     (works against any Sidecar-compatible page, e.g. the benchmark's
+     fake Sidecar)
+3. Post-workflow: nothing to wait for (no fixed sleeps)
+"""
+
+from typing import Optional
+
+# Import from parent package's pipeline
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from pipeline.base import BasePipeline, PipelineConfig, PipelineResult
+from logger import get_logger
+
+log = get_logger(__name__)
+
+
+class ChromiumPipeline(BasePipeline):
+    """
+    Pipeline implementation for headless Chromium.
+    """
+
+    def __init__(self, driver, navigator, config, **kwargs):
+        """
+        Initialize headless Chromium pipeline.
+
+        Args:
+            driver: Selenium WebDriver (already attached to headless Chromium)
+            navigator: ChromiumNavigator instance (already created)
+            config: Pipeline configuration
+            **kwargs: Optional parameters (html_folder, pattern, query, read_responses, save_text, reuse_page)
+        """
+        super().__init__(driver, navigator, config, **kwargs)
+
+        # HTML corpus mode
+        self.html_folder: Optional[str] = kwargs.get('html_folder', None)
+        self.pattern: str = kwargs.get('pattern', "*.html")
+
+        # Query mode (Sidecar-compatible page)
+        self.query: Optional[str] = kwargs.get('query', None)
+        self.read_responses: bool = kwargs.get('read_responses', True)
+        self.save_text: Optional[str] = kwargs.get('save_text', None)
+        self.conversion = None
+
+        self.reuse_page: bool = kwargs.get('reuse_page', False)
+
+    def get_browser_name(self) -> str:
+        """Return the browser name."""
+        return "Chromium (headless)"
+
+    def pre_workflow_steps(self) -> bool:
+        """
+        Pre-workflow: Navigate to the target URL.
+
+        Returns:
+            True if successful
+        """
+        target_url = self.config.target_url
+        if not target_url or target_url == "about:blank":
+            return True
+
+        if self.reuse_page and self.navigator.get_current_url() == target_url:
+            log.info("[CHROMIUM] ✓ Target already loaded - reusing page")
+            return True
+
+        with self.timer.measure("navigation"):
+            nav_result = self.navigator.navigate_to_url(target_url)
+
+        if not nav_result.success:
+            log.error("[CHROMIUM] ✗ Failed to navigate: %s", nav_result.message)
+            return False
+        return True
+
+    def execute_workflow(self) -> bool:
+        """
+        Execute workflow: load the HTML corpus or send the query.
+
+        Returns:
+            True if successful (or nothing to do)
+        """
+        if self.html_folder:
+            log.info("[CHROMIUM] Loading HTML corpus from %s (%s)", self.html_folder, self.pattern)
+            with self.timer.measure("corpus"):
+                opened = self.navigator.open_local_html_files(self.html_folder, self.pattern)
+            self.metadata['opened_files'] = opened
+            return bool(opened)
+
+        if self.query:
+            from conversion import ConversionFactory, ConversionType
+
+            if not self.conversion:
+                self.conversion = ConversionFactory.create(
+                    ConversionType.COMET,
+                    self.driver,
+                    self.navigator
+                )
+            self.conversion.timer = self.timer
+            self.conversion.watchdog = self.watchdog
+
+            conversion_result = self.conversion.execute(
+                query=self.query,
+                capture=self.read_responses,
+                save_text=self.save_text,
+                max_wait=60.0
+            )
+
+            self.metadata['conversion_result'] = {
+                'success': conversion_result.success,
+                'query': conversion_result.query,
+                'response': conversion_result.response,
+                'text_filepath': conversion_result.text_filepath,
+                'error': conversion_result.error
+            }
+
+            if not conversion_result.success:
+                log.error("[CHROMIUM] ✗ Conversion failed: %s", conversion_result.error)
+                return False
+            return True
+
+        log.info("[CHROMIUM] No HTML folder or query provided, skipping")
+        return True
+
+    def post_workflow_steps(self) -> bool:
+        """
+        Post-workflow: nothing to wait for.
+
+        Returns:
+            True (always succeeds)
+        """
+        return True
@@ -8,6 +8,7 @@ Components:
 - CometBrowserLauncher: Launches Comet executable
 - CometNavigator: Navigation with Sidecar support
 - CometPipeline: Workflow execution
+- TabMultiplexer: Concurrent Sidecar conversations in K tabs (CDP sessions)
 
 Usage:
     from browser.comet import CometBrowser
@@ -20,10 +21,13 @@ from .browser import CometBrowser
 from .launcher import CometBrowserLauncher
 from .navigator import CometNavigator
 from .pipeline import CometPipeline
+from .multiplex import SidecarTab, TabMultiplexer
 
 __all__ = [
     'CometBrowser',
     'CometBrowserLauncher',
     'CometNavigator',
-    'CometPipeline'
+    'CometPipeline',
+    'SidecarTab',
+    'TabMultiplexer'
 ]
@@ -5,6 +5,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from browser.base import BaseBrowser, BrowserInfo
+from logger import get_logger
+
+log = get_logger(__name__)
 
 # Import Comet-specific components from same package
 from .launcher import CometBrowserLauncher
@@ -132,18 +135,18 @@ class CometBrowser(BaseBrowser):
         
         try:
             import archive.comet_ui_automation as comet_ui
-            print("[INFO] Activating Comet Assistant...")
+            log.info("Activating Comet Assistant...")
             success = comet_ui.click_assistant_button_ui()
             
             if success:
-                print("[SUCCESS] Assistant activated")
+                log.info("[SUCCESS] Assistant activated")
             else:
-                print("[WARNING] Failed to activate Assistant")
+                log.warning("Failed to activate Assistant")
             
             return success
             
         except Exception as e:
-            print(f"[ERROR] Assistant activation failed: {e}")
+            log.error("Assistant activation failed: %s", e)
             return False
     
     def open_sidecar(self, wait_time: int = 3) -> bool:
@@ -161,12 +164,12 @@ class CometBrowser(BaseBrowser):
         
         SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
         
-        print(f"[INFO] Opening Perplexity Sidecar...")
+        log.info("Opening Perplexity Sidecar...")
         result = self.navigate_to(SIDECAR_URL, wait_time=wait_time)
         
         if result.success:
-            print(f"[SUCCESS] Sidecar opened")
+            log.info("[SUCCESS] Sidecar opened")
             return True
         else:
-            print(f"[WARNING] Failed to open Sidecar: {result.message}")
+            log.warning("Failed to open Sidecar: %s", result.message)
             return False
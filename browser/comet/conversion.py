@@ -6,6 +6,7 @@ Conversion implementation for Perplexity Comet browser.
 Handles sending queries and capturing responses from Perplexity Sidecar.
 """
 
+import logging
 import time
 from typing import Any, Optional
 
@@ -14,6 +15,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from conversion.base import BaseConversion
+from logger import get_logger
+
+log = get_logger(__name__)
 
 
 class CometConversion(BaseConversion):
@@ -55,253 +59,256 @@ class CometConversion(BaseConversion):
             from selenium.webdriver.support import expected_conditions as EC
             from selenium.common.exceptions import StaleElementReferenceException
             
-            print(f"[COMET CONVERSION] Sending query...")
-            print(f"[COMET CONVERSION] Query: '{query}'")
+            log.info("[COMET CONVERSION] Sending query...")
+            log.debug("[COMET CONVERSION] Query: '%s'", query)
+            self.submitted_ns = None
             
             # Bring window to focus
             try:
                 self.driver.switch_to.window(self.driver.current_window_handle)
                 self.driver.execute_script("window.focus();")
-                print(f"[COMET CONVERSION] Window focused")
+                log.debug("[COMET CONVERSION] Window focused")
                 time.sleep(2)  # Give more time for page to be ready
             except Exception as e:
-                print(f"[WARN] Could not focus window: {e}")
+                log.warning("Could not focus window: %s", e)
             
-            # Wait for input field to be available
-            print(f"[COMET CONVERSION] Looking for input field...")
+            with self.timer.measure("editor_lookup"):
+                # Wait for input field to be available
+                log.debug("[COMET CONVERSION] Looking for input field...")
             
-            # Add extra wait time to ensure page is fully loaded
-            print(f"[COMET CONVERSION] Waiting for page to be fully interactive...")
-            time.sleep(3)
+                # Add extra wait time to ensure page is fully loaded
+                log.debug("[COMET CONVERSION] Waiting for page to be fully interactive...")
+                time.sleep(3)
             
-            # Debug: Check current URL and page state
-            current_url = self.driver.current_url
-            print(f"[DEBUG] Current URL: {current_url}")
+                # Debug: Check current URL and page state
+                current_url = self.driver.current_url
+                log.debug("Current URL: %s", current_url)
             
-            # Try to find the ask-input element with multiple fallback strategies
-            ask_input = None
+                # Try to find the ask-input element with multiple fallback strategies
+                ask_input = None
             
-            # Strategy 1: Wait for Lexical editor to be ready (most reliable)
-            try:
-                print("[DEBUG] Strategy 1: Waiting for Lexical editor...")
-                
-                def wait_for_lexical_editor():
-                    return self.driver.execute_script('''
-                        var element = document.getElementById("ask-input");
-                        return element && element.getAttribute("data-lexical-editor") === "true";
-                    ''')
-                
-                WebDriverWait(self.driver, 10).until(lambda driver: wait_for_lexical_editor())
-                ask_input = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "ask-input"))
-                )
-                print("[DEBUG] ✓ Strategy 1 success: Lexical editor ready")
+                # Strategy 1: Wait for Lexical editor to be ready (most reliable)
+                try:
+                    log.debug("Strategy 1: Waiting for Lexical editor...")
                 
-            except Exception as e1:
-                print(f"[DEBUG] Strategy 1 failed: {e1}")
+                    def wait_for_lexical_editor():
+                        return self.driver.execute_script('''
+                            var element = document.getElementById("ask-input");
+                            return element && element.getAttribute("data-lexical-editor") === "true";
+                        ''')
                 
-                # Strategy 2: Look for ask-input by ID (less strict)
-                try:
-                    print("[DEBUG] Strategy 2: Looking for ask-input by ID...")
+                    WebDriverWait(self.driver, 10).until(lambda driver: wait_for_lexical_editor())
                     ask_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.ID, "ask-input"))
+                        EC.element_to_be_clickable((By.ID, "ask-input"))
                     )
-                    # Verify it's visible and enabled
-                    if ask_input.is_displayed() and ask_input.is_enabled():
-                        print("[DEBUG] ✓ Strategy 2 success: Found ask-input")
-                    else:
-                        raise Exception("Element not interactive")
+                    log.debug("✓ Strategy 1 success: Lexical editor ready")
+                
+                except Exception as e1:
+                    log.debug("Strategy 1 failed: %s", e1)
+                
+                    # Strategy 2: Look for ask-input by ID (less strict)
+                    try:
+                        log.debug("Strategy 2: Looking for ask-input by ID...")
+                        ask_input = WebDriverWait(self.driver, 5).until(
+                            EC.presence_of_element_located((By.ID, "ask-input"))
+                        )
+                        # Verify it's visible and enabled
+                        if ask_input.is_displayed() and ask_input.is_enabled():
+                            log.debug("✓ Strategy 2 success: Found ask-input")
+                        else:
+                            raise Exception("Element not interactive")
                         
-                except Exception as e2:
-                    print(f"[DEBUG] Strategy 2 failed: {e2}")
+                    except Exception as e2:
+                        log.debug("Strategy 2 failed: %s", e2)
                     
-                    # Strategy 3: Find any contenteditable with lexical attribute
-                    try:
-                        print("[DEBUG] Strategy 3: Looking for contenteditable with lexical...")
-                        contenteditables = self.driver.find_elements(By.CSS_SELECTOR, "[contenteditable='true']")
-                        print(f"[DEBUG] Found {len(contenteditables)} contenteditable elements")
+                        # Strategy 3: Find any contenteditable with lexical attribute
+                        try:
+                            log.debug("Strategy 3: Looking for contenteditable with lexical...")
+                            contenteditables = self.driver.find_elements(By.CSS_SELECTOR, "[contenteditable='true']")
+                            log.debug("Found %s contenteditable elements", len(contenteditables))
                         
-                        for idx, elem in enumerate(contenteditables):
-                            try:
-                                lexical = elem.get_attribute('data-lexical-editor')
-                                elem_id = elem.get_attribute('id')
-                                print(f"[DEBUG] Element {idx}: id='{elem_id}' lexical='{lexical}'")
+                            for idx, elem in enumerate(contenteditables):
+                                try:
+                                    lexical = elem.get_attribute('data-lexical-editor')
+                                    elem_id = elem.get_attribute('id')
+                                    log.debug("Element %s: id='%s' lexical='%s'", idx, elem_id, lexical)
                                 
-                                # Prefer ask-input, but accept any lexical editor
-                                if elem_id == 'ask-input' or lexical == 'true':
-                                    if elem.is_displayed() and elem.is_enabled():
-                                        ask_input = elem
-                                        print(f"[DEBUG] ✓ Strategy 3 success: Using element {idx}")
-                                        break
-                            except Exception as elem_err:
-                                print(f"[DEBUG] Element {idx} check failed: {elem_err}")
+                                    # Prefer ask-input, but accept any lexical editor
+                                    if elem_id == 'ask-input' or lexical == 'true':
+                                        if elem.is_displayed() and elem.is_enabled():
+                                            ask_input = elem
+                                            log.debug("✓ Strategy 3 success: Using element %s", idx)
+                                            break
+                                except Exception as elem_err:
+                                    log.debug("Element %s check failed: %s", idx, elem_err)
                                 
-                        if not ask_input:
-                            raise Exception("No suitable contenteditable found")
+                            if not ask_input:
+                                raise Exception("No suitable contenteditable found")
                             
-                    except Exception as e3:
-                        print(f"[DEBUG] Strategy 3 failed: {e3}")
-                        raise Exception("All input detection strategies failed")
-            
-            if ask_input:
+                        except Exception as e3:
+                            log.debug("Strategy 3 failed: %s", e3)
+                            raise Exception("All input detection strategies failed")
+
+            with self.timer.measure("send"):
+                if ask_input:
                 
-                print(f"[COMET CONVERSION] ✓ Found ask-input element")
+                    log.debug("[COMET CONVERSION] ✓ Found ask-input element")
                 
-                # Wait for element to become fully interactive
-                print(f"[COMET CONVERSION] Waiting for element to be interactive...")
-                try:
-                    # Additional wait for element to become clickable
-                    WebDriverWait(self.driver, 10).until(
-                        lambda driver: ask_input.is_displayed() and ask_input.is_enabled()
-                    )
+                    # Wait for element to become fully interactive
+                    log.debug("[COMET CONVERSION] Waiting for element to be interactive...")
+                    try:
+                        # Additional wait for element to become clickable
+                        WebDriverWait(self.driver, 10).until(
+                            lambda driver: ask_input.is_displayed() and ask_input.is_enabled()
+                        )
                     
-                    # Try multiple methods to make it interactive
-                    # Method 1: Scroll to element
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", ask_input)
-                    time.sleep(0.5)
+                        # Try multiple methods to make it interactive
+                        # Method 1: Scroll to element
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", ask_input)
+                        time.sleep(0.5)
                     
-                    # Method 2: Try to focus via JavaScript first
-                    self.driver.execute_script("arguments[0].focus();", ask_input)
-                    time.sleep(0.5)
+                        # Method 2: Try to focus via JavaScript first
+                        self.driver.execute_script("arguments[0].focus();", ask_input)
+                        time.sleep(0.5)
                     
-                    print(f"[COMET CONVERSION] Element should now be interactive")
+                        log.debug("[COMET CONVERSION] Element should now be interactive")
                     
-                except Exception as wait_err:
-                    print(f"[COMET CONVERSION] Warning: Interactive wait failed: {wait_err}")
+                    except Exception as wait_err:
+                        log.warning("[COMET CONVERSION] Warning: Interactive wait failed: %s", wait_err)
                 
-                # Clear any existing content first - try JavaScript approach first
-                print(f"[COMET CONVERSION] Clearing input field...")
+                    # Clear any existing content first - try JavaScript approach first
+                    log.debug("[COMET CONVERSION] Clearing input field...")
                 
-                try:
-                    # Try JavaScript approach first (more reliable for contenteditable)
-                    self.driver.execute_script("""
-                        var element = arguments[0];
-                        element.focus();
+                    try:
+                        # Try JavaScript approach first (more reliable for contenteditable)
+                        self.driver.execute_script("""
+                            var element = arguments[0];
+                            element.focus();
                         
-                        // For Lexical editor, clear content properly
-                        if (element.getAttribute('data-lexical-editor') === 'true') {
-                            // Try to clear Lexical editor content
-                            element.innerHTML = '<p><br></p>';
-                        } else {
-                            // Regular contenteditable clear
-                            element.innerHTML = '';
-                        }
+                            // For Lexical editor, clear content properly
+                            if (element.getAttribute('data-lexical-editor') === 'true') {
+                                // Try to clear Lexical editor content
+                                element.innerHTML = '<p><br></p>';
+                            } else {
+                                // Regular contenteditable clear
+                                element.innerHTML = '';
+                            }
                         
-                        // Trigger input events
-                        element.dispatchEvent(new Event('input', { bubbles: true }));
-                        element.dispatchEvent(new Event('change', { bubbles: true }));
-                    """, ask_input)
+                            // Trigger input events
+                            element.dispatchEvent(new Event('input', { bubbles: true }));
+                            element.dispatchEvent(new Event('change', { bubbles: true }));
+                        """, ask_input)
                     
-                    time.sleep(0.5)
-                    print(f"[COMET CONVERSION] ✓ Cleared via JavaScript")
-                    
-                except Exception as js_err:
-                    print(f"[COMET CONVERSION] JavaScript clear failed: {js_err}")
-                    # Fallback to click approach
-                    try:
-                        ask_input.click()
-                        time.sleep(0.5)
-                        ask_input.send_keys(Keys.CONTROL + "a")
-                        time.sleep(0.2)
-                        ask_input.send_keys(Keys.DELETE)
                         time.sleep(0.5)
-                        print(f"[COMET CONVERSION] ✓ Cleared via keyboard")
-                    except Exception as kb_err:
-                        print(f"[COMET CONVERSION] Keyboard clear failed: {kb_err}")
+                        log.debug("[COMET CONVERSION] ✓ Cleared via JavaScript")
+                    
+                    except Exception as js_err:
+                        log.warning("[COMET CONVERSION] JavaScript clear failed: %s", js_err)
+                        # Fallback to click approach
+                        try:
+                            ask_input.click()
+                            time.sleep(0.5)
+                            ask_input.send_keys(Keys.CONTROL + "a")
+                            time.sleep(0.2)
+                            ask_input.send_keys(Keys.DELETE)
+                            time.sleep(0.5)
+                            log.debug("[COMET CONVERSION] ✓ Cleared via keyboard")
+                        except Exception as kb_err:
+                            log.warning("[COMET CONVERSION] Keyboard clear failed: %s", kb_err)
                 
-                # Now try to type the query
-                print(f"[COMET CONVERSION] Typing query...")
+                    # Now try to type the query
+                    log.debug("[COMET CONVERSION] Typing query...")
                 
-                # Try JavaScript typing first (more reliable for Lexical)
-                try:
-                    self.driver.execute_script("""
-                        var element = arguments[0];
-                        var text = arguments[1];
+                    # Try JavaScript typing first (more reliable for Lexical)
+                    try:
+                        self.driver.execute_script("""
+                            var element = arguments[0];
+                            var text = arguments[1];
                         
-                        element.focus();
+                            element.focus();
                         
-                        // For Lexical editor, simulate typing properly
-                        if (element.getAttribute('data-lexical-editor') === 'true') {
-                            // Clear and set content for Lexical
-                            element.innerHTML = '<p>' + text + '</p>';
-                        } else {
-                            // Regular contenteditable
-                            element.textContent = text;
-                        }
+                            // For Lexical editor, simulate typing properly
+                            if (element.getAttribute('data-lexical-editor') === 'true') {
+                                // Clear and set content for Lexical
+                                element.innerHTML = '<p>' + text + '</p>';
+                            } else {
+                                // Regular contenteditable
+                                element.textContent = text;
+                            }
                         
-                        // Trigger input events
-                        element.dispatchEvent(new Event('input', { bubbles: true }));
-                        element.dispatchEvent(new Event('change', { bubbles: true }));
-                    """, ask_input, query)
+                            // Trigger input events
+                            element.dispatchEvent(new Event('input', { bubbles: true }));
+                            element.dispatchEvent(new Event('change', { bubbles: true }));
+                        """, ask_input, query)
                     
-                    print(f"[COMET CONVERSION] ✓ Query typed via JavaScript")
-                    time.sleep(0.5)
+                        log.debug("[COMET CONVERSION] ✓ Query typed via JavaScript")
+                        time.sleep(0.5)
                     
-                except Exception as js_type_err:
-                    print(f"[COMET CONVERSION] JavaScript typing failed: {js_type_err}")
-                    # Fallback to regular send_keys
-                    try:
-                        ask_input.send_keys(query)
-                        print(f"[COMET CONVERSION] ✓ Query typed via send_keys")
-                    except Exception as sendkeys_err:
-                        print(f"[COMET CONVERSION] Send keys failed: {sendkeys_err}")
-                        raise Exception(f"All typing methods failed")
+                    except Exception as js_type_err:
+                        log.warning("[COMET CONVERSION] JavaScript typing failed: %s", js_type_err)
+                        # Fallback to regular send_keys
+                        try:
+                            ask_input.send_keys(query)
+                            log.debug("[COMET CONVERSION] ✓ Query typed via send_keys")
+                        except Exception as sendkeys_err:
+                            log.warning("[COMET CONVERSION] Send keys failed: %s", sendkeys_err)
+                            raise Exception(f"All typing methods failed")
                 
-                print(f"[COMET CONVERSION] ✓ Query typed successfully")
-                time.sleep(0.5)
+                    log.debug("[COMET CONVERSION] ✓ Query typed successfully")
+                    time.sleep(0.5)
                 
-                if submit:
-                    print(f"[COMET CONVERSION] Submitting query...")
-                    ask_input.send_keys(Keys.RETURN)
-                    time.sleep(1)
-                    print(f"[COMET CONVERSION] ✓ Query submitted")
+                    if submit:
+                        log.debug("[COMET CONVERSION] Submitting query...")
+                        ask_input.send_keys(Keys.RETURN)
+                        self.submitted_ns = time.perf_counter_ns()
+                        time.sleep(1)
+                        log.info("[COMET CONVERSION] ✓ Query submitted")
                 
-                print(f"[COMET CONVERSION] ✓ Found input element")
+                    log.debug("[COMET CONVERSION] ✓ Found input element")
                 
-                # Clear any existing content first
-                print(f"[COMET CONVERSION] Clearing input field...")
-                ask_input.click()
-                time.sleep(0.5)
+                    # Clear any existing content first
+                    log.debug("[COMET CONVERSION] Clearing input field...")
+                    ask_input.click()
+                    time.sleep(0.5)
                 
-                # Select all and delete (works with Lexical editor)
-                ask_input.send_keys(Keys.CONTROL + "a")
-                time.sleep(0.2)
-                ask_input.send_keys(Keys.DELETE)
-                time.sleep(0.5)
+                    # Select all and delete (works with Lexical editor)
+                    ask_input.send_keys(Keys.CONTROL + "a")
+                    time.sleep(0.2)
+                    ask_input.send_keys(Keys.DELETE)
+                    time.sleep(0.5)
                 
-                # Type the query using send_keys (should work with Lexical)
-                print(f"[COMET CONVERSION] Typing query...")
-                ask_input.send_keys(query)
+                    # Type the query using send_keys (should work with Lexical)
+                    log.debug("[COMET CONVERSION] Typing query...")
+                    ask_input.send_keys(query)
                 
-                print(f"[COMET CONVERSION] ✓ Query typed successfully")
-                time.sleep(0.5)
+                    log.debug("[COMET CONVERSION] ✓ Query typed successfully")
+                    time.sleep(0.5)
                 
-                if submit:
-                    print(f"[COMET CONVERSION] Submitting query...")
-                    ask_input.send_keys(Keys.RETURN)
-                    time.sleep(1)
-                    print(f"[COMET CONVERSION] ✓ Query submitted")
+                    if submit:
+                        log.debug("[COMET CONVERSION] Submitting query...")
+                        ask_input.send_keys(Keys.RETURN)
+                        self.submitted_ns = time.perf_counter_ns()
+                        time.sleep(1)
+                        log.info("[COMET CONVERSION] ✓ Query submitted")
                 
-                return True
-            else:
-                print(f"[COMET CONVERSION] ✗ Could not find suitable input element")
+                    return True
+                else:
+                    log.error("[COMET CONVERSION] ✗ Could not find suitable input element")
                 
-                # Debug: Save page source for inspection
-                try:
-                    from pathlib import Path
-                    debug_file = Path("output/debug_page_source.html")
-                    debug_file.parent.mkdir(parents=True, exist_ok=True)
-                    debug_file.write_text(self.driver.page_source, encoding='utf-8')
-                    print(f"[DEBUG] Page source saved to: {debug_file}")
-                except Exception as debug_err:
-                    print(f"[WARN] Could not save debug page source: {debug_err}")
+                    # Debug: Save page source for inspection
+                    try:
+                        from pathlib import Path
+                        debug_file = Path("output/debug_page_source.html")
+                        debug_file.parent.mkdir(parents=True, exist_ok=True)
+                        debug_file.write_text(self.driver.page_source, encoding='utf-8')
+                        log.debug("Page source saved to: %s", debug_file)
+                    except Exception as debug_err:
+                        log.warning("Could not save debug page source: %s", debug_err)
                 
-                return False
+                    return False
             
         except Exception as e:
-            print(f"[COMET CONVERSION ERROR] Failed to send query: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[COMET CONVERSION ERROR] Failed to send query: %s", e, exc_info=True)
             return False
     
     def capture_response(self, wait_for_completion: bool = True, 
@@ -324,9 +331,9 @@ class CometConversion(BaseConversion):
             from selenium.webdriver.support import expected_conditions as EC
             from selenium.common.exceptions import StaleElementReferenceException
             
-            print(f"[COMET CONVERSION] Capturing response...")
-            print(f"[COMET CONVERSION] Wait for completion: {wait_for_completion}")
-            print(f"[COMET CONVERSION] Max wait: {max_wait}s")
+            log.info("[COMET CONVERSION] Capturing response...")
+            log.debug("[COMET CONVERSION] Wait for completion: %s", wait_for_completion)
+            log.debug("[COMET CONVERSION] Max wait: %ss", max_wait)
             
             # Response selectors to try
             response_selectors = [
@@ -334,12 +341,14 @@ class CometConversion(BaseConversion):
             ]
             
             start_time = time.time()
+            start_ns = time.perf_counter_ns()
+            submitted_ns = self.submitted_ns or start_ns  # Time to first token counts from the submit
             response_element = None
             
             # Try each selector
             for selector in response_selectors:
                 try:
-                    print(f"[COMET CONVERSION] Trying selector: {selector}")
+                    log.debug("[COMET CONVERSION] Trying selector: %s", selector)
                     wait = WebDriverWait(self.driver, 5)
                     elements = wait.until(
                         EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
@@ -348,46 +357,56 @@ class CometConversion(BaseConversion):
                     if elements:
                         # Get the last/most recent element
                         response_element = elements[-1]
-                        print(f"[COMET CONVERSION] ✓ Found response element: {selector}")
+                        log.debug("[COMET CONVERSION] ✓ Found response element: %s", selector)
                         break
                         
                 except Exception:
                     continue
             
             if not response_element:
-                print(f"[COMET CONVERSION] ✗ Could not find response element")
+                log.error("[COMET CONVERSION] ✗ Could not find response element")
                 return None
             
             # Wait for response to complete if requested
             if wait_for_completion:
-                print(f"[COMET CONVERSION] Waiting for response to complete...")
+                log.debug("[COMET CONVERSION] Waiting for response to complete...")
                 previous_text = ""
                 stable_count = 0
+                first_token_seen = False
                 
                 while time.time() - start_time < max_wait:
+                    if self.watchdog:
+                        self.watchdog.check()  # Fail fast instead of polling a dead page
+                    
                     try:
                         # Try to get text from current element
                         current_text = response_element.text.strip()
                     except StaleElementReferenceException:
-                        print(f"[COMET CONVERSION] Element became stale, re-finding...")
+                        log.debug("[COMET CONVERSION] Element became stale, re-finding...")
                         # Re-find the response element
                         try:
                             response_element = WebDriverWait(self.driver, 10).until(
                                 EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                             )
                             current_text = response_element.text.strip()
-                            print(f"[COMET CONVERSION] ✓ Re-found response element")
+                            log.debug("[COMET CONVERSION] ✓ Re-found response element")
                         except Exception as refind_err:
-                            print(f"[COMET CONVERSION] Failed to re-find element: {refind_err}")
+                            log.warning("[COMET CONVERSION] Failed to re-find element: %s", refind_err)
                             current_text = ""
                     except Exception as text_err:
-                        print(f"[COMET CONVERSION] Error getting text: {text_err}")
+                        log.warning("[COMET CONVERSION] Error getting text: %s", text_err)
                         current_text = ""
                     
+                    if current_text and not first_token_seen:
+                        first_token_seen = True
+                        self.timer.record(
+                            "first_token", time.perf_counter_ns() - submitted_ns, started_ns=submitted_ns
+                        )
+                    
                     if current_text == previous_text and current_text:
                         stable_count += 1
                         if stable_count >= 3:  # Stable for 3 checks
-                            print(f"[COMET CONVERSION] ✓ Response appears complete")
+                            log.debug("[COMET CONVERSION] ✓ Response appears complete")
                             break
                     else:
                         stable_count = 0
@@ -396,7 +415,7 @@ class CometConversion(BaseConversion):
                     time.sleep(1)
                 
                 if time.time() - start_time >= max_wait:
-                    print(f"[COMET CONVERSION] ⚠ Max wait reached")
+                    log.warning("[COMET CONVERSION] ⚠ Max wait reached")
             else:
                 time.sleep(2)  # Brief wait
             
@@ -404,17 +423,16 @@ class CometConversion(BaseConversion):
             response_text = response_element.text.strip()
             
             if response_text:
-                print(f"[COMET CONVERSION] ✓ Captured response ({len(response_text)} chars)")
-                print(f"[COMET CONVERSION] Preview: {response_text[:150]}...")
+                log.info("[COMET CONVERSION] ✓ Captured response (%s chars)", len(response_text))
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[COMET CONVERSION] Preview: %s...", response_text[:150])
                 return response_text
             else:
-                print(f"[COMET CONVERSION] ⚠ Response element found but text is empty")
+                log.warning("[COMET CONVERSION] ⚠ Response element found but text is empty")
                 return None
                 
         except Exception as e:
-            print(f"[COMET CONVERSION ERROR] Failed to capture response: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[COMET CONVERSION ERROR] Failed to capture response: %s", e, exc_info=True)
             return None
     
     def capture_response_html(self, wait_for_completion: bool = True, 
@@ -434,7 +452,7 @@ class CometConversion(BaseConversion):
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
             
-            print(f"[COMET CONVERSION] Capturing response HTML...")
+            log.info("[COMET CONVERSION] Capturing response HTML...")
             
             # Response selectors to try
             response_selectors = [
@@ -454,19 +472,19 @@ class CometConversion(BaseConversion):
                     
                     if elements:
                         response_element = elements[-1]
-                        print(f"[COMET CONVERSION] ✓ Found response element for HTML: {selector}")
+                        log.debug("[COMET CONVERSION] ✓ Found response element for HTML: %s", selector)
                         break
                         
                 except Exception:
                     continue
             
             if not response_element:
-                print(f"[COMET CONVERSION] ✗ Could not find response element")
+                log.error("[COMET CONVERSION] ✗ Could not find response element")
                 return None
             
             # Wait for response to complete if requested
             if wait_for_completion:
-                print(f"[COMET CONVERSION] Waiting for HTML to stabilize...")
+                log.debug("[COMET CONVERSION] Waiting for HTML to stabilize...")
                 previous_html = ""
                 stable_count = 0
                 
@@ -476,7 +494,7 @@ class CometConversion(BaseConversion):
                     if current_html == previous_html and current_html:
                         stable_count += 1
                         if stable_count >= 3:  # Stable for 3 checks
-                            print(f"[COMET CONVERSION] ✓ HTML appears complete")
+                            log.debug("[COMET CONVERSION] ✓ HTML appears complete")
                             break
                     else:
                         stable_count = 0
@@ -485,7 +503,7 @@ class CometConversion(BaseConversion):
                     time.sleep(1)
                 
                 if time.time() - start_time >= max_wait:
-                    print(f"[COMET CONVERSION] ⚠ Max wait reached for HTML")
+                    log.warning("[COMET CONVERSION] ⚠ Max wait reached for HTML")
             else:
                 time.sleep(2)
             
@@ -493,16 +511,14 @@ class CometConversion(BaseConversion):
             response_html = response_element.get_attribute('innerHTML')
             
             if response_html:
-                print(f"[COMET CONVERSION] ✓ Captured HTML ({len(response_html)} chars)")
+                log.info("[COMET CONVERSION] ✓ Captured HTML (%s chars)", len(response_html))
                 return response_html
             else:
-                print(f"[COMET CONVERSION] ⚠ Response HTML is empty")
+                log.warning("[COMET CONVERSION] ⚠ Response HTML is empty")
                 return None
                 
         except Exception as e:
-            print(f"[COMET CONVERSION ERROR] Failed to capture HTML: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[COMET CONVERSION ERROR] Failed to capture HTML: %s", e, exc_info=True)
             return None
     
     def save_response_html(self, filepath: str, wait_for_completion: bool = True,
@@ -528,7 +544,7 @@ class CometConversion(BaseConversion):
             )
             
             if not response_html:
-                print(f"[COMET CONVERSION] ✗ No HTML to save")
+                log.error("[COMET CONVERSION] ✗ No HTML to save")
                 return False
             
             # Create output directory if needed
@@ -602,13 +618,11 @@ class CometConversion(BaseConversion):
             # Write to file
             output_path.write_text(html_document, encoding='utf-8')
             
-            print(f"[COMET CONVERSION] ✓ HTML saved to: {output_path.absolute()}")
+            log.info("[COMET CONVERSION] ✓ HTML saved to: %s", output_path.absolute())
             return True
             
         except Exception as e:
-            print(f"[COMET CONVERSION ERROR] Failed to save HTML: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[COMET CONVERSION ERROR] Failed to save HTML: %s", e, exc_info=True)
             return False
     
     def save_response_text(self, filepath: str, wait_for_completion: bool = True,
@@ -634,7 +648,7 @@ class CometConversion(BaseConversion):
             )
             
             if not response_text:
-                print(f"[COMET CONVERSION] ✗ No text to save")
+                log.error("[COMET CONVERSION] ✗ No text to save")
                 return False
             
             # Create output directory if needed
@@ -657,11 +671,9 @@ End of Response
             # Write to file
             output_path.write_text(text_document, encoding='utf-8')
             
-            print(f"[COMET CONVERSION] ✓ Text saved to: {output_path.absolute()}")
+            log.info("[COMET CONVERSION] ✓ Text saved to: %s", output_path.absolute())
             return True
             
         except Exception as e:
-            print(f"[COMET CONVERSION ERROR] Failed to save text: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[COMET CONVERSION ERROR] Failed to save text: %s", e, exc_info=True)
             return False
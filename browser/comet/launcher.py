@@ -14,6 +14,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from browser_launcher.base import BrowserLauncher, BrowserConfig
+from logger import get_logger
+
+log = get_logger(__name__)
 
 try:
     from selenium import webdriver
@@ -115,29 +118,29 @@ class CometBrowserLauncher(BrowserLauncher):
                     m = re.search(r"/(\d+)\.", browser_str)
                     if m:
                         chrome_major = m.group(1)
-                        print(f"[*] Detected Comet version: Chrome/{chrome_major}")
+                        log.info("[*] Detected Comet version: Chrome/%s", chrome_major)
                         
                         try:
                             driver_path = cda.install(chrome_major)
                             
                             # Verify version match
                             if driver_path and "141" in driver_path and chrome_major == "140":
-                                print(f"[!] Version mismatch detected, forcing fallback")
+                                log.error("[!] Version mismatch detected, forcing fallback")
                                 driver_path = None
                         except Exception:
                             driver_path = cda.install()
             except Exception as e:
-                print(f"[!] Version detection failed: {e}")
+                log.error("[!] Version detection failed: %s", e)
                 driver_path = cda.install()
             
             if driver_path:
-                print(f"[*] chromedriver_autoinstaller provided: {driver_path}")
+                log.info("[*] chromedriver_autoinstaller provided: %s", driver_path)
                 return driver_path
         
         except ImportError:
-            print("[*] chromedriver_autoinstaller not available")
+            log.info("[*] chromedriver_autoinstaller not available")
         except Exception as e:
-            print(f"[!] chromedriver_autoinstaller failed: {e}")
+            log.error("[!] chromedriver_autoinstaller failed: %s", e)
         
         # Fallback to manual download if needed
         driver_path = self._download_matching_chromedriver()
@@ -147,12 +150,12 @@ class CometBrowserLauncher(BrowserLauncher):
         # Last resort: webdriver_manager
         try:
             from webdriver_manager.chrome import ChromeDriverManager
-            print("[*] Falling back to webdriver_manager")
+            log.info("[*] Falling back to webdriver_manager")
             driver_path = ChromeDriverManager().install()
-            print(f"[*] webdriver_manager provided: {driver_path}")
+            log.info("[*] webdriver_manager provided: %s", driver_path)
             return driver_path
         except Exception as e:
-            print(f"[!] webdriver_manager failed: {e}")
+            log.error("[!] webdriver_manager failed: %s", e)
         
         return None
     
@@ -186,7 +189,7 @@ class CometBrowserLauncher(BrowserLauncher):
             chrome_full_version = m.group(1)
             chrome_major = chrome_full_version.split('.')[0]
             
-            print(f"[*] Downloading ChromeDriver for Chrome {chrome_full_version}")
+            log.info("[*] Downloading ChromeDriver for Chrome %s", chrome_full_version)
             
             # Get matching ChromeDriver version from Google's API
             releases_url = "https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json"
@@ -208,7 +211,7 @@ class CometBrowserLauncher(BrowserLauncher):
                                 chromedriver_version = version
                                 download_url = platform_info.get("url")
                                 
-                                print(f"[*] Found ChromeDriver {chromedriver_version}")
+                                log.info("[*] Found ChromeDriver %s", chromedriver_version)
                                 
                                 # Download and extract
                                 with tempfile.TemporaryDirectory() as temp_dir:
@@ -228,25 +231,25 @@ class CometBrowserLauncher(BrowserLauncher):
                                     for root, dirs, files in os.walk(extract_dir):
                                         if "chromedriver.exe" in files:
                                             driver_path = os.path.join(root, "chromedriver.exe")
-                                            print(f"[*] Downloaded to: {driver_path}")
+                                            log.info("[*] Downloaded to: %s", driver_path)
                                             return driver_path
                                 
                                 return None
         
         except Exception as e:
-            print(f"[!] Manual ChromeDriver download failed: {e}")
+            log.error("[!] Manual ChromeDriver download failed: %s", e)
             return None
     
     def attach_selenium(self) -> Any:
         """Attach Selenium WebDriver to running Comet browser"""
         if not SELENIUM_AVAILABLE:
-            print("[!] Selenium not installed")
+            log.error("[!] Selenium not installed")
             return None
         
         # Get ChromeDriver
         driver_path = self._get_chromedriver_path()
         if not driver_path:
-            print("[!] No ChromeDriver available")
+            log.error("[!] No ChromeDriver available")
             return None
         
         # Configure Selenium options
@@ -0,0 +1,515 @@
+"""
+Sidecar Tab Multiplexer
+=======================
+Runs K concurrent Sidecar conversations inside one Comet browser.
+
+Selenium drives one window at a time, so switch_to.window serializes every
+query/answer loop behind a single "current" tab. TabMultiplexer bypasses
+WebDriver and talks to the browser's DevTools socket directly:
+- One CDPConnection per browser, one flat-mode session per tab
+- Target.createTarget opens each Sidecar tab; focus emulation keeps
+  background tabs behaving like the focused one
+- Every tab has its own worker thread and job queue; submit() assigns a job
+  to the least-loaded tab, or to a given tab to continue its conversation
+- A crashed tab (Inspector.targetCrashed) fails its current job and is
+  reopened before its next one
+
+Usage:
+    with TabMultiplexer(debug_port=9222, tabs=4) as mux:
+        results = mux.map(["query 1", "query 2", "query 3"])
+        follow_up = mux.submit("and why?", tab=0).result()
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import queue
+import threading
+import time
+
+# Import from parent packages
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from cdp import CDPConnection, CDPConnectionClosed, CDPError
+from conversion.base import ConversionResult
+from profiling.timer import StepTimer
+from browser.watchdog import BrowserCrashedError
+from logger import get_logger, job_context
+
+from . import scripts
+
+log = get_logger(__name__)
+
+SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
+
+
+@dataclass
+class TabJob:
+    """One query queued for a tab."""
+    query: str
+    submit: bool = True
+    capture: bool = True
+    max_wait: float = 60.0
+    on_text: Optional[Callable[[str], Any]] = None
+    future: Future = field(default_factory=Future)
+
+
+class SidecarTab:
+    """
+    One Sidecar page driven through its own CDP session.
+    """
+
+    def __init__(self, conn: CDPConnection, index: int, target_url: str = SIDECAR_URL,
+                 poll_interval: float = 0.25, stable_polls: int = 3,
+                 ready_timeout: float = 30.0):
+        """
+        Initialize tab (call open() to create the page).
+
+        Args:
+            conn: Browser-level CDP connection shared by all tabs
+            index: Tab number within the multiplexer
+            target_url: Sidecar URL to load
+            poll_interval: Seconds between answer polls
+            stable_polls: Unchanged polls after which an answer counts as complete
+            ready_timeout: Seconds to wait for the editor after loading
+        """
+        self.conn = conn
+        self.index = index
+        self.target_url = target_url
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+        self.ready_timeout = ready_timeout
+        self.target_id: Optional[str] = None
+        self.session_id: Optional[str] = None
+        self.timer = StepTimer()
+        self.submitted_ns: Optional[int] = None  # perf_counter_ns() at the last Enter (first_token starts here)
+        self.jobs_done = 0
+        self.crashed = threading.Event()
+        self._ready = False
+
+    # ==================== Lifecycle ====================
+
+    def open(self):
+        """Create the page target, attach a session and start loading Sidecar."""
+        self.crashed.clear()
+        self._ready = False
+        self.target_id = self.conn.send(
+            "Target.createTarget", {'url': "about:blank", 'background': True}
+        )['targetId']
+        self.session_id = self.conn.attach(self.target_id)
+        self.conn.on("Inspector.targetCrashed", self._on_crashed, session_id=self.session_id)
+        self.conn.send("Inspector.enable", session_id=self.session_id)
+        self.conn.send("Page.enable", session_id=self.session_id)
+        # Without this only the foreground tab gets focus/keyboard events
+        self.conn.send("Emulation.setFocusEmulationEnabled", {'enabled': True},
+                       session_id=self.session_id)
+        self.conn.send("Page.navigate", {'url': self.target_url}, session_id=self.session_id)
+        log.debug("[MULTIPLEX] Tab %s opened (target %s)", self.index, self.target_id)
+
+    def close(self):
+        """Close the page target (ignores errors for a gone browser)."""
+        if self.session_id:
+            self.conn.off("Inspector.targetCrashed", self._on_crashed, session_id=self.session_id)
+        if self.target_id:
+            try:
+                self.conn.send("Target.closeTarget", {'targetId': self.target_id})
+            except (CDPError, CDPConnectionClosed, TimeoutError):
+                pass
+        self.target_id = None
+        self.session_id = None
+        self._ready = False
+
+    def reopen(self):
+        """Replace a crashed or broken page with a fresh one."""
+        log.info("[MULTIPLEX] Reopening tab %s", self.index)
+        self.close()
+        self.open()
+
+    def _on_crashed(self, params: Dict[str, Any], session_id: Optional[str]):
+        log.error("[MULTIPLEX] ✗ Tab %s renderer crashed", self.index)
+        self.crashed.set()
+
+    # ==================== Page access ====================
+
+    def evaluate(self, expression: str) -> Any:
+        """
+        Evaluate a JavaScript expression in the tab.
+
+        Args:
+            expression: JavaScript expression
+
+        Returns:
+            The expression's value (returned by value)
+
+        Raises:
+            BrowserCrashedError: If the tab crashed
+            RuntimeError: If the expression threw
+        """
+        self.check()
+        result = self.conn.send(
+            "Runtime.evaluate",
+            {'expression': expression, 'returnByValue': True, 'awaitPromise': True},
+            session_id=self.session_id
+        )
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise RuntimeError(details.get('exception', {}).get('description') or details.get('text'))
+        return result.get('result', {}).get('value')
+
+    def check(self):
+        """
+        Raise if the tab crashed.
+
+        Raises:
+            BrowserCrashedError: After Inspector.targetCrashed for this tab
+        """
+        if self.crashed.is_set():
+            raise BrowserCrashedError(f"Tab {self.index} renderer crashed")
+
+    def wait_ready(self) -> bool:
+        """
+        Wait until the Lexical editor is mounted.
+
+        Returns:
+            True if the editor appeared within ready_timeout
+        """
+        if self._ready:
+            return True
+
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            try:
+                if self.evaluate(scripts.EDITOR_READY):
+                    self._ready = True
+                    return True
+            except (BrowserCrashedError, CDPConnectionClosed):
+                raise  # BrowserCrashedError is a RuntimeError: fail now, not after ready_timeout
+            except (RuntimeError, CDPError):
+                pass  # Page still navigating (execution context replaced)
+            time.sleep(self.poll_interval)
+        return False
+
+    # ==================== Conversation ====================
+
+    def send_query(self, query: str, submit: bool = True) -> int:
+        """
+        Type a query into the editor and (optionally) press Enter.
+
+        Args:
+            query: The text to send
+            submit: If True, press Enter to submit
+
+        Returns:
+            Number of answer blocks before submitting (baseline for capture)
+
+        Raises:
+            RuntimeError: If the editor is missing or did not accept the text
+        """
+        with self.timer.measure("editor_lookup"):
+            if not self.wait_ready():
+                raise RuntimeError(f"Tab {self.index}: editor not ready after {self.ready_timeout}s")
+
+        self.submitted_ns = None
+        with self.timer.measure("send"):
+            baseline = self.evaluate(scripts.PROSE_COUNT) or 0
+            if not self.evaluate(scripts.SELECT_EDITOR):
+                raise RuntimeError(f"Tab {self.index}: #ask-input not found")
+
+            self.conn.send("Input.insertText", {'text': query}, session_id=self.session_id)
+            if self.evaluate(scripts.EDITOR_TEXT) != query.strip():
+                self.evaluate(scripts.set_editor_text(query))
+
+            if submit:
+                for event in scripts.ENTER_KEY_EVENTS:
+                    self.conn.send("Input.dispatchKeyEvent", event, session_id=self.session_id)
+                self.submitted_ns = time.perf_counter_ns()
+        return baseline
+
+    def capture_response(self, baseline: int, max_wait: float = 60.0,
+                         on_text: Optional[Callable[[str], Any]] = None) -> Optional[str]:
+        """
+        Poll the newest answer block until its text stops changing.
+
+        Args:
+            baseline: Answer count returned by send_query()
+            max_wait: Maximum time to wait (seconds)
+            on_text: Called with the answer so far at each poll; a truthy return
+                     (e.g. PromptInjectionOracle.feed_snapshot's early verdict) stops waiting
+
+        Returns:
+            The response text, or None if no answer appeared
+        """
+        expression = scripts.last_prose_after(baseline)
+        start_ns = time.perf_counter_ns()
+        submitted_ns = self.submitted_ns or start_ns  # Time to first token counts from the submit
+        deadline = time.monotonic() + max_wait
+        previous_text = None
+        stable_count = 0
+        first_token_seen = False
+
+        while time.monotonic() < deadline:
+            current_text = self.evaluate(expression)
+
+            if current_text and not first_token_seen:
+                first_token_seen = True
+                self.timer.record("first_token", time.perf_counter_ns() - submitted_ns, started_ns=submitted_ns)
+
+            if current_text and on_text is not None and on_text(current_text):
+                previous_text = current_text
+                break
+
+            if current_text and current_text == previous_text:
+                stable_count += 1
+                if stable_count >= self.stable_polls:
+                    break
+            else:
+                stable_count = 0
+                previous_text = current_text
+
+            time.sleep(self.poll_interval)
+        else:
+            log.warning("[MULTIPLEX] ⚠ Tab %s: max wait reached", self.index)
+
+        self.timer.record("capture", time.perf_counter_ns() - start_ns, started_ns=start_ns)
+        return previous_text
+
+    def ask(self, query: str, submit: bool = True, capture: bool = True,
+            max_wait: float = 60.0, on_text: Optional[Callable[[str], Any]] = None) -> ConversionResult:
+        """
+        Run one query/answer round trip in this tab.
+
+        Args:
+            query: The text to send
+            submit: If True, press Enter to submit
+            capture: If True, wait for and return the answer
+            max_wait: Maximum time to wait for the answer (seconds)
+            on_text: Streamed-answer callback (see capture_response())
+
+        Returns:
+            ConversionResult with this job's step timings
+        """
+        self.timer = StepTimer()  # Per job: one timer for the tab's lifetime would grow without bound
+        try:
+            baseline = self.send_query(query, submit=submit)
+            response = self.capture_response(baseline, max_wait, on_text) if submit and capture else None
+            if submit and capture and response is None:
+                result = ConversionResult(success=False, query=query, error="Could not capture response")
+            else:
+                result = ConversionResult(success=True, query=query, response=response)
+        except (BrowserCrashedError, CDPConnectionClosed) as e:
+            result = ConversionResult(success=False, query=query, error=f"Browser crashed: {e}")
+        except (CDPError, TimeoutError, RuntimeError) as e:
+            result = ConversionResult(success=False, query=query, error=str(e))
+        finally:
+            self.jobs_done += 1
+        result.timings = self.timer.totals()
+        return result
+
+
+class TabMultiplexer:
+    """
+    K Sidecar tabs in one browser, each with its own worker and job queue.
+    """
+
+    def __init__(self, debug_port: int, tabs: int = 4, target_url: str = SIDECAR_URL,
+                 poll_interval: float = 0.25, stable_polls: int = 3,
+                 ready_timeout: float = 30.0, host: str = "127.0.0.1"):
+        """
+        Initialize multiplexer (call start() or use as a context manager).
+
+        Args:
+            debug_port: Browser remote debugging port
+            tabs: Number of concurrent Sidecar tabs
+            target_url: Sidecar URL to open in every tab
+            poll_interval: Seconds between answer polls
+            stable_polls: Unchanged polls after which an answer counts as complete
+            ready_timeout: Seconds to wait for each tab's editor
+            host: DevTools host
+        """
+        self.debug_port = debug_port
+        self.host = host
+        self.tab_count = max(1, tabs)
+        self.target_url = target_url
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+        self.ready_timeout = ready_timeout
+        self.conn: Optional[CDPConnection] = None
+        self.tabs: List[SidecarTab] = []
+        self._queues: List["queue.Queue[Optional[TabJob]]"] = []
+        self._outstanding: List[int] = []
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_browser(cls, browser, tabs: int = 4, **kwargs) -> "TabMultiplexer":
+        """
+        Create a multiplexer for a launched BaseBrowser.
+
+        Args:
+            browser: Launched browser (its launcher provides the debug port)
+            tabs: Number of concurrent Sidecar tabs
+            **kwargs: Other TabMultiplexer arguments
+
+        Returns:
+            TabMultiplexer (not started)
+        """
+        if browser._launcher is None:
+            raise RuntimeError("Browser not launched. Call launch() first.")
+        return cls(browser._launcher.config.debug_port, tabs=tabs, **kwargs)
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> "TabMultiplexer":
+        """Connect to the browser, open the tabs and start one worker per tab."""
+        self.conn = CDPConnection.from_port(self.debug_port, self.host)
+        for index in range(self.tab_count):
+            tab = SidecarTab(
+                self.conn, index, self.target_url,
+                poll_interval=self.poll_interval,
+                stable_polls=self.stable_polls,
+                ready_timeout=self.ready_timeout
+            )
+            tab.open()
+            self.tabs.append(tab)
+            self._queues.append(queue.Queue())
+            self._outstanding.append(0)
+
+        for index in range(self.tab_count):
+            worker = threading.Thread(
+                target=self._worker_loop, args=(index,), name=f"sidecar-tab-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        log.info("[MULTIPLEX] ✓ %s Sidecar tabs on port %s", self.tab_count, self.debug_port)
+        return self
+
+    def stop(self, close_tabs: bool = True):
+        """
+        Stop the workers after their queued jobs and disconnect.
+
+        Args:
+            close_tabs: Also close the Sidecar tabs
+        """
+        for q in self._queues:
+            q.put(None)
+        for worker in self._workers:
+            worker.join()
+        if close_tabs:
+            for tab in self.tabs:
+                tab.close()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self._workers.clear()
+        self._queues.clear()
+        self._outstanding.clear()
+        self.tabs.clear()
+
+    # ==================== Jobs ====================
+
+    def submit(self, query: str, tab: Optional[int] = None, submit: bool = True,
+               capture: bool = True, max_wait: float = 60.0,
+               on_text: Optional[Callable[[str], Any]] = None) -> "Future[ConversionResult]":
+        """
+        Queue a query.
+
+        Args:
+            query: The text to send
+            tab: Tab index to run in (keeps a conversation in one thread);
+                None assigns the tab with the fewest outstanding jobs
+            submit: If True, press Enter to submit
+            capture: If True, wait for and return the answer
+            max_wait: Maximum time to wait for the answer (seconds)
+            on_text: Streamed-answer callback, called on the tab's worker thread
+
+        Returns:
+            Future resolving to a ConversionResult
+        """
+        if not self._workers:
+            raise RuntimeError("TabMultiplexer not started. Call start() first.")
+
+        job = TabJob(query=query, submit=submit, capture=capture, max_wait=max_wait, on_text=on_text)
+        with self._lock:
+            if tab is None:
+                tab = min(range(self.tab_count), key=lambda i: self._outstanding[i])
+            elif not 0 <= tab < self.tab_count:
+                raise ValueError(f"tab must be in 0..{self.tab_count - 1}")
+            self._outstanding[tab] += 1
+        self._queues[tab].put(job)
+        return job.future
+
+    def ask(self, query: str, tab: Optional[int] = None, **kwargs) -> ConversionResult:
+        """Run one query and wait for its result."""
+        return self.submit(query, tab=tab, **kwargs).result()
+
+    def map(self, queries: Iterable[str], **kwargs) -> List[ConversionResult]:
+        """
+        Run many queries across all tabs.
+
+        Args:
+            queries: Queries to send
+            **kwargs: submit()/capture/max_wait options
+
+        Returns:
+            ConversionResults in query order
+        """
+        futures = [self.submit(query, **kwargs) for query in queries]
+        return [future.result() for future in futures]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Per-tab counters.
+
+        Returns:
+            Dictionary with each tab's outstanding and completed jobs
+        """
+        with self._lock:
+            outstanding = list(self._outstanding)
+        return {
+            'tabs': [
+                {'index': tab.index, 'target_id': tab.target_id,
+                 'outstanding': outstanding[tab.index], 'jobs_done': tab.jobs_done,
+                 'crashed': tab.crashed.is_set()}
+                for tab in self.tabs
+            ],
+        }
+
+    def _worker_loop(self, index: int):
+        """Run one tab's jobs in order until stop()."""
+        tab = self.tabs[index]
+        jobs = self._queues[index]
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            result, error = None, None
+            try:
+                with job_context(tab=index):
+                    if tab.crashed.is_set():
+                        try:
+                            tab.reopen()
+                        except (CDPError, CDPConnectionClosed, TimeoutError) as e:
+                            log.error("[MULTIPLEX] ✗ Could not reopen tab %s: %s", index, e)
+
+                    result = tab.ask(job.query, submit=job.submit, capture=job.capture,
+                                     max_wait=job.max_wait, on_text=job.on_text)
+            except Exception as e:
+                # Anything ask() does not handle itself (e.g. a failing on_text
+                # callback) fails this job only; the worker keeps serving the tab
+                log.error("[MULTIPLEX] ✗ Job on tab %s failed: %s", index, e, exc_info=True)
+                error = e
+            finally:
+                with self._lock:
+                    self._outstanding[index] -= 1
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -18,6 +18,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from pipeline.base import BasePipeline, PipelineConfig, PipelineResult
+from logger import get_logger
+
+log = get_logger(__name__)
 # NOTE: ConversionFactory imported lazily when needed (not at module level)
 
 
@@ -42,7 +45,8 @@ class CometPipeline(BasePipeline):
             driver: Selenium WebDriver (already attached to Comet)
             navigator: CometNavigator instance (already created)
             config: Pipeline configuration
-            **kwargs: Optional parameters (query, submit, conversation, read_responses, use_conversion, save_text)
+            **kwargs: Optional parameters (query, submit, conversation, read_responses, use_conversion, save_text,
+                reuse_page, response_cache)
         """
         super().__init__(driver, navigator, config, **kwargs)
         
@@ -60,6 +64,12 @@ class CometPipeline(BasePipeline):
         
         # NEW: Text saving
         self.save_text: Optional[str] = kwargs.get('save_text', None)
+        
+        # Skip re-navigation when the tab is already on Sidecar (warm browser / daemon mode)
+        self.reuse_page: bool = kwargs.get('reuse_page', False)
+        
+        # conversion.ResponseCache answering repeated queries without a browser round trip
+        self.response_cache = kwargs.get('response_cache', None)
     
     def get_browser_name(self) -> str:
         """Return the browser name."""
@@ -72,14 +82,14 @@ class CometPipeline(BasePipeline):
         Returns:
             True if successful
         """
-        print(f"[COMET] Navigating to Sidecar...")
+        log.info("[COMET] Navigating to Sidecar...")
         
         # Check if multiple tabs are open
         all_handles = self.driver.window_handles
-        print(f"[DEBUG] Number of tabs open: {len(all_handles)}")
+        log.debug("Number of tabs open: %s", len(all_handles))
         
         if len(all_handles) > 1:
-            print(f"[COMET] Multiple tabs detected - finding correct one...")
+            log.info("[COMET] Multiple tabs detected - finding correct one...")
             
             SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
             correct_handle = None
@@ -88,45 +98,50 @@ class CometPipeline(BasePipeline):
             for handle in all_handles:
                 self.driver.switch_to.window(handle)
                 current_url = self.driver.current_url
-                print(f"[DEBUG] Tab URL: {current_url}")
+                log.debug("Tab URL: %s", current_url)
                 
                 if "copilot=true" in current_url:
-                    print(f"[COMET] ✓ Found tab with copilot=true - using this one")
+                    log.info("[COMET] ✓ Found tab with copilot=true - using this one")
                     correct_handle = handle
                     break
             
             if correct_handle:
                 self.driver.switch_to.window(correct_handle)
-                print(f"[COMET] ✓ Switched to correct tab (ignoring other tabs)")
+                log.info("[COMET] ✓ Switched to correct tab (ignoring other tabs)")
             else:
                 # No correct tab found, use first tab
                 self.driver.switch_to.window(all_handles[0])
-                print(f"[COMET] No copilot=true tab found, will navigate to correct URL")
+                log.info("[COMET] No copilot=true tab found, will navigate to correct URL")
         
         # Navigate to Sidecar URL
         SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
         
         # Check current URL
         current_url = self.navigator.get_current_url()
-        print(f"[COMET] Current URL before navigation: {current_url}")
+        log.info("[COMET] Current URL before navigation: %s", current_url)
+        
+        if self.reuse_page and current_url == SIDECAR_URL:
+            log.info("[COMET] ✓ Sidecar already loaded - reusing page")
+            return True
         
         # Always navigate to ensure we have the correct URL with copilot parameter
-        print(f"[COMET] Navigating to: {SIDECAR_URL}")
-        nav_result = self.navigator.navigate_to_url(SIDECAR_URL, wait_time=5)
+        log.info("[COMET] Navigating to: %s", SIDECAR_URL)
+        with self.timer.measure("navigation"):
+            nav_result = self.navigator.navigate_to_url(SIDECAR_URL, wait_time=5)
         
         if not nav_result.success:
-            print(f"[COMET] ✗ Failed to navigate to Sidecar: {nav_result.message}")
+            log.error("[COMET] ✗ Failed to navigate to Sidecar: %s", nav_result.message)
             return False
         
-        print(f"[COMET] Verifying Sidecar loaded...")
+        log.info("[COMET] Verifying Sidecar loaded...")
         current_url = self.navigator.get_current_url()
-        print(f"[COMET] Current URL: {current_url}")
+        log.info("[COMET] Current URL: %s", current_url)
         
         if "sidecar" in current_url.lower():
-            print(f"[COMET] ✓ Sidecar page confirmed")
+            log.info("[COMET] ✓ Sidecar page confirmed")
             return True
         else:
-            print(f"[COMET] ⚠ Warning: Not on Sidecar page, continuing anyway...")
+            log.warning("[COMET] ⚠ Warning: Not on Sidecar page, continuing anyway...")
             return True
     
     def execute_workflow(self) -> bool:
@@ -142,21 +157,24 @@ class CometPipeline(BasePipeline):
         """
         # Mode 1: Conversion module mode (RECOMMENDED!)
         if self.query and (self.use_conversion or self.submit_query):
-            print(f"[COMET] === CONVERSION MODULE MODE ===")
-            print(f"[COMET] Query: '{self.query}'")
-            print(f"[COMET] Using conversion module for clean query/response...")
+            log.info("[COMET] === CONVERSION MODULE MODE ===")
+            log.info("[COMET] Query: '%s'", self.query)
+            log.info("[COMET] Using conversion module for clean query/response...")
             
             # Lazy import to avoid circular dependencies
             from conversion import ConversionFactory, ConversionType
             
             # Create conversion handler
             if not self.conversion:
-                print(f"[COMET] Creating conversion handler...")
+                log.info("[COMET] Creating conversion handler...")
                 self.conversion = ConversionFactory.create(
                     ConversionType.COMET,
                     self.driver,
-                    self.navigator
+                    self.navigator,
+                    response_cache=self.response_cache
                 )
+            self.conversion.timer = self.timer
+            self.conversion.watchdog = self.watchdog
             
             # Execute conversion: send query + capture response
             conversion_result = self.conversion.execute(
@@ -176,23 +194,23 @@ class CometPipeline(BasePipeline):
             }
             
             if conversion_result.success:
-                print(f"[COMET] ✓ Conversion completed successfully")
+                log.info("[COMET] ✓ Conversion completed successfully")
                 if conversion_result.response:
-                    print(f"[COMET] ✓ Response captured ({len(conversion_result.response)} chars)")
+                    log.info("[COMET] ✓ Response captured (%s chars)", len(conversion_result.response))
                 if conversion_result.text_filepath:
-                    print(f"[COMET] ✓ Text saved to: {conversion_result.text_filepath}")
+                    log.info("[COMET] ✓ Text saved to: %s", conversion_result.text_filepath)
             else:
-                print(f"[COMET] ✗ Conversion failed: {conversion_result.error}")
+                log.error("[COMET] ✗ Conversion failed: %s", conversion_result.error)
                 return False
             
             return True
         
         # Mode 2: Conversation mode (legacy - will be migrated to conversion module later)
         if self.conversation:
-            print(f"[COMET] === CONVERSATION MODE (LEGACY) ===")
-            print(f"[COMET] ⚠ Conversation mode not yet migrated to conversion module")
-            print(f"[COMET] Messages to send: {len(self.conversation)}")
-            print(f"[COMET] This mode is deprecated - use single query conversion for now")
+            log.info("[COMET] === CONVERSATION MODE (LEGACY) ===")
+            log.warning("[COMET] ⚠ Conversation mode not yet migrated to conversion module")
+            log.info("[COMET] Messages to send: %s", len(self.conversation))
+            log.info("[COMET] This mode is deprecated - use single query conversion for now")
             
             # TODO: Implement multi-turn conversation in conversion module
             # For now, just return success and note it in metadata
@@ -203,7 +221,7 @@ class CometPipeline(BasePipeline):
             return True
         
         # No query or conversation provided
-        print(f"[COMET] No query or conversation provided, skipping")
+        log.info("[COMET] No query or conversation provided, skipping")
         return True
     
     def post_workflow_steps(self) -> bool:
@@ -213,10 +231,10 @@ class CometPipeline(BasePipeline):
         Returns:
             True (always succeeds)
         """
-        print(f"[COMET] Workflow complete!")
+        log.info("[COMET] Workflow complete!")
         
         if self.query and self.submit_query:
-            print(f"[COMET] Waiting for Perplexity response...")
+            log.info("[COMET] Waiting for Perplexity response...")
             time.sleep(3)  # Wait for response to start loading
         
         return True
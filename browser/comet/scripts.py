@@ -0,0 +1,102 @@
+"""
+Sidecar Page Scripts
+====================
+JavaScript expressions for driving a Perplexity Sidecar page through CDP
+Runtime.evaluate (no WebDriver element handles involved).
+
+The Sidecar input is a Lexical editor (#ask-input, data-lexical-editor="true").
+Lexical ignores direct innerHTML edits, so text is entered with CDP
+Input.insertText after SELECT_EDITOR has focused the editor and selected
+its content (the inserted text replaces the selection). Answers stream into
+one `.prose` block per submission; the newest block is the last one.
+"""
+
+import json
+
+# True once the Lexical editor is mounted
+EDITOR_READY = """
+(() => {
+    const el = document.getElementById('ask-input');
+    return !!el && el.getAttribute('data-lexical-editor') === 'true';
+})()
+"""
+
+# Focus the editor and select everything in it; False if it is missing
+SELECT_EDITOR = """
+(() => {
+    const el = document.getElementById('ask-input');
+    if (!el) return false;
+    el.scrollIntoView({block: 'center'});
+    el.focus();
+    const range = document.createRange();
+    range.selectNodeContents(el);
+    const selection = window.getSelection();
+    selection.removeAllRanges();
+    selection.addRange(range);
+    return true;
+})()
+"""
+
+# Current editor text (to verify the query landed before pressing Enter)
+EDITOR_TEXT = """
+(() => {
+    const el = document.getElementById('ask-input');
+    return el ? el.innerText.trim() : null;
+})()
+"""
+
+# Number of answer blocks on the page (baseline before submitting)
+PROSE_COUNT = "document.querySelectorAll('.prose').length"
+
+# Key events that make up one Enter press (Input.dispatchKeyEvent params)
+ENTER_KEY_EVENTS = [
+    {'type': 'rawKeyDown', 'key': 'Enter', 'code': 'Enter',
+     'windowsVirtualKeyCode': 13, 'nativeVirtualKeyCode': 13},
+    {'type': 'char', 'key': 'Enter', 'code': 'Enter', 'text': '\r',
+     'windowsVirtualKeyCode': 13, 'nativeVirtualKeyCode': 13},
+    {'type': 'keyUp', 'key': 'Enter', 'code': 'Enter',
+     'windowsVirtualKeyCode': 13, 'nativeVirtualKeyCode': 13},
+]
+
+
+def last_prose_after(baseline: int) -> str:
+    """
+    Expression returning the newest answer text, or null if no answer block
+    beyond the first `baseline` blocks exists yet.
+
+    Args:
+        baseline: PROSE_COUNT before the query was submitted
+
+    Returns:
+        JavaScript expression
+    """
+    return f"""
+(() => {{
+    const els = document.querySelectorAll('.prose');
+    if (els.length <= {int(baseline)}) return null;
+    return els[els.length - 1].innerText.trim();
+}})()
+"""
+
+
+def set_editor_text(text: str) -> str:
+    """
+    Fallback for pages without a real Lexical editor: replace the editor
+    content through execCommand, which fires the same beforeinput/input
+    events Lexical listens to.
+
+    Args:
+        text: Text to put in the editor
+
+    Returns:
+        JavaScript expression
+    """
+    return f"""
+(() => {{
+    const el = document.getElementById('ask-input');
+    if (!el) return false;
+    el.focus();
+    document.execCommand('selectAll', false, null);
+    return document.execCommand('insertText', false, {json.dumps(text)});
+}})()
+"""
@@ -14,11 +14,16 @@ from enum import Enum
 from typing import Dict, Type
 from .base import BaseBrowser
 from .comet import CometBrowser
+from .chromium import ChromiumHeadlessBrowser
+from logger import get_logger
+
+log = get_logger(__name__)
 
 
 class BrowserType(Enum):
     """Supported browser types."""
     COMET = "comet"
+    CHROMIUM_HEADLESS = "chromium_headless"
 
 
 
@@ -86,7 +91,7 @@ class BrowserFactory:
             )
         
         _BROWSER_CLASSES[browser_type] = browser_class
-        print(f"[INFO] Registered browser: {browser_type.value} -> {browser_class.__name__}")
+        log.debug("Registered browser: %s -> %s", browser_type.value, browser_class.__name__)
     
     @staticmethod
     def get_supported_types() -> list[BrowserType]:
@@ -135,3 +140,7 @@ def create_browser(browser_type: BrowserType) -> BaseBrowser:
 
     """
     return BrowserFactory.create(browser_type)
+
+
+# Headless Chromium (Linux execution backend for corpus runs and benchmarks)
+BrowserFactory.register_browser(BrowserType.CHROMIUM_HEADLESS, ChromiumHeadlessBrowser)
@@ -0,0 +1,294 @@
+"""
+Browser Supervisor
+==================
+Recycles a BaseBrowser after a number of jobs or when it grows too large.
+
+Long Sidecar conversations leak memory in the page; nothing in a single
+PipelineResult shows it. The supervisor samples, between jobs:
+- CDP Performance.getMetrics: JSHeapUsedSize, JSHeapTotalSize, Nodes,
+  Documents, JSEventListeners
+- CDP Memory.getDOMCounters (fallback for node/document counts)
+- Resident set size of the browser process tree (psutil, optional)
+
+and restarts the browser (re-attaching a fresh navigator) when the
+RecyclePolicy says so. Restarts happen before the next job runs, on the
+caller's thread, so queued work simply waits rather than being dropped.
+
+Usage:
+    supervisor = BrowserSupervisor(browser, RecyclePolicy(max_jobs=100, max_js_heap_mb=400))
+    for query in queries:
+        result = supervisor.run_pipeline(config, query=query, submit=True)
+        print(result.metadata['browser_metrics'])
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+import time
+
+from .base import BaseBrowser
+from logger import get_logger
+
+log = get_logger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+MB = 1024 * 1024
+
+
+@dataclass
+class RecyclePolicy:
+    """When to restart a browser (None disables a limit)."""
+    max_jobs: Optional[int] = 200
+    max_js_heap_mb: Optional[float] = 512.0
+    max_rss_mb: Optional[float] = 2048.0
+    max_dom_nodes: Optional[int] = 200_000
+    sample_every: int = 1  # Sample metrics every N jobs
+
+
+@dataclass
+class BrowserMetrics:
+    """One memory sample of a browser."""
+    js_heap_used_mb: Optional[float] = None
+    js_heap_total_mb: Optional[float] = None
+    dom_nodes: Optional[int] = None
+    documents: Optional[int] = None
+    js_event_listeners: Optional[int] = None
+    rss_mb: Optional[float] = None
+    sampled_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary (for PipelineResult metadata)."""
+        return asdict(self)
+
+
+def sample_metrics(driver, debug_port: Optional[int] = None,
+                   pid: Optional[int] = None) -> BrowserMetrics:
+    """
+    Sample memory metrics from a running browser.
+
+    Every source is best-effort: a metric that cannot be read stays None.
+
+    Args:
+        driver: Selenium WebDriver (Chromium-based)
+        debug_port: DevTools port, used to find the browser process for RSS
+        pid: Browser process id (takes precedence over debug_port)
+
+    Returns:
+        BrowserMetrics
+    """
+    metrics = BrowserMetrics(sampled_at=time.time())
+
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        values = {
+            m['name']: m['value']
+            for m in driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+        }
+        if 'JSHeapUsedSize' in values:
+            metrics.js_heap_used_mb = values['JSHeapUsedSize'] / MB
+        if 'JSHeapTotalSize' in values:
+            metrics.js_heap_total_mb = values['JSHeapTotalSize'] / MB
+        if 'Nodes' in values:
+            metrics.dom_nodes = int(values['Nodes'])
+        if 'Documents' in values:
+            metrics.documents = int(values['Documents'])
+        if 'JSEventListeners' in values:
+            metrics.js_event_listeners = int(values['JSEventListeners'])
+    except Exception as e:
+        log.debug("[SUPERVISOR] Performance.getMetrics failed: %s", e)
+
+    if metrics.dom_nodes is None:
+        try:
+            counters = driver.execute_cdp_cmd('Memory.getDOMCounters', {})
+            metrics.dom_nodes = counters.get('nodes')
+            metrics.documents = counters.get('documents')
+            metrics.js_event_listeners = counters.get('jsEventListeners')
+        except Exception as e:
+            log.debug("[SUPERVISOR] Memory.getDOMCounters failed: %s", e)
+
+    if PSUTIL_AVAILABLE:
+        if pid is None and debug_port is not None:
+            pid = find_browser_pid(debug_port)
+        if pid is not None:
+            metrics.rss_mb = process_tree_rss(pid) / MB
+
+    return metrics
+
+
+def find_browser_pid(debug_port: int) -> Optional[int]:
+    """
+    Find the main browser process listening on a DevTools port.
+
+    Args:
+        debug_port: Remote debugging port
+
+    Returns:
+        Process id, or None if not found (or psutil unavailable)
+    """
+    if not PSUTIL_AVAILABLE:
+        return None
+
+    port_arg = f"--remote-debugging-port={debug_port}"
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        try:
+            cmdline = proc.info.get('cmdline') or []
+            # Child processes (renderers, GPU) carry --type=...; the browser does not
+            if port_arg in cmdline and not any(arg.startswith("--type=") for arg in cmdline):
+                return proc.info['pid']
+        except Exception:
+            pass
+    return None
+
+
+def process_tree_rss(pid: int) -> int:
+    """
+    Total resident set size of a process and all its children.
+
+    Args:
+        pid: Root process id
+
+    Returns:
+        RSS in bytes (0 if the process is gone)
+    """
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return 0
+
+    total = 0
+    for proc in processes:
+        try:
+            total += proc.memory_info().rss
+        except Exception:
+            pass
+    return total
+
+
+class BrowserSupervisor:
+    """
+    Runs pipelines on a browser and restarts it according to a RecyclePolicy.
+    """
+
+    def __init__(self, browser: BaseBrowser, policy: Optional[RecyclePolicy] = None):
+        """
+        Initialize supervisor.
+
+        Args:
+            browser: Browser to supervise (launched lazily if needed)
+            policy: Recycling policy (defaults to RecyclePolicy())
+        """
+        self.browser = browser
+        self.policy = policy or RecyclePolicy()
+        self.jobs_since_restart = 0
+        self.restarts = 0
+        self.last_metrics: Optional[BrowserMetrics] = None
+        self.recycle_reason: Optional[str] = None  # Set when a restart is due before the next job
+
+    def run_pipeline(self, config, **kwargs):
+        """
+        Run one pipeline, restarting the browser first if a recycle is due.
+
+        Args:
+            config: PipelineConfig
+            **kwargs: Pipeline-specific arguments
+
+        Returns:
+            PipelineResult (metadata['browser_metrics'] holds the latest sample)
+        """
+        if self.recycle_reason:
+            self.restart(self.recycle_reason)
+
+        result = self.browser.run_pipeline(config, **kwargs)
+        self.jobs_since_restart += 1
+
+        if self.jobs_since_restart % max(1, self.policy.sample_every) == 0:
+            self.last_metrics = self.sample()
+        if self.last_metrics:
+            result.metadata['browser_metrics'] = self.last_metrics.to_dict()
+
+        self.recycle_reason = self.check_policy()
+        if self.recycle_reason:
+            log.info("[SUPERVISOR] Recycle due before next job: %s", self.recycle_reason)
+        return result
+
+    def sample(self) -> Optional[BrowserMetrics]:
+        """
+        Sample the supervised browser's memory metrics.
+
+        Returns:
+            BrowserMetrics, or None if the browser is not running
+        """
+        driver = self.browser.get_driver()
+        if driver is None:
+            return None
+
+        launcher = self.browser._launcher
+        pid = None
+        debug_port = None
+        if launcher is not None:
+            debug_port = launcher.config.debug_port
+            if launcher.process is not None:
+                pid = launcher.process.pid
+
+        metrics = sample_metrics(driver, debug_port=debug_port, pid=pid)
+        log.debug("[SUPERVISOR] Metrics: %s", metrics)
+        return metrics
+
+    def check_policy(self) -> Optional[str]:
+        """
+        Compare the job count and latest metrics with the policy.
+
+        Returns:
+            Reason string if the browser should be recycled, else None
+        """
+        policy = self.policy
+        metrics = self.last_metrics
+
+        if policy.max_jobs and self.jobs_since_restart >= policy.max_jobs:
+            return f"{self.jobs_since_restart} jobs since last restart"
+        if metrics is None:
+            return None
+        if policy.max_js_heap_mb and (metrics.js_heap_used_mb or 0) > policy.max_js_heap_mb:
+            return f"JS heap {metrics.js_heap_used_mb:.0f} MB > {policy.max_js_heap_mb:.0f} MB"
+        if policy.max_rss_mb and (metrics.rss_mb or 0) > policy.max_rss_mb:
+            return f"RSS {metrics.rss_mb:.0f} MB > {policy.max_rss_mb:.0f} MB"
+        if policy.max_dom_nodes and (metrics.dom_nodes or 0) > policy.max_dom_nodes:
+            return f"{metrics.dom_nodes} DOM nodes > {policy.max_dom_nodes}"
+        return None
+
+    def restart(self, reason: str = "manual") -> bool:
+        """
+        Restart the supervised browser.
+
+        Args:
+            reason: Why (for the log)
+
+        Returns:
+            True if the browser came back up
+        """
+        log.info("[SUPERVISOR] Restarting %s (%s)", self.browser.get_browser_info().name, reason)
+        ok = self.browser.restart()
+        self.restarts += 1
+        self.jobs_since_restart = 0
+        self.last_metrics = None
+        self.recycle_reason = None if ok else reason
+        return ok
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Supervisor counters.
+
+        Returns:
+            Dictionary with restarts, jobs since restart and latest metrics
+        """
+        return {
+            'restarts': self.restarts,
+            'jobs_since_restart': self.jobs_since_restart,
+            'recycle_pending': self.recycle_reason,
+            'metrics': self.last_metrics.to_dict() if self.last_metrics else None,
+        }
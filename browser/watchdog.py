@@ -0,0 +1,240 @@
+"""
+Browser Watchdog
+================
+Detects renderer crashes, browser exits and hung ChromeDriver calls so the
+current job fails fast and the browser is respawned for the next one.
+
+Signals:
+- CDP events on a direct DevTools connection: Target.targetCrashed,
+  Inspector.targetCrashed (per page session) and Target.targetDestroyed
+  for the last open page
+- DevTools WebSocket closing unexpectedly
+- Process liveness: BrowserLauncher.process (or the process owning the
+  debug port when attached to an existing browser), confirmed against the
+  DevTools endpoint because some launchers hand off to another process
+- Hard per-call deadline on every WebDriver HTTP command
+
+Code that waits in loops (e.g. CometConversion.capture_response) calls
+watchdog.check(), which raises BrowserCrashedError once a crash was seen.
+
+Usage:
+    watchdog = BrowserWatchdog(debug_port=9222, process=launcher.process)
+    watchdog.start()
+    watchdog.guard_driver(driver)
+    ...
+    watchdog.check()          # raises BrowserCrashedError after a crash
+"""
+
+from typing import Any, Dict, Optional, Set
+import subprocess
+import threading
+import time
+
+import requests
+
+from cdp import CDPConnection, CDPConnectionClosed, CDPError
+from logger import get_logger
+
+log = get_logger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class BrowserCrashedError(RuntimeError):
+    """The browser or its page crashed, exited or stopped responding."""
+
+
+def set_command_deadline(driver: Any, seconds: float) -> bool:
+    """
+    Apply a hard HTTP timeout to every WebDriver command of a driver.
+
+    A hung ChromeDriver (or a renderer stuck in script) then raises after
+    `seconds` instead of blocking indefinitely.
+
+    Args:
+        driver: Selenium WebDriver (instrumented proxies are fine)
+        seconds: Per-command deadline
+
+    Returns:
+        True if the deadline was applied
+    """
+    executor = getattr(driver, 'command_executor', None)
+    client_config = getattr(executor, '_client_config', None)
+    if client_config is not None:
+        client_config.timeout = seconds
+        return True
+
+    # Older Selenium: class-level timeout shared by all connections
+    try:
+        from selenium.webdriver.remote.remote_connection import RemoteConnection
+        RemoteConnection.set_timeout(seconds)
+        return True
+    except Exception as e:
+        log.warning("[WATCHDOG] Could not set WebDriver command deadline: %s", e)
+        return False
+
+
+class BrowserWatchdog:
+    """
+    Watches one browser for crashes, exits and hangs.
+    """
+
+    def __init__(self, debug_port: int, process: Optional[subprocess.Popen] = None,
+                 command_timeout: float = 30.0, poll_interval: float = 1.0):
+        """
+        Initialize watchdog.
+
+        Args:
+            debug_port: Browser remote debugging port
+            process: Browser process started by the launcher (None if attached)
+            command_timeout: Hard deadline for each WebDriver command (seconds)
+            poll_interval: Seconds between process liveness checks
+        """
+        self.debug_port = debug_port
+        self.process = process
+        self.command_timeout = command_timeout
+        self.poll_interval = poll_interval
+        self.crash_reason: Optional[str] = None
+        self.crashed = threading.Event()
+        self._conn: Optional[CDPConnection] = None
+        self._pages: Set[str] = set()
+        self._sessions: Dict[str, str] = {}  # sessionId -> targetId
+        self._pid: Optional[int] = None
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> "BrowserWatchdog":
+        """Connect to DevTools and start the liveness poller."""
+        self._stop.clear()
+        try:
+            self._conn = CDPConnection.from_port(self.debug_port)
+            self._conn.on("Target.targetCrashed", self._on_target_crashed)
+            self._conn.on("Target.targetDestroyed", self._on_target_destroyed)
+            self._conn.on("Target.targetCreated", self._on_target_created)
+            self._conn.on("Inspector.targetCrashed", self._on_inspector_crashed)
+            self._conn.on_close(self._on_connection_closed)
+            self._conn.send("Target.setDiscoverTargets", {'discover': True})
+            for info in self._conn.send("Target.getTargets").get('targetInfos', []):
+                if info.get('type') == 'page':
+                    self._watch_page(info['targetId'])
+        except Exception as e:
+            log.warning("[WATCHDOG] CDP events unavailable (%s) - process checks only", e)
+            self._conn = None
+
+        if self.process is None and PSUTIL_AVAILABLE:
+            from .supervisor import find_browser_pid
+            self._pid = find_browser_pid(self.debug_port)
+
+        self._poller = threading.Thread(target=self._poll_loop, name="watchdog", daemon=True)
+        self._poller.start()
+        log.info("[WATCHDOG] Watching browser on port %s", self.debug_port)
+        return self
+
+    def stop(self):
+        """Stop watching (does not touch the browser)."""
+        self._stop.set()
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            conn.close()
+
+    def guard_driver(self, driver: Any) -> bool:
+        """
+        Apply the per-command deadline to a WebDriver.
+
+        Args:
+            driver: Selenium WebDriver
+
+        Returns:
+            True if the deadline was applied
+        """
+        return set_command_deadline(driver, self.command_timeout)
+
+    # ==================== Status ====================
+
+    def check(self):
+        """
+        Raise if a crash has been detected.
+
+        Raises:
+            BrowserCrashedError: With the crash reason
+        """
+        if self.crashed.is_set():
+            raise BrowserCrashedError(self.crash_reason or "Browser crashed")
+
+    def mark_crashed(self, reason: str):
+        """Record a crash (first reason wins)."""
+        if self.crashed.is_set() or self._stop.is_set():
+            return
+        self.crash_reason = reason
+        self.crashed.set()
+        log.error("[WATCHDOG] ✗ %s", reason)
+
+    # ==================== CDP events ====================
+
+    def _watch_page(self, target_id: str):
+        """Attach to a page so Inspector.targetCrashed is delivered for it."""
+        self._pages.add(target_id)
+        try:
+            session_id = self._conn.attach(target_id)
+            self._sessions[session_id] = target_id
+            self._conn.send("Inspector.enable", session_id=session_id)
+        except (CDPError, CDPConnectionClosed, TimeoutError) as e:
+            log.debug("[WATCHDOG] Could not attach to %s: %s", target_id, e)
+
+    def _on_target_created(self, params: Dict[str, Any], session_id: Optional[str]):
+        info = params.get('targetInfo', {})
+        if info.get('type') == 'page' and info.get('targetId') not in self._pages:
+            # Attach off the reader thread (send() waits for the reader)
+            threading.Thread(target=self._watch_page, args=(info['targetId'],), daemon=True).start()
+
+    def _on_target_crashed(self, params: Dict[str, Any], session_id: Optional[str]):
+        self.mark_crashed(
+            f"Target {params.get('targetId')} crashed "
+            f"(status={params.get('status')}, code={params.get('errorCode')})"
+        )
+
+    def _on_inspector_crashed(self, params: Dict[str, Any], session_id: Optional[str]):
+        self.mark_crashed(f"Renderer crashed (target {self._sessions.get(session_id, '?')})")
+
+    def _on_target_destroyed(self, params: Dict[str, Any], session_id: Optional[str]):
+        target_id = params.get('targetId')
+        if target_id in self._pages:
+            self._pages.discard(target_id)
+            if not self._pages:
+                self.mark_crashed("Last page target was destroyed")
+
+    def _on_connection_closed(self):
+        if not self._stop.is_set():
+            self.mark_crashed("DevTools connection closed (browser exited?)")
+
+    # ==================== Process liveness ====================
+
+    def _poll_loop(self):
+        """Check process liveness until stopped or crashed."""
+        while not self._stop.wait(self.poll_interval):
+            if self.crashed.is_set():
+                return
+            if not self._process_alive() and not self._devtools_alive():
+                self.mark_crashed("Browser process exited")
+                return
+
+    def _process_alive(self) -> bool:
+        if self.process is not None:
+            return self.process.poll() is None
+        if self._pid is not None and PSUTIL_AVAILABLE:
+            return psutil.pid_exists(self._pid)
+        return True  # Nothing to check against
+
+    def _devtools_alive(self) -> bool:
+        try:
+            return requests.get(
+                f"http://127.0.0.1:{self.debug_port}/json/version", timeout=0.5
+            ).ok
+        except Exception:
+            return False
@@ -12,6 +12,12 @@ import subprocess
 import time
 import requests
 
+from profiling.timer import StepTimer
+from profiling.driver_proxy import InstrumentedDriver
+from logger import get_logger
+
+log = get_logger(__name__)
+
 
 @dataclass
 class BrowserConfig:
@@ -24,6 +30,8 @@ class BrowserConfig:
     user_data_dir: Optional[Path] = None
     extra_args: List[str] = field(default_factory=list)
     timeout: float = 12.0
+    instrument_driver: bool = False  # Wrap driver in profiling.InstrumentedDriver
+    reuse_existing: bool = False  # Attach to a healthy browser already on debug_port instead of relaunching
     
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -51,6 +59,7 @@ class BrowserLauncher(ABC):
         self.config = config
         self.process: Optional[subprocess.Popen] = None
         self.driver = None
+        self.timer = StepTimer()  # Replaced by the Browser facade's timer when owned by one
         
     @abstractmethod
     def get_launch_args(self) -> List[str]:
@@ -82,7 +91,7 @@ class BrowserLauncher(ABC):
         try:
             import psutil
         except ImportError:
-            print("[WARN] psutil not installed - cannot kill existing processes")
+            log.warning("psutil not installed - cannot kill existing processes")
             return 0
         
         killed_count = 0
@@ -97,7 +106,7 @@ class BrowserLauncher(ABC):
                 # Check if process matches any of our target names
                 if any(pname.lower() in name or pname.lower() in exe or pname.lower() in cmd 
                        for pname in process_names):
-                    print(f"[+] Killing existing process pid={proc.pid} ({name})")
+                    log.info("[+] Killing existing process pid=%s (%s)", proc.pid, name)
                     proc.kill()
                     killed_count += 1
             except Exception:
@@ -125,7 +134,7 @@ class BrowserLauncher(ABC):
         if try_alternate_format:
             args = [str(self.config.executable_path), "--"] + args[1:]
         
-        print(f"[*] Launching {self.__class__.__name__}:", " ".join(args))
+        log.info("[*] Launching %s: %s", self.__class__.__name__, ' '.join(args))
         
         # Launch from exe folder as working directory
         cwd = str(self.config.executable_path.parent)
@@ -169,6 +178,67 @@ class BrowserLauncher(ABC):
             f"Last error: {last_exc}"
         )
     
+    def find_running_browser(self) -> Optional[Dict[str, Any]]:
+        """
+        Health check for attach-only mode.
+        
+        A running browser is reusable when its DevTools endpoint answers on
+        debug_port and (if user_data_dir is set) the process that owns the
+        port was started with that profile.
+        
+        Returns:
+            DevTools version information, or None if no reusable browser
+        """
+        url = f"http://127.0.0.1:{self.config.debug_port}/json/version"
+        try:
+            r = requests.get(url, timeout=0.5)
+            if not r.ok:
+                return None
+            devtools_info = r.json()
+        except Exception:
+            return None
+        
+        if self.config.user_data_dir and not self._profile_matches():
+            log.info("[*] Browser on port %s uses a different profile - not reusing",
+                     self.config.debug_port)
+            return None
+        
+        return devtools_info
+    
+    def _profile_matches(self) -> bool:
+        """
+        Check that a process with our debug port also uses our profile.
+        
+        Returns:
+            True if found (or psutil is unavailable and the check is skipped)
+        """
+        try:
+            import psutil
+        except ImportError:
+            log.warning("psutil not installed - cannot verify browser profile")
+            return True
+        
+        port_arg = f"--remote-debugging-port={self.config.debug_port}"
+        expected = {
+            str(self.config.user_data_dir),
+            str(Path(self.config.user_data_dir).resolve()),
+            str(self.config.executable_path.parent / self.config.user_data_dir),
+        }
+        
+        for proc in psutil.process_iter(['cmdline']):
+            try:
+                cmdline = proc.info.get('cmdline') or []
+                if port_arg not in cmdline:
+                    continue
+                for arg in cmdline:
+                    if arg.startswith("--user-data-dir="):
+                        if arg.split("=", 1)[1] in expected:
+                            return True
+            except Exception:
+                pass
+        
+        return False
+    
     @abstractmethod
     def attach_selenium(self) -> Any:
         """
@@ -183,17 +253,36 @@ class BrowserLauncher(ABC):
         """
         Complete workflow: kill existing processes, launch browser, attach Selenium.
         
+        With config.reuse_existing, a healthy browser already listening on
+        debug_port is attached to directly (no kill, profile wipe or launch);
+        the full launch runs only if that health check or attach fails.
+        
         Args:
             kill_existing: Whether to kill existing browser processes first
             
         Returns:
             Selenium WebDriver instance
         """
+        if self.config.reuse_existing:
+            with self.timer.measure("health_check"):
+                devtools_info = self.find_running_browser()
+            if devtools_info:
+                log.info("[*] Reusing running browser: %s", devtools_info.get('Browser'))
+                try:
+                    if self._attach():
+                        return self.driver
+                except Exception as e:
+                    log.warning("Attach to running browser failed: %s", e)
+                log.info("[*] Falling back to full launch...")
+            else:
+                log.info("[*] No reusable browser on port %s - launching", self.config.debug_port)
+        
         # Step 1: Kill existing processes
         if kill_existing:
-            killed = self.kill_existing_processes()
-            if killed > 0:
-                time.sleep(1)  # Give processes time to fully terminate
+            with self.timer.measure("process_kill"):
+                killed = self.kill_existing_processes()
+                if killed > 0:
+                    time.sleep(1)  # Give processes time to fully terminate
             
             # Clean user data directory to start fresh (prevents tab accumulation)
             if self.config.user_data_dir:
@@ -201,39 +290,59 @@ class BrowserLauncher(ABC):
                 user_data_path = Path(self.config.user_data_dir)
                 if user_data_path.exists():
                     try:
-                        print(f"[*] Cleaning profile directory: {user_data_path}")
-                        shutil.rmtree(user_data_path)
-                        print(f"[*] Profile cleaned successfully")
+                        log.info("[*] Cleaning profile directory: %s", user_data_path)
+                        with self.timer.measure("profile_wipe"):
+                            shutil.rmtree(user_data_path)
+                        log.info("[*] Profile cleaned successfully")
                     except Exception as e:
-                        print(f"[WARN] Could not clean profile: {e}")
+                        log.warning("Could not clean profile: %s", e)
         
         # Step 2: Launch browser
         try:
-            self.launch_browser(try_alternate_format=False)
-            devtools_info = self.wait_for_devtools()
+            with self.timer.measure("launch"):
+                self.launch_browser(try_alternate_format=False)
+            with self.timer.measure("devtools_wait"):
+                devtools_info = self.wait_for_devtools()
         except RuntimeError:
             # Try alternate argument format
-            print("[*] Retrying with alternate argument format...")
+            log.info("[*] Retrying with alternate argument format...")
             if self.process:
                 try:
                     self.process.kill()
                 except Exception:
                     pass
             
-            self.launch_browser(try_alternate_format=True)
-            devtools_info = self.wait_for_devtools()
+            with self.timer.measure("launch"):
+                self.launch_browser(try_alternate_format=True)
+            with self.timer.measure("devtools_wait"):
+                devtools_info = self.wait_for_devtools()
         
-        print(f"[*] DevTools available. Browser: {devtools_info.get('Browser')}")
-        print(f"[*] WebSocket URL: {devtools_info.get('webSocketDebuggerUrl')}")
+        log.info("[*] DevTools available. Browser: %s", devtools_info.get('Browser'))
+        log.info("[*] WebSocket URL: %s", devtools_info.get('webSocketDebuggerUrl'))
         
         # Step 3: Attach Selenium
-        print("[*] Attaching Selenium WebDriver...")
-        self.driver = self.attach_selenium()
+        self._attach()
+        return self.driver
+    
+    def _attach(self) -> Any:
+        """
+        Attach Selenium (and optional instrumentation) to the running browser.
+        
+        Returns:
+            Selenium WebDriver instance, or None if attach failed
+        """
+        log.info("[*] Attaching Selenium WebDriver...")
+        with self.timer.measure("driver_attach"):
+            self.driver = self.attach_selenium()
+        
+        if self.driver and self.config.instrument_driver:
+            log.info("[*] WebDriver command instrumentation enabled")
+            self.driver = InstrumentedDriver(self.driver)
         
         if self.driver:
-            print("[*] Selenium attached successfully!")
+            log.info("[*] Selenium attached successfully!")
         else:
-            print("[!] Selenium attach failed")
+            log.error("[!] Selenium attach failed")
         
         return self.driver
     
@@ -243,7 +352,7 @@ class BrowserLauncher(ABC):
             try:
                 self.driver.quit()
             except Exception as e:
-                print(f"[WARN] Error closing driver: {e}")
+                log.warning("Error closing driver: %s", e)
         
         if self.process:
             try:
@@ -0,0 +1,63 @@
+"""
+Campaign Module
+===============
+Fuzzing campaigns: run a corpus of HTML test cases through a browser,
+with CPU-bound work (preparing cases, hashing/compressing/classifying
+results) in bounded process-pool stages around the browser loop.
+
+Components:
+- CampaignRunner: Corpus -> prepare stage -> browser loop -> analyze stage
+- ProcessPoolStage: Process pool with back-pressure (max_pending)
+- CaseResult / Verdict: Per-case outcome written to results.jsonl
+- CoverageFuzzer: Coverage-guided mutation loop (CDP precise coverage)
+- Minimizer: Parallel, cached delta debugging of cases that triggered an oracle
+- CampaignScheduler: UCB1/epsilon-greedy over attack buckets, weighted by yield
+- RunManifest: Skips cases unchanged since their last result (incremental re-runs)
+- AnswerClusterer: MinHash/LSH clusters of near-identical assistant answers
+
+Usage:
+    python -m campaign --browser chromium_headless --corpus htmls --output output/campaign
+
+    # From Python
+    from campaign import CampaignRunner, CampaignConfig
+    summary = CampaignRunner(browser, config=CampaignConfig(workers=4)).run()
+    summary = CoverageFuzzer(browser, config=FuzzerConfig(max_execs=10000)).run()
+"""
+
+from .clustering import AnswerClusterer, Cluster, cluster_results
+from .coverage import CoverageCollector, CoverageMap
+from .fuzzer import CoverageFuzzer, FuzzerConfig
+from .manifest import RunManifest, environment_key
+from .minimizer import FunctionReproducer, MinimizationResult, Minimizer, Reproducer, XSSReproducer
+from .runner import CampaignConfig, CampaignRunner, CampaignSummary
+from .scheduler import BanditScheduler, CampaignScheduler, SeedPool
+from .stage import ProcessPoolStage, StageOutput
+from .tasks import CaseResult, Observation, Verdict
+
+__all__ = [
+    'AnswerClusterer',
+    'BanditScheduler',
+    'CampaignConfig',
+    'CampaignRunner',
+    'CampaignScheduler',
+    'CampaignSummary',
+    'CaseResult',
+    'Cluster',
+    'CoverageCollector',
+    'CoverageFuzzer',
+    'CoverageMap',
+    'FunctionReproducer',
+    'FuzzerConfig',
+    'MinimizationResult',
+    'Minimizer',
+    'Observation',
+    'ProcessPoolStage',
+    'SeedPool',
+    'Reproducer',
+    'RunManifest',
+    'StageOutput',
+    'Verdict',
+    'XSSReproducer',
+    'cluster_results',
+    'environment_key',
+]
@@ -0,0 +1,183 @@
+"""
+Campaign Entry Point
+====================
+Usage:
+    python -m campaign --browser chromium_headless --corpus htmls --output output/campaign
+    python -m campaign --attacks XSS_DOM,CSP_BYPASS --workers 4 --max-pending 16
+    python -m campaign --mutants-per-case 100 --seed 7
+    python -m campaign --fuzz --max-execs 50000 --coverage-target perplexity.ai/sidecar
+    python -m campaign --attacks XSS_DOM --minimize --minimize-tabs 8
+    python -m campaign --schedule ucb1 --max-cases 20000
+    python -m campaign --schedule ucb1 --query "Summarize this page" --cluster-answers
+    python -m campaign --incremental  # Only cases edited since the last run
+    python -m campaign --packed htmls.pack  # Cases served from a packed corpus (python -m corpus pack)
+    python -m campaign --query "Summarize this page" --response-cache output/conversations.db
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from browser import BrowserFactory, BrowserType
+from logger import configure_logging
+from corpus import Corpus, PackedCorpusServer, TestCase
+from campaign.clustering import AnswerClusterer, cluster_results
+from campaign.fuzzer import CoverageFuzzer, FuzzerConfig
+from campaign.runner import CampaignConfig, CampaignRunner
+from campaign.scheduler import CampaignScheduler
+from campaign.tasks import Verdict
+
+
+def minimize(browser, results, corpus: Corpus, args):
+    """Minimize executed cases into the corpus as <name>_min."""
+    from cdp import CDPConnection
+    from campaign.minimizer import Minimizer, XSSReproducer
+
+    conn = CDPConnection.from_port(browser._launcher.config.debug_port)
+    spool_dir = str(Path(args.output) / "minimize")
+    try:
+        with XSSReproducer(conn, tabs=args.minimize_tabs, spool_dir=spool_dir) as reproducer:
+            minimizer = Minimizer(reproducer)
+            for result in results:
+                case = TestCase(attack=result.attack, name=Path(result.case_path).stem,
+                                path=result.case_path)
+                minimizer.save(minimizer.minimize(case), corpus, case)
+    finally:
+        conn.close()
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run an HTML corpus through a browser")
+    parser.add_argument("--browser", default=BrowserType.COMET.value,
+                        choices=[bt.value for bt in BrowserType], help="Browser type")
+    parser.add_argument("--corpus", default="htmls", help="Corpus directory")
+    parser.add_argument("--attacks", default=None,
+                        help="Comma-separated attack names (default: all of the browser's)")
+    parser.add_argument("--query", default=None, help="Ask the assistant this after each case loads")
+    parser.add_argument("--workers", type=int, default=None, help="Processes per pool stage")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Max in-flight items per pool stage (back-pressure)")
+    parser.add_argument("--max-cases", type=int, default=None, help="Stop after this many cases")
+    parser.add_argument("--mutants-per-case", type=int, default=None,
+                        help="Run this many HTMLMutator mutants of each corpus case instead of the cases")
+    parser.add_argument("--seed", type=int, default=0, help="Mutator seed")
+    parser.add_argument("--schedule", default=None, choices=["ucb1", "epsilon_greedy"],
+                        help="Run mutants picked by a bandit over attack buckets (yield-weighted)")
+    parser.add_argument("--fuzz", action="store_true",
+                        help="Coverage-guided fuzzing: mutate cases that reach new JS coverage")
+    parser.add_argument("--max-execs", type=int, default=10000, help="Fuzzing: cases to run")
+    parser.add_argument("--time-budget", type=float, default=None, help="Fuzzing: seconds to run")
+    parser.add_argument("--coverage-target", action="append", default=[],
+                        help="Fuzzing: also take coverage of targets whose URL contains this")
+    parser.add_argument("--minimize", action="store_true",
+                        help="Minimize cases the XSS oracle marked executed and save them to the corpus")
+    parser.add_argument("--minimize-tabs", type=int, default=4, help="Tabs running minimizer candidates")
+    parser.add_argument("--cluster-answers", action="store_true",
+                        help="Cluster near-identical answers (de-prioritizes well-known ones with --schedule); "
+                             "needs NumPy in practice, the pure-Python fallback is very slow")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip cases whose content, query and browser version are unchanged since their last run")
+    parser.add_argument("--packed", default=None,
+                        help="Run the cases of this packed corpus, served over local HTTP")
+    parser.add_argument("--response-cache", default=None,
+                        help="SQLite file caching answers by (query, page hash, browser version)")
+    parser.add_argument("--response-cache-ttl", type=float, default=24 * 3600.0,
+                        help="Seconds a cached answer stays valid")
+    parser.add_argument("--output", default="output/campaign", help="Results directory")
+    parser.add_argument("--no-snapshots", action="store_true", help="Do not keep page snapshots")
+    parser.add_argument("--watchdog", action="store_true",
+                        help="Detect renderer crashes/hangs and respawn the browser")
+    parser.add_argument("--log-level", default=None,
+                        help="DEBUG, INFO, WARNING or ERROR (default: $FUZZER_LOG_LEVEL or INFO)")
+    parser.add_argument("--log-format", default=None, choices=["console", "json"],
+                        help="Default: $FUZZER_LOG_FORMAT or console")
+    args = parser.parse_args(argv)
+    if args.incremental:
+        # The manifest only tracks corpus cases; generated/served cases would all run and none be recorded
+        modes = [flag for flag, value in (("--schedule", args.schedule), ("--packed", args.packed),
+                                          ("--mutants-per-case", args.mutants_per_case), ("--fuzz", args.fuzz))
+                 if value]
+        if modes:
+            parser.error(f"--incremental cannot be combined with {', '.join(modes)}")
+
+    configure_logging(level=args.log_level, fmt=args.log_format)
+
+    browser = BrowserFactory.create(BrowserType(args.browser))
+    browser.enable_watchdog = args.watchdog
+    attacks = args.attacks.split(",") if args.attacks else browser.get_attack_names()
+
+    settings = dict(
+        query=args.query,
+        workers=args.workers,
+        max_pending=args.max_pending,
+        max_cases=args.max_cases,
+        output_dir=args.output,
+        keep_snapshots=not args.no_snapshots,
+        incremental=args.incremental,
+        response_cache=args.response_cache,
+        response_cache_ttl=args.response_cache_ttl
+    )
+    if args.fuzz:
+        config = FuzzerConfig(max_execs=args.max_execs, time_budget_s=args.time_budget,
+                              seed=args.seed, extra_targets=args.coverage_target, **settings)
+    else:
+        config = CampaignConfig(**settings)
+
+    corpus = Corpus(args.corpus, attacks=attacks)
+    cases = None
+    scheduler = None
+    server = None
+    if args.packed and not args.fuzz:
+        server = PackedCorpusServer(args.packed).start()
+        wanted = set(attacks)
+        cases = (case for case in server.pack.iter_cases(base_url=server.base_url)
+                 if case.attack in wanted)
+    elif args.schedule and not args.fuzz:
+        clusterer = AnswerClusterer() if args.cluster_answers else None
+        scheduler = CampaignScheduler(corpus, attacks, policy=args.schedule, seed=args.seed,
+                                      clusterer=clusterer)
+        cases = scheduler.stream(total=args.max_cases or 10000)
+    elif args.mutants_per_case and not args.fuzz:
+        from generator import HTMLMutator
+        cases = HTMLMutator(seed=args.seed).stream(corpus.iter_cases(), per_case=args.mutants_per_case)
+
+    executed = []
+
+    def on_result(result):
+        if scheduler is not None:
+            scheduler.record(result)
+        if args.minimize and result.verdict == Verdict.EXECUTED and result.case_path:
+            executed.append(result)
+
+    if not browser.launch():
+        return 1
+    try:
+        if args.fuzz:
+            fuzzer = CoverageFuzzer(browser, corpus, config, on_result=on_result)
+            summary = fuzzer.run()
+        else:
+            summary = CampaignRunner(browser, corpus, config, on_result=on_result).run(cases)
+        if executed:
+            minimize(browser, executed, Corpus(args.corpus), args)
+    finally:
+        browser.quit()
+        if server is not None:
+            server.stop()
+
+    print(json.dumps(summary.to_dict(), indent=2))
+    if args.fuzz:
+        print(json.dumps(fuzzer.coverage.stats(), indent=2))
+    if scheduler is not None:
+        print(json.dumps(scheduler.stats(), indent=2))
+    if args.cluster_answers and (scheduler is not None or summary.results_path):
+        clusterer = scheduler.clusterer if scheduler is not None else cluster_results(summary.results_path)
+        for cluster in clusterer.clusters(min_size=2)[:20]:
+            print(f"{cluster.size:6d}  {cluster.representative}  {cluster.sample[:80]!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
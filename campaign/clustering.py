@@ -0,0 +1,307 @@
+"""
+Answer Clustering
+=================
+Near-duplicate clustering of captured assistant answers with MinHash and
+locality-sensitive hashing, so thousands of near-identical refusals are
+reviewed as one representative per cluster.
+
+- Shingles: character k-grams of the normalized answer (lowercase,
+  collapsed whitespace), hashed with crc32
+- MinHash: num_perm universal hashes (a*x + b) mod (2^31 - 1); with NumPy
+  a batch of answers is one (num_perm x shingles) matrix and per-answer
+  minima come from np.minimum.reduceat. Batches are cut at `max_columns`
+  shingles (64k columns = 64 MiB of uint64 at num_perm=128), not at a
+  fixed number of answers, so long answers cannot blow up memory.
+- NumPy is effectively required (it is in requirements.txt): the pure-Python
+  fallback gives identical signatures but took ~25 s per 256 answers, which
+  only suits small tests.
+- LSH: the signature is cut into `bands` bands; answers sharing any band
+  bucket are candidates, and join the cluster of the first candidate
+  representative whose estimated Jaccard similarity reaches `threshold`.
+  The banding midpoint (1/bands)^(1/rows) must sit well below `threshold`,
+  or pairs just above it are often never compared: the default 32 bands x
+  4 rows put it at ~0.42 and find a 0.7-similar pair with p > 0.999.
+
+Usage:
+    clusterer = AnswerClusterer(threshold=0.7)
+    clusterer.add_many((r['case_id'], r['response']) for r in results if r['response'])
+    for cluster in clusterer.clusters()[:10]:
+        print(cluster.size, cluster.representative, cluster.sample)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import random
+import re
+import zlib
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+_PRIME = (1 << 31) - 1  # a * x stays below 2^63 for x < 2^32
+_WHITESPACE = re.compile(r"\s+")
+
+
+def shingles(text: str, size: int = 5) -> List[int]:
+    """
+    Hashed character shingles of a normalized text.
+
+    Args:
+        text: Answer text
+        size: Characters per shingle
+
+    Returns:
+        Distinct shingle hashes (at least one, even for short or empty text)
+    """
+    normalized = _WHITESPACE.sub(" ", text.lower()).strip()
+    if len(normalized) <= size:
+        return [zlib.crc32(normalized.encode('utf-8'))]
+    encoded = normalized.encode('utf-8')
+    return list({zlib.crc32(encoded[i:i + size]) for i in range(len(encoded) - size + 1)})
+
+
+@dataclass
+class Cluster:
+    """One group of near-identical answers."""
+    cluster_id: int
+    representative: str  # Key of the first member
+    sample: str  # Start of the representative's text
+    members: List[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+class AnswerClusterer:
+    """
+    Incremental MinHash/LSH clustering of answer texts.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 5,
+                 threshold: float = 0.7, seed: int = 1, batch_size: int = 256,
+                 max_columns: int = 1 << 16):
+        """
+        Initialize clusterer.
+
+        Args:
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be a multiple; rows = num_perm / bands);
+                keep (1/bands)^(1/rows) well below threshold
+            shingle_size: Characters per shingle
+            threshold: Minimum estimated Jaccard similarity to join a cluster
+            seed: Seed of the hash family (signatures are comparable for equal seeds)
+            batch_size: Answers per add_many() batch
+            max_columns: Shingles per vectorized MinHash matrix (bounds its memory)
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.max_columns = max_columns
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if not NUMPY_AVAILABLE:
+            log.warning("[CLUSTER] NumPy not installed - pure-Python MinHash is very slow (pip install numpy)")
+        if NUMPY_AVAILABLE:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+        self._buckets: List[Dict[bytes, int]] = [{} for _ in range(bands)]  # band key -> cluster id
+        self._signatures: List[Any] = []  # Representative signature per cluster
+        self.clusters_by_id: List[Cluster] = []
+        self._cluster_of: Dict[str, int] = {}
+
+    # ==================== MinHash ====================
+
+    def signatures(self, texts: Sequence[str]) -> List[Any]:
+        """
+        MinHash signatures of texts.
+
+        Args:
+            texts: Answer texts
+
+        Returns:
+            One signature per text (NumPy uint64 rows, or tuples without NumPy)
+        """
+        shingle_sets = [shingles(text, self.shingle_size) for text in texts]
+        if not shingle_sets:
+            return []
+        if not NUMPY_AVAILABLE:
+            return [
+                tuple(min((a * (x % _PRIME) + b) % _PRIME for x in values)
+                      for a, b in zip(self._a, self._b))
+                for values in shingle_sets
+            ]
+
+        result: List[Any] = []
+        for batch in self._column_batches(shingle_sets):
+            if len(batch[0]) > self.max_columns:
+                result.append(self._long_signature(batch[0]))
+                continue
+            lengths = np.fromiter((len(values) for values in batch), dtype=np.int64, count=len(batch))
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            values = np.fromiter((x for v in batch for x in v), dtype=np.uint64, count=int(lengths.sum()))
+            hashed = (self._a_np * (values % _PRIME) + self._b_np) % _PRIME  # (num_perm, total)
+            minima = np.minimum.reduceat(hashed, offsets, axis=1)  # (num_perm, len(batch))
+            result.extend(minima.T.copy())
+        return result
+
+    def _column_batches(self, shingle_sets: List[List[int]]) -> Iterable[List[List[int]]]:
+        """Consecutive runs of shingle sets with at most max_columns shingles (longer sets alone)."""
+        batch: List[List[int]] = []
+        columns = 0
+        for values in shingle_sets:
+            if batch and columns + len(values) > self.max_columns:
+                yield batch
+                batch, columns = [], 0
+            batch.append(values)
+            columns += len(values)
+        if batch:
+            yield batch
+
+    def _long_signature(self, values: List[int]) -> Any:
+        """Signature of one answer with more than max_columns shingles, in column chunks."""
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, len(values), self.max_columns):
+            chunk = np.array(values[start:start + self.max_columns], dtype=np.uint64)
+            hashed = (self._a_np * (chunk % _PRIME) + self._b_np) % _PRIME
+            np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+
+    def _band_keys(self, signature: Any) -> List[bytes]:
+        rows = self.rows
+        if NUMPY_AVAILABLE:
+            return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+        return [repr(signature[i * rows:(i + 1) * rows]).encode() for i in range(self.bands)]
+
+    def similarity(self, first: Any, second: Any) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        if NUMPY_AVAILABLE:
+            return float(np.count_nonzero(first == second)) / self.num_perm
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    # ==================== Clustering ====================
+
+    def add_many(self, items: Iterable[Tuple[str, str]]) -> List[int]:
+        """
+        Cluster answers (signatures computed in vectorized batches).
+
+        Args:
+            items: (key, text) pairs, e.g. (case_id, response)
+
+        Returns:
+            Cluster id per item
+        """
+        items = list(items)
+        cluster_ids: List[int] = []
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            signatures = self.signatures([text for _, text in batch])
+            for (key, text), signature in zip(batch, signatures):
+                cluster_ids.append(self._assign(key, text, signature))
+        return cluster_ids
+
+    def add(self, key: str, text: str, signature: Any = None) -> int:
+        """
+        Cluster one answer.
+
+        Args:
+            key: Identifier (e.g. case_id)
+            text: Answer text
+            signature: Precomputed signatures([text])[0] (e.g. computed outside a lock)
+
+        Returns:
+            Cluster id
+        """
+        if signature is None:
+            signature = self.signatures([text])[0]
+        return self._assign(key, text, signature)
+
+    def _assign(self, key: str, text: str, signature: Any) -> int:
+        band_keys = self._band_keys(signature)
+        for band, band_key in enumerate(band_keys):
+            cluster_id = self._buckets[band].get(band_key)
+            if cluster_id is not None and \
+                    self.similarity(signature, self._signatures[cluster_id]) >= self.threshold:
+                break
+        else:
+            cluster_id = len(self.clusters_by_id)
+            self.clusters_by_id.append(Cluster(cluster_id, key, text[:200]))
+            self._signatures.append(signature)
+            for band, band_key in enumerate(band_keys):
+                self._buckets[band].setdefault(band_key, cluster_id)
+        self.clusters_by_id[cluster_id].members.append(key)
+        self._cluster_of[key] = cluster_id
+        return cluster_id
+
+    def cluster_of(self, key: str) -> Optional[Cluster]:
+        """Cluster an added key belongs to."""
+        cluster_id = self._cluster_of.get(key)
+        return None if cluster_id is None else self.clusters_by_id[cluster_id]
+
+    def clusters(self, min_size: int = 1) -> List[Cluster]:
+        """
+        Clusters, largest first.
+
+        Args:
+            min_size: Skip smaller clusters
+
+        Returns:
+            List of Cluster
+        """
+        return sorted((c for c in self.clusters_by_id if c.size >= min_size), key=lambda c: -c.size)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters.
+
+        Returns:
+            Dictionary with answers, clusters, the largest cluster and the backend
+        """
+        largest = max((c.size for c in self.clusters_by_id), default=0)
+        return {
+            'answers': len(self._cluster_of),
+            'clusters': len(self.clusters_by_id),
+            'largest_cluster': largest,
+            'backend': 'numpy' if NUMPY_AVAILABLE else 'python',
+        }
+
+
+def cluster_results(results_path: str, **kwargs) -> AnswerClusterer:
+    """
+    Cluster the answers of a campaign's results.jsonl.
+
+    Args:
+        results_path: results.jsonl written by CampaignRunner
+        **kwargs: AnswerClusterer arguments
+
+    Returns:
+        AnswerClusterer with every answered case added
+    """
+    clusterer = AnswerClusterer(**kwargs)
+
+    def answers():
+        with open(results_path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('response'):
+                    yield record['case_id'], record['response']
+
+    clusterer.add_many(answers())
+    log.info("[CLUSTER] %s", clusterer.stats())
+    return clusterer
@@ -0,0 +1,243 @@
+"""
+JS Coverage
+===========
+Per-case JavaScript block coverage through CDP precise coverage, folded
+into fixed-size bitmaps for fast novelty checks.
+
+Collection: Profiler.startPreciseCoverage (detailed, no call counts) before
+a case loads, Profiler.takePreciseCoverage after it ran. "take" also resets
+the counters, so every take covers exactly one case. Commands go through
+Selenium's execute_cdp_cmd for the page under test, or through a
+CDPConnection session for other targets (e.g. the Sidecar frame).
+
+Features: every covered block becomes (script, function, block ordinal),
+hashed (crc32) into a 2^bits bitmap held as a Python int. Scripts of the
+case document itself are keyed by "<case>" rather than by file URL, and
+blocks by ordinal rather than source offset, so the same code in two
+mutants maps to the same bits. Union, difference and popcount on int
+bitmaps run in C, one call per case.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+import zlib
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_MAP_BITS = 16
+
+SendFunction = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+
+def coverage_features(result: Dict[str, Any], case_url: Optional[str] = None) -> Iterator[str]:
+    """
+    Turn a Profiler.takePreciseCoverage result into feature strings.
+
+    Args:
+        result: CDP result ({'result': [ScriptCoverage, ...]})
+        case_url: URL of the case document (its scripts are keyed "<case>")
+
+    Yields:
+        "script|function|ordinal" for every block executed at least once
+    """
+    for script in result.get('result', []):
+        url = script.get('url') or ""
+        if not url:
+            continue  # eval()/injected snippets: offsets are meaningless across cases
+        if case_url and url.split('#')[0] == case_url:
+            key = "<case>"
+        else:
+            parts = urlsplit(url)
+            key = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        for function in script.get('functions', []):
+            name = function.get('functionName') or "<anonymous>"
+            for ordinal, block in enumerate(function.get('ranges', [])):
+                if block.get('count', 0) > 0:
+                    yield f"{key}|{name}|{ordinal}"
+
+
+def to_bitmap(features: Iterable[str], bits: int = DEFAULT_MAP_BITS) -> int:
+    """
+    Fold features into a bitmap.
+
+    Args:
+        features: Feature strings
+        bits: Bitmap size exponent (2^bits positions)
+
+    Returns:
+        Bitmap as an int
+    """
+    mask = (1 << bits) - 1
+    bitmap = 0
+    for feature in features:
+        bitmap |= 1 << (zlib.crc32(feature.encode('utf-8', errors='replace')) & mask)
+    return bitmap
+
+
+class CoverageCollector:
+    """
+    Starts and takes precise coverage on one target.
+    """
+
+    def __init__(self, send: SendFunction, name: str = "page"):
+        """
+        Initialize collector.
+
+        Args:
+            send: Function sending a CDP command to the target and returning its result
+            name: Label for logs
+        """
+        self.send = send
+        self.name = name
+        self.started = False
+
+    @classmethod
+    def from_driver(cls, driver: Any) -> "CoverageCollector":
+        """Collector for the WebDriver's current page."""
+        return cls(driver.execute_cdp_cmd, name="page")
+
+    @classmethod
+    def from_target(cls, debug_port: int, url_contains: str) -> Optional["CoverageCollector"]:
+        """
+        Collector for another target, e.g. the Sidecar/assistant frame.
+
+        Args:
+            debug_port: Browser remote debugging port
+            url_contains: Substring identifying the target's URL
+
+        Returns:
+            CoverageCollector, or None if no such target is open
+        """
+        from cdp import CDPConnection
+
+        conn = CDPConnection.from_port(debug_port)
+        for info in conn.send("Target.getTargets").get('targetInfos', []):
+            if url_contains in info.get('url', "") and info.get('type') in ('page', 'iframe', 'other'):
+                session_id = conn.attach(info['targetId'])
+                collector = cls(lambda method, params: conn.send(method, params, session_id=session_id),
+                                name=url_contains)
+                collector.connection = conn
+                return collector
+        conn.close()
+        return None
+
+    def start(self):
+        """Enable the profiler and start block coverage (idempotent)."""
+        if self.started:
+            return
+        self.send('Profiler.enable', {})
+        self.send('Profiler.startPreciseCoverage', {'callCount': False, 'detailed': True})
+        self.started = True
+
+    def take(self, case_url: Optional[str] = None, bits: int = DEFAULT_MAP_BITS) -> int:
+        """
+        Take (and reset) coverage since the last take.
+
+        Args:
+            case_url: URL of the case document
+            bits: Bitmap size exponent
+
+        Returns:
+            Bitmap of covered blocks (0 if coverage could not be read)
+        """
+        try:
+            result = self.send('Profiler.takePreciseCoverage', {})
+        except Exception as e:
+            log.debug("[COVERAGE] %s: takePreciseCoverage failed: %s", self.name, e)
+            self.started = False  # Renderer swapped or crashed: start again next case
+            return 0
+        return to_bitmap(coverage_features(result, case_url), bits)
+
+    def stop(self):
+        """Stop coverage (ignores errors for a gone target)."""
+        try:
+            self.send('Profiler.stopPreciseCoverage', {})
+        except Exception:
+            pass
+        self.started = False
+        connection = getattr(self, 'connection', None)
+        if connection is not None:
+            connection.close()
+
+
+class CoverageMap:
+    """
+    Accumulated coverage of a campaign, overall and per attack.
+    """
+
+    def __init__(self, bits: int = DEFAULT_MAP_BITS):
+        """
+        Initialize an empty map.
+
+        Args:
+            bits: Bitmap size exponent
+        """
+        self.bits = bits
+        self.total = 0
+        self.by_attack: Dict[str, int] = {}
+
+    def novelty(self, bitmap: int) -> int:
+        """Number of bits in `bitmap` not seen before."""
+        return (bitmap & ~self.total).bit_count()
+
+    def merge(self, bitmap: int, attack: Optional[str] = None) -> int:
+        """
+        Add a case's bitmap.
+
+        Args:
+            bitmap: Case coverage
+            attack: Attack name of the case
+
+        Returns:
+            Number of new bits
+        """
+        new_bits = self.novelty(bitmap)
+        self.total |= bitmap
+        key = attack or ''
+        self.by_attack[key] = self.by_attack.get(key, 0) | bitmap
+        return new_bits
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Coverage counters.
+
+        Returns:
+            Dictionary with covered bits overall, per attack and the map size
+        """
+        return {
+            'map_size': 1 << self.bits,
+            'covered': self.total.bit_count(),
+            'by_attack': {attack: bitmap.bit_count() for attack, bitmap in self.by_attack.items()},
+        }
+
+    def to_bytes(self) -> bytes:
+        """Overall bitmap as bytes (for saving/resuming)."""
+        return self.total.to_bytes((1 << self.bits) // 8, 'little')
+
+    @classmethod
+    def from_bytes(cls, data: bytes, bits: int = DEFAULT_MAP_BITS) -> "CoverageMap":
+        """Restore a map saved with to_bytes() (per-attack maps are not kept)."""
+        coverage = cls(bits)
+        coverage.total = int.from_bytes(data, 'little')
+        return coverage
+
+
+def merge_collectors(collectors: List[CoverageCollector], case_url: Optional[str],
+                     bits: int = DEFAULT_MAP_BITS) -> int:
+    """
+    Take coverage from several targets into one bitmap.
+
+    Args:
+        collectors: Page collector plus any extra-target collectors
+        case_url: URL of the case document
+        bits: Bitmap size exponent
+
+    Returns:
+        Union of the targets' bitmaps
+    """
+    bitmap = 0
+    for collector in collectors:
+        bitmap |= collector.take(case_url, bits)
+    return bitmap
@@ -0,0 +1,228 @@
+"""
+Coverage-Guided Fuzzer
+======================
+A CampaignRunner whose cases come from a feedback loop: mutants of queue
+entries are run, their JS block coverage is taken (campaign.coverage) and
+mutants that reach new coverage join the queue.
+
+    queue --pick--> HTMLMutator --> prepare --> browser loop --> analyze
+      ^                                           | coverage
+      +----------------- new bits? ---------------+
+
+Seeds (corpus cases) are run first and always stay in the queue. Entries
+are picked with weight (1 + new bits found) / (1 + times picked), so fresh
+productive entries get more mutants. Interesting mutants are also written
+to output_dir/queue/<ATTACK>/ so they can seed the next campaign, and are
+offered to the mutator as splice donors.
+
+Usage:
+    browser = BrowserFactory.create(BrowserType.CHROMIUM_HEADLESS)
+    browser.launch()
+    fuzzer = CoverageFuzzer(browser, Corpus("htmls"),
+                            FuzzerConfig(max_execs=10000, output_dir="output/fuzz"))
+    summary = fuzzer.run()
+    print(summary.to_dict(), fuzzer.coverage.stats())
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+import random
+import time
+
+from corpus import Corpus, TestCase
+from generator import HTMLMutator, TokenDoc, tokenize
+from logger import get_logger
+
+from .coverage import DEFAULT_MAP_BITS, CoverageCollector, CoverageMap, merge_collectors
+from .runner import CampaignConfig, CampaignRunner, CampaignSummary
+from .tasks import Observation
+
+log = get_logger(__name__)
+
+
+@dataclass
+class FuzzerConfig(CampaignConfig):
+    """Fuzzer settings (on top of the campaign settings)."""
+    max_execs: Optional[int] = 10000  # Cases run, seeds included (None = until time_budget_s)
+    time_budget_s: Optional[float] = None
+    seed: int = 0
+    mutants_per_pick: int = 16  # Mutants per queue pick
+    max_rounds: int = 4  # Stacked mutations per mutant
+    map_bits: int = DEFAULT_MAP_BITS  # Coverage bitmap has 2^map_bits positions
+    extra_targets: List[str] = field(default_factory=list)  # URL substrings, e.g. the Sidecar frame
+    max_donors: int = 256  # Splice donors kept by the mutator
+
+
+@dataclass
+class QueueEntry:
+    """A case mutants are derived from."""
+    case: TestCase
+    new_bits: int = 0
+    picks: int = 0
+    doc: Optional[TokenDoc] = None
+
+    @property
+    def weight(self) -> float:
+        return (1 + self.new_bits) / (1 + self.picks)
+
+
+class CoverageFuzzer(CampaignRunner):
+    """
+    Coverage-guided mutation loop over a launched browser.
+    """
+
+    def __init__(self, browser, corpus: Optional[Corpus] = None,
+                 config: Optional[FuzzerConfig] = None,
+                 mutator: Optional[HTMLMutator] = None, **kwargs):
+        """
+        Initialize fuzzer.
+
+        Args:
+            browser: Launched BaseBrowser (Chromium-based: coverage uses CDP)
+            corpus: Seed corpus (defaults to htmls/ filtered by the browser's attack names)
+            config: Fuzzer settings
+            mutator: Mutator (defaults to HTMLMutator(seed=config.seed))
+            **kwargs: Passed to CampaignRunner (e.g. on_result)
+        """
+        config = config or FuzzerConfig()
+        super().__init__(browser, corpus, config, **kwargs)
+        self.mutator = mutator or HTMLMutator(seed=config.seed)
+        self.coverage = CoverageMap(config.map_bits)
+        self.queue: List[QueueEntry] = []
+        self._entries: Dict[str, QueueEntry] = {}
+        self._rng = random.Random(config.seed)
+        self._collectors: List[CoverageCollector] = []
+        self._driver = None
+        self._queue_corpus = Corpus(str(Path(config.output_dir) / "queue")) if config.output_dir else None
+        self._serial = 0
+        self._deadline: Optional[float] = None
+
+    def run(self, cases: Optional[Iterable[TestCase]] = None) -> CampaignSummary:
+        """
+        Run seeds, then mutants until max_execs or time_budget_s.
+
+        Args:
+            cases: Seed cases instead of the corpus
+
+        Returns:
+            CampaignSummary (per-case coverage is in results.jsonl)
+        """
+        config = self.config
+        if config.max_execs is None and config.time_budget_s is None:
+            raise ValueError("FuzzerConfig needs max_execs or time_budget_s")
+        if config.time_budget_s is not None:
+            self._deadline = time.monotonic() + config.time_budget_s
+
+        seeds = self.corpus.iter_cases() if cases is None else cases
+        try:
+            summary = super().run(self._schedule(seeds))
+        finally:
+            for collector in self._collectors:
+                collector.stop()
+            self._collectors = []
+        log.info("[FUZZ] Queue %s entries, %s/%s bits covered",
+                 len(self.queue), self.coverage.total.bit_count(), 1 << config.map_bits)
+        return summary
+
+    # ==================== Scheduling ====================
+
+    def _done(self) -> bool:
+        if self.config.max_execs is not None and self._serial >= self.config.max_execs:
+            return True
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _schedule(self, seeds: Iterable[TestCase]) -> Iterator[TestCase]:
+        """Cases for the prepare stage: seeds first, then mutants of picked entries."""
+        for case in seeds:
+            if self._done():
+                return
+            self._add_entry(case)
+            self._serial += 1
+            yield case
+
+        while not self._done() and self.queue:
+            entry = self._pick()
+            for _ in range(self.config.mutants_per_pick):
+                if self._done():
+                    return
+                yield self._mutant(entry)
+
+    def _pick(self) -> QueueEntry:
+        entry = self._rng.choices(self.queue, weights=[e.weight for e in self.queue])[0]
+        entry.picks += 1
+        if entry.doc is None:
+            entry.doc = tokenize(entry.case.load())
+        return entry
+
+    def _mutant(self, entry: QueueEntry) -> TestCase:
+        parent = entry.case
+        rounds = self.mutator.rng.randint(1, self.config.max_rounds)
+        doc = self.mutator.mutate(entry.doc, rounds, parent.meta.get('canary', ""))
+        case = TestCase(
+            attack=parent.attack,
+            name=f"fz{self.config.seed}_{self._serial:08d}",
+            html=doc.render(),
+            meta={**parent.meta, 'parent': parent.case_id, 'rounds': rounds,
+                  'mutator_seed': self.mutator.seed},
+        )
+        self._serial += 1
+        return case
+
+    def _add_entry(self, case: TestCase, new_bits: int = 0) -> QueueEntry:
+        entry = QueueEntry(case=case, new_bits=new_bits)
+        self.queue.append(entry)
+        self._entries[case.case_id] = entry
+        return entry
+
+    # ==================== Coverage ====================
+
+    def _ensure_collectors(self):
+        """(Re)start coverage when the driver is new (first case, browser respawn)."""
+        driver = self.browser.get_driver()
+        if driver is not self._driver:
+            for collector in self._collectors:
+                collector.stop()
+            self._collectors = [CoverageCollector.from_driver(driver)]
+            for url_contains in self.config.extra_targets:
+                collector = CoverageCollector.from_target(
+                    self.browser._launcher.config.debug_port, url_contains
+                )
+                if collector is None:
+                    log.warning("[FUZZ] No target matching %r for coverage", url_contains)
+                else:
+                    self._collectors.append(collector)
+            self._driver = driver
+        for collector in self._collectors:
+            collector.start()
+
+    def observe(self, case: TestCase) -> Observation:
+        """Run one case and fold its coverage into the map; queue it if it found new bits."""
+        try:
+            self._ensure_collectors()
+        except Exception as e:
+            log.warning("[FUZZ] Could not start coverage: %s", e)
+        observation = super().observe(case)
+
+        bitmap = merge_collectors(self._collectors, case.url, self.config.map_bits)
+        new_bits = self.coverage.merge(bitmap, case.attack)
+        observation.coverage = {'blocks': bitmap.bit_count(), 'new': new_bits}
+
+        seed_entry = self._entries.get(case.case_id)
+        if seed_entry is not None:
+            seed_entry.new_bits = new_bits
+            if not observation.loaded:
+                self.queue.remove(seed_entry)
+        elif new_bits and observation.loaded:
+            self._keep(case, new_bits)
+        return observation
+
+    def _keep(self, case: TestCase, new_bits: int):
+        """Add an interesting mutant to the queue, the splice donors and queue/ on disk."""
+        entry = self._add_entry(case, new_bits)
+        entry.doc = tokenize(case.html)
+        if len(self.mutator.splice_donors) < self.config.max_donors:
+            self.mutator.add_donor(entry.doc)
+        if self._queue_corpus is not None:
+            self._queue_corpus.add(case.attack, case.html, name=case.name, meta=case.meta)
+        log.debug("[FUZZ] %s: +%s bits (queue %s)", case.case_id, new_bits, len(self.queue))
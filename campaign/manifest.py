@@ -0,0 +1,237 @@
+"""
+Run Manifest
+============
+Incremental re-runs: a SQLite manifest maps each corpus file to the
+content hash and environment (query, browser, browser version) of its last
+result, so re-running a campaign after editing a handful of files in htmls/
+only executes the cases whose content or environment changed.
+
+Diffing never reads unchanged files: directories are listed with
+os.scandir and a file whose size and mtime match its manifest row is
+skipped on the spot. Only files whose stat changed are hashed (a touched
+but identical file is skipped and its stat refreshed). Manifest rows are
+loaded one attack directory at a time, so memory stays bounded by the
+largest directory rather than the corpus.
+
+Usage:
+    manifest = RunManifest("output/campaign/manifest.sqlite")
+    environment = environment_key(query=config.query, browser="Comet", version="131.0")
+    for case in manifest.changed_cases(corpus, environment):
+        ...
+    manifest.record(result)  # After the case ran (CampaignRunner does both)
+    manifest.close()
+"""
+
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from corpus import Corpus, TestCase
+from logger import get_logger
+
+from .tasks import CaseResult, Verdict
+
+log = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    directory TEXT NOT NULL,  -- Attack directory relative to the corpus root ('' = root)
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    environment TEXT NOT NULL,
+    verdict TEXT,
+    result TEXT,
+    updated REAL,
+    PRIMARY KEY (directory, name)
+) WITHOUT ROWID
+"""
+
+
+def environment_key(**values: Any) -> str:
+    """
+    Key of everything besides the file content that affects a result.
+
+    Args:
+        **values: e.g. query, browser, version (None values are kept)
+
+    Returns:
+        Short hex digest, stable across runs
+    """
+    data = json.dumps(values, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RunManifest:
+    """
+    Content hash + environment of the last result of every corpus file.
+    """
+
+    def __init__(self, path: str, commit_every: int = 500):
+        """
+        Open (or create) a manifest.
+
+        Args:
+            path: SQLite file
+            commit_every: Recorded results per transaction
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.commit_every = commit_every
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[str, str, int, int, Optional[str]]] = {}  # case_id -> stat at scan time
+        self._uncommitted = 0
+        self.environment: Optional[str] = None
+        self.stats: Dict[str, int] = {'scanned': 0, 'unchanged': 0, 'touched': 0, 'changed': 0, 'new': 0}
+
+    # ==================== Diff ====================
+
+    def changed_cases(self, corpus: Corpus, environment: str,
+                      include_uncategorized: bool = True) -> Iterator[TestCase]:
+        """
+        Corpus cases that need to run: new, edited, or last run in another environment.
+
+        Args:
+            corpus: Corpus to diff
+            environment: environment_key() of this run
+            include_uncategorized: Also diff files directly under the root
+
+        Yields:
+            TestCase with attack, name and path set (sha256/size too when it was hashed)
+        """
+        self.environment = environment
+        self.stats = dict.fromkeys(self.stats, 0)
+        directories = [(None, corpus.root)] if include_uncategorized and corpus.root.is_dir() else []
+        directories += [(path.name, path) for path in corpus.attack_dirs()]
+
+        for attack, path in directories:
+            directory = attack or ""
+            rows = self._rows(directory)
+            try:
+                entries = sorted((e for e in os.scandir(path)
+                                  if fnmatch(e.name, corpus.pattern) and e.is_file()),
+                                 key=lambda e: e.name)
+            except OSError as e:
+                log.warning("[MANIFEST] Cannot list %s: %s", path, e)
+                continue
+            for entry in entries:
+                self.stats['scanned'] += 1
+                stat = entry.stat()
+                case = TestCase(attack=attack, name=entry.name.rsplit('.', 1)[0], path=entry.path)
+                row = rows.get(entry.name)
+                if row is None:
+                    self.stats['new'] += 1
+                elif row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+                    if row[3] == environment:
+                        self.stats['unchanged'] += 1
+                        continue
+                    self.stats['changed'] += 1
+                else:
+                    case.sha256 = _file_sha256(entry.path)
+                    case.size = stat.st_size
+                    if case.sha256 == row[2] and row[3] == environment:
+                        self.stats['touched'] += 1
+                        self._touch(directory, entry.name, stat.st_size, stat.st_mtime_ns)
+                        continue
+                    self.stats['changed'] += 1
+                with self._lock:
+                    self._pending[case.case_id] = (directory, entry.name, stat.st_size,
+                                                   stat.st_mtime_ns, case.sha256)
+                yield case
+        self.commit()
+        log.info("[MANIFEST] Diffed %s files: %s", self.stats['scanned'], self.stats)
+
+    def _rows(self, directory: str) -> Dict[str, Tuple[int, int, Optional[str], str]]:
+        with self._lock:
+            cursor = self._db.execute(
+                "SELECT name, size, mtime_ns, sha256, environment FROM cases WHERE directory = ?",
+                (directory,))
+            return {name: (size, mtime_ns, sha256, env) for name, size, mtime_ns, sha256, env in cursor}
+
+    def _touch(self, directory: str, name: str, size: int, mtime_ns: int):
+        with self._lock:
+            self._db.execute("UPDATE cases SET size = ?, mtime_ns = ? WHERE directory = ? AND name = ?",
+                             (size, mtime_ns, directory, name))
+            self._tick()
+
+    # ==================== Results ====================
+
+    def record(self, result: CaseResult):
+        """
+        Store the result of a case yielded by changed_cases().
+
+        Errors are not stored, so they are retried on the next run.
+
+        Args:
+            result: Analyzed case
+        """
+        with self._lock:
+            pending = self._pending.pop(result.case_id, None)
+            if pending is None or result.verdict == Verdict.ERROR:
+                return
+            directory, name, size, mtime_ns, sha256 = pending
+            self._db.execute(
+                "INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (directory, name, size, mtime_ns, result.case_sha256 or sha256, self.environment,
+                 result.verdict, json.dumps(result.to_dict()), time.time()))
+            self._tick()
+
+    def last_result(self, case: TestCase) -> Optional[Dict[str, Any]]:
+        """
+        Stored result of a corpus case.
+
+        Args:
+            case: TestCase with path set
+
+        Returns:
+            CaseResult.to_dict() of its last run, or None
+        """
+        with self._lock:
+            row = self._db.execute("SELECT result FROM cases WHERE directory = ? AND name = ?",
+                                   (case.attack or "", Path(case.path).name)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def _tick(self):
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self._db.commit()
+            self._uncommitted = 0
+
+    def commit(self):
+        """Flush recorded results."""
+        with self._lock:
+            self._db.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        """Flush and close the database."""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def __repr__(self):
+        return f"RunManifest(path={self.path!r})"
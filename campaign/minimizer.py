@@ -0,0 +1,407 @@
+"""
+Test-Case Minimizer
+===================
+Delta debugging (ddmin) for cases that triggered an oracle: the smallest
+HTML that still reproduces is written back to the corpus.
+
+Passes, each keeping the result only if it still reproduces:
+1. DOM nodes, level by level (hierarchical ddmin over generator tokens):
+   whole subtrees first, then their children
+2. Attributes of the remaining elements
+3. Characters of the remaining text (bounded by max_tests)
+
+Each ddmin step produces its candidate subsets/complements at once and
+runs them in batches across the reproducer's tabs; the first reproducing
+candidate (in ddmin order) wins. Verdicts are cached by (canaries, attack,
+SHA-256 of the candidate), so an identical candidate is never executed twice
+for the same case, and a cached verdict is never reused for a case whose
+oracle would judge it differently.
+
+Usage:
+    conn = CDPConnection.from_port(9222)
+    with XSSReproducer(conn, tabs=4, spool_dir="output/minimize") as reproducer:
+        minimizer = Minimizer(reproducer)
+        result = minimizer.minimize(case)
+        saved = minimizer.save(result, Corpus("htmls"))
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import queue
+import time
+
+from cdp import CDPConnection
+from corpus import Corpus, TestCase
+from generator import TokenDoc, tokenize
+from generator.grammar import VOID_TAGS
+from generator.mutator import ATTR, CLOSE_TAG, OPEN_TAG, TAG_END
+from logger import get_logger
+from oracle import OracleVerdict, XSSTab, case_canaries
+
+log = get_logger(__name__)
+
+
+def _sha256(html: str) -> str:
+    return hashlib.sha256(html.encode('utf-8', errors='replace')).hexdigest()
+
+
+# ==================== Reproducers ====================
+
+class Reproducer(ABC):
+    """Runs candidate HTML and says whether the case's behaviour reproduces."""
+
+    parallelism = 1  # Candidates worth running at once
+
+    @abstractmethod
+    def check_many(self, case: TestCase, htmls: Sequence[str]) -> List[bool]:
+        """
+        Run candidates of a case.
+
+        Args:
+            case: Original case (attack, canary)
+            htmls: Candidate HTML documents
+
+        Returns:
+            One bool per candidate
+        """
+        pass
+
+    def close(self):
+        """Release tabs/workers."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class FunctionReproducer(Reproducer):
+    """Any predicate fn(case, html) -> bool, run on a thread pool."""
+
+    def __init__(self, fn: Callable[[TestCase, str], bool], workers: int = 1):
+        """
+        Initialize reproducer.
+
+        Args:
+            fn: Predicate (must be thread-safe if workers > 1)
+            workers: Concurrent calls
+        """
+        self.fn = fn
+        self.parallelism = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reproduce")
+
+    def check_many(self, case: TestCase, htmls: Sequence[str]) -> List[bool]:
+        return list(self._pool.map(lambda html: bool(self.fn(case, html)), htmls))
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+
+class XSSReproducer(Reproducer):
+    """Reproduces XSS oracle verdicts (executed) in a pool of XSSTabs."""
+
+    def __init__(self, conn: CDPConnection, tabs: int = 4, spool_dir: str = "output/minimize",
+                 timeout: float = 10.0, settle: float = 0.25):
+        """
+        Initialize reproducer.
+
+        Args:
+            conn: Browser-level CDP connection
+            tabs: Background tabs (candidates run in parallel)
+            spool_dir: Where candidates are written (file:// URLs, named by SHA-256)
+            timeout: Per-candidate limit (seconds)
+            settle: See XSSOracle
+        """
+        self.parallelism = tabs
+        self.spool_dir = Path(spool_dir)
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.tabs = [XSSTab(conn, index=i, settle=settle) for i in range(tabs)]
+        for tab in self.tabs:
+            tab.open()
+        self._free: "queue.Queue[XSSTab]" = queue.Queue()
+        for tab in self.tabs:
+            self._free.put(tab)
+        self._pool = ThreadPoolExecutor(max_workers=tabs, thread_name_prefix="xss-reproduce")
+
+    def _check(self, case: TestCase, canary: Optional[str], html: str) -> bool:
+        digest = _sha256(html)
+        path = self.spool_dir / f"{digest}.html"
+        if not path.exists():
+            path.write_text(html, encoding='utf-8')
+        candidate = TestCase(attack=case.attack, name=digest[:16], path=str(path),
+                             meta={'canary': canary} if canary else {})
+        tab = self._free.get()
+        try:
+            return tab.run(candidate, self.timeout).verdict == OracleVerdict.EXECUTED
+        finally:
+            self._free.put(tab)
+
+    def check_many(self, case: TestCase, htmls: Sequence[str]) -> List[bool]:
+        canaries = case_canaries(case)
+        canary = canaries[0] if canaries else None
+        return list(self._pool.map(lambda html: self._check(case, canary, html), htmls))
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        for tab in self.tabs:
+            tab.close()
+
+
+# ==================== Minimizer ====================
+
+@dataclass
+class MinimizationResult:
+    """Outcome of minimizing one case."""
+    case_id: str
+    reproduced: bool  # False: the original did not reproduce (nothing minimized)
+    html: str
+    original_size: int
+    minimized_size: int
+    tests_run: int = 0
+    cache_hits: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self, include_html: bool = False) -> Dict[str, Any]:
+        """Plain dictionary."""
+        data = asdict(self)
+        if not include_html:
+            data.pop('html')
+        return data
+
+
+def _element_spans(doc: TokenDoc) -> List[Tuple[int, int, int]]:
+    """
+    Element subtrees of a token array.
+
+    Returns:
+        (start, end, depth) token ranges, end exclusive; unclosed elements run
+        to their parent's end (or the document end)
+    """
+    spans: List[Tuple[int, int, int]] = []
+    stack: List[Tuple[str, int]] = []  # (tag, index in spans)
+    tokens, kinds = doc.tokens, doc.kinds
+    for index, kind in enumerate(kinds):
+        if kind == OPEN_TAG:
+            tag = tokens[index][1:].lower()
+            spans.append((index, len(tokens), len(stack)))
+            stack.append((tag, len(spans) - 1))
+        elif kind == TAG_END and stack:
+            tag, span_index = stack[-1]
+            if tokens[index].endswith("/>") or tag in VOID_TAGS:
+                stack.pop()
+                start, _, depth = spans[span_index]
+                spans[span_index] = (start, index + 1, depth)
+        elif kind == CLOSE_TAG:
+            tag = tokens[index][2:-1].strip().lower()
+            for position in range(len(stack) - 1, -1, -1):
+                if stack[position][0] == tag:
+                    while len(stack) > position:
+                        _, span_index = stack.pop()
+                        start, _, depth = spans[span_index]
+                        spans[span_index] = (start, index + 1, depth)
+                    break
+    for _, span_index in stack:  # Unclosed: to the document end
+        start, _, depth = spans[span_index]
+        spans[span_index] = (start, len(tokens), depth)
+    return spans
+
+
+class Minimizer:
+    """
+    Parallel, cached ddmin over DOM nodes, attributes and characters.
+    """
+
+    def __init__(self, reproducer: Reproducer, max_tests: int = 5000, char_level: bool = True):
+        """
+        Initialize minimizer.
+
+        Args:
+            reproducer: Runs candidates (its parallelism sets the batch size)
+            max_tests: Executions per case (cache hits are free)
+            char_level: Run the character pass after the node and attribute passes
+        """
+        self.reproducer = reproducer
+        self.max_tests = max_tests
+        self.char_level = char_level
+        self.cache: Dict[Tuple[Tuple[str, ...], Optional[str], str], bool] = {}  # (canaries, attack, sha256) -> verdict
+        self._case: Optional[TestCase] = None
+        self._case_key: Tuple[Tuple[str, ...], Optional[str]] = ((), None)
+        self._tests = 0
+        self._hits = 0
+
+    # ==================== Public API ====================
+
+    def minimize(self, case: TestCase) -> MinimizationResult:
+        """
+        Minimize one case.
+
+        Args:
+            case: Case that triggered an oracle (html or path set)
+
+        Returns:
+            MinimizationResult
+        """
+        start = time.perf_counter()
+        html = case.load()
+        self._case = case
+        self._case_key = (tuple(case_canaries(case)), case.attack)
+        self._tests = 0
+        self._hits = 0
+
+        reproduced = self._test([html])[0]
+        if not reproduced:
+            log.warning("[MINIMIZE] %s does not reproduce, skipping", case.case_id)
+        else:
+            html = self._node_pass(html)
+            html = self._attribute_pass(html)
+            if self.char_level:
+                html = self._char_pass(html)
+
+        result = MinimizationResult(
+            case_id=case.case_id, reproduced=reproduced, html=html,
+            original_size=len(case.load()), minimized_size=len(html),
+            tests_run=self._tests, cache_hits=self._hits,
+            elapsed_s=time.perf_counter() - start,
+        )
+        log.info("[MINIMIZE] %s: %s -> %s chars (%s tests, %s cached, %.1fs)",
+                 case.case_id, result.original_size, result.minimized_size,
+                 result.tests_run, result.cache_hits, result.elapsed_s)
+        return result
+
+    def save(self, result: MinimizationResult, corpus: Corpus, case: Optional[TestCase] = None) -> Optional[TestCase]:
+        """
+        Write a minimized case to a corpus as <name>_min.
+
+        Args:
+            result: From minimize()
+            corpus: Destination corpus
+            case: The original case (defaults to the last one minimized)
+
+        Returns:
+            The saved TestCase, or None if the original did not reproduce
+        """
+        if not result.reproduced:
+            return None
+        case = case or self._case
+        return corpus.add(case.attack, result.html, name=f"{case.name}_min",
+                          meta={**case.meta, 'minimized_from': case.case_id,
+                                'original_size': result.original_size})
+
+    # ==================== Testing ====================
+
+    def _test(self, htmls: Sequence[str]) -> List[bool]:
+        """Verdicts for candidates, executing only the ones not cached."""
+        digests = [self._case_key + (_sha256(html),) for html in htmls]
+        todo: Dict[Tuple[Tuple[str, ...], Optional[str], str], str] = {}
+        for digest, html in zip(digests, htmls):
+            if digest in self.cache:
+                self._hits += 1
+            elif digest not in todo:
+                todo[digest] = html
+        if todo:
+            verdicts = self.reproducer.check_many(self._case, list(todo.values()))
+            self._tests += len(todo)
+            self.cache.update(zip(todo.keys(), verdicts))
+        return [self.cache[digest] for digest in digests]
+
+    def _ddmin(self, units: List[Any], render: Callable[[List[Any]], str]) -> List[Any]:
+        """
+        Classic ddmin over `units`, candidates tested in parallel batches.
+
+        Args:
+            units: Removable pieces, in document order
+            render: Builds a candidate document from the kept units
+
+        Returns:
+            Kept units (1-minimal unless max_tests ran out)
+        """
+        batch = max(1, self.reproducer.parallelism)
+        granularity = 2
+        while len(units) >= 2 and self._tests < self.max_tests:
+            size = len(units)
+            bounds = [size * i // granularity for i in range(granularity + 1)]
+            chunks = [units[bounds[i]:bounds[i + 1]] for i in range(granularity)]
+            candidates = [(chunk, 2) for chunk in chunks]
+            if granularity > 2:
+                candidates += [
+                    (units[:bounds[i]] + units[bounds[i + 1]:], max(granularity - 1, 2))
+                    for i in range(granularity)
+                ]
+
+            reduced = None
+            for offset in range(0, len(candidates), batch):
+                group = candidates[offset:offset + batch]
+                verdicts = self._test([render(kept) for kept, _ in group])
+                for (kept, next_granularity), ok in zip(group, verdicts):
+                    if ok:
+                        reduced = (kept, next_granularity)
+                        break
+                if reduced or self._tests >= self.max_tests:
+                    break
+
+            if reduced:
+                units, granularity = reduced
+            elif granularity >= size:
+                break
+            else:
+                granularity = min(granularity * 2, size)
+        return units
+
+    # ==================== Passes ====================
+
+    def _node_pass(self, html: str) -> str:
+        """Remove element subtrees, shallowest level first."""
+        depth = 0
+        while self._tests < self.max_tests:
+            doc = tokenize(html)
+            level = [(start, end) for start, end, d in _element_spans(doc) if d == depth]
+            if not level:
+                return html
+            tokens = doc.tokens
+
+            def render(kept: List[Tuple[int, int]], level=level, tokens=tokens) -> str:
+                kept_set = set(kept)
+                removed = [span for span in level if span not in kept_set]
+                parts, position = [], 0
+                for start, end in removed:
+                    parts.extend(tokens[position:start])
+                    position = end
+                parts.extend(tokens[position:])
+                return "".join(parts)
+
+            kept = self._ddmin(level, render)
+            if len(kept) == 1 and self._test([render([])])[0]:
+                kept = []
+            html = render(kept)
+            depth += 1
+        return html
+
+    def _attribute_pass(self, html: str) -> str:
+        """Remove attributes."""
+        doc = tokenize(html)
+        attributes = [index for index, kind in enumerate(doc.kinds) if kind == ATTR]
+        if not attributes:
+            return html
+        tokens = doc.tokens
+        attribute_set = set(attributes)
+
+        def render(kept: List[int]) -> str:
+            kept_set = set(kept)
+            return "".join(token for index, token in enumerate(tokens)
+                           if index not in attribute_set or index in kept_set)
+
+        kept = self._ddmin(attributes, render)
+        if len(kept) == 1 and self._test([render([])])[0]:
+            kept = []
+        return render(kept)
+
+    def _char_pass(self, html: str) -> str:
+        """Remove characters."""
+        kept = self._ddmin(list(range(len(html))), lambda kept: "".join(html[i] for i in kept))
+        return "".join(html[i] for i in kept)
@@ -0,0 +1,405 @@
+"""
+Campaign Runner
+===============
+Runs a corpus of HTML test cases through one browser.
+
+Three stages, connected by bounded queues:
+
+    corpus --> [prepare: process pool] --> browser loop --> [analyze: process pool] --> results.jsonl
+               read, hash, spool           navigate,         hash, compress,
+                                           snapshot, ask     classify
+
+The browser loop (the only stage that touches WebDriver) runs on the
+calling thread and never does Python-side heavy lifting. Both pool stages
+hold at most `max_pending` items, so a large corpus is read lazily and a
+slow stage pushes back on the one before it instead of growing memory.
+
+Usage:
+    browser = BrowserFactory.create(BrowserType.CHROMIUM_HEADLESS)
+    browser.launch()
+    corpus = Corpus("htmls", attacks=browser.get_attack_names())
+    summary = CampaignRunner(browser, corpus, CampaignConfig(output_dir="output/campaign")).run()
+    print(summary.to_dict())
+"""
+
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import itertools
+import json
+import threading
+import time
+
+from cdp import CDPConnection, CDPConnectionClosed, CDPError
+from conversion.base import ConversionResult
+from conversion.cache import ResponseCache, page_hash
+from corpus import Corpus, TestCase
+from logger import get_logger, job_context
+from oracle import XSS_ATTACKS, XSSOracle, case_canaries
+
+from .manifest import RunManifest, environment_key
+from .stage import ProcessPoolStage, StageOutput
+from .tasks import CaseResult, Observation, Verdict, analyze_observation, prepare_case
+
+log = get_logger(__name__)
+
+
+@dataclass
+class CampaignConfig:
+    """Campaign settings."""
+    query: Optional[str] = None  # Asked in a separate Sidecar tab after each case loads
+    sidecar_ready_timeout: float = 30.0  # Wait for the Sidecar editor once; afterwards `query` fails fast
+    load_wait_time: float = 0.0
+    max_wait: float = 60.0  # Answer wait when `query` is set
+    workers: Optional[int] = None  # Processes per pool stage (None = CPU count)
+    max_pending: Optional[int] = None  # Bound per pool stage (None = 2 * workers)
+    max_cases: Optional[int] = None
+    output_dir: Optional[str] = None  # results.jsonl, snapshots/ and spool/ go here
+    keep_snapshots: bool = True  # Write compressed page snapshots to output_dir/snapshots
+    xss_oracle: bool = True  # Watch XSS_* cases through CDP events (Chromium-based browsers)
+    xss_settle: float = 0.25  # Quiet period after load before an XSS case counts as clean
+    incremental: bool = False  # Skip corpus cases unchanged since their last result (see RunManifest)
+    manifest_path: Optional[str] = None  # Defaults to output_dir/manifest.sqlite
+    response_cache: Optional[str] = None  # SQLite file answering repeated `query`s on identical pages
+    response_cache_ttl: float = 24 * 3600.0
+
+
+@dataclass
+class CampaignSummary:
+    """Aggregate counters of a campaign (individual results go to results.jsonl)."""
+    total: int = 0
+    by_verdict: Dict[str, int] = field(default_factory=dict)
+    by_attack: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    skipped: int = 0  # Unchanged cases left out by an incremental run
+    elapsed_s: float = 0.0
+    results_path: Optional[str] = None
+    stages: List[Dict[str, Any]] = field(default_factory=list)
+    response_cache: Optional[Dict[str, int]] = None  # Hit/miss counters when a response cache is used
+
+    def record(self, result: CaseResult):
+        """Count one result."""
+        self.total += 1
+        self.by_verdict[result.verdict] = self.by_verdict.get(result.verdict, 0) + 1
+        per_attack = self.by_attack.setdefault(result.attack or '', {})
+        per_attack[result.verdict] = per_attack.get(result.verdict, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary."""
+        return {
+            'total': self.total,
+            'by_verdict': self.by_verdict,
+            'by_attack': self.by_attack,
+            'skipped': self.skipped,
+            'elapsed_s': round(self.elapsed_s, 3),
+            'results_path': self.results_path,
+            'stages': self.stages,
+            'response_cache': self.response_cache,
+        }
+
+
+class CampaignRunner:
+    """
+    Drives test cases through a launched browser with process-pool stages.
+    """
+
+    def __init__(self, browser, corpus: Optional[Corpus] = None,
+                 config: Optional[CampaignConfig] = None,
+                 on_result: Optional[Callable[[CaseResult], None]] = None):
+        """
+        Initialize runner.
+
+        Args:
+            browser: Launched BaseBrowser
+            corpus: Corpus to run (defaults to htmls/ filtered by the browser's attack names)
+            config: Campaign settings
+            on_result: Called with each CaseResult (on the analyze collector thread)
+        """
+        self.browser = browser
+        self.corpus = corpus or Corpus("htmls", attacks=browser.get_attack_names())
+        self.config = config or CampaignConfig()
+        self.on_result = on_result
+        self.summary = CampaignSummary()
+        self._sidecar = None  # SidecarTab asking `query` (never the tab showing the case)
+        self._sidecar_error: Optional[str] = None  # Why no Sidecar could be opened
+        self._response_cache: Optional[ResponseCache] = None
+        self._xss_oracle = None
+        self._manifest: Optional[RunManifest] = None
+        self._results_file = None
+        self._lock = threading.Lock()
+
+    def run(self, cases: Optional[Iterable[TestCase]] = None) -> CampaignSummary:
+        """
+        Run the campaign.
+
+        Args:
+            cases: Cases to run instead of the corpus (e.g. from a generator)
+
+        Returns:
+            CampaignSummary
+        """
+        config = self.config
+        output_dir = Path(config.output_dir) if config.output_dir else None
+        if cases is None and config.incremental:
+            manifest_path = config.manifest_path or (str(output_dir / "manifest.sqlite") if output_dir else None)
+            if manifest_path is None:
+                raise ValueError("Incremental campaigns need output_dir or manifest_path")
+            self._manifest = RunManifest(manifest_path)
+            cases = self._manifest.changed_cases(self.corpus, self._environment())
+        elif config.incremental:
+            log.warning("[CAMPAIGN] Incremental mode is off: explicit cases are run in full and not recorded")
+        cases = self.corpus.iter_cases() if cases is None else cases
+        if config.max_cases is not None:
+            cases = itertools.islice(cases, config.max_cases)
+
+        spool_dir = snapshot_dir = None
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            spool_dir = str(output_dir / "spool")
+            if config.keep_snapshots:
+                snapshot_dir = str(output_dir / "snapshots")
+            self.summary.results_path = str(output_dir / "results.jsonl")
+            self._results_file = open(self.summary.results_path, 'a', encoding='utf-8')
+
+        prepare = ProcessPoolStage(
+            partial(prepare_case, spool_dir=spool_dir),
+            workers=config.workers, max_pending=config.max_pending, name="prepare"
+        )
+        analyze = ProcessPoolStage(
+            partial(analyze_observation, snapshot_dir=snapshot_dir),
+            workers=config.workers, max_pending=config.max_pending,
+            sink=self._on_analyzed, name="analyze"
+        )
+
+        log.info("[CAMPAIGN] Starting: %r", self.corpus)
+        start = time.perf_counter()
+        try:
+            with prepare, analyze:
+                for output in prepare.stream(cases):
+                    if not output.ok:
+                        log.warning("[CAMPAIGN] Could not prepare %s: %s",
+                                    output.item.case_id, output.error)
+                        self._record(self._failed_result(output.item, f"Prepare failed: {output.error}"))
+                        continue
+                    case = output.value
+                    with job_context(case=case.case_id):
+                        observation = self.observe(case)
+                    analyze.submit(observation)
+        finally:
+            self._close_xss_oracle()
+            self._close_sidecar()
+            if self._manifest is not None:
+                self.summary.skipped = self._manifest.stats['unchanged'] + self._manifest.stats['touched']
+                self._manifest.close()
+                self._manifest = None
+            if self._response_cache is not None:
+                self.summary.response_cache = self._response_cache.stats()
+                self._response_cache.close()
+                self._response_cache = None
+            self.summary.elapsed_s = time.perf_counter() - start
+            self.summary.stages = [prepare.stats(), analyze.stats()]
+            if self._results_file:
+                self._results_file.close()
+                self._results_file = None
+
+        log.info("[CAMPAIGN] ✓ %s cases in %.1fs: %s",
+                 self.summary.total, self.summary.elapsed_s, self.summary.by_verdict)
+        return self.summary
+
+    def _environment(self) -> str:
+        """environment_key() of this run: query, browser name and running browser version."""
+        version = None
+        try:
+            version = self.browser.get_driver().capabilities.get('browserVersion')
+        except Exception as e:
+            log.debug("[CAMPAIGN] Browser version unavailable: %s", e)
+        return environment_key(query=self.config.query, browser=self.browser.get_browser_info().name,
+                               version=version)
+
+    # ==================== Browser loop ====================
+
+    def observe(self, case: TestCase) -> Observation:
+        """
+        Load one case in the browser and collect what it shows.
+
+        Args:
+            case: Prepared case (path set)
+
+        Returns:
+            Observation for the analyze stage
+        """
+        browser = self.browser
+        if browser.watchdog and browser.watchdog.crashed.is_set():
+            log.warning("[CAMPAIGN] Respawning browser after crash (%s)", browser.watchdog.crash_reason)
+            browser.restart()
+            self._close_sidecar()
+            self._close_xss_oracle()
+
+        observation = Observation(case=case.to_dict(), loaded=False)
+        try:
+            navigator = browser.get_navigator()
+            driver = browser.get_driver()
+            xss_oracle = self._get_xss_oracle(driver) if case.attack in XSS_ATTACKS else None
+            if xss_oracle:
+                canaries = case_canaries(case)
+                xss_oracle.arm(canaries[0] if canaries else None, case.attack)
+
+            started = time.perf_counter()
+            nav_result = navigator.navigate_to_url(case.url, wait_time=self.config.load_wait_time)
+            observation.timings['navigation'] = (time.perf_counter() - started) * 1000
+            observation.loaded = nav_result.success
+            if not nav_result.success:
+                observation.error = nav_result.message
+                return observation
+
+            if xss_oracle:
+                started = time.perf_counter()
+                observation.xss = xss_oracle.wait(loaded=True).to_dict()
+                observation.timings['xss_oracle'] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            observation.title = driver.title
+            observation.page_source = driver.page_source
+            observation.timings['snapshot'] = (time.perf_counter() - started) * 1000
+
+            if self.config.query:
+                started = time.perf_counter()
+                conversion_result = self._ask(driver, page_hash(observation.page_source))
+                observation.timings['conversion'] = (time.perf_counter() - started) * 1000
+                observation.response = conversion_result.response
+                if not conversion_result.success:
+                    observation.error = conversion_result.error
+
+        except Exception as e:
+            observation.error = str(e)
+
+        if browser.watchdog and browser.watchdog.crashed.is_set():
+            observation.error = f"Browser crashed: {browser.watchdog.crash_reason}"
+        return observation
+
+    def _get_xss_oracle(self, driver):
+        """Event-driven XSS oracle on the driver's page (None if disabled or unavailable)."""
+        if self._xss_oracle is None and self.config.xss_oracle:
+            launcher = self.browser._launcher
+            debug_port = getattr(getattr(launcher, 'config', None), 'debug_port', None)
+            if debug_port is None:
+                return None
+            try:
+                self._xss_oracle = XSSOracle.for_driver(driver, debug_port, settle=self.config.xss_settle)
+            except Exception as e:
+                log.warning("[CAMPAIGN] XSS oracle unavailable, disabling it: %s", e)
+                self.config.xss_oracle = False
+        return self._xss_oracle
+
+    def _close_xss_oracle(self):
+        if self._xss_oracle is not None:
+            self._xss_oracle.close()
+            self._xss_oracle = None
+
+    # ==================== Sidecar ====================
+
+    def _ask(self, driver, page_sha256: Optional[str]) -> ConversionResult:
+        """
+        Ask `query` about the loaded case from the Sidecar tab.
+
+        The case stays in the driver's tab: typing into that tab would hit
+        any contenteditable/Lexical element the case itself contains.
+
+        Args:
+            driver: WebDriver showing the case (for the browser version)
+            page_sha256: page_hash() of the case's page source
+
+        Returns:
+            ConversionResult (a failed one, immediately, when no Sidecar is open)
+        """
+        query = self.config.query
+        if self._response_cache is None and self.config.response_cache:
+            self._response_cache = ResponseCache(self.config.response_cache,
+                                                 ttl_s=self.config.response_cache_ttl)
+        cache_key = browser_version = None
+        if self._response_cache is not None:
+            browser_version = (getattr(driver, 'capabilities', None) or {}).get('browserVersion')
+            cache_key = self._response_cache.key_for(query, page_sha256, browser_version)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return ConversionResult(success=True, query=query, response=cached, cached=True)
+
+        sidecar = self._get_sidecar()
+        if sidecar is None:
+            return ConversionResult(success=False, query=query, error=self._sidecar_error)
+        result = sidecar.ask(query, max_wait=self.config.max_wait)
+        if result.success and result.response and cache_key is not None:
+            self._response_cache.put(cache_key, result.response, query=query,
+                                     page_sha256=page_sha256, browser_version=browser_version)
+        return result
+
+    def _get_sidecar(self):
+        """Sidecar tab for `query`, opened once per browser (None once opening failed)."""
+        if self._sidecar is not None or self._sidecar_error is not None:
+            return self._sidecar
+        from browser.comet.multiplex import SIDECAR_URL, SidecarTab
+
+        debug_port = getattr(getattr(self.browser._launcher, 'config', None), 'debug_port', None)
+        if debug_port is None:
+            self._sidecar_error = "No Sidecar open: browser has no DevTools port"
+            return None
+        conn = None
+        try:
+            conn = CDPConnection.from_port(debug_port)
+            sidecar = SidecarTab(conn, 0, SIDECAR_URL, ready_timeout=self.config.sidecar_ready_timeout)
+            sidecar.open()
+            if not sidecar.wait_ready():
+                sidecar.close()
+                raise RuntimeError(f"editor did not appear at {SIDECAR_URL} "
+                                   f"within {self.config.sidecar_ready_timeout}s")
+        except (CDPError, CDPConnectionClosed, TimeoutError, RuntimeError) as e:
+            if conn is not None:
+                conn.close()
+            self._sidecar_error = f"No Sidecar open: {e}"
+            log.error("[CAMPAIGN] ✗ %s - answers will not be captured", self._sidecar_error)
+            return None
+        log.info("[CAMPAIGN] Asking from Sidecar tab %s", sidecar.target_id)
+        self._sidecar = sidecar
+        return sidecar
+
+    def _close_sidecar(self):
+        self._sidecar_error = None
+        if self._sidecar is not None:
+            self._sidecar.close()
+            self._sidecar.conn.close()
+            self._sidecar = None
+
+    # ==================== Results ====================
+
+    def _on_analyzed(self, output: StageOutput):
+        """Analyze-stage sink (collector thread)."""
+        if output.ok:
+            self._record(output.value)
+        else:
+            self._record(self._failed_result(None, f"Analyze failed: {output.error}",
+                                             output.item.case))
+
+    def _failed_result(self, case: Optional[TestCase], error: str,
+                       case_dict: Optional[Dict[str, Any]] = None) -> CaseResult:
+        case_dict = case_dict or case.to_dict()
+        return CaseResult(
+            case_id=case_dict['case_id'],
+            attack=case_dict.get('attack'),
+            category=case_dict.get('category', 'other'),
+            case_sha256=case_dict.get('sha256'),
+            verdict=Verdict.ERROR,
+            error=error
+        )
+
+    def _record(self, result: CaseResult):
+        with self._lock:
+            self.summary.record(result)
+            if self._results_file:
+                self._results_file.write(json.dumps(result.to_dict()) + "\n")
+        if self._manifest is not None:
+            self._manifest.record(result)
+        if self.on_result:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                log.warning("[CAMPAIGN] on_result callback failed: %s", e)
@@ -0,0 +1,368 @@
+"""
+Campaign Scheduler
+==================
+Bandit scheduling of test cases by historical yield: attack buckets
+(get_attack_names()) are the arms, seeds inside a bucket are ranked by
+what their mutants produced.
+
+- BanditScheduler: UCB1 or epsilon-greedy over arms. Arm scores live in a
+  heap with lazy invalidation, so recording a result is an O(log n) push;
+  UCB's log(t) term is refreshed with an O(n) rebuild only when t doubles.
+- SeedPool: per-bucket heap of seeds keyed by (1 + yield) / (1 + picks).
+- CampaignScheduler: yields mutants for CampaignRunner.run() and takes
+  results back through on_result, closing the loop.
+
+Rewards: a finding (executed, injected, crash) is worth 1, a case that
+reached new coverage `coverage_reward`, anything else 0. With an
+AnswerClusterer, an answer starting a new cluster earns `novel_answer_reward`
+and an answer in a well-known cluster (at least `known_cluster_size`
+members, e.g. the stock refusal) costs its seed an extra pick.
+
+Usage:
+    scheduler = CampaignScheduler(Corpus("htmls"), browser.get_attack_names(), policy="ucb1")
+    runner = CampaignRunner(browser, config=config, on_result=scheduler.record)
+    summary = runner.run(scheduler.stream(total=10000))
+    print(scheduler.stats())
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import heapq
+import itertools
+import math
+import random
+import threading
+
+from corpus import Corpus, TestCase
+from generator import HTMLMutator, TokenDoc, tokenize
+from logger import get_logger
+
+from .clustering import AnswerClusterer
+from .tasks import CaseResult, Verdict
+
+log = get_logger(__name__)
+
+FINDING_VERDICTS = frozenset((Verdict.EXECUTED, Verdict.INJECTED, Verdict.CRASH))
+
+
+def reward_of(result: CaseResult, coverage_reward: float = 0.25) -> float:
+    """
+    Reward of one case result.
+
+    Args:
+        result: Analyzed case
+        coverage_reward: Reward for new coverage without a finding
+
+    Returns:
+        1.0 for a finding, coverage_reward for new coverage, else 0.0
+    """
+    if result.verdict in FINDING_VERDICTS:
+        return 1.0
+    if result.coverage.get('new'):
+        return coverage_reward
+    return 0.0
+
+
+@dataclass
+class ArmStats:
+    """Counters of one arm."""
+    pulls: int = 0
+    reward: float = 0.0
+    findings: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.reward / self.pulls if self.pulls else 0.0
+
+
+class BanditScheduler:
+    """
+    Multi-armed bandit over attack buckets.
+    """
+
+    POLICIES = ("ucb1", "epsilon_greedy")
+
+    def __init__(self, arms: Iterable[str], policy: str = "ucb1", epsilon: float = 0.1,
+                 exploration: float = math.sqrt(2), seed: int = 0):
+        """
+        Initialize scheduler.
+
+        Args:
+            arms: Arm names (e.g. browser.get_attack_names())
+            policy: "ucb1" or "epsilon_greedy"
+            epsilon: Exploration rate of epsilon_greedy
+            exploration: UCB1 exploration constant
+            seed: Seed of the exploration RNG
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy!r} (expected one of {self.POLICIES})")
+        self.policy = policy
+        self.epsilon = epsilon
+        self.exploration = exploration
+        self.arms: Dict[str, ArmStats] = {arm: ArmStats() for arm in arms}
+        if not self.arms:
+            raise ValueError("BanditScheduler needs at least one arm")
+        self.total_pulls = 0
+        self._rng = random.Random(seed)
+        self._names = list(self.arms)
+        self._versions: Dict[str, int] = {arm: 0 for arm in self.arms}
+        self._heap: List[Tuple[float, int, str]] = []  # (-score, version, arm)
+        self._rebuild_at = 2
+        self._rebuild()
+
+    def _score(self, stats: ArmStats) -> float:
+        if self.policy == "epsilon_greedy":
+            return stats.mean
+        if stats.pulls == 0:
+            return math.inf  # Every arm is tried once first
+        return stats.mean + self.exploration * math.sqrt(math.log(max(self.total_pulls, 1)) / stats.pulls)
+
+    def _push(self, arm: str):
+        if len(self._heap) > 4 * len(self.arms) + 64:
+            self._rebuild()  # Drop stale entries
+            return
+        self._versions[arm] += 1
+        heapq.heappush(self._heap, (-self._score(self.arms[arm]), self._versions[arm], arm))
+
+    def _rebuild(self):
+        self._heap = []
+        for arm in self.arms:
+            self._versions[arm] += 1
+            self._heap.append((-self._score(self.arms[arm]), self._versions[arm], arm))
+        heapq.heapify(self._heap)
+
+    def select(self) -> str:
+        """
+        Pick the arm to run next (counts as a pull).
+
+        Returns:
+            Arm name
+        """
+        if self.policy == "epsilon_greedy" and self._rng.random() < self.epsilon:
+            arm = self._rng.choice(self._names)
+        else:
+            while True:
+                _, version, arm = self._heap[0]
+                if version == self._versions[arm]:
+                    break
+                heapq.heappop(self._heap)  # Stale entry
+        self.arms[arm].pulls += 1
+        self.total_pulls += 1
+        if self.policy == "ucb1" and self.total_pulls >= self._rebuild_at:
+            self._rebuild_at *= 2
+            self._rebuild()
+        else:
+            self._push(arm)
+        return arm
+
+    def update(self, arm: str, reward: float):
+        """
+        Record the reward of a pull of `arm`.
+
+        Args:
+            arm: Arm name
+            reward: Reward in [0, 1]
+        """
+        stats = self.arms.get(arm)
+        if stats is None:
+            return
+        stats.reward += reward
+        if reward >= 1.0:
+            stats.findings += 1
+        self._push(arm)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Per-arm counters.
+
+        Returns:
+            Dictionary with the policy, total pulls and arm -> pulls/mean/findings
+        """
+        return {
+            'policy': self.policy,
+            'total_pulls': self.total_pulls,
+            'arms': {
+                arm: {'pulls': s.pulls, 'mean_reward': round(s.mean, 4), 'findings': s.findings}
+                for arm, s in sorted(self.arms.items(), key=lambda item: -item[1].mean)
+            },
+        }
+
+
+class SeedPool:
+    """
+    Seeds of one bucket, best (1 + yield) / (1 + picks) first.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []  # (-priority, version, case_id)
+        self._seeds: Dict[str, TestCase] = {}
+        self._yield: Dict[str, float] = {}
+        self._picks: Dict[str, int] = {}
+        self._versions: Dict[str, int] = {}
+        self.docs: Dict[str, TokenDoc] = {}
+
+    def __len__(self) -> int:
+        return len(self._seeds)
+
+    def _entry(self, case_id: str) -> Tuple[float, int, str]:
+        self._versions[case_id] = self._versions.get(case_id, 0) + 1
+        priority = (1 + self._yield[case_id]) / (1 + self._picks[case_id])
+        return (-priority, self._versions[case_id], case_id)
+
+    def _push(self, case_id: str):
+        if len(self._heap) > 2 * len(self._seeds) + 64:
+            self._heap = [self._entry(seed_id) for seed_id in self._seeds]  # Drop stale entries
+            heapq.heapify(self._heap)
+            return
+        heapq.heappush(self._heap, self._entry(case_id))
+
+    def add(self, case: TestCase, initial_yield: float = 0.0):
+        """Add a seed."""
+        self._seeds[case.case_id] = case
+        self._yield[case.case_id] = initial_yield
+        self._picks[case.case_id] = 0
+        self._push(case.case_id)
+
+    def pick(self) -> TestCase:
+        """Best seed (its pick count goes up, lowering it until it yields)."""
+        while True:
+            _, version, case_id = heapq.heappop(self._heap)
+            if version == self._versions[case_id]:
+                break
+        self._picks[case_id] += 1
+        self._push(case_id)
+        return self._seeds[case_id]
+
+    def credit(self, case_id: str, reward: float):
+        """Add a mutant's reward to its seed."""
+        if case_id in self._seeds and reward:
+            self._yield[case_id] += reward
+            self._push(case_id)
+
+    def penalize(self, case_id: str, picks: int = 1):
+        """Count extra picks against a seed (its mutants keep producing known output)."""
+        if case_id in self._seeds and picks:
+            self._picks[case_id] += picks
+            self._push(case_id)
+
+
+class CampaignScheduler:
+    """
+    Bandit-driven case source for CampaignRunner.
+    """
+
+    def __init__(self, corpus: Corpus, attacks: Iterable[str], policy: str = "ucb1",
+                 epsilon: float = 0.1, seed: int = 0, mutator: Optional[HTMLMutator] = None,
+                 max_rounds: int = 4, coverage_reward: float = 0.25,
+                 clusterer: Optional[AnswerClusterer] = None, known_cluster_size: int = 20,
+                 novel_answer_reward: float = 0.1):
+        """
+        Initialize scheduler.
+
+        Args:
+            corpus: Seed corpus (cases grouped by attack directory)
+            attacks: Attack names to schedule (arms); attacks without seeds are skipped
+            policy: "ucb1" or "epsilon_greedy"
+            epsilon: Exploration rate of epsilon_greedy
+            seed: Seed for the bandit and the mutator
+            mutator: Mutator (defaults to HTMLMutator(seed=seed))
+            max_rounds: Stacked mutations per mutant
+            coverage_reward: Reward for new coverage without a finding
+            clusterer: Clusters answers; well-known clusters de-prioritize their seeds
+            known_cluster_size: Members from which a cluster counts as well-known
+            novel_answer_reward: Reward for an answer starting a new cluster
+        """
+        self.mutator = mutator or HTMLMutator(seed=seed)
+        self.max_rounds = max_rounds
+        self.coverage_reward = coverage_reward
+        self.clusterer = clusterer
+        self.known_cluster_size = known_cluster_size
+        self.novel_answer_reward = novel_answer_reward
+        attacks = set(attacks)
+        self.pools: Dict[str, SeedPool] = {}
+        for case in corpus.iter_cases(include_uncategorized=False):
+            if case.attack in attacks:
+                self.pools.setdefault(case.attack, SeedPool()).add(case)
+        if not self.pools:
+            raise ValueError(f"No seeds for any of the attacks in {corpus!r}")
+        self.bandit = BanditScheduler(self.pools, policy=policy, epsilon=epsilon, seed=seed)
+        self._issued: Dict[str, Tuple[str, str]] = {}  # mutant case_id -> (attack, seed case_id)
+        self._serial = itertools.count()
+        self._lock = threading.Lock()
+
+    def next_case(self) -> TestCase:
+        """
+        Next case to run: a mutant of the best seed of the selected bucket.
+
+        Returns:
+            TestCase (html set)
+        """
+        with self._lock:
+            attack = self.bandit.select()
+            pool = self.pools[attack]
+            parent = pool.pick()
+            doc = pool.docs.get(parent.case_id)
+            if doc is None:
+                doc = pool.docs[parent.case_id] = tokenize(parent.load())
+            rounds = self.mutator.rng.randint(1, self.max_rounds)
+            mutant = self.mutator.mutate(doc, rounds, parent.meta.get('canary', ""))
+            case = TestCase(
+                attack=attack,
+                name=f"{parent.name}_b{next(self._serial):07d}",
+                html=mutant.render(),
+                meta={**parent.meta, 'parent': parent.case_id, 'rounds': rounds,
+                      'mutator_seed': self.mutator.seed, 'policy': self.bandit.policy},
+            )
+            self._issued[case.case_id] = (attack, parent.case_id)
+        return case
+
+    def stream(self, total: Optional[int] = None) -> Iterator[TestCase]:
+        """
+        Cases for CampaignRunner.run().
+
+        Args:
+            total: Number of cases (None = endless; bound it with CampaignConfig.max_cases)
+
+        Yields:
+            TestCase
+        """
+        count = 0
+        while total is None or count < total:
+            yield self.next_case()
+            count += 1
+
+    def record(self, result: CaseResult):
+        """
+        Feed a result back (use as CampaignRunner's on_result).
+
+        Args:
+            result: Analyzed case
+        """
+        signature = None
+        if self.clusterer is not None and result.response:
+            signature = self.clusterer.signatures([result.response])[0]  # Outside the lock
+        with self._lock:
+            issued = self._issued.pop(result.case_id, None)
+            if issued is None:
+                return
+            attack, parent_id = issued
+            reward = reward_of(result, self.coverage_reward)
+            if signature is not None:
+                cluster = self.clusterer.clusters_by_id[
+                    self.clusterer.add(result.case_id, result.response, signature)]
+                if cluster.size == 1:
+                    reward = max(reward, self.novel_answer_reward)
+                elif cluster.size >= self.known_cluster_size and reward < 1.0:
+                    self.pools[attack].penalize(parent_id)
+            self.bandit.update(attack, reward)
+            self.pools[attack].credit(parent_id, reward)
+
+    def stats(self) -> Dict[str, Any]:
+        """Bandit counters plus seeds per bucket."""
+        with self._lock:
+            stats = self.bandit.stats()
+            stats['seeds'] = {attack: len(pool) for attack, pool in self.pools.items()}
+            stats['pending'] = len(self._issued)
+            if self.clusterer is not None:
+                stats['answers'] = self.clusterer.stats()
+        return stats
@@ -0,0 +1,267 @@
+"""
+Process Pool Stage
+==================
+Runs a CPU-bound function over a stream of items in worker processes,
+with a hard bound on how much work is outstanding.
+
+At most `max_pending` items are in flight or finished-but-not-consumed at
+any time. Producers block in submit() (or stream() stops pulling input)
+until the consumer takes results out, so a fast producer cannot fill
+memory while a slow consumer (e.g. the browser loop) catches up.
+
+Two ways to consume:
+- stream(items): lazily pulls input and yields results as they complete
+- submit(item) with a `sink`: a collector thread hands each result to the
+  sink, so the submitting thread (e.g. the browser loop) never waits on
+  Python-side work unless the stage is full
+
+Usage:
+    with ProcessPoolStage(prepare_case, workers=4) as stage:
+        for output in stage.stream(corpus.iter_cases()):
+            print(output.value)
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+import multiprocessing
+import os
+import queue
+import threading
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class StageOutput:
+    """Result of one item (exactly one of value/error is meaningful)."""
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ProcessPoolStage:
+    """
+    Bounded process-pool stage.
+    """
+
+    def __init__(self, fn: Callable[[Any], Any], workers: Optional[int] = None,
+                 max_pending: Optional[int] = None,
+                 sink: Optional[Callable[[StageOutput], None]] = None,
+                 name: str = "stage"):
+        """
+        Initialize stage (worker processes start on first use).
+
+        Args:
+            fn: Picklable top-level function (or functools.partial of one)
+            workers: Worker processes (defaults to the CPU count)
+            max_pending: Bound on in-flight plus unconsumed items
+                (defaults to 2 * workers)
+            sink: Called with each StageOutput on a collector thread; without
+                a sink, consume results with stream() or drain()
+            name: Name for logs and stats
+        """
+        self.fn = fn
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        self.sink = sink
+        self.name = name
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._done: "queue.Queue[Optional[StageOutput]]" = queue.Queue()
+        self._collector: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._blocked = 0  # submit() calls that had to wait for a free slot
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> "ProcessPoolStage":
+        """Start the worker processes (and the sink collector)."""
+        if self._executor is None:
+            # spawn avoids forking a process that holds WebDriver/CDP threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            if self.sink is not None:
+                self._collector = threading.Thread(
+                    target=self._collect_loop, name=f"{self.name}-collector", daemon=True
+                )
+                self._collector.start()
+            log.debug("[STAGE] %s: %s workers, max %s pending", self.name, self.workers, self.max_pending)
+        return self
+
+    def close(self, wait: bool = True):
+        """
+        Shut the stage down.
+
+        Args:
+            wait: Wait for outstanding items (and the sink) to finish
+        """
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        if self._collector is not None:
+            self._done.put(None)
+            if wait:
+                self._collector.join()
+        self._executor = None
+        self._collector = None
+
+    # ==================== Producing ====================
+
+    def submit(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Queue one item, blocking while the stage is full.
+
+        Without a sink, the caller must consume results (drain()) or the
+        stage stays full and submit() times out.
+
+        Args:
+            item: Argument for fn
+            timeout: Seconds to wait for a free slot (None = forever)
+
+        Returns:
+            True if queued, False on timeout
+        """
+        self.start()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._blocked += 1
+            if not self._slots.acquire(timeout=timeout):
+                return False
+        self._dispatch(item)
+        return True
+
+    def _dispatch(self, item: Any):
+        """Send an item to the pool (a slot is already held)."""
+        with self._lock:
+            self._outstanding += 1
+            self._submitted += 1
+        future = self._executor.submit(self.fn, item)
+        future.add_done_callback(lambda f, item=item: self._on_done(item, f))
+
+    def _on_done(self, item: Any, future: Future):
+        """Executor callback: park the result for the consumer."""
+        try:
+            output = StageOutput(item=item, value=future.result())
+        except BaseException as e:
+            output = StageOutput(item=item, error=e)
+        self._done.put(output)
+
+    # ==================== Consuming ====================
+
+    def _take(self, block: bool = True, timeout: Optional[float] = None) -> Optional[StageOutput]:
+        """Take one finished result and free its slot."""
+        try:
+            output = self._done.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return None
+        if output is None:
+            return None
+        with self._lock:
+            self._outstanding -= 1
+            self._completed += 1
+            if output.error is not None:
+                self._failed += 1
+        self._slots.release()
+        return output
+
+    def drain(self, block: bool = False) -> Iterator[StageOutput]:
+        """
+        Yield finished results (stages without a sink).
+
+        Args:
+            block: Wait until every submitted item has finished
+
+        Yields:
+            StageOutput in completion order
+        """
+        while True:
+            with self._lock:
+                outstanding = self._outstanding
+            if outstanding == 0:
+                return
+            output = self._take(block=block)
+            if output is None:
+                return
+            yield output
+
+    def stream(self, items: Iterable[Any]) -> Iterator[StageOutput]:
+        """
+        Run fn over items, pulling input only when a slot is free.
+
+        Args:
+            items: Input items (may be a lazy generator)
+
+        Yields:
+            StageOutput in completion order
+        """
+        self.start()
+        iterator = iter(items)
+        exhausted = False
+        while True:
+            while not exhausted and self._slots.acquire(blocking=False):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self._slots.release()
+                    exhausted = True
+                    break
+                self._dispatch(item)
+
+            with self._lock:
+                outstanding = self._outstanding
+            if exhausted and outstanding == 0:
+                return
+
+            output = self._take()
+            if output is not None:
+                yield output
+
+    def _collect_loop(self):
+        """Hand results to the sink until close()."""
+        while True:
+            output = self._take()
+            if output is None:
+                return
+            try:
+                self.sink(output)
+            except Exception as e:
+                log.warning("[STAGE] %s sink failed: %s", self.name, e)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Stage counters.
+
+        Returns:
+            Dictionary with submitted/completed/failed/outstanding counts and
+            how often a producer had to wait (back-pressure)
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'failed': self._failed,
+                'outstanding': self._outstanding,
+                'producer_waits': self._blocked,
+            }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,168 @@
+"""
+Campaign Tasks
+==============
+CPU-bound campaign work that runs in ProcessPoolStage worker processes.
+
+Everything here is a top-level function over picklable data (TestCase,
+plain dictionaries), so it can cross the process boundary:
+- prepare_case: read/generate the HTML, hash it, spool in-memory cases to disk
+- analyze_observation: hash and compress what the browser returned and
+  classify the outcome into a verdict (answers go through the
+  prompt-injection oracle)
+"""
+
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import zlib
+
+from corpus.case import TestCase
+from oracle import OracleVerdict, classify_response
+
+
+class Verdict:
+    """Outcome labels for one test case."""
+    LOADED = "loaded"        # Page loaded, nothing else observed
+    ANSWERED = "answered"    # Page loaded and the assistant answered
+    INJECTED = "injected"    # The answer followed the page's injected instruction (oracle)
+    EXECUTED = "executed"    # Injected script ran (XSS oracle)
+    ERROR = "error"          # Navigation or conversion failed
+    CRASH = "crash"          # Renderer/browser crashed or hung
+
+
+@dataclass
+class Observation:
+    """What the browser loop saw for one case (sent to analyze_observation)."""
+    case: Dict[str, Any]
+    loaded: bool
+    page_source: Optional[str] = None
+    title: Optional[str] = None
+    response: Optional[str] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # Step -> ms
+    coverage: Dict[str, int] = field(default_factory=dict)  # Set by CoverageFuzzer
+    xss: Optional[Dict[str, Any]] = None  # XSSResult for XSS_* cases
+
+
+@dataclass
+class CaseResult:
+    """Analyzed outcome of one case."""
+    case_id: str
+    attack: Optional[str]
+    category: str
+    case_sha256: Optional[str]
+    verdict: str
+    error: Optional[str] = None
+    case_path: Optional[str] = None
+    title: Optional[str] = None
+    response: Optional[str] = None
+    response_sha256: Optional[str] = None
+    page_sha256: Optional[str] = None
+    page_bytes: int = 0
+    compressed_bytes: int = 0
+    snapshot_path: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    coverage: Dict[str, int] = field(default_factory=dict)
+    oracle: Optional[Dict[str, Any]] = None  # OracleResult of the answer
+    xss: Optional[Dict[str, Any]] = None  # XSSResult of the page
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary (one JSON line per case)."""
+        return asdict(self)
+
+
+def _sha256(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode('utf-8', errors='replace')).hexdigest()
+
+
+def prepare_case(case: TestCase, spool_dir: Optional[str] = None) -> TestCase:
+    """
+    Load and fingerprint a case; write in-memory cases to disk.
+
+    Args:
+        case: Case from the corpus (path set) or a generator (html set)
+        spool_dir: Where in-memory cases are written (required for those)
+
+    Returns:
+        The case with html, sha256, size and path filled in (path stays unset for
+        cases served from meta['url'])
+    """
+    case.fingerprint()
+    if case.path is None and not case.meta.get('url'):
+        if spool_dir is None:
+            raise ValueError(f"Generated case {case.case_id} needs a spool directory")
+        directory = Path(spool_dir) / (case.attack or "_uncategorized")
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{case.name}.html"
+        path.write_text(case.html, encoding='utf-8')
+        case.path = str(path)
+    return case
+
+
+def analyze_observation(observation: Observation, snapshot_dir: Optional[str] = None,
+                        compress_level: int = 6) -> CaseResult:
+    """
+    Hash, compress and classify one observation.
+
+    Args:
+        observation: What the browser loop saw
+        snapshot_dir: Where compressed page snapshots are written (None = not kept)
+        compress_level: zlib level for the page snapshot
+
+    Returns:
+        CaseResult
+    """
+    case = observation.case
+    error = observation.error or ""
+
+    if error.startswith("Browser crashed"):
+        verdict = Verdict.CRASH
+    elif not observation.loaded or observation.error:
+        verdict = Verdict.ERROR
+    elif observation.response:
+        verdict = Verdict.ANSWERED
+    else:
+        verdict = Verdict.LOADED
+
+    result = CaseResult(
+        case_id=case['case_id'],
+        attack=case.get('attack'),
+        category=case.get('category', 'other'),
+        case_sha256=case.get('sha256'),
+        verdict=verdict,
+        error=observation.error,
+        case_path=case.get('path'),
+        title=observation.title,
+        response=observation.response,
+        response_sha256=_sha256(observation.response),
+        page_sha256=_sha256(observation.page_source),
+        timings=observation.timings,
+        coverage=observation.coverage,
+        xss=observation.xss,
+    )
+    if observation.xss and observation.xss['verdict'] == OracleVerdict.EXECUTED \
+            and verdict in (Verdict.LOADED, Verdict.ANSWERED):
+        result.verdict = Verdict.EXECUTED
+
+    if observation.response:
+        oracle = classify_response(case, observation.response, html=observation.page_source)
+        result.oracle = oracle.to_dict()
+        if oracle.verdict == OracleVerdict.INJECTED and verdict == Verdict.ANSWERED:
+            result.verdict = Verdict.INJECTED
+
+    if observation.page_source is not None:
+        raw = observation.page_source.encode('utf-8', errors='replace')
+        compressed = zlib.compress(raw, compress_level)
+        result.page_bytes = len(raw)
+        result.compressed_bytes = len(compressed)
+        if snapshot_dir:
+            path = Path(snapshot_dir) / f"{result.page_sha256}.html.z"
+            if not path.exists():  # Content-addressed: identical pages stored once
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(compressed)
+            result.snapshot_path = str(path)
+
+    return result
@@ -0,0 +1,33 @@
+"""
+CDP Module
+==========
+Direct Chrome DevTools Protocol access (events, flat-mode sessions) for
+Chromium-based browsers, alongside Selenium's request/response-only
+execute_cdp_cmd. AsyncCDPConnection is the asyncio variant (websockets).
+
+Usage:
+    from cdp import CDPConnection
+
+    conn = CDPConnection.from_port(9222)
+    conn.on("Target.targetCrashed", on_crash)
+    conn.send("Target.setDiscoverTargets", {"discover": True})
+"""
+
+from .connection import (
+    CDPConnection,
+    CDPConnectionClosed,
+    CDPError,
+    get_browser_ws_url,
+    WEBSOCKET_AVAILABLE,
+)
+from .async_connection import AsyncCDPConnection, WEBSOCKETS_AVAILABLE
+
+__all__ = [
+    'CDPConnection',
+    'CDPConnectionClosed',
+    'CDPError',
+    'get_browser_ws_url',
+    'WEBSOCKET_AVAILABLE',
+    'AsyncCDPConnection',
+    'WEBSOCKETS_AVAILABLE',
+]
@@ -0,0 +1,302 @@
+"""
+Async CDP Connection
+====================
+asyncio counterpart of CDPConnection, built on the `websockets` package.
+
+Every command is a future resolved by one reader task, so hundreds of
+outstanding waits (page loads, answer polling, events) share a single
+event loop instead of one blocked thread each.
+- send(): awaitable command with a per-call timeout
+- on()/off(): event listeners (plain functions or coroutine functions)
+- wait_for(): await the next matching event
+- attach(): flat-mode sessions, so many tabs share one socket
+
+Usage:
+    conn = await AsyncCDPConnection.from_port(9222)
+    target = await conn.send("Target.createTarget", {"url": "about:blank"})
+    session_id = await conn.attach(target["targetId"])
+    await conn.close()
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import inspect
+import itertools
+import json
+
+from .connection import CDPConnectionClosed, CDPError, get_browser_ws_url
+from logger import get_logger
+
+log = get_logger(__name__)
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+
+AsyncEventCallback = Callable[[Dict[str, Any], Optional[str]], Any]
+
+
+class AsyncCDPConnection:
+    """
+    Browser-level CDP client for asyncio code.
+    """
+
+    def __init__(self, ws_url: str, timeout: float = 10.0):
+        """
+        Initialize connection (await connect() or use from_port()).
+
+        Args:
+            ws_url: Browser WebSocket URL (ws://127.0.0.1:<port>/devtools/browser/<id>)
+            timeout: Default per-command timeout (seconds)
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError("websockets is required for AsyncCDPConnection")
+
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._listeners: Dict[Tuple[str, Optional[str]], List[AsyncEventCallback]] = defaultdict(list)
+        self._close_listeners: List[Callable[[], Any]] = []
+        self._reader: Optional[asyncio.Task] = None
+        self.closed = asyncio.Event()
+
+    @classmethod
+    async def from_port(cls, debug_port: int, host: str = "127.0.0.1",
+                        timeout: float = 10.0) -> "AsyncCDPConnection":
+        """
+        Connect to the browser listening on a debugging port.
+
+        Args:
+            debug_port: Remote debugging port
+            host: DevTools host
+            timeout: Default per-command timeout (seconds)
+
+        Returns:
+            Connected AsyncCDPConnection
+        """
+        ws_url = await asyncio.to_thread(get_browser_ws_url, debug_port, host)
+        return await cls(ws_url, timeout=timeout).connect()
+
+    # ==================== Lifecycle ====================
+
+    async def connect(self) -> "AsyncCDPConnection":
+        """Open the WebSocket and start the reader task."""
+        # No Origin header is sent, so Chrome needs no --remote-allow-origins;
+        # max_size=None because screenshots and DOM snapshots exceed 1 MiB
+        self._ws = await websockets.connect(
+            self.ws_url, max_size=None, ping_interval=None, open_timeout=self.timeout
+        )
+        self.closed.clear()
+        self._reader = asyncio.create_task(self._read_loop(), name="cdp-reader")
+        log.debug("[CDP] Connected (async): %s", self.ws_url)
+        return self
+
+    async def close(self):
+        """Close the WebSocket (pending commands fail with CDPConnectionClosed)."""
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        if self._reader is not None:
+            try:
+                await self._reader
+            except Exception:
+                pass
+        self.closed.set()
+
+    # ==================== Commands ====================
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   session_id: Optional[str] = None,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a command and await its result.
+
+        Args:
+            method: CDP method (e.g., "Target.getTargets")
+            params: Command parameters
+            session_id: Flat-mode session to send to (None = browser target)
+            timeout: Seconds to wait (defaults to the connection timeout)
+
+        Returns:
+            The command's result object
+
+        Raises:
+            CDPError: If the browser returned an error
+            TimeoutError: If no response arrived in time
+            CDPConnectionClosed: If the connection is closed
+        """
+        if self.closed.is_set():
+            raise CDPConnectionClosed(f"Connection closed before {method}")
+
+        message_id = next(self._ids)
+        message: Dict[str, Any] = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send(json.dumps(message))
+            response = await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{method} timed out")
+        except websockets.WebSocketException as e:
+            raise CDPConnectionClosed(f"{method}: {e}")
+        finally:
+            self._pending.pop(message_id, None)
+
+        if response is None:
+            raise CDPConnectionClosed(f"Connection closed during {method}")
+        if 'error' in response:
+            raise CDPError(method, response['error'])
+        return response.get('result', {})
+
+    async def attach(self, target_id: str) -> str:
+        """
+        Attach to a target in flat mode.
+
+        Args:
+            target_id: Target to attach to
+
+        Returns:
+            Session id for send(..., session_id=...)
+        """
+        result = await self.send("Target.attachToTarget", {'targetId': target_id, 'flatten': True})
+        return result['sessionId']
+
+    async def detach(self, session_id: str):
+        """Detach a flat-mode session (ignores errors for gone targets)."""
+        try:
+            await self.send("Target.detachFromTarget", {'sessionId': session_id})
+        except (CDPError, CDPConnectionClosed, TimeoutError):
+            pass
+
+    # ==================== Events ====================
+
+    def on(self, event: str, callback: AsyncEventCallback, session_id: Optional[str] = None):
+        """
+        Register an event listener.
+
+        Args:
+            event: CDP event name (e.g., "Page.loadEventFired")
+            callback: Called as callback(params, session_id); coroutine
+                functions are scheduled as tasks
+            session_id: Only deliver events from this session (None = any session)
+        """
+        self._listeners[(event, session_id)].append(callback)
+
+    def off(self, event: str, callback: AsyncEventCallback, session_id: Optional[str] = None):
+        """Remove an event listener registered with on()."""
+        listeners = self._listeners.get((event, session_id), [])
+        if callback in listeners:
+            listeners.remove(callback)
+
+    def on_close(self, callback: Callable[[], Any]):
+        """Register a callback for when the WebSocket closes."""
+        self._close_listeners.append(callback)
+
+    async def wait_for(self, event: str, session_id: Optional[str] = None,
+                       predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                       timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Await the next occurrence of an event.
+
+        Register the wait before triggering the event, e.g.
+        `waiter = asyncio.ensure_future(conn.wait_for(...))` then send.
+
+        Args:
+            event: CDP event name
+            session_id: Only match events from this session
+            predicate: Extra filter on the event params
+            timeout: Seconds to wait (defaults to the connection timeout)
+
+        Returns:
+            The event params
+
+        Raises:
+            TimeoutError: If the event did not arrive in time
+            CDPConnectionClosed: If the connection closed first
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(params: Dict[str, Any], sid: Optional[str]):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(event, listener, session_id)
+        closed = asyncio.ensure_future(self.closed.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {future, closed},
+                timeout=self.timeout if timeout is None else timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if future in done:
+                return future.result()
+            if closed in done:
+                raise CDPConnectionClosed(f"Connection closed while waiting for {event}")
+            raise TimeoutError(f"{event} not received")
+        finally:
+            closed.cancel()
+            self.off(event, listener, session_id)
+
+    # ==================== Reader ====================
+
+    async def _read_loop(self):
+        """Dispatch responses and events until the socket closes."""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self._pending.get(message['id'])
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                elif 'method' in message:
+                    self._dispatch(message)
+        except Exception as e:
+            if not self.closed.is_set():
+                log.debug("[CDP] Reader stopped: %s", e)
+        finally:
+            self.closed.set()
+            for future in list(self._pending.values()):
+                if not future.done():
+                    future.set_result(None)  # -> CDPConnectionClosed
+            for callback in self._close_listeners:
+                try:
+                    outcome = callback()
+                    if inspect.isawaitable(outcome):
+                        asyncio.ensure_future(outcome)
+                except Exception as e:
+                    log.warning("[CDP] Close listener failed: %s", e)
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Call the listeners for one event."""
+        event = message['method']
+        session_id = message.get('sessionId')
+        params = message.get('params', {})
+
+        callbacks = list(self._listeners.get((event, None), []))
+        if session_id:
+            callbacks += self._listeners.get((event, session_id), [])
+
+        for callback in callbacks:
+            try:
+                outcome = callback(params, session_id)
+                if inspect.isawaitable(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception as e:
+                log.warning("[CDP] Listener for %s failed: %s", event, e)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,314 @@
+"""
+CDP Connection
+==============
+Direct Chrome DevTools Protocol client over the browser-level WebSocket.
+
+Selenium's execute_cdp_cmd is request/response only and goes through
+ChromeDriver; it cannot deliver events (Target.targetCrashed,
+Inspector.targetCrashed, Runtime.bindingCalled, ...). CDPConnection talks
+to the browser's webSocketDebuggerUrl directly:
+- send(): blocking command with a per-call timeout
+- on()/off(): event listeners, optionally scoped to one session
+- attach(): flat-mode sessions (Target.attachToTarget flatten=True), so
+  many targets share one socket
+- A reader thread dispatches responses and events; listeners run on that
+  thread and should return quickly
+
+Usage:
+    conn = CDPConnection.from_port(9222)
+    conn.on("Target.targetCrashed", lambda params, session_id: print(params))
+    conn.send("Target.setDiscoverTargets", {"discover": True})
+    conn.close()
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import itertools
+import json
+import threading
+
+import requests
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+
+EventCallback = Callable[[Dict[str, Any], Optional[str]], None]
+
+
+class CDPError(Exception):
+    """A CDP command returned an error response."""
+
+    def __init__(self, method: str, error: Dict[str, Any]):
+        self.method = method
+        self.code = error.get('code')
+        self.error_message = error.get('message', '')
+        super().__init__(f"{method} failed: {self.error_message} ({self.code})")
+
+
+class CDPConnectionClosed(Exception):
+    """The DevTools WebSocket closed (browser exited or crashed)."""
+
+
+def get_browser_ws_url(debug_port: int, host: str = "127.0.0.1", timeout: float = 2.0) -> str:
+    """
+    Look up the browser-level DevTools WebSocket URL.
+
+    Args:
+        debug_port: Remote debugging port
+        host: DevTools host
+        timeout: HTTP timeout (seconds)
+
+    Returns:
+        webSocketDebuggerUrl from /json/version
+
+    Raises:
+        RuntimeError: If the endpoint is unreachable
+    """
+    try:
+        r = requests.get(f"http://{host}:{debug_port}/json/version", timeout=timeout)
+        r.raise_for_status()
+        return r.json()['webSocketDebuggerUrl']
+    except Exception as e:
+        raise RuntimeError(f"DevTools not reachable on {host}:{debug_port}: {e}")
+
+
+class _Pending:
+    """One in-flight command."""
+
+    __slots__ = ('event', 'response')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
+
+
+class CDPConnection:
+    """
+    Browser-level CDP client with sessions and event listeners.
+    """
+
+    def __init__(self, ws_url: str, timeout: float = 10.0):
+        """
+        Initialize connection (call connect() or use from_port()).
+
+        Args:
+            ws_url: Browser WebSocket URL (ws://127.0.0.1:<port>/devtools/browser/<id>)
+            timeout: Default per-command timeout (seconds)
+        """
+        if not WEBSOCKET_AVAILABLE:
+            raise ImportError("websocket-client is required for CDPConnection")
+
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, _Pending] = {}
+        self._listeners: Dict[Tuple[str, Optional[str]], List[EventCallback]] = defaultdict(list)
+        self._close_listeners: List[Callable[[], None]] = []
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+        self.closed = threading.Event()
+
+    @classmethod
+    def from_port(cls, debug_port: int, host: str = "127.0.0.1",
+                  timeout: float = 10.0) -> "CDPConnection":
+        """
+        Connect to the browser listening on a debugging port.
+
+        Args:
+            debug_port: Remote debugging port
+            host: DevTools host
+            timeout: Default per-command timeout (seconds)
+
+        Returns:
+            Connected CDPConnection
+        """
+        return cls(get_browser_ws_url(debug_port, host), timeout=timeout).connect()
+
+    # ==================== Lifecycle ====================
+
+    def connect(self) -> "CDPConnection":
+        """Open the WebSocket and start the reader thread."""
+        # suppress_origin: Chrome rejects unknown Origin headers unless
+        # launched with --remote-allow-origins
+        self._ws = websocket.create_connection(
+            self.ws_url,
+            timeout=self.timeout,
+            suppress_origin=True,
+            enable_multithread=True
+        )
+        self._ws.settimeout(None)
+        self.closed.clear()
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+        log.debug("[CDP] Connected: %s", self.ws_url)
+        return self
+
+    def close(self):
+        """Close the WebSocket (pending commands fail with CDPConnectionClosed)."""
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+        self.closed.set()
+
+    # ==================== Commands ====================
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+             session_id: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a command and wait for its result.
+
+        Args:
+            method: CDP method (e.g., "Target.getTargets")
+            params: Command parameters
+            session_id: Flat-mode session to send to (None = browser target)
+            timeout: Seconds to wait (defaults to the connection timeout)
+
+        Returns:
+            The command's result object
+
+        Raises:
+            CDPError: If the browser returned an error
+            TimeoutError: If no response arrived in time
+            CDPConnectionClosed: If the connection is closed
+        """
+        if self.closed.is_set():
+            raise CDPConnectionClosed(f"Connection closed before {method}")
+
+        message_id = next(self._ids)
+        message: Dict[str, Any] = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+
+        pending = _Pending()
+        with self._lock:
+            self._pending[message_id] = pending
+        try:
+            with self._send_lock:
+                self._ws.send(json.dumps(message))
+            if not pending.event.wait(self.timeout if timeout is None else timeout):
+                raise TimeoutError(f"{method} timed out")
+        except websocket.WebSocketException as e:
+            raise CDPConnectionClosed(f"{method}: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(message_id, None)
+
+        response = pending.response
+        if response is None:
+            raise CDPConnectionClosed(f"Connection closed during {method}")
+        if 'error' in response:
+            raise CDPError(method, response['error'])
+        return response.get('result', {})
+
+    def attach(self, target_id: str) -> str:
+        """
+        Attach to a target in flat mode.
+
+        Args:
+            target_id: Target to attach to (from Target.getTargets)
+
+        Returns:
+            Session id for send(..., session_id=...)
+        """
+        result = self.send("Target.attachToTarget", {'targetId': target_id, 'flatten': True})
+        return result['sessionId']
+
+    def detach(self, session_id: str):
+        """Detach a flat-mode session (ignores errors for gone targets)."""
+        try:
+            self.send("Target.detachFromTarget", {'sessionId': session_id})
+        except (CDPError, CDPConnectionClosed, TimeoutError):
+            pass
+
+    # ==================== Events ====================
+
+    def on(self, event: str, callback: EventCallback, session_id: Optional[str] = None):
+        """
+        Register an event listener.
+
+        Args:
+            event: CDP event name (e.g., "Inspector.targetCrashed")
+            callback: Called as callback(params, session_id) on the reader thread
+            session_id: Only deliver events from this session (None = any session)
+        """
+        with self._lock:
+            self._listeners[(event, session_id)].append(callback)
+
+    def off(self, event: str, callback: EventCallback, session_id: Optional[str] = None):
+        """Remove an event listener registered with on()."""
+        with self._lock:
+            listeners = self._listeners.get((event, session_id), [])
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def on_close(self, callback: Callable[[], None]):
+        """Register a callback for when the WebSocket closes."""
+        self._close_listeners.append(callback)
+
+    # ==================== Reader ====================
+
+    def _read_loop(self):
+        """Dispatch responses and events until the socket closes."""
+        try:
+            while True:
+                raw = self._ws.recv()
+                if not raw:
+                    break
+                message = json.loads(raw)
+                if 'id' in message:
+                    with self._lock:
+                        pending = self._pending.get(message['id'])
+                    if pending:
+                        pending.response = message
+                        pending.event.set()
+                elif 'method' in message:
+                    self._dispatch(message)
+        except Exception as e:
+            if not self.closed.is_set():
+                log.debug("[CDP] Reader stopped: %s", e)
+        finally:
+            self.closed.set()
+            with self._lock:
+                pending_items = list(self._pending.values())
+            for pending in pending_items:
+                pending.event.set()  # response stays None -> CDPConnectionClosed
+            for callback in self._close_listeners:
+                try:
+                    callback()
+                except Exception as e:
+                    log.warning("[CDP] Close listener failed: %s", e)
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Call the listeners for one event."""
+        event = message['method']
+        session_id = message.get('sessionId')
+        params = message.get('params', {})
+
+        with self._lock:
+            callbacks = list(self._listeners.get((event, None), []))
+            if session_id:
+                callbacks += self._listeners.get((event, session_id), [])
+
+        for callback in callbacks:
+            try:
+                callback(params, session_id)
+            except Exception as e:
+                log.warning("[CDP] Listener for %s failed: %s", event, e)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
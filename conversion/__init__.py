@@ -6,9 +6,12 @@ Factory and base classes for browser conversion operations.
 Conversion handles communication with AI assistants:
 - Sending queries
 - Capturing responses
+- Answering repeated queries from a ResponseCache (LRU + TTL, SQLite-backed)
 """
 
 from .factory import ConversionFactory, ConversionType
 from .base import BaseConversion, ConversionResult
+from .cache import ResponseCache, page_hash
 
-__all__ = ['ConversionFactory', 'ConversionType', 'BaseConversion', 'ConversionResult']
+__all__ = ['ConversionFactory', 'ConversionType', 'BaseConversion', 'ConversionResult',
+           'ResponseCache', 'page_hash']
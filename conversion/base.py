@@ -8,7 +8,15 @@ Conversion handles the communication layer with AI assistants.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from profiling.timer import StepTimer
+from logger import get_logger
+
+from .cache import page_hash
+
+log = get_logger(__name__)
 
 
 @dataclass
@@ -22,12 +30,16 @@ class ConversionResult:
         response: The assistant's response text (if captured)
         text_filepath: Path to saved text file (if saved)
         error: Error message if failed
+        cached: Response came from the response cache (no browser round trip)
+        timings: Step name -> total nanoseconds, when the handler times its own steps
     """
     success: bool
     query: str
     response: Optional[str] = None
     text_filepath: Optional[str] = None
     error: Optional[str] = None
+    cached: bool = False
+    timings: Optional[Dict[str, int]] = None
 
 
 class BaseConversion(ABC):
@@ -49,6 +61,10 @@ class BaseConversion(ABC):
         """
         self.driver = driver
         self.navigator = navigator
+        self.timer = StepTimer()  # Pipeline replaces this with its own timer
+        self.submitted_ns: Optional[int] = None  # perf_counter_ns() at the last submit (first_token starts here)
+        self.watchdog = None  # Pipeline sets this; wait loops call watchdog.check()
+        self.response_cache = None  # Optional conversion.cache.ResponseCache consulted by execute()
     
     @abstractmethod
     def send_query(self, query: str, submit: bool = True) -> bool:
@@ -109,31 +125,64 @@ class BaseConversion(ABC):
         # Default implementation: not supported
         return False
     
+    def _cache_key(self, query: str, page_sha256: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Response-cache key of a query on the current page.
+
+        Without page_sha256 the page is identified by its URL: the Sidecar
+        DOM contains every earlier answer, so hashing page_source would
+        never give the same key twice.
+        """
+        if page_sha256 is None:
+            page_sha256 = page_hash(self.driver.current_url)
+        browser_version = (getattr(self.driver, 'capabilities', None) or {}).get('browserVersion')
+        return self.response_cache.key_for(query, page_sha256, browser_version), page_sha256, browser_version
+
     def execute(self, query: str, capture: bool = True, 
                save_html: Optional[str] = None, save_text: Optional[str] = None,
-               max_wait: float = 60.0) -> ConversionResult:
+               max_wait: float = 60.0, page_sha256: Optional[str] = None) -> ConversionResult:
         """
         Execute a complete conversion: send query and capture response.
         
+        With a response_cache set, a captured answer to the same query on the
+        same page and browser version is returned without touching the browser
+        (and written to save_text when given).
+        
         Args:
             query: The question/prompt to send
             capture: Whether to capture the response
             save_html: Optional filepath to save HTML response
             save_text: Optional filepath to save text response
             max_wait: Maximum wait time for response (seconds)
+            page_sha256: conversion.cache.page_hash() of the page the question is about
+                (defaults to a hash of the current URL)
             
         Returns:
             ConversionResult with query and response
         """
-        print(f"[CONVERSION] Executing query...")
-        print(f"[CONVERSION] Query: '{query}'")
-        print(f"[CONVERSION] Capture response: {capture}")
+        log.info("[CONVERSION] Executing query...")
+        log.debug("[CONVERSION] Query: '%s'", query)
+        log.debug("[CONVERSION] Capture response: %s", capture)
         if save_html:
-            print(f"[CONVERSION] Save HTML to: {save_html}")
+            log.debug("[CONVERSION] Save HTML to: %s", save_html)
         if save_text:
-            print(f"[CONVERSION] Save text to: {save_text}")
+            log.debug("[CONVERSION] Save text to: %s", save_text)
         
         try:
+            cache_key = None
+            if self.response_cache is not None and capture:
+                cache_key, page_sha256, browser_version = self._cache_key(query, page_sha256)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    log.info("[CONVERSION] ✓ Response cache hit (%s characters)", len(cached))
+                    text_filepath = None
+                    if save_text:
+                        Path(save_text).parent.mkdir(parents=True, exist_ok=True)
+                        Path(save_text).write_text(cached, encoding='utf-8')
+                        text_filepath = save_text
+                    return ConversionResult(success=True, query=query, response=cached,
+                                            text_filepath=text_filepath, cached=True)
+
             # Send the query
             send_success = self.send_query(query, submit=True)
             
@@ -144,41 +193,46 @@ class BaseConversion(ABC):
                     error="Failed to send query"
                 )
             
-            print(f"[CONVERSION] ✓ Query sent successfully")
+            log.info("[CONVERSION] ✓ Query sent successfully")
             
             # Capture response if requested
             response_text = None
             text_filepath = None
             
             if capture:
-                print(f"[CONVERSION] Capturing response...")
-                response_text = self.capture_response(
-                    wait_for_completion=True,
-                    max_wait=max_wait
-                )
+                log.info("[CONVERSION] Capturing response...")
+                with self.timer.measure("completion"):
+                    response_text = self.capture_response(
+                        wait_for_completion=True,
+                        max_wait=max_wait
+                    )
                 
                 if response_text:
-                    print(f"[CONVERSION] ✓ Response captured ({len(response_text)} characters)")
+                    log.info("[CONVERSION] ✓ Response captured (%s characters)", len(response_text))
+                    if cache_key is not None:
+                        self.response_cache.put(cache_key, response_text, query=query,
+                                                page_sha256=page_sha256, browser_version=browser_version)
                 else:
-                    print(f"[CONVERSION] ⚠ No response text captured")
+                    log.warning("[CONVERSION] ⚠ No response text captured")
             
             # Save text if requested
             if save_text:
-                print(f"[CONVERSION] Saving text...")
-                text_saved = self.save_response_text(
-                    filepath=save_text,
-                    wait_for_completion=False if response_text else True,  # Skip wait if already captured
-                    max_wait=max_wait
-                )
+                log.info("[CONVERSION] Saving text...")
+                with self.timer.measure("save"):
+                    text_saved = self.save_response_text(
+                        filepath=save_text,
+                        wait_for_completion=False if response_text else True,  # Skip wait if already captured
+                        max_wait=max_wait
+                    )
                 
-                print(f"[CONVERSION DEBUG] text_saved result: {text_saved}")
+                log.debug("[CONVERSION DEBUG] text_saved result: %s", text_saved)
                 
                 if text_saved:
                     text_filepath = save_text
-                    print(f"[CONVERSION] ✓ Text saved successfully")
-                    print(f"[CONVERSION DEBUG] text_filepath set to: {text_filepath}")
+                    log.info("[CONVERSION] ✓ Text saved successfully")
+                    log.debug("[CONVERSION DEBUG] text_filepath set to: %s", text_filepath)
                 else:
-                    print(f"[CONVERSION] ⚠ Failed to save text")
+                    log.warning("[CONVERSION] ⚠ Failed to save text")
             
             # Determine success - succeed if query was sent and either:
             # 1. Response was captured successfully, OR 
@@ -188,13 +242,13 @@ class BaseConversion(ABC):
             success = send_success and (response_captured or text_saved)
             
             # Debug logging
-            print(f"[CONVERSION DEBUG] send_success: {send_success}")
-            print(f"[CONVERSION DEBUG] capture: {capture}")
-            print(f"[CONVERSION DEBUG] response_text: {'Yes' if response_text else 'None'}")
-            print(f"[CONVERSION DEBUG] response_captured: {response_captured}")
-            print(f"[CONVERSION DEBUG] text_saved: {text_saved}")
-            print(f"[CONVERSION DEBUG] text_filepath: {text_filepath}")
-            print(f"[CONVERSION DEBUG] final success: {success}")
+            log.debug("[CONVERSION DEBUG] send_success: %s", send_success)
+            log.debug("[CONVERSION DEBUG] capture: %s", capture)
+            log.debug("[CONVERSION DEBUG] response_text: %s", 'Yes' if response_text else 'None')
+            log.debug("[CONVERSION DEBUG] response_captured: %s", response_captured)
+            log.debug("[CONVERSION DEBUG] text_saved: %s", text_saved)
+            log.debug("[CONVERSION DEBUG] text_filepath: %s", text_filepath)
+            log.debug("[CONVERSION DEBUG] final success: %s", success)
             
             # Override error message if we have partial success
             error_msg = None
@@ -215,9 +269,7 @@ class BaseConversion(ABC):
             )
         
         except Exception as e:
-            print(f"[CONVERSION ERROR] {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[CONVERSION ERROR] %s", e, exc_info=True)
             return ConversionResult(
                 success=False,
                 query=query,
@@ -0,0 +1,209 @@
+"""
+Response Cache
+==============
+Optional cache in front of BaseConversion.execute(): re-asking the same
+prompt against the same page in the same browser version returns the
+stored answer without a browser round trip.
+
+Key: SHA-256 of (query, page-content hash, browser version).
+Storage: in-memory LRU of `capacity` entries, backed by a SQLite file
+(conversations.db) so answers survive restarts. Entries older than `ttl_s`
+are treated as misses and dropped, in memory and on disk.
+
+Usage:
+    cache = ResponseCache("output/conversations.db", capacity=2048, ttl_s=24 * 3600)
+    conversion = ConversionFactory.create(ConversionType.COMET, driver, navigator,
+                                          response_cache=cache)
+    result = conversion.execute("Summarize this page")  # result.cached on a hit
+    print(cache.stats())
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    query TEXT NOT NULL,
+    page_sha256 TEXT,
+    browser_version TEXT,
+    response TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def page_hash(page_source: Optional[str]) -> Optional[str]:
+    """
+    Hash of a page's content for cache keys.
+
+    Args:
+        page_source: driver.page_source (None = unknown page)
+
+    Returns:
+        Hex digest, or None
+    """
+    if page_source is None:
+        return None
+    return hashlib.sha256(page_source.encode('utf-8', errors='replace')).hexdigest()
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of assistant answers, optionally persisted to SQLite.
+    """
+
+    def __init__(self, path: Optional[str] = None, capacity: int = 1024, ttl_s: float = 24 * 3600.0):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file (e.g. output/conversations.db); None keeps the cache in memory only
+            capacity: Entries kept in memory
+            ttl_s: Age after which an entry is a miss
+        """
+        self.path = path
+        self.capacity = capacity
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (response, created)
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+        self.counters: Dict[str, int] = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'stores': 0,
+                                         'evictions': 0, 'expired': 0}
+
+    @staticmethod
+    def key_for(query: str, page_sha256: Optional[str], browser_version: Optional[str]) -> str:
+        """
+        Cache key of one question.
+
+        Args:
+            query: Prompt sent to the assistant
+            page_sha256: page_hash() of the page the question is about
+            browser_version: Running browser version
+
+        Returns:
+            Hex digest
+        """
+        data = json.dumps([query, page_sha256, browser_version]).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Cached answer.
+
+        Args:
+            key: key_for() of the question
+
+        Returns:
+            Answer text, or None on a miss (absent or expired)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[1] <= self.ttl_s:
+                    self._entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    return entry[0]
+                self._drop(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT response, created FROM responses WHERE key = ?",
+                                       (key,)).fetchone()
+                if row is not None:
+                    if now - row[1] <= self.ttl_s:
+                        self._remember(key, row[0], row[1])
+                        self.counters['hits'] += 1
+                        self.counters['disk_hits'] += 1
+                        return row[0]
+                    self._drop(key)
+            self.counters['misses'] += 1
+            return None
+
+    def put(self, key: str, response: str, query: str = "", page_sha256: Optional[str] = None,
+            browser_version: Optional[str] = None):
+        """
+        Store an answer.
+
+        Args:
+            key: key_for() of the question
+            response: Answer text
+            query / page_sha256 / browser_version: Kept next to the answer in SQLite for inspection
+        """
+        created = time.time()
+        with self._lock:
+            self._remember(key, response, created)
+            self.counters['stores'] += 1
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                                 (key, query, page_sha256, browser_version, response, created))
+                self._db.commit()
+
+    def _remember(self, key: str, response: str, created: float):
+        self._entries[key] = (response, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def _drop(self, key: str):
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+        self.counters['expired'] += 1
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries from memory and disk.
+
+        Returns:
+            Number of entries deleted
+        """
+        cutoff = time.time() - self.ttl_s
+        with self._lock:
+            stale = [key for key, (_, created) in self._entries.items() if created < cutoff]
+            for key in stale:
+                del self._entries[key]
+            removed = len(stale)
+            if self._db is not None:
+                removed = max(removed, self._db.execute("DELETE FROM responses WHERE created < ?",
+                                                        (cutoff,)).rowcount)
+                self._db.commit()
+            self.counters['expired'] += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters.
+
+        Returns:
+            Dictionary with hits, misses, disk_hits, stores, evictions, expired and memory entries
+        """
+        with self._lock:
+            return {**self.counters, 'entries': len(self._entries)}
+
+    def close(self):
+        """Close the SQLite store."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __repr__(self):
+        return f"ResponseCache(path={self.path!r}, capacity={self.capacity}, ttl_s={self.ttl_s})"
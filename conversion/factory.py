@@ -21,7 +21,8 @@ class ConversionFactory:
     """
     
     @staticmethod
-    def create(conversion_type: ConversionType, driver: Any, navigator: Any = None):
+    def create(conversion_type: ConversionType, driver: Any, navigator: Any = None,
+               response_cache: Any = None):
         """
         Create a conversion handler for the specified browser type.
         
@@ -29,6 +30,7 @@ class ConversionFactory:
             conversion_type: Type of conversion to create
             driver: Selenium WebDriver instance
             navigator: Navigator instance (optional)
+            response_cache: conversion.cache.ResponseCache to answer repeated queries from (optional)
             
         Returns:
             Conversion instance for the specified browser
@@ -39,6 +41,8 @@ class ConversionFactory:
         if conversion_type == ConversionType.COMET:
             # Import from browser/comet/ folder (not from conversion/comet/)
             from browser.comet.conversion import CometConversion
-            return CometConversion(driver, navigator)
+            conversion = CometConversion(driver, navigator)
+            conversion.response_cache = response_cache
+            return conversion
         else:
             raise ValueError(f"Unsupported conversion type: {conversion_type}")
@@ -0,0 +1,47 @@
+"""
+Corpus Module
+=============
+HTML test cases for fuzzing campaigns.
+
+Layout: htmls/<ATTACK_NAME>/*.html, where ATTACK_NAME is one of
+BaseBrowser.get_attack_names(); files directly in htmls/ are uncategorized.
+
+Components:
+- Corpus: Reads and writes the htmls/ layout
+- scan_files / scan_cases: Lazy, shardable os.scandir enumeration for huge directories
+- PackedCorpus: One memory-mapped file instead of millions of .html files,
+  served by PackedCorpusServer (HTTP) or PackedCorpusInterceptor (CDP Fetch)
+
+Usage:
+    from corpus import Corpus
+
+    corpus = Corpus("htmls", attacks=browser.get_attack_names())
+    for case in corpus.iter_cases():
+        print(case.case_id, case.category)
+"""
+
+from .case import ATTACK_CATEGORIES, TestCase, attack_category, canary_meta, html_canaries
+from .interceptor import PackedCorpusInterceptor
+from .packed import PackedCorpus, PackedCorpusError, pack_cases, pack_directory, unpack
+from .reader import scan_cases, scan_files, shard_of
+from .server import PackedCorpusServer
+from .store import Corpus
+
+__all__ = [
+    'ATTACK_CATEGORIES',
+    'Corpus',
+    'PackedCorpus',
+    'PackedCorpusError',
+    'PackedCorpusInterceptor',
+    'PackedCorpusServer',
+    'TestCase',
+    'attack_category',
+    'canary_meta',
+    'html_canaries',
+    'pack_cases',
+    'pack_directory',
+    'scan_cases',
+    'scan_files',
+    'shard_of',
+    'unpack',
+]
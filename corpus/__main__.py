@@ -0,0 +1,67 @@
+"""
+Corpus Entry Point
+==================
+Usage:
+    python -m corpus pack htmls htmls.pack
+    python -m corpus unpack htmls.pack htmls_restored
+    python -m corpus serve htmls.pack --port 8765
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from logger import configure_logging
+from corpus.packed import PackedCorpus, pack_directory, unpack
+from corpus.server import PackedCorpusServer
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(prog="python -m corpus", description="Packed corpus tools")
+    parser.add_argument("--log-level", default=None,
+                        help="DEBUG, INFO, WARNING or ERROR (default: $FUZZER_LOG_LEVEL or INFO)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack = commands.add_parser("pack", help="Pack a corpus directory into one file")
+    pack.add_argument("root", help="Corpus directory (htmls/<ATTACK>/*.html)")
+    pack.add_argument("output", help="Packed file to write")
+    pack.add_argument("--pattern", default="*.html", help="Case file pattern")
+    pack.add_argument("--no-compress", action="store_true", help="Store every record uncompressed")
+    pack.add_argument("--level", type=int, default=6, help="zlib level")
+
+    unpack_parser = commands.add_parser("unpack", help="Write a packed file back out as .html files")
+    unpack_parser.add_argument("pack", help="Packed file")
+    unpack_parser.add_argument("output", help="Corpus directory to create")
+
+    serve = commands.add_parser("serve", help="Serve a packed file over HTTP")
+    serve.add_argument("pack", help="Packed file")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+
+    args = parser.parse_args(argv)
+    configure_logging(level=args.log_level)
+
+    if args.command == "pack":
+        started = time.perf_counter()
+        count = pack_directory(args.root, args.output, pattern=args.pattern,
+                               compress=not args.no_compress, level=args.level)
+        print(f"Packed {count} cases into {args.output} in {time.perf_counter() - started:.1f}s")
+    elif args.command == "unpack":
+        count = unpack(args.pack, args.output)
+        print(f"Wrote {count} cases to {args.output}")
+    else:
+        with PackedCorpus(args.pack) as pack, PackedCorpusServer(pack, args.host, args.port) as server:
+            print(f"Serving {len(pack)} cases at {server.base_url}/<ATTACK>/<name>.html (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
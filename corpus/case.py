@@ -0,0 +1,159 @@
+"""
+Test Cases
+==========
+One HTML test case of the fuzzing corpus, plus the attack categories that
+group the names returned by BaseBrowser.get_attack_names().
+
+Corpus layout (htmls/):
+    htmls/<ATTACK_NAME>/<case>.html   e.g. htmls/XSS_DOM/innerhtml_01.html
+    htmls/<case>.html                 uncategorized cases (attack = None)
+"""
+
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import re
+
+
+# Same grouping (and order) as CometBrowser.get_attack_names()
+ATTACK_CATEGORIES: Dict[str, tuple] = {
+    'web': (
+        "XSS_REFLECTED", "XSS_STORED", "XSS_DOM", "CSRF", "CLICKJACKING",
+        "OPEN_REDIRECT", "PATH_TRAVERSAL", "SQL_INJECTION", "COMMAND_INJECTION",
+        "XXE", "SSRF",
+    ),
+    'browser': (
+        "PROTOTYPE_POLLUTION", "POSTMESSAGE_XSS", "CORS_MISCONFIGURATION",
+        "CSP_BYPASS", "SRI_BYPASS", "DANGLING_MARKUP", "MUTATION_XSS",
+    ),
+    'ai': (
+        "SIDECAR_INJECTION", "ASSISTANT_PROMPT_INJECTION", "AI_CONTEXT_POISONING",
+        "DEVTOOLS_PROTOCOL_ABUSE",
+    ),
+    'file': (
+        "LOCAL_FILE_INCLUSION", "FILE_URI_LEAK", "SAME_ORIGIN_BYPASS",
+    ),
+    'engine': (
+        "V8_EXPLOITATION", "RENDERER_RCE", "SANDBOX_ESCAPE", "USE_AFTER_FREE",
+        "TYPE_CONFUSION", "BUFFER_OVERFLOW",
+    ),
+}
+
+# Generated cases carry their canary in the page itself, so it survives
+# writing to disk, packing and mutation (meta is not persisted)
+_CANARY_META = re.compile(r"<meta\s+name=[\"']?fuzz-canary[\"']?\s+content=[\"']?([0-9a-f]{12})")
+
+_CATEGORY_BY_ATTACK = {
+    attack: category
+    for category, attacks in ATTACK_CATEGORIES.items()
+    for attack in attacks
+}
+
+
+def attack_category(attack: Optional[str]) -> str:
+    """
+    Category of an attack name.
+
+    Args:
+        attack: Attack name (e.g., "XSS_DOM"), or None
+
+    Returns:
+        'web', 'browser', 'ai', 'file', 'engine' or 'other'
+    """
+    return _CATEGORY_BY_ATTACK.get(attack or "", 'other')
+
+
+def canary_meta(canary: str) -> str:
+    """<meta> tag recording a case's canary (see html_canaries())."""
+    return f'<meta name="fuzz-canary" content="{canary}">'
+
+
+def html_canaries(html: str) -> List[str]:
+    """
+    Canaries recorded in a case's HTML with canary_meta().
+
+    Args:
+        html: Case HTML
+
+    Returns:
+        Canary strings (may be empty)
+    """
+    return _CANARY_META.findall(html)
+
+
+@dataclass
+class TestCase:
+    """
+    One HTML test case.
+
+    Either `path` (a file in the corpus) or `html` (generated in memory)
+    is set; prepare steps fill in the other fields.
+    """
+    attack: Optional[str]
+    name: str
+    path: Optional[str] = None
+    html: Optional[str] = None
+    sha256: Optional[str] = None
+    size: Optional[int] = None
+    meta: Dict[str, Any] = field(default_factory=dict)  # Generator provenance (seed, template, payload)
+
+    @property
+    def case_id(self) -> str:
+        """Stable id: ATTACK/name (or just name when uncategorized)."""
+        return f"{self.attack}/{self.name}" if self.attack else self.name
+
+    @property
+    def category(self) -> str:
+        """Attack category (see ATTACK_CATEGORIES)."""
+        return attack_category(self.attack)
+
+    @property
+    def url(self) -> str:
+        """file:// URL of the case, or meta['url'] for served cases (e.g. from a PackedCorpus)."""
+        if not self.path:
+            if self.meta.get('url'):
+                return self.meta['url']
+            raise ValueError(f"Test case {self.case_id} has no file on disk")
+        return Path(self.path).resolve().as_uri()
+
+    def load(self) -> str:
+        """
+        Return the HTML, reading it from `path` if needed.
+
+        Returns:
+            HTML source
+        """
+        if self.html is None:
+            self.html = Path(self.path).read_text(encoding='utf-8', errors='replace')
+        return self.html
+
+    def fingerprint(self) -> str:
+        """
+        SHA-256 of the HTML (computed once).
+
+        Returns:
+            Hex digest
+        """
+        if self.sha256 is None:
+            data = self.load().encode('utf-8')
+            self.sha256 = hashlib.sha256(data).hexdigest()
+            self.size = len(data)
+        return self.sha256
+
+    def to_dict(self, include_html: bool = False) -> Dict[str, Any]:
+        """
+        Plain dictionary (JSON-serializable).
+
+        Args:
+            include_html: Include the HTML source
+
+        Returns:
+            Dictionary with the case fields plus case_id and category
+        """
+        data = asdict(self)
+        if not include_html:
+            data.pop('html')
+        data['case_id'] = self.case_id
+        data['category'] = self.category
+        return data
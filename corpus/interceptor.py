@@ -0,0 +1,114 @@
+"""
+Packed Corpus Interception
+==========================
+Serves a PackedCorpus to a page through CDP Fetch interception: requests
+under `base_url` are paused by the browser and fulfilled straight from the
+memory-mapped pack, with no server, socket or temporary file involved.
+Record bytes are base64-encoded directly from memoryview slices of the
+mapping (Fetch.fulfillRequest takes the body as base64).
+
+Usage:
+    conn = CDPConnection.from_port(9222)
+    session_id = conn.attach(target_id)
+    with PackedCorpusInterceptor(conn, "htmls.pack", session_id=session_id) as interceptor:
+        for case in interceptor.pack.iter_cases(base_url=interceptor.base_url):
+            conn.send("Page.navigate", {'url': case.url}, session_id=session_id)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
+import base64
+
+from cdp import CDPConnection, CDPConnectionClosed, CDPError
+from logger import get_logger
+
+from .packed import PackedCorpus
+from .server import case_id_from_path
+
+log = get_logger(__name__)
+
+DEFAULT_BASE_URL = "http://corpus.invalid"
+
+
+class PackedCorpusInterceptor:
+    """
+    Fulfills requests for `base_url` from a packed corpus.
+    """
+
+    def __init__(self, conn: CDPConnection, pack: Union[str, PackedCorpus],
+                 session_id: Optional[str] = None, base_url: str = DEFAULT_BASE_URL,
+                 workers: int = 4):
+        """
+        Initialize interceptor.
+
+        Args:
+            conn: CDP connection
+            pack: PackedCorpus or path of a packed file (opened and closed by the interceptor)
+            session_id: Page session to intercept in (None = the connection's target)
+            base_url: URL prefix served from the pack
+            workers: Threads answering paused requests
+        """
+        self.conn = conn
+        self._owns_pack = not isinstance(pack, PackedCorpus)
+        self.pack = PackedCorpus(pack) if self._owns_pack else pack
+        self.session_id = session_id
+        self.base_url = base_url.rstrip("/")
+        self.served = 0
+        self.missing = 0
+        self._workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def install(self) -> "PackedCorpusInterceptor":
+        """Enable Fetch interception for base_url."""
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="corpus-fetch")
+        self.conn.on("Fetch.requestPaused", self._on_request_paused, self.session_id)
+        self.conn.send("Fetch.enable", {
+            'patterns': [{'urlPattern': f"{self.base_url}/*", 'requestStage': 'Request'}],
+        }, session_id=self.session_id)
+        log.info("[CORPUS] Intercepting %s (%s cases)", self.base_url, len(self.pack))
+        return self
+
+    def close(self):
+        """Disable interception and release the pack."""
+        self.conn.off("Fetch.requestPaused", self._on_request_paused, self.session_id)
+        try:
+            self.conn.send("Fetch.disable", session_id=self.session_id)
+        except (CDPError, CDPConnectionClosed, TimeoutError):
+            pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._owns_pack:
+            self.pack.close()
+
+    def url_for(self, case_id: str) -> str:
+        """URL of a case under base_url."""
+        return f"{self.base_url}/{case_id}.html"
+
+    def _on_request_paused(self, params: Dict[str, Any], session_id: Optional[str]):
+        # Commands cannot be sent from the reader thread (their response is read here)
+        self._executor.submit(self._fulfill, params['requestId'], params['request']['url'], session_id)
+
+    def _fulfill(self, request_id: str, url: str, session_id: Optional[str]):
+        body = self.pack.get(case_id_from_path(url))
+        if body is None:
+            self.missing += 1
+            params = {'requestId': request_id, 'responseCode': 404, 'body': ""}
+        else:
+            self.served += 1
+            params = {
+                'requestId': request_id,
+                'responseCode': 200,
+                'responseHeaders': [{'name': 'Content-Type', 'value': 'text/html; charset=utf-8'}],
+                'body': base64.b64encode(body).decode('ascii'),
+            }
+        try:
+            self.conn.send("Fetch.fulfillRequest", params, session_id=session_id)
+        except (CDPError, CDPConnectionClosed, TimeoutError) as e:
+            log.debug("[CORPUS] Could not fulfill %s: %s", url, e)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
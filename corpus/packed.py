@@ -0,0 +1,307 @@
+"""
+Packed Corpus
+=============
+One file instead of millions of small .html files: concatenated records
+(zlib-compressed when that saves space) followed by a fixed-width index
+that is memory-mapped, so any case is reached in O(1) by position and
+O(log n) by case_id without loading the index. Uncompressed records are
+returned as memoryview slices of the mapping (no copy).
+
+Layout (little-endian):
+    header   magic "HTMLPACK", version u16, reserved u16, count u32,
+             names_offset u64, index_offset u64                 (32 bytes)
+    records  record bytes, back to back
+    names    case_id strings (UTF-8), back to back
+    index    count x (offset u64, stored_size u32, size u32,
+             name_offset u64, name_size u16, codec u8, pad)    (32 bytes each)
+
+Index entries are sorted by case_id.
+
+Usage:
+    pack_directory("htmls", "htmls.pack")
+    with PackedCorpus("htmls.pack") as pack:
+        view = pack.get("XSS_DOM/innerhtml_01")  # memoryview or bytes
+        for case in pack.iter_cases():
+            print(case.case_id, len(case.html))
+    unpack("htmls.pack", "htmls_restored")
+
+    python -m corpus pack htmls htmls.pack
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+import bisect
+import mmap
+import os
+import struct
+import zlib
+
+from logger import get_logger
+
+from .case import TestCase
+from .reader import scan_cases
+
+log = get_logger(__name__)
+
+MAGIC = b"HTMLPACK"
+VERSION = 1
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+_HEADER = struct.Struct("<8sHHIQQ")
+_ENTRY = struct.Struct("<QIIQHB5x")
+
+
+class PackedCorpusError(Exception):
+    """Raised for files that are not (valid) packed corpora."""
+    pass
+
+
+def pack_cases(cases: Iterable[Tuple[str, bytes]], output_path: str, compress: bool = True,
+               level: int = 6) -> int:
+    """
+    Write a packed corpus.
+
+    Args:
+        cases: (case_id, HTML bytes) pairs, any order
+        output_path: Packed file to write
+        compress: zlib-compress records that shrink
+        level: zlib level
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If a case_id occurs twice (nothing is written)
+    """
+    entries = {}
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        for case_id, data in cases:
+            if case_id in entries:
+                f.close()
+                os.remove(tmp_path)
+                raise ValueError(f"Duplicate case_id in packed corpus: {case_id}")
+            codec, stored = CODEC_RAW, data
+            if compress:
+                packed = zlib.compress(data, level)
+                if len(packed) < len(data):
+                    codec, stored = CODEC_ZLIB, packed
+            f.write(stored)
+            entries[case_id] = (offset, len(stored), len(data), codec)
+            offset += len(stored)
+
+        names_offset = offset
+        index = []
+        for case_id in sorted(entries):
+            name = case_id.encode('utf-8')
+            record_offset, stored_size, size, codec = entries[case_id]
+            index.append(_ENTRY.pack(record_offset, stored_size, size, offset, len(name), codec))
+            f.write(name)
+            offset += len(name)
+        f.write(b"".join(index))
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(entries), names_offset, offset))
+    os.replace(tmp_path, output_path)
+    return len(entries)
+
+
+def pack_directory(root: str, output_path: str, pattern: str = "*.html", compress: bool = True,
+                   level: int = 6) -> int:
+    """
+    Pack a corpus directory (htmls/<ATTACK>/*.html layout).
+
+    case_ids are file paths relative to root without the extension
+    (htmls/XSS_DOM/sub/a.html -> "XSS_DOM/sub/a"), so files with the same
+    name in different subdirectories stay distinct and unpack() restores
+    the tree.
+
+    Args:
+        root: Corpus directory
+        output_path: Packed file to write
+        pattern: fnmatch pattern for case files
+        compress: zlib-compress records that shrink
+        level: zlib level
+
+    Returns:
+        Number of records written
+    """
+    def read():
+        for case in scan_cases(root, pattern):
+            relative = os.path.relpath(case.path, root).replace(os.sep, "/")
+            yield os.path.splitext(relative)[0], Path(case.path).read_bytes()
+
+    count = pack_cases(read(), output_path, compress=compress, level=level)
+    log.info("[CORPUS] Packed %s cases from %s into %s (%s bytes)",
+             count, root, output_path, os.path.getsize(output_path))
+    return count
+
+
+def unpack(pack_path: str, output_dir: str) -> int:
+    """
+    Write a packed corpus back out as .html files.
+
+    Args:
+        pack_path: Packed file
+        output_dir: Corpus directory to create
+
+    Returns:
+        Number of files written
+    """
+    with PackedCorpus(pack_path) as pack:
+        for i in range(len(pack)):
+            path = Path(output_dir) / f"{pack.case_id(i)}.html"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(pack.read(i))
+        return len(pack)
+
+
+class PackedCorpus:
+    """
+    Read-only, memory-mapped packed corpus.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a packed corpus.
+
+        Args:
+            path: Packed file (see pack_directory())
+
+        Raises:
+            PackedCorpusError: Not a packed corpus, or truncated
+        """
+        self.path = str(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            self._file.close()
+            raise PackedCorpusError(f"{self.path} is too small to be a packed corpus")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, _, self._count, self._names_offset, self._index_offset = \
+            _HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise PackedCorpusError(f"{self.path} is not a version {VERSION} packed corpus")
+        if self._index_offset + self._count * _ENTRY.size > size:
+            self.close()
+            raise PackedCorpusError(f"{self.path} is truncated")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int) -> Tuple[int, int, int, int, int, int]:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return _ENTRY.unpack_from(self._view, self._index_offset + i * _ENTRY.size)
+
+    def case_id(self, i: int) -> str:
+        """case_id of record `i`."""
+        _, _, _, name_offset, name_size, _ = self._entry(i)
+        return str(self._view[name_offset:name_offset + name_size], 'utf-8')
+
+    def find(self, case_id: str) -> Optional[int]:
+        """
+        Position of a case (binary search over the mapped index).
+
+        Args:
+            case_id: ATTACK/name
+
+        Returns:
+            Record position, or None
+        """
+        keys = _CaseIds(self)
+        i = bisect.bisect_left(keys, case_id)
+        return i if i < self._count and keys[i] == case_id else None
+
+    def read(self, i: int) -> Union[memoryview, bytes]:
+        """
+        Contents of record `i`.
+
+        Args:
+            i: Record position
+
+        Returns:
+            memoryview into the mapping (uncompressed records), else decompressed bytes
+        """
+        offset, stored_size, size, _, _, codec = self._entry(i)
+        view = self._view[offset:offset + stored_size]
+        if codec == CODEC_RAW:
+            return view
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(view, bufsize=max(size, 1))
+        raise PackedCorpusError(f"Record {i} of {self.path} has unknown codec {codec}")
+
+    def get(self, case_id: str) -> Optional[Union[memoryview, bytes]]:
+        """
+        Contents of a case by case_id.
+
+        Args:
+            case_id: ATTACK/name
+
+        Returns:
+            memoryview or bytes, or None if absent
+        """
+        i = self.find(case_id)
+        return None if i is None else self.read(i)
+
+    def iter_cases(self, base_url: Optional[str] = None, shard: int = 0,
+                   num_shards: int = 1) -> Iterator[TestCase]:
+        """
+        Cases in case_id order, HTML decoded.
+
+        Args:
+            base_url: Server or interception prefix; sets meta['url'] to base_url + case_id + ".html"
+            shard: Shard to yield (position modulo num_shards)
+            num_shards: Number of shards
+
+        Yields:
+            TestCase with html (and meta['url'] when base_url is given)
+        """
+        for i in range(shard, self._count, num_shards):
+            case_id = self.case_id(i)
+            attack, _, name = case_id.partition("/")  # Nested cases keep "sub/name" as name
+            if not name:
+                attack, name = None, case_id
+            meta = {'pack': self.path}
+            if base_url:
+                meta['url'] = f"{base_url.rstrip('/')}/{case_id}.html"
+            yield TestCase(attack=attack or None, name=name,
+                           html=str(self.read(i), 'utf-8', errors='replace'), meta=meta)
+
+    def close(self):
+        """Release the mapping (memoryviews handed out must be released first)."""
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            log.debug("[CORPUS] %s still has exported views; leaving it mapped", self.path)
+            return
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"PackedCorpus(path={self.path!r}, cases={self._count})"
+
+
+class _CaseIds:
+    """Sequence view of a PackedCorpus's case_ids, for bisect."""
+
+    def __init__(self, pack: PackedCorpus):
+        self._pack = pack
+
+    def __len__(self) -> int:
+        return len(self._pack)
+
+    def __getitem__(self, i: int) -> str:
+        return self._pack.case_id(i)
@@ -0,0 +1,124 @@
+"""
+Corpus Reader
+=============
+Lazy enumeration of very large HTML directories.
+
+`sorted(folder.glob(pattern))` lists and sorts a whole directory before
+the first file can be opened; with millions of files that takes longer
+than the first hundred cases. scan_files() walks directories with
+os.scandir and yields matching files as the OS returns them, so the
+first case starts after one directory read. Optionally recursive, and
+shardable: shard_of() hashes the path relative to the root, so N
+workers each given (shard, N) split a corpus without coordinating.
+
+Usage:
+    for path in scan_files("htmls", "*.html", recursive=True):
+        navigator.navigate_to_url(Path(path).resolve().as_uri())
+
+    # Worker 2 of 4
+    for case in scan_cases("htmls", shard=2, num_shards=4):
+        ...
+"""
+
+from fnmatch import fnmatch
+from typing import Iterator, Optional
+import os
+import zlib
+
+from logger import get_logger
+
+from .case import TestCase
+
+log = get_logger(__name__)
+
+
+def shard_of(relative_path: str, num_shards: int) -> int:
+    """
+    Shard of a file (stable across processes and runs, unlike hash()).
+
+    Args:
+        relative_path: Path relative to the scanned root, '/'-separated
+        num_shards: Number of shards
+
+    Returns:
+        Shard index in [0, num_shards)
+    """
+    return zlib.crc32(relative_path.encode('utf-8', 'surrogateescape')) % num_shards
+
+
+def scan_files(root, pattern: str = "*.html", recursive: bool = False,
+               shard: int = 0, num_shards: int = 1, ordered: bool = False) -> Iterator[str]:
+    """
+    Files under `root` matching `pattern`, yielded as they are listed.
+
+    Hidden files and directories are skipped (as with glob). A "**/"
+    prefix on the pattern implies recursive.
+
+    Args:
+        root: Directory to scan
+        pattern: fnmatch pattern for file names
+        recursive: Descend into subdirectories
+        shard: Shard to yield (see shard_of())
+        num_shards: Number of shards (1 = everything)
+        ordered: Sort each directory's entries (reads a whole directory before yielding from it)
+
+    Yields:
+        File paths (str)
+    """
+    if pattern.startswith("**/"):
+        pattern, recursive = pattern[3:], True
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"shard must be in [0, {num_shards}), got {shard}")
+
+    pending = [(os.fspath(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda e: e.name) if ordered else iterator
+                subdirectories = []
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            if recursive:
+                                subdirectories.append((entry.path, prefix + entry.name + "/"))
+                            continue
+                        if not entry.is_file() or not fnmatch(entry.name, pattern):
+                            continue
+                    except OSError:
+                        continue  # Vanished or unreadable
+                    if num_shards > 1 and shard_of(prefix + entry.name, num_shards) != shard:
+                        continue
+                    yield entry.path
+        except OSError as e:
+            log.warning("[CORPUS] Cannot list %s: %s", directory, e)
+            continue
+        pending.extend(reversed(subdirectories))  # Depth-first, in listing order
+
+
+def scan_cases(root, pattern: str = "*.html", shard: int = 0, num_shards: int = 1,
+               attack: Optional[str] = None) -> Iterator[TestCase]:
+    """
+    Test cases of a corpus directory, streamed (see scan_files()).
+
+    Files directly under `root` get `attack`; files in subdirectories get
+    their top-level directory name as attack (the htmls/<ATTACK>/ layout).
+
+    Args:
+        root: Corpus directory
+        pattern: fnmatch pattern for file names
+        shard: Shard to yield
+        num_shards: Number of shards
+        attack: Attack of files directly under root
+
+    Yields:
+        TestCase with attack, name and path set
+    """
+    root = os.fspath(root)
+    for path in scan_files(root, pattern, recursive=True, shard=shard, num_shards=num_shards):
+        relative = os.path.relpath(path, root).replace(os.sep, "/")
+        top, _, rest = relative.partition("/")
+        name = os.path.splitext(os.path.basename(path))[0]
+        yield TestCase(attack=top if rest else attack, name=name, path=path)
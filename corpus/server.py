@@ -0,0 +1,112 @@
+"""
+Packed Corpus Server
+====================
+Serves a PackedCorpus over HTTP on 127.0.0.1: GET /<ATTACK>/<name>.html
+returns the case. Uncompressed records go from the memory mapping to the
+socket as memoryview slices, without copying.
+
+Usage:
+    with PackedCorpusServer("htmls.pack") as server:
+        for case in server.pack.iter_cases(base_url=server.base_url):
+            navigator.navigate_to_url(case.url)
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Union
+from urllib.parse import unquote, urlsplit
+import threading
+
+from logger import get_logger
+
+from .packed import PackedCorpus
+
+log = get_logger(__name__)
+
+
+def case_id_from_path(path: str) -> str:
+    """
+    case_id addressed by a URL path ("/XSS_DOM/a.html" -> "XSS_DOM/a").
+
+    Args:
+        path: URL or URL path
+
+    Returns:
+        case_id
+    """
+    path = unquote(urlsplit(path).path).lstrip("/")
+    return path[:-5] if path.endswith(".html") else path
+
+
+class _PackedCorpusHandler(BaseHTTPRequestHandler):
+    """GET handler reading from server.pack."""
+
+    def do_GET(self):
+        body = self.server.pack.get(case_id_from_path(self.path))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)  # Unbuffered socket writer: memoryview goes to sendall() as is
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PackedCorpusServer:
+    """
+    Threaded HTTP server for a packed corpus.
+
+    Binds to an ephemeral port by default; the chosen port is available
+    as `port` once started.
+    """
+
+    def __init__(self, pack: Union[str, PackedCorpus], host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize server.
+
+        Args:
+            pack: PackedCorpus or path of a packed file (opened and closed by the server)
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+        """
+        self._owns_pack = not isinstance(pack, PackedCorpus)
+        self.pack = PackedCorpus(pack) if self._owns_pack else pack
+        self.host = host
+        self.port = port
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PackedCorpusServer":
+        """Start serving in a background thread."""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _PackedCorpusHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.pack = self.pack
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        log.info("[CORPUS] Serving %s cases at %s", len(self.pack), self.base_url)
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._owns_pack:
+            self.pack.close()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server (e.g., http://127.0.0.1:54321)."""
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,129 @@
+"""
+Corpus Store
+============
+Reads and writes the htmls/ corpus (one directory per attack name).
+
+Usage:
+    corpus = Corpus("htmls", attacks=browser.get_attack_names())
+    for case in corpus.iter_cases():
+        print(case.case_id, case.url)
+    corpus.add("XSS_DOM", "<img src=x onerror=alert(1)>")
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+import hashlib
+
+from logger import get_logger
+
+from .case import TestCase, canary_meta, html_canaries
+from .reader import scan_files
+
+log = get_logger(__name__)
+
+
+class Corpus:
+    """
+    HTML test cases on disk, grouped by attack name.
+    """
+
+    def __init__(self, root: str = "htmls", attacks: Optional[Iterable[str]] = None,
+                 pattern: str = "*.html"):
+        """
+        Initialize corpus.
+
+        Args:
+            root: Corpus directory
+            attacks: Attack names to include (None = every attack directory);
+                usually BaseBrowser.get_attack_names()
+            pattern: Glob pattern for case files
+        """
+        self.root = Path(root)
+        self.attacks: Optional[List[str]] = list(attacks) if attacks is not None else None
+        self.pattern = pattern
+
+    def attack_dirs(self) -> List[Path]:
+        """
+        Attack directories present in the corpus.
+
+        Returns:
+            Directories, filtered by `attacks` when set, sorted by name
+        """
+        if not self.root.is_dir():
+            return []
+        dirs = sorted(p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith('.'))
+        if self.attacks is None:
+            return dirs
+        wanted = set(self.attacks)
+        for path in dirs:
+            if path.name not in wanted:
+                log.debug("[CORPUS] Skipping %s (not an attack of this browser)", path.name)
+        return [p for p in dirs if p.name in wanted]
+
+    def iter_cases(self, include_uncategorized: bool = True) -> Iterator[TestCase]:
+        """
+        Iterate over the test cases lazily (HTML is not read here).
+
+        Directories are listed with scan_files(ordered=True): cases come in
+        the same name order as before, without a glob() + sort per directory.
+
+        Args:
+            include_uncategorized: Also yield files directly under the root
+
+        Yields:
+            TestCase with attack, name and path set
+        """
+        if include_uncategorized and self.root.is_dir():
+            for path in scan_files(self.root, self.pattern, ordered=True):
+                yield TestCase(attack=None, name=Path(path).stem, path=path)
+
+        for directory in self.attack_dirs():
+            for path in scan_files(directory, self.pattern, ordered=True):
+                yield TestCase(attack=directory.name, name=Path(path).stem, path=path)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Number of cases per attack ('' for uncategorized).
+
+        Returns:
+            Dictionary mapping attack name to case count
+        """
+        counts: Dict[str, int] = {}
+        for case in self.iter_cases():
+            key = case.attack or ''
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def add(self, attack: Optional[str], html: str, name: Optional[str] = None,
+            meta: Optional[Dict] = None) -> TestCase:
+        """
+        Write a new case into the corpus.
+
+        Args:
+            attack: Attack name (directory); None writes to the root
+            html: HTML source
+            name: File stem (defaults to the first 16 hex digits of the SHA-256)
+            meta: Provenance kept on the returned TestCase (only meta['canary'] is
+                written, as a canary_meta() tag, when the HTML does not record it yet)
+
+        Returns:
+            The written TestCase
+        """
+        canary = (meta or {}).get('canary')
+        if canary and canary not in html_canaries(html):
+            html = canary_meta(canary) + html
+        data = html.encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+        name = name or sha256[:16]
+        directory = self.root / attack if attack else self.root
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}.html"
+        path.write_bytes(data)
+        return TestCase(attack=attack, name=name, path=str(path), html=html,
+                        sha256=sha256, size=len(data), meta=dict(meta or {}))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.iter_cases())
+
+    def __repr__(self):
+        return f"Corpus(root={str(self.root)!r}, attacks={len(self.attacks) if self.attacks else 'all'})"
@@ -0,0 +1,39 @@
+"""
+Daemon Module
+=============
+Long-running automation daemon: keeps browsers warm and accepts jobs over
+a local JSON API, so launch cost is paid once per daemon instead of once
+per query.
+
+Components:
+- BrowserPool: Launched BaseBrowser instances, one worker thread each,
+  fed from a job queue
+- DaemonServer: JSON API over TCP (127.0.0.1) or a Unix socket
+- Job: One pipeline run with status, timestamps and result
+
+Usage:
+    python -m daemon --port 8765
+
+    # From Python
+    from daemon import BrowserPool, PoolConfig, Job
+
+    pool = BrowserPool(PoolConfig())
+    pool.start()
+    job = pool.submit(Job.from_request({"query": "What is Python?"}))
+    job.done.wait()
+    pool.stop()
+"""
+
+from .jobs import Job, JobStatus, result_to_dict
+from .pool import BrowserPool, PoolConfig
+from .server import DaemonServer, run_daemon
+
+__all__ = [
+    'Job',
+    'JobStatus',
+    'result_to_dict',
+    'BrowserPool',
+    'PoolConfig',
+    'DaemonServer',
+    'run_daemon',
+]
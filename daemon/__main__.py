@@ -0,0 +1,83 @@
+"""
+Daemon Entry Point
+==================
+Usage:
+    python -m daemon --port 8765
+    python -m daemon --unix-socket /tmp/fuzzer.sock --log-level DEBUG
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from browser import BrowserType
+from logger import configure_logging
+from browser.supervisor import RecyclePolicy
+from daemon.pool import PoolConfig, SIDECAR_URL
+from daemon.server import run_daemon
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Browser automation daemon with a local job API")
+    parser.add_argument("--browser", default=BrowserType.COMET.value,
+                        choices=[bt.value for bt in BrowserType], help="Browser type")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--unix-socket", default=None, help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--size", type=int, default=1, help="Number of warm browsers")
+    parser.add_argument("--target-url", default=SIDECAR_URL, help="Default target URL")
+    parser.add_argument("--reload-page", action="store_true",
+                        help="Reload the target page for every job")
+    parser.add_argument("--reuse-browser", action="store_true",
+                        help="Attach to an already running browser instead of relaunching")
+    parser.add_argument("--recycle-after-jobs", type=int, default=None,
+                        help="Restart a browser after this many jobs")
+    parser.add_argument("--max-js-heap-mb", type=float, default=None,
+                        help="Restart a browser when its JS heap exceeds this")
+    parser.add_argument("--max-rss-mb", type=float, default=None,
+                        help="Restart a browser when its process tree RSS exceeds this")
+    parser.add_argument("--watchdog", action="store_true",
+                        help="Detect renderer crashes/hangs, fail the job fast and respawn")
+    parser.add_argument("--command-timeout", type=float, default=30.0,
+                        help="Per-command WebDriver deadline in seconds (with --watchdog)")
+    parser.add_argument("--instrument", action="store_true", help="Record WebDriver command stats")
+    parser.add_argument("--response-cache", default=None,
+                        help="SQLite file answering repeated queries on the same page without the browser")
+    parser.add_argument("--response-cache-ttl", type=float, default=24 * 3600.0,
+                        help="Seconds a cached answer stays valid")
+    parser.add_argument("--log-level", default=None,
+                        help="DEBUG, INFO, WARNING or ERROR (default: $FUZZER_LOG_LEVEL or INFO)")
+    parser.add_argument("--log-format", default=None, choices=["console", "json"],
+                        help="Default: $FUZZER_LOG_FORMAT or console")
+    args = parser.parse_args(argv)
+
+    configure_logging(level=args.log_level, fmt=args.log_format)
+
+    recycle_policy = None
+    if args.recycle_after_jobs or args.max_js_heap_mb or args.max_rss_mb:
+        recycle_policy = RecyclePolicy(
+            max_jobs=args.recycle_after_jobs,
+            max_js_heap_mb=args.max_js_heap_mb,
+            max_rss_mb=args.max_rss_mb
+        )
+
+    pool_config = PoolConfig(
+        browser_type=BrowserType(args.browser),
+        size=args.size,
+        target_url=args.target_url,
+        reuse_page=not args.reload_page,
+        instrument_driver=args.instrument,
+        reuse_existing=args.reuse_browser,
+        recycle_policy=recycle_policy,
+        watchdog=args.watchdog,
+        command_timeout=args.command_timeout,
+        response_cache=args.response_cache,
+        response_cache_ttl=args.response_cache_ttl
+    )
+    return run_daemon(pool_config, host=args.host, port=args.port, unix_socket=args.unix_socket)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
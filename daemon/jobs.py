@@ -0,0 +1,173 @@
+"""
+Daemon Jobs
+===========
+Job records tracked by the automation daemon.
+
+A Job is one pipeline run (a single query or a conversation) submitted
+through the local API. It moves QUEUED -> RUNNING -> SUCCEEDED/FAILED and
+carries a JSON-serializable copy of the PipelineResult once finished.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+import threading
+import time
+import uuid
+
+
+class JobStatus(Enum):
+    """Lifecycle states of a daemon job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+# Pipeline kwargs a client may set per job (everything else is rejected).
+# File paths (save_text) and the target URL are deliberately not settable
+# over the API: any local process, or a page loaded by the fuzzer, can POST.
+JOB_FIELDS = (
+    'query',
+    'submit',
+    'conversation',
+    'read_responses',
+    'use_conversion',
+)
+
+# JSON type each job field must have (checked here, not later in a worker)
+_FIELD_TYPES = {
+    'query': (str, "a string"),
+    'submit': (bool, "a boolean"),
+    'conversation': (list, "a list of strings"),
+    'read_responses': (bool, "a boolean"),
+    'use_conversion': (bool, "a boolean"),
+}
+
+
+@dataclass
+class Job:
+    """A single pipeline run requested through the daemon API."""
+    pipeline_kwargs: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    worker: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @classmethod
+    def from_request(cls, payload: Dict[str, Any]) -> "Job":
+        """
+        Build a job from an API request body.
+
+        Args:
+            payload: Decoded JSON object (e.g., {"query": "...", "submit": true})
+
+        Returns:
+            New queued Job
+
+        Raises:
+            ValueError: If the payload is malformed
+        """
+        if not isinstance(payload, dict):
+            raise ValueError("Job must be a JSON object")
+
+        if 'target_url' in payload:
+            raise ValueError("target_url is set per pool (--target-url), not per job")
+        unknown = set(payload) - set(JOB_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        for key, (expected, description) in _FIELD_TYPES.items():
+            value = payload.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, expected) or (
+                    key == 'conversation' and not all(isinstance(item, str) for item in value)):
+                raise ValueError(f"'{key}' must be {description}")
+        if not payload.get('query') and not payload.get('conversation'):
+            raise ValueError("Job needs a 'query' or a 'conversation'")
+
+        kwargs = {
+            'submit': True,
+            'read_responses': True,
+            'use_conversion': True,
+        }
+        kwargs.update({key: payload[key] for key in JOB_FIELDS if key in payload})
+        return cls(pipeline_kwargs=kwargs)
+
+    @property
+    def finished(self) -> bool:
+        """True once the job succeeded or failed."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable view of the job.
+
+        Returns:
+            Dictionary with id, status, timestamps, request and result
+        """
+        return {
+            'id': self.id,
+            'status': self.status.value,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'worker': self.worker,
+            'request': self.pipeline_kwargs,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+def result_to_dict(result) -> Dict[str, Any]:
+    """
+    Convert a PipelineResult to a JSON-serializable dictionary.
+
+    The driver is dropped; metadata values that are not plain JSON types
+    are converted with str().
+
+    Args:
+        result: PipelineResult instance
+
+    Returns:
+        Dictionary with success, message, steps, metadata and timings (ms)
+    """
+    return {
+        'success': result.success,
+        'message': result.message,
+        'steps_completed': list(result.steps_completed),
+        'metadata': _jsonable(result.metadata),
+        'timings_ms': {step: ns / 1_000_000 for step, ns in result.timings.items()},
+    }
+
+
+def _jsonable(value: Any) -> Any:
+    """Recursively convert a value to plain JSON types."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return str(value)
+
+
+def summarize(jobs: List[Job]) -> Dict[str, int]:
+    """
+    Count jobs per status.
+
+    Args:
+        jobs: Jobs to count
+
+    Returns:
+        Dictionary of status value -> count
+    """
+    counts = {status.value: 0 for status in JobStatus}
+    for job in jobs:
+        counts[job.status.value] += 1
+    return counts
@@ -0,0 +1,344 @@
+"""
+Browser Pool
+============
+Keeps BaseBrowser instances launched and runs queued jobs on them.
+
+Each browser is owned by exactly one worker thread (WebDriver sessions are
+not thread-safe), so the number of concurrent jobs equals the pool size.
+Launch cost (process kill, profile wipe, ChromeDriver resolution, DevTools
+wait) is paid once per browser when the pool starts; a browser whose
+driver stops responding is replaced before its worker takes the next job.
+With a RecyclePolicy, each browser is wrapped in a BrowserSupervisor that
+restarts it between jobs after N jobs or above a memory threshold.
+
+Note: Comet always listens on the same debugging port with a single
+profile, so a Comet pool should have size 1.
+
+Usage:
+    pool = BrowserPool(PoolConfig(browser_type=BrowserType.COMET))
+    pool.start()
+    job = pool.submit(Job.from_request({"query": "What is Python?"}))
+    job.done.wait()
+    print(job.to_dict())
+    pool.stop()
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import queue
+import threading
+import time
+
+from browser import BaseBrowser, BrowserFactory, BrowserType
+from browser.supervisor import BrowserSupervisor, RecyclePolicy
+from conversion.cache import ResponseCache
+from pipeline import PipelineConfig
+from logger import get_logger, job_context
+from .jobs import Job, JobStatus, result_to_dict, summarize
+
+log = get_logger(__name__)
+
+SIDECAR_URL = "https://www.perplexity.ai/sidecar?copilot=true"
+
+JobCallback = Callable[[Job], None]
+
+
+@dataclass
+class PoolConfig:
+    """Configuration for the browser pool."""
+    browser_type: BrowserType = BrowserType.COMET
+    size: int = 1  # Number of browsers (and worker threads)
+    target_url: str = SIDECAR_URL
+    load_wait_time: int = 5
+    reuse_page: bool = True  # Skip Sidecar reload when the tab is already on it
+    instrument_driver: bool = False
+    reuse_existing: bool = False  # Attach to an already running browser on startup
+    recycle_policy: Optional[RecyclePolicy] = None  # None = never recycle
+    watchdog: bool = False  # Fail jobs fast on crashes/hangs and respawn the browser
+    command_timeout: float = 30.0  # Per-command WebDriver deadline (with watchdog)
+    max_finished_jobs: int = 1000  # Finished jobs kept for GET /jobs/<id>
+    response_cache: Optional[str] = None  # SQLite file answering repeated queries (shared by all browsers)
+    response_cache_ttl: float = 24 * 3600.0
+
+
+class BrowserPool:
+    """
+    Pool of warm browsers fed from a job queue.
+    """
+
+    def __init__(self, config: Optional[PoolConfig] = None):
+        """
+        Initialize pool (browsers are launched by start()).
+
+        Args:
+            config: Pool configuration
+        """
+        self.config = config or PoolConfig()
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._callbacks: Dict[str, List[JobCallback]] = {}
+        self._lock = threading.Lock()
+        self._browsers: List[Optional[BaseBrowser]] = []
+        self._supervisors: Dict[int, BrowserSupervisor] = {}
+        self._workers: List[threading.Thread] = []
+        self._started_at: Optional[float] = None
+        self._launches = 0
+        self.response_cache: Optional[ResponseCache] = None
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> bool:
+        """
+        Launch all browsers and start the worker threads.
+
+        Browsers are launched one after another so launchers that kill
+        existing processes do not race each other.
+
+        Returns:
+            True if at least one browser launched
+        """
+        if self._workers:
+            return True
+
+        if self.config.response_cache and self.response_cache is None:
+            self.response_cache = ResponseCache(self.config.response_cache,
+                                                ttl_s=self.config.response_cache_ttl)
+        for index in range(self.config.size):
+            self._browsers.append(self._launch_browser(index))
+            self._supervise(index)
+
+        if not any(self._browsers):
+            log.error("[POOL] ✗ No browser could be launched")
+            return False
+
+        for index in range(self.config.size):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(index,),
+                name=f"pool-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        self._started_at = time.time()
+        log.info("[POOL] ✓ %s browser(s) ready", sum(1 for b in self._browsers if b))
+        return True
+
+    def stop(self, timeout: Optional[float] = 30.0):
+        """
+        Stop the workers after their current job and close all browsers.
+
+        Jobs still queued are marked failed.
+
+        Args:
+            timeout: Seconds to wait for each worker to finish
+        """
+        self._drain_queue("Daemon shutting down")
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers.clear()
+
+        for browser in self._browsers:
+            if browser:
+                browser.quit()
+        self._browsers.clear()
+        if self.response_cache is not None:
+            log.info("[POOL] Response cache: %s", self.response_cache.stats())
+            self.response_cache.close()
+            self.response_cache = None
+        log.info("[POOL] Stopped")
+
+    # ==================== Jobs ====================
+
+    def submit(self, job: Job, on_done: Optional[JobCallback] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            job: Job to run
+            on_done: Called (on the worker thread) when the job finishes
+
+        Returns:
+            The queued job
+        """
+        with self._lock:
+            self._jobs[job.id] = job
+            if on_done:
+                self._callbacks[job.id] = [on_done]
+            self._evict_finished()
+        self._queue.put(job)
+        log.debug("[POOL] Queued job %s", job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by id.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job or None if unknown (or already evicted)
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """Get all tracked jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def stats(self) -> dict:
+        """
+        Pool health and counters.
+
+        Returns:
+            Dictionary with browsers, queue depth, job counts and uptime
+        """
+        with self._lock:
+            counts = summarize(list(self._jobs.values()))
+        supervisors = [self._supervisors[i].stats() for i in sorted(self._supervisors)]
+        return {
+            'browser': self.config.browser_type.value,
+            'browsers': len(self._browsers),
+            'browsers_ready': sum(1 for b in self._browsers if b),
+            'launches': self._launches,
+            'restarts': sum(s['restarts'] for s in supervisors),
+            'supervisors': supervisors,
+            'queue_depth': self._queue.qsize(),
+            'jobs': counts,
+            'uptime_s': time.time() - self._started_at if self._started_at else 0.0,
+        }
+
+    # ==================== Workers ====================
+
+    def _worker_loop(self, index: int):
+        """Run jobs from the queue on browser `index` until stopped."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+
+            browser = self._browsers[index]
+            if browser is None or not self._is_alive(browser):
+                browser = self._replace_browser(index)
+            if browser is None:
+                self._finish(job, error="Browser unavailable")
+                continue
+
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+            job.worker = f"{self.config.browser_type.value}-{index}"
+            with job_context(job_id=job.id, worker=job.worker):
+                self._run_job(self._supervisors.get(index) or browser, job)
+
+    def _run_job(self, runner, job: Job):
+        """Run one job on a launched browser (or its supervisor)."""
+        config = PipelineConfig(
+            target_url=self.config.target_url,
+            load_wait_time=self.config.load_wait_time,
+            keep_open=False,  # The pool owns the browser lifetime
+            activate_features=False
+        )
+        kwargs = dict(job.pipeline_kwargs)
+        kwargs.setdefault('reuse_page', self.config.reuse_page)
+        if self.response_cache is not None:
+            kwargs['response_cache'] = self.response_cache
+
+        try:
+            result = runner.run_pipeline(config, **kwargs)
+        except Exception as e:
+            log.error("[POOL] Job %s crashed: %s", job.id, e, exc_info=True)
+            self._finish(job, error=str(e))
+            return
+
+        self._finish(job, result=result_to_dict(result),
+                     error=None if result.success else result.message)
+
+    def _finish(self, job: Job, result: Optional[dict] = None, error: Optional[str] = None):
+        """Mark a job finished, wake waiters and run callbacks."""
+        job.result = result
+        job.error = error
+        job.status = JobStatus.FAILED if error else JobStatus.SUCCEEDED
+        job.finished_at = time.time()
+        job.done.set()
+        log.info("[POOL] Job %s %s", job.id, job.status.value)
+
+        with self._lock:
+            callbacks = self._callbacks.pop(job.id, [])
+        for callback in callbacks:
+            try:
+                callback(job)
+            except Exception as e:
+                log.warning("[POOL] Job callback failed: %s", e)
+
+    def _drain_queue(self, reason: str):
+        """Fail every job still waiting in the queue."""
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None:
+                self._finish(job, error=reason)
+
+    def _evict_finished(self):
+        """Drop the oldest finished jobs beyond max_finished_jobs (lock held)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.config.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    # ==================== Browsers ====================
+
+    def _launch_browser(self, index: int) -> Optional[BaseBrowser]:
+        """Create and launch browser `index`."""
+        browser = BrowserFactory.create(self.config.browser_type)
+        browser.instrument_driver = self.config.instrument_driver
+        browser.reuse_existing = self.config.reuse_existing
+        browser.enable_watchdog = self.config.watchdog
+        browser.command_timeout = self.config.command_timeout
+        log.info("[POOL] Launching browser %s...", index)
+        self._launches += 1
+        if not browser.launch():
+            log.error("[POOL] ✗ Browser %s failed to launch", index)
+            return None
+        return browser
+
+    def _replace_browser(self, index: int) -> Optional[BaseBrowser]:
+        """Close browser `index` (if any) and launch a new one."""
+        old = self._browsers[index]
+        if old:
+            log.warning("[POOL] Browser %s is not responding - relaunching", index)
+            try:
+                old.quit()
+            except Exception:
+                pass
+        self._browsers[index] = self._launch_browser(index)
+        self._supervise(index)
+        return self._browsers[index]
+
+    def _supervise(self, index: int):
+        """Wrap browser `index` in a supervisor if a recycle policy is set."""
+        browser = self._browsers[index]
+        if self.config.recycle_policy is None or browser is None:
+            self._supervisors.pop(index, None)
+            return
+        restarts = self._supervisors[index].restarts if index in self._supervisors else 0
+        self._supervisors[index] = BrowserSupervisor(browser, self.config.recycle_policy)
+        self._supervisors[index].restarts = restarts
+
+    @staticmethod
+    def _is_alive(browser: BaseBrowser) -> bool:
+        """Cheap liveness probe: one WebDriver round trip."""
+        driver = browser.get_driver()
+        if driver is None:
+            return False
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,275 @@
+"""
+Daemon Job API
+==============
+Local JSON API in front of a BrowserPool, served over TCP (127.0.0.1) or
+a Unix socket.
+
+Endpoints:
+    GET  /health                 Pool status, queue depth and job counts
+    GET  /jobs                   All tracked jobs
+    GET  /jobs/<id>[?wait=S]     One job (optionally wait up to S seconds)
+    POST /jobs[?wait=S]          Submit {"query": ...} or {"conversation": [...]}
+                                 -> 202 with the queued job, or the finished
+                                 job if it completes within S seconds
+    POST /jobs?stream=1          Submit {"jobs": [...]} and receive one JSON
+                                 line per job as each one completes
+
+Usage:
+    python -m daemon --port 8765
+    curl -s -X POST 'http://127.0.0.1:8765/jobs?wait=120' \\
+         -H 'Content-Type: application/json' -d '{"query": "What is Python?"}'
+
+POST bodies must be sent as Content-Type: application/json. Browsers only
+send that cross-origin after a CORS preflight, which this API never
+answers, so pages loaded by the fuzzer cannot submit jobs with plain
+form or text POSTs.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import json
+import os
+import queue
+import signal
+import socketserver
+import threading
+
+from logger import get_logger
+from .jobs import Job
+from .pool import BrowserPool, PoolConfig
+
+log = get_logger(__name__)
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix domain socket, one thread per connection."""
+    daemon_threads = True
+
+
+class _JobRequestHandler(BaseHTTPRequestHandler):
+    """Routes API requests to the pool attached to the server."""
+
+    server_version = "FuzzerDaemon/1.0"
+
+    @property
+    def pool(self) -> BrowserPool:
+        return self.server.pool
+
+    # ==================== Routing ====================
+
+    def do_GET(self):
+        path, params = self._parse_path()
+
+        if path == "/health":
+            self._send_json(200, self.pool.stats())
+        elif path == "/jobs":
+            self._send_json(200, {'jobs': [job.to_dict() for job in self.pool.list_jobs()]})
+        elif path.startswith("/jobs/"):
+            job = self.pool.get(path[len("/jobs/"):])
+            if job is None:
+                self._send_json(404, {'error': "Unknown job"})
+                return
+            self._wait_for(job, params)
+            self._send_json(200, job.to_dict())
+        else:
+            self._send_json(404, {'error': f"No route for GET {path}"})
+
+    def do_POST(self):
+        path, params = self._parse_path()
+        if path != "/jobs":
+            self._send_json(404, {'error': f"No route for POST {path}"})
+            return
+
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            self._send_json(415, {'error': "Content-Type must be application/json"})
+            return
+
+        try:
+            payload = self._read_json()
+            if 'jobs' in payload:
+                if not isinstance(payload['jobs'], list):
+                    raise ValueError("'jobs' must be a list of job objects")
+                jobs = [Job.from_request(item) for item in payload['jobs']]
+            else:
+                jobs = [Job.from_request(payload)]
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        if params.get('stream'):
+            self._stream_results(jobs)
+            return
+
+        for job in jobs:
+            self.pool.submit(job)
+        for job in jobs:
+            self._wait_for(job, params)
+
+        body = [job.to_dict() for job in jobs]
+        status = 200 if all(job.finished for job in jobs) else 202
+        self._send_json(status, body if 'jobs' in payload else body[0])
+
+    # ==================== Helpers ====================
+
+    def _stream_results(self, jobs):
+        """Submit jobs and write one JSON line per job as it completes."""
+        completed: "queue.Queue[Job]" = queue.Queue()
+        for job in jobs:
+            self.pool.submit(job, on_done=completed.put)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for _ in jobs:
+            job = completed.get()
+            try:
+                self.wfile.write(json.dumps(job.to_dict()).encode('utf-8') + b"\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                log.debug("[API] Client disconnected while streaming")
+                return
+
+    def _wait_for(self, job: Job, params: dict):
+        """Block up to ?wait=S seconds for the job to finish."""
+        wait = params.get('wait')
+        if wait:
+            try:
+                job.done.wait(float(wait))
+            except ValueError:
+                pass
+
+    def _parse_path(self) -> Tuple[str, dict]:
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        return parsed.path.rstrip("/") or "/", params
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            raise ValueError("Request body missing or too large")
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        return payload
+
+    def _send_json(self, status: int, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        log.debug("[API] %s - %s", self.address_string(), format % args)
+
+
+class DaemonServer:
+    """
+    Serves the job API for a BrowserPool.
+    """
+
+    def __init__(self, pool: BrowserPool, host: str = "127.0.0.1", port: int = 8765,
+                 unix_socket: Optional[str] = None):
+        """
+        Initialize server.
+
+        Args:
+            pool: Started BrowserPool that runs the jobs
+            host: Interface to bind (TCP mode)
+            port: Port to bind (TCP mode, 0 = pick a free port)
+            unix_socket: Serve on this Unix socket path instead of TCP
+        """
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self._httpd = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "DaemonServer":
+        """Start serving in a background thread."""
+        if self.unix_socket:
+            socket_path = Path(self.unix_socket)
+            if socket_path.exists():
+                socket_path.unlink()
+            self._httpd = _ThreadingUnixHTTPServer(str(socket_path), _JobRequestHandler)
+            os.chmod(socket_path, 0o600)
+        else:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _JobRequestHandler)
+            self.port = self._httpd.server_address[1]
+        self._httpd.pool = self.pool
+
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        log.info("[DAEMON] Job API listening on %s", self.address)
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            if self.unix_socket and Path(self.unix_socket).exists():
+                Path(self.unix_socket).unlink()
+
+    @property
+    def address(self) -> str:
+        """Human-readable listening address."""
+        if self.unix_socket:
+            return f"unix:{self.unix_socket}"
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def run_daemon(pool_config: Optional[PoolConfig] = None, host: str = "127.0.0.1",
+               port: int = 8765, unix_socket: Optional[str] = None) -> int:
+    """
+    Launch the browser pool and serve the job API until interrupted.
+
+    Args:
+        pool_config: Pool configuration
+        host: Interface to bind (TCP mode)
+        port: Port to bind (TCP mode)
+        unix_socket: Serve on this Unix socket path instead of TCP
+
+    Returns:
+        Process exit code
+    """
+    pool = BrowserPool(pool_config)
+    if not pool.start():
+        return 1
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    server = DaemonServer(pool, host=host, port=port, unix_socket=unix_socket)
+    try:
+        server.start()
+        log.info("[DAEMON] Ready - press Ctrl+C to stop")
+        while not stop_event.is_set():
+            stop_event.wait(1.0)
+    except KeyboardInterrupt:
+        log.info("\n[DAEMON] Interrupted")
+    finally:
+        server.stop()
+        pool.stop()
+    return 0
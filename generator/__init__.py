@@ -0,0 +1,35 @@
+"""
+Generator Module
+================
+HTML test-case generation for every attack name of
+CometBrowser.get_attack_names(): compiled templates (injection contexts)
+times payload libraries, rendered lazily and deterministically per seed,
+plus a grammar-aware mutator working on token arrays.
+
+Usage:
+    python -m generator --out htmls --per-attack 100 --seed 1
+
+    # From Python
+    from generator import CaseGenerator
+
+    generator = CaseGenerator(attacks=browser.get_attack_names(), seed=1)
+    summary = CampaignRunner(browser).run(generator.stream(per_attack=50))
+
+    mutants = HTMLMutator(seed=1).stream(Corpus("htmls").iter_cases(), per_case=100)
+    summary = CampaignRunner(browser).run(mutants)
+"""
+
+from .engine import ALL_ATTACKS, CaseGenerator
+from .mutator import HTMLMutator, TokenDoc, tokenize
+from .payloads import PAYLOADS
+from .templates import CompiledTemplate
+
+__all__ = [
+    'ALL_ATTACKS',
+    'CaseGenerator',
+    'CompiledTemplate',
+    'HTMLMutator',
+    'PAYLOADS',
+    'TokenDoc',
+    'tokenize',
+]
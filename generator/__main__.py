@@ -0,0 +1,47 @@
+"""
+Generator Entry Point
+=====================
+Usage:
+    python -m generator --out htmls --per-attack 100 --seed 1
+    python -m generator --attacks XSS_DOM,MUTATION_XSS --total 50000 --out /data/corpus
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from logger import configure_logging
+from corpus import Corpus
+from generator.engine import CaseGenerator
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate an HTML test-case corpus")
+    parser.add_argument("--out", default="htmls", help="Corpus directory")
+    parser.add_argument("--attacks", default=None, help="Comma-separated attack names (default: all)")
+    parser.add_argument("--per-attack", type=int, default=None, help="Cases per attack")
+    parser.add_argument("--total", type=int, default=None, help="Cases overall")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--start", type=int, default=0, help="First case index (resume)")
+    parser.add_argument("--log-level", default=None,
+                        help="DEBUG, INFO, WARNING or ERROR (default: $FUZZER_LOG_LEVEL or INFO)")
+    args = parser.parse_args(argv)
+
+    configure_logging(level=args.log_level)
+    if args.per_attack is None and args.total is None:
+        parser.error("one of --per-attack or --total is required")
+
+    generator = CaseGenerator(attacks=args.attacks.split(",") if args.attacks else None, seed=args.seed)
+    start = time.perf_counter()
+    written = generator.write(Corpus(args.out), per_attack=args.per_attack,
+                              total=args.total, start=args.start)
+    elapsed = time.perf_counter() - start
+    print(f"{written} cases in {elapsed:.2f}s ({written / max(elapsed, 1e-9):.0f} cases/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
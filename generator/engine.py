@@ -0,0 +1,182 @@
+"""
+Case Generator
+==============
+Lazily renders HTML test cases per attack name from compiled templates and
+payload libraries.
+
+Every case is a pure function of (seed, attack, index): the same seed
+always yields the same corpus, any case can be re-rendered on its own
+(case()), and a stream can resume at any index. Nothing is buffered, so
+corpora larger than memory are written straight to disk.
+
+Usage:
+    generator = CaseGenerator(seed=1)
+    for case in generator.stream(per_attack=1000):
+        ...
+    generator.write(Corpus("htmls"), per_attack=100)
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import itertools
+import random
+
+from corpus import ATTACK_CATEGORIES, Corpus, TestCase, attack_category
+from logger import get_logger
+
+from .payloads import PAYLOADS
+from .templates import ATTACK_TEMPLATES, CATEGORY_TEMPLATES, PRELUDE, CompiledTemplate
+
+log = get_logger(__name__)
+
+ALL_ATTACKS: List[str] = [attack for attacks in ATTACK_CATEGORIES.values() for attack in attacks]
+
+_FILLER_WORDS = (
+    "lorem", "ipsum", "dolor", "sit", "amet", "page", "content", "report", "summary",
+    "review", "price", "update", "account", "details", "support", "help", "news",
+)
+
+
+class CaseGenerator:
+    """
+    Deterministic, streaming HTML test-case generator.
+    """
+
+    def __init__(self, attacks: Optional[Iterable[str]] = None, seed: int = 0,
+                 max_filler_words: int = 40):
+        """
+        Initialize generator (templates and payloads are compiled here, once).
+
+        Args:
+            attacks: Attack names to generate (defaults to all; usually
+                BaseBrowser.get_attack_names())
+            seed: Corpus seed
+            max_filler_words: Upper bound for {{filler}} length
+
+        Raises:
+            ValueError: For an attack name without payloads
+        """
+        self.attacks = list(attacks) if attacks is not None else list(ALL_ATTACKS)
+        self.seed = seed
+        self.max_filler_words = max_filler_words
+        self._compiled: Dict[str, Tuple[List[CompiledTemplate], List[CompiledTemplate]]] = {}
+        for attack in self.attacks:
+            if attack not in PAYLOADS:
+                raise ValueError(f"No payloads for attack: {attack}")
+            templates = CATEGORY_TEMPLATES[attack_category(attack)] + ATTACK_TEMPLATES.get(attack, ())
+            self._compiled[attack] = (
+                [CompiledTemplate(t) for t in templates],
+                [CompiledTemplate(p) for p in PAYLOADS[attack]],
+            )
+
+    def space(self, attack: str) -> int:
+        """
+        Number of distinct template x payload combinations of an attack.
+
+        Args:
+            attack: Attack name
+
+        Returns:
+            Combination count (cases beyond it differ only in canary/filler)
+        """
+        templates, payloads = self._compiled[attack]
+        return len(templates) * len(payloads)
+
+    def case(self, attack: str, index: int) -> TestCase:
+        """
+        Render one case.
+
+        Args:
+            attack: Attack name
+            index: Case number within the attack (any non-negative int)
+
+        Returns:
+            TestCase with html and meta set (path is None until written)
+        """
+        templates, payloads = self._compiled[attack]
+        rng = random.Random(f"{self.seed}:{attack}:{index}")
+
+        # Walk template x payload combinations in order, then repeat with new randomness
+        combo = index % (len(templates) * len(payloads))
+        template_index, payload_index = divmod(combo, len(payloads))
+
+        canary = f"{rng.getrandbits(48):012x}"
+        values = {
+            'canary': canary,
+            'id': f"f{canary[:8]}",
+            'title': f"{attack} {index}",
+            'filler': " ".join(rng.choices(_FILLER_WORDS, k=rng.randint(0, self.max_filler_words))),
+            'prelude': PRELUDE,
+        }
+        values['payload'] = payloads[payload_index].render(values)
+
+        return TestCase(
+            attack=attack,
+            name=f"s{self.seed}_{index:07d}",
+            html=templates[template_index].render(values),
+            meta={
+                'seed': self.seed,
+                'index': index,
+                'template': template_index,
+                'payload': payload_index,
+                'canary': canary,
+            },
+        )
+
+    def generate(self, attack: str, count: Optional[int] = None, start: int = 0) -> Iterator[TestCase]:
+        """
+        Stream cases of one attack.
+
+        Args:
+            attack: Attack name
+            count: Number of cases (None = endless)
+            start: First index (to resume a stream)
+
+        Yields:
+            TestCase
+        """
+        indexes = itertools.count(start) if count is None else range(start, start + count)
+        for index in indexes:
+            yield self.case(attack, index)
+
+    def stream(self, per_attack: Optional[int] = None, total: Optional[int] = None,
+               start: int = 0) -> Iterator[TestCase]:
+        """
+        Stream cases of all attacks, round-robin (one of each attack in turn).
+
+        Args:
+            per_attack: Cases per attack (None = endless)
+            total: Stop after this many cases overall
+            start: First index per attack
+
+        Yields:
+            TestCase
+        """
+        indexes = itertools.count(start) if per_attack is None else range(start, start + per_attack)
+        cases = (self.case(attack, index) for index in indexes for attack in self.attacks)
+        if total is not None:
+            cases = itertools.islice(cases, total)
+        yield from cases
+
+    def write(self, corpus: Corpus, per_attack: Optional[int] = None,
+              total: Optional[int] = None, start: int = 0) -> int:
+        """
+        Write a stream of cases into a corpus directory.
+
+        Args:
+            corpus: Destination corpus
+            per_attack: Cases per attack
+            total: Cases overall
+            start: First index per attack
+
+        Returns:
+            Number of cases written
+        """
+        if per_attack is None and total is None:
+            raise ValueError("write() needs per_attack or total (the stream is endless)")
+
+        written = 0
+        for case in self.stream(per_attack=per_attack, total=total, start=start):
+            corpus.add(case.attack, case.html, name=case.name, meta=case.meta)
+            written += 1
+        log.info("[GENERATOR] ✓ Wrote %s cases to %s", written, corpus.root)
+        return written
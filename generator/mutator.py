@@ -0,0 +1,410 @@
+"""
+HTML Mutator
+============
+Grammar-aware HTML mutation on a token array.
+
+A document is tokenized once into a TokenDoc: a list of token strings plus
+a parallel bytearray of token kinds (open tag, attribute, tag end, close
+tag, text, raw script/style body, comment, declaration). Mutations are
+list operations on those arrays (insert, replace, delete, duplicate,
+splice), so there is no reparsing and no string concatenation until a
+mutant is rendered, once, with ''.join.
+
+Structural operators keep markup well-formed (elements are inserted at
+element boundaries, attributes right after a tag name); havoc operators
+(delete/duplicate/swap arbitrary tokens) deliberately break it, which is
+what mutation-XSS style parser bugs need.
+
+Usage:
+    mutator = HTMLMutator(seed=1)
+    for mutant in mutator.stream(Corpus("htmls").iter_cases(), per_case=100):
+        ...  # TestCase with html set; CampaignRunner spools and loads it
+"""
+
+from typing import Callable, Iterable, Iterator, List, Optional
+import random
+import re
+
+from corpus import TestCase
+
+from . import grammar
+
+# Token kinds
+OPEN_TAG = 1   # "<div"
+ATTR = 2       # ' id="x"'
+TAG_END = 3    # ">" or "/>"
+CLOSE_TAG = 4  # "</div>"
+TEXT = 5
+RAW = 6        # Body of <script>/<style>/<textarea>/<title>/<xmp> (always present, may be "")
+COMMENT = 7
+DECL = 8       # <!DOCTYPE ...>
+
+RAW_TEXT_TAGS = frozenset(("script", "style", "textarea", "title", "xmp", "noembed", "plaintext"))
+
+_COMMENT = re.compile(r"<!--.*?(?:-->|$)", re.S)
+_DECL = re.compile(r"<![^>]*>?")
+_CLOSE = re.compile(r"</[a-zA-Z][^>]*>?")
+_OPEN = re.compile(r"<([a-zA-Z][\w:-]*)")
+_ATTR = re.compile(r"""\s+[^\s"'=<>/]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+))?|\s+/(?!>)""")
+_TAG_END = re.compile(r"\s*/?>")
+_TEXT = re.compile(r"[^<]+|<")
+_RAW_END = {tag: re.compile(f"</{tag}", re.I) for tag in RAW_TEXT_TAGS}
+
+
+class TokenDoc:
+    """
+    Token-array form of an HTML document.
+    """
+
+    __slots__ = ('tokens', 'kinds')
+
+    def __init__(self, tokens: List[str], kinds: bytearray):
+        self.tokens = tokens
+        self.kinds = kinds
+
+    def copy(self) -> "TokenDoc":
+        """Shallow copy (token strings are shared, arrays are not)."""
+        return TokenDoc(self.tokens[:], self.kinds[:])
+
+    def render(self) -> str:
+        """Serialize back to HTML."""
+        return "".join(self.tokens)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+def tokenize(html: str) -> TokenDoc:
+    """
+    Split HTML into a TokenDoc (lossless: render() returns the input).
+
+    Args:
+        html: HTML source
+
+    Returns:
+        TokenDoc
+    """
+    tokens: List[str] = []
+    kinds = bytearray()
+    position, end = 0, len(html)
+
+    while position < end:
+        if html.startswith("<!--", position):
+            match = _COMMENT.match(html, position)
+            kind = COMMENT
+        elif html.startswith("<!", position):
+            match = _DECL.match(html, position)
+            kind = DECL
+        elif html.startswith("</", position) and _CLOSE.match(html, position):
+            match = _CLOSE.match(html, position)
+            kind = CLOSE_TAG
+        else:
+            match = _OPEN.match(html, position)
+            if match:
+                tag = match.group(1).lower()
+                tokens.append(match.group(0))
+                kinds.append(OPEN_TAG)
+                position = match.end()
+                while True:
+                    attr = _ATTR.match(html, position)
+                    if not attr:
+                        break
+                    tokens.append(attr.group(0))
+                    kinds.append(ATTR)
+                    position = attr.end()
+                tag_end = _TAG_END.match(html, position)
+                if tag_end:
+                    tokens.append(tag_end.group(0))
+                    kinds.append(TAG_END)
+                    position = tag_end.end()
+                    if tag in RAW_TEXT_TAGS:
+                        raw_end = _RAW_END[tag].search(html, position)
+                        close = raw_end.start() if raw_end else end
+                        tokens.append(html[position:close])
+                        kinds.append(RAW)
+                        position = close
+                continue
+            match = _TEXT.match(html, position)
+            kind = TEXT
+
+        tokens.append(match.group(0))
+        kinds.append(kind)
+        position = match.end()
+
+    return TokenDoc(tokens, kinds)
+
+
+class HTMLMutator:
+    """
+    Fast grammar-aware mutator over TokenDocs.
+    """
+
+    def __init__(self, seed: int = 0, max_tokens: int = 4096, havoc: bool = True):
+        """
+        Initialize mutator.
+
+        Args:
+            seed: Seed for mutant streams (stream()/mutants() are deterministic per seed)
+            max_tokens: Growth cap; above it only shrinking operators run
+            havoc: Include operators that produce malformed markup
+        """
+        self.seed = seed
+        self.max_tokens = max_tokens
+        self.rng = random.Random(seed)
+        self.operators: List[Callable[[TokenDoc, str], None]] = [
+            self.insert_element,
+            self.insert_attribute,
+            self.replace_attribute,
+            self.mutate_css,
+            self.insert_script,
+            self.insert_hidden_prompt,
+            self.replace_text,
+            self.delete_token,
+        ]
+        if havoc:
+            self.operators += [self.duplicate_span, self.swap_tokens]
+        self.splice_donors: List[TokenDoc] = []
+
+    # ==================== Driving ====================
+
+    def mutate(self, doc: TokenDoc, rounds: int = 1, canary: str = "") -> TokenDoc:
+        """
+        Return a mutated copy of a document.
+
+        Args:
+            doc: Source document (not modified)
+            rounds: Number of stacked mutations
+            canary: Substituted for {{canary}} in inserted probes
+
+        Returns:
+            New TokenDoc
+        """
+        mutant = doc.copy()
+        self.mutate_in_place(mutant, rounds, canary)
+        return mutant
+
+    def mutate_in_place(self, doc: TokenDoc, rounds: int = 1, canary: str = ""):
+        """Apply `rounds` random operators to `doc`."""
+        choice = self.rng.choice
+        operators = self.operators
+        for _ in range(rounds):
+            if len(doc.tokens) >= self.max_tokens:
+                self.delete_token(doc, canary)
+            elif self.splice_donors and self.rng.random() < 0.05:
+                self.splice(doc, canary)
+            else:
+                choice(operators)(doc, canary)
+
+    def mutants(self, case: TestCase, count: Optional[int] = None,
+                max_rounds: int = 4) -> Iterator[TestCase]:
+        """
+        Stream mutants of one case.
+
+        Args:
+            case: Parent case (html or path set)
+            count: Number of mutants (None = endless)
+            max_rounds: Stacked mutations per mutant (1..max_rounds)
+
+        Yields:
+            TestCase with html set and meta['parent'] = the parent's case_id
+        """
+        doc = tokenize(case.load())
+        canary = case.meta.get('canary', "")
+        self.rng.seed(f"{self.seed}:{case.case_id}")
+        index = 0
+        while count is None or index < count:
+            rounds = self.rng.randint(1, max_rounds)
+            mutant = self.mutate(doc, rounds, canary)
+            yield TestCase(
+                attack=case.attack,
+                name=f"{case.name}_m{index:06d}",
+                html=mutant.render(),
+                meta={**case.meta, 'parent': case.case_id, 'mutation': index,
+                      'rounds': rounds, 'mutator_seed': self.seed},
+            )
+            index += 1
+
+    def stream(self, cases: Iterable[TestCase], per_case: Optional[int] = 10,
+               max_rounds: int = 4) -> Iterator[TestCase]:
+        """
+        Stream mutants of many cases (e.g. a corpus directory).
+
+        Args:
+            cases: Parent cases
+            per_case: Mutants per parent
+            max_rounds: Stacked mutations per mutant
+
+        Yields:
+            Mutant TestCases
+        """
+        for case in cases:
+            yield from self.mutants(case, per_case, max_rounds)
+
+    def add_donor(self, doc: TokenDoc):
+        """Register a document whose spans splice() may copy in (crossover)."""
+        self.splice_donors.append(doc)
+
+    # ==================== Positions ====================
+
+    def _boundary(self, doc: TokenDoc) -> int:
+        """Random index where a whole element can be inserted."""
+        kinds = doc.kinds
+        size = len(kinds)
+        randrange = self.rng.randrange
+        for _ in range(8):
+            i = randrange(size + 1)
+            if i == size:
+                return i
+            kind = kinds[i]
+            if kind in (ATTR, TAG_END, RAW):
+                continue
+            if i and kinds[i - 1] in (OPEN_TAG, ATTR, RAW):
+                continue
+            return i
+        return size
+
+    def _find(self, doc: TokenDoc, kind: int) -> int:
+        """Random index of a token of `kind`, or -1."""
+        kinds = doc.kinds
+        size = len(kinds)
+        if not size:
+            return -1
+        start = self.rng.randrange(size)
+        i = kinds.find(kind, start)
+        if i < 0:
+            i = kinds.find(kind, 0, start)
+        return i
+
+    @staticmethod
+    def _owner_tag(doc: TokenDoc, index: int) -> str:
+        """Lower-cased start-tag token ("<style") that a RAW/ATTR token belongs to."""
+        i = index - 1
+        while i >= 0 and doc.kinds[i] != OPEN_TAG:
+            i -= 1
+        return doc.tokens[i].lower() if i >= 0 else ""
+
+    @staticmethod
+    def _insert(doc: TokenDoc, index: int, tokens: List[str], kinds: bytes):
+        doc.tokens[index:index] = tokens
+        doc.kinds[index:index] = kinds
+
+    # ==================== Structural operators ====================
+
+    def insert_element(self, doc: TokenDoc, canary: str):
+        """Insert a random element (with an attribute) at an element boundary."""
+        rng = self.rng
+        tag = rng.choice(grammar.TAGS)
+        attr = self._attribute(canary)
+        if tag in grammar.VOID_TAGS:
+            self._insert(doc, self._boundary(doc), [f"<{tag}", attr, ">"],
+                         bytes((OPEN_TAG, ATTR, TAG_END)))
+        elif tag in RAW_TEXT_TAGS:
+            self._insert(doc, self._boundary(doc), [f"<{tag}", attr, ">", canary, f"</{tag}>"],
+                         bytes((OPEN_TAG, ATTR, TAG_END, RAW, CLOSE_TAG)))
+        else:
+            self._insert(doc, self._boundary(doc), [f"<{tag}", attr, ">", canary, f"</{tag}>"],
+                         bytes((OPEN_TAG, ATTR, TAG_END, TEXT, CLOSE_TAG)))
+
+    def insert_attribute(self, doc: TokenDoc, canary: str):
+        """Add an attribute to a random start tag."""
+        i = self._find(doc, OPEN_TAG)
+        if i < 0:
+            return self.insert_element(doc, canary)
+        self._insert(doc, i + 1, [self._attribute(canary)], bytes((ATTR,)))
+
+    def replace_attribute(self, doc: TokenDoc, canary: str):
+        """Replace a random attribute with a new name/value pair."""
+        i = self._find(doc, ATTR)
+        if i < 0:
+            return self.insert_attribute(doc, canary)
+        doc.tokens[i] = self._attribute(canary)
+
+    def mutate_css(self, doc: TokenDoc, canary: str):
+        """Add a style attribute, or append a rule to a <style> body."""
+        rng = self.rng
+        declaration = (f"{rng.choice(grammar.CSS_PROPERTIES)}:"
+                       f"{rng.choice(grammar.CSS_VALUES).replace('{{canary}}', canary)}")
+        i = self._find(doc, RAW)
+        if i >= 0 and rng.random() < 0.5 and self._owner_tag(doc, i) == "<style":
+            doc.tokens[i] += f"\n* {{{declaration}}}"
+            return
+        i = self._find(doc, OPEN_TAG)
+        if i < 0:
+            return self.insert_element(doc, canary)
+        self._insert(doc, i + 1, [f' style="{declaration}"'], bytes((ATTR,)))
+
+    def insert_script(self, doc: TokenDoc, canary: str):
+        """Insert an inline <script> (or an event handler) using a grammar snippet."""
+        snippet = self.rng.choice(grammar.SCRIPTS).replace('{{canary}}', canary)
+        self._insert(doc, self._boundary(doc), ["<script", ">", snippet, "</script>"],
+                     bytes((OPEN_TAG, TAG_END, RAW, CLOSE_TAG)))
+
+    def insert_hidden_prompt(self, doc: TokenDoc, canary: str):
+        """Insert text a user cannot see but an assistant reading the DOM can."""
+        rng = self.rng
+        text = rng.choice(grammar.HIDDEN_PROMPTS).replace('{{canary}}', canary)
+        style = rng.choice(grammar.HIDING_STYLES)
+        self._insert(doc, self._boundary(doc), ["<div", f' style="{style}"', ">", text, "</div>"],
+                     bytes((OPEN_TAG, ATTR, TAG_END, TEXT, CLOSE_TAG)))
+
+    def replace_text(self, doc: TokenDoc, canary: str):
+        """Replace a text node with a hidden prompt or a grammar value."""
+        i = self._find(doc, TEXT)
+        if i < 0:
+            return self.insert_hidden_prompt(doc, canary)
+        rng = self.rng
+        source = grammar.HIDDEN_PROMPTS if rng.random() < 0.5 else grammar.ATTRIBUTE_VALUES
+        doc.tokens[i] = rng.choice(source).replace('{{canary}}', canary)
+
+    def delete_token(self, doc: TokenDoc, canary: str):
+        """Remove a random attribute, text node or comment (any token with havoc)."""
+        if not doc.tokens:
+            return
+        rng = self.rng
+        i = self._find(doc, rng.choice((ATTR, TEXT, COMMENT)))
+        if i < 0:
+            i = rng.randrange(len(doc.tokens))
+        del doc.tokens[i]
+        del doc.kinds[i]
+
+    # ==================== Havoc operators ====================
+
+    def duplicate_span(self, doc: TokenDoc, canary: str):
+        """Copy a short run of tokens to another position."""
+        size = len(doc.tokens)
+        if not size:
+            return
+        rng = self.rng
+        start = rng.randrange(size)
+        stop = min(size, start + rng.randint(1, 8))
+        target = rng.randrange(size + 1)
+        self._insert(doc, target, doc.tokens[start:stop], doc.kinds[start:stop])
+
+    def swap_tokens(self, doc: TokenDoc, canary: str):
+        """Exchange two tokens."""
+        size = len(doc.tokens)
+        if size < 2:
+            return
+        randrange = self.rng.randrange
+        a, b = randrange(size), randrange(size)
+        doc.tokens[a], doc.tokens[b] = doc.tokens[b], doc.tokens[a]
+        doc.kinds[a], doc.kinds[b] = doc.kinds[b], doc.kinds[a]
+
+    def splice(self, doc: TokenDoc, canary: str):
+        """Insert a run of tokens from a donor document (crossover)."""
+        rng = self.rng
+        donor = rng.choice(self.splice_donors)
+        if not donor.tokens:
+            return
+        start = rng.randrange(len(donor.tokens))
+        stop = min(len(donor.tokens), start + rng.randint(1, 16))
+        self._insert(doc, self._boundary(doc), donor.tokens[start:stop], donor.kinds[start:stop])
+
+    # ==================== Grammar ====================
+
+    def _attribute(self, canary: str) -> str:
+        """Render one ` name="value"` attribute token."""
+        rng = self.rng
+        value = rng.choice(grammar.ATTRIBUTE_VALUES).replace('{{canary}}', canary)
+        # Values are not escaped: breaking out of the quotes is part of the grammar
+        return f' {rng.choice(grammar.ATTRIBUTE_NAMES)}="{value}"'
@@ -0,0 +1,163 @@
+"""
+HTML Templates
+==============
+Page skeletons that place a payload into a specific context (element body,
+attribute value, script string, srcdoc, ...), compiled once into literal
+parts and slots so rendering is a single ''.join.
+
+Placeholder syntax: {{slot}} or {{slot|filter}}
+    slots:   prelude, payload, canary, id, title, filler
+    filters: html (escape text), attr (escape quotes too), js (string
+             literal body), url (percent-encode)
+"""
+
+from typing import Callable, Dict, List, Mapping, Tuple, Union
+from urllib.parse import quote
+import html
+import json
+import re
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)(?:\|(\w+))?\}\}")
+
+
+def _js_string(value: str) -> str:
+    # JSON string body, with "</" split so it cannot close the script element
+    return json.dumps(value)[1:-1].replace("</", "<\\/")
+
+
+FILTERS: Dict[str, Callable[[str], str]] = {
+    'html': lambda value: html.escape(value, quote=False),
+    'attr': lambda value: html.escape(value, quote=True),
+    'js': _js_string,
+    'url': lambda value: quote(value, safe=''),
+}
+
+# Defines the signal payloads call when they fire (oracles may override it)
+PRELUDE = (
+    "<script>window.__fuzzSignal = window.__fuzzSignal || "
+    "function (c) { document.title = 'FUZZ:' + c; };</script>"
+)
+
+
+class CompiledTemplate:
+    """
+    A template parsed into literal text and (slot, filter) parts.
+    """
+
+    __slots__ = ('source', 'parts', 'slots')
+
+    def __init__(self, source: str):
+        """
+        Compile a template.
+
+        Args:
+            source: Template text with {{slot}} / {{slot|filter}} placeholders
+
+        Raises:
+            ValueError: For an unknown filter
+        """
+        self.source = source
+        self.parts: List[Union[str, Tuple[str, Callable[[str], str]]]] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            if match.start() > position:
+                self.parts.append(source[position:match.start()])
+            slot, filter_name = match.group(1), match.group(2)
+            if filter_name and filter_name not in FILTERS:
+                raise ValueError(f"Unknown template filter: {filter_name}")
+            self.parts.append((slot, FILTERS[filter_name] if filter_name else None))
+            position = match.end()
+        if position < len(source):
+            self.parts.append(source[position:])
+        self.slots = frozenset(part[0] for part in self.parts if isinstance(part, tuple))
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Fill the placeholders.
+
+        Args:
+            values: Slot values (missing slots render as "")
+
+        Returns:
+            Rendered text
+        """
+        out = []
+        append = out.append
+        for part in self.parts:
+            if part.__class__ is str:
+                append(part)
+            else:
+                value = values.get(part[0], "")
+                append(part[1](value) if part[1] else value)
+        return "".join(out)
+
+    def __repr__(self):
+        return f"CompiledTemplate({self.source[:40]!r}...)"
+
+
+# The fuzz-canary <meta> keeps the canary with the file (corpus.case.html_canaries reads it back)
+_HEAD = ("<!DOCTYPE html><html><head><meta charset=\"utf-8\"><meta name=\"fuzz-canary\" content=\"{{canary}}\">"
+         "<title>{{title}}</title>{{prelude}}</head>")
+
+# Contexts per attack category (see corpus.ATTACK_CATEGORIES)
+CATEGORY_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    'web': (
+        _HEAD + "<body><h1>Search</h1><p>Results for: {{payload}}</p></body></html>",
+        _HEAD + "<body><form><input id=\"{{id}}\" name=\"q\" value=\"{{payload}}\"></form></body></html>",
+        _HEAD + "<body><div id=\"{{id}}\"></div><script>var q = \"{{payload|js}}\";"
+        "document.getElementById('{{id}}').innerHTML = q;</script></body></html>",
+        _HEAD + "<body><textarea>{{payload}}</textarea><p>{{filler}}</p></body></html>",
+        _HEAD + "<body><a href=\"/search?q={{payload|url}}\">again</a><p>{{payload}}</p></body></html>",
+    ),
+    'browser': (
+        _HEAD + "<body>{{payload}}</body></html>",
+        _HEAD + "<body><iframe srcdoc=\"{{prelude|attr}}{{payload|attr}}\"></iframe></body></html>",
+        _HEAD + "<body><template id=\"{{id}}\">{{payload}}</template><script>"
+        "document.body.appendChild(document.getElementById('{{id}}').content.cloneNode(true));"
+        "</script></body></html>",
+        _HEAD + "<body><div id=\"{{id}}\"></div><script>"
+        "document.getElementById('{{id}}').innerHTML = \"{{payload|js}}\";</script></body></html>",
+    ),
+    'ai': (
+        _HEAD + "<body><article><h1>{{title}}</h1><p>{{filler}}</p>{{payload}}<p>{{filler}}</p>"
+        "</article></body></html>",
+        _HEAD + "<body><main><h1>Product review</h1><p>{{filler}}</p></main>"
+        "<footer>{{payload}}</footer></body></html>",
+        _HEAD + "<body><table><tr><th>Question</th><th>Answer</th></tr>"
+        "<tr><td>{{filler}}</td><td>{{payload}}</td></tr></table></body></html>",
+    ),
+    'file': (
+        _HEAD + "<body><h1>Local document</h1>{{payload}}</body></html>",
+        _HEAD + "<body><p>{{filler}}</p>{{payload}}<p>{{filler}}</p></body></html>",
+    ),
+    'engine': (
+        _HEAD + "<body>{{payload}}</body></html>",
+        _HEAD + "<body><div id=\"{{id}}\">{{filler}}</div>{{payload}}{{payload}}</body></html>",
+    ),
+    'other': (
+        _HEAD + "<body>{{payload}}</body></html>",
+    ),
+}
+
+# Extra contexts for attacks whose sink is specific
+ATTACK_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "XSS_DOM": (
+        _HEAD + "<body><div id=\"{{id}}\"></div><script>"
+        "document.getElementById('{{id}}').innerHTML = decodeURIComponent(\"{{payload|url}}\");"
+        "</script></body></html>",
+        _HEAD + "<body><script>document.write(\"{{payload|js}}\");</script></body></html>",
+    ),
+    "POSTMESSAGE_XSS": (
+        _HEAD + "<body><iframe srcdoc=\"{{prelude|attr}}{{payload|attr}}\"></iframe>{{payload}}</body></html>",
+    ),
+    "SIDECAR_INJECTION": (
+        _HEAD + "<body><div id=\"thread\">{{payload}}</div>"
+        "<div id=\"ask-input\" contenteditable=\"true\" data-lexical-editor=\"true\"><p><br></p></div>"
+        "</body></html>",
+    ),
+    "ASSISTANT_PROMPT_INJECTION": (
+        _HEAD + "<body><article><h1>{{title}}</h1><p>{{filler}}</p>"
+        "<div aria-hidden=\"true\" style=\"position:absolute;left:-9999px\">{{payload}}</div>"
+        "<p>{{filler}}</p></article></body></html>",
+    ),
+}
@@ -0,0 +1,58 @@
+"""
+Logger Module
+=============
+Structured, low-overhead logging that replaces print-based tracing.
+
+- Levels: DEBUG traces (per-strategy, per-poll, previews) are dropped
+  before formatting unless enabled
+- Lazy formatting: %-style arguments, formatted only when emitted
+- JSON-lines output for machine consumption
+- Per-job context attached to every record
+
+Usage:
+    from logger import get_logger, configure_logging, job_context
+
+    log = get_logger(__name__)
+
+    configure_logging(level="DEBUG", fmt="json", filepath="output/run.jsonl")
+
+    with job_context(job_id="a1b2", query="What is Python?"):
+        log.info("[COMET] Sending query")
+        log.debug("Current URL: %s", url)
+"""
+
+import logging
+
+from .config import (
+    configure_logging,
+    get_logger,
+    ConsoleFormatter,
+    JsonLinesFormatter,
+    ROOT_LOGGER_NAME,
+)
+from .context import job_context, get_job_context, JobContextFilter
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+__all__ = [
+    # Configuration
+    'configure_logging',
+    'get_logger',
+    'ConsoleFormatter',
+    'JsonLinesFormatter',
+    'ROOT_LOGGER_NAME',
+
+    # Job context
+    'job_context',
+    'get_job_context',
+    'JobContextFilter',
+
+    # Levels
+    'DEBUG',
+    'INFO',
+    'WARNING',
+    'ERROR',
+]
@@ -0,0 +1,139 @@
+"""
+Logging Configuration
+=====================
+Level-filtered, lazily formatted logging for the whole project.
+
+All project loggers live under the "fuzzer" namespace and are obtained with
+get_logger(__name__). Messages use %-style arguments so nothing is
+formatted unless a handler will emit the record; hot loops additionally
+check log.isEnabledFor(logging.DEBUG) once before iterating.
+
+Importing the package configures nothing: the "fuzzer" logger only has a
+NullHandler until an entry point (main.py, python -m campaign/daemon/...)
+calls configure_logging(), so embedding code keeps control of its own
+logging setup.
+
+Output formats:
+- "console": the message as-is (matches the historical print output),
+  prefixed with the level name from WARNING up and with the job id when
+  a job context is active
+- "json": one JSON object per line with timestamp, level, logger,
+  message, job context and exception text
+
+Environment defaults (used by configure_logging() for arguments left at None):
+- FUZZER_LOG_LEVEL:  DEBUG, INFO, WARNING, ERROR (default INFO)
+- FUZZER_LOG_FORMAT: console or json (default console)
+- FUZZER_LOG_FILE:   write to this file instead of stdout
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Union
+import json
+import logging
+import os
+import sys
+
+from .context import JobContextFilter
+
+
+ROOT_LOGGER_NAME = "fuzzer"
+
+logging.getLogger(ROOT_LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Plain message output, prefixed with the level name (WARNING and above) and the job id."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname}: {message}"
+        job = getattr(record, 'job', None)
+        if job and 'job_id' in job:
+            message = f"[job {job['job_id']}] {message}"
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            message = f"{message}\n{record.exc_text}"
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        job = getattr(record, 'job', None)
+        if job:
+            entry.update(job)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: Union[int, str, None] = None,
+                      fmt: Optional[str] = None,
+                      stream=None,
+                      filepath: Optional[str] = None) -> logging.Logger:
+    """
+    Configure the project root logger (replaces any previous configuration).
+
+    Meant for entry points only; library modules just call get_logger().
+
+    Args:
+        level: Minimum level (e.g., logging.DEBUG or "DEBUG"; None = FUZZER_LOG_LEVEL or INFO)
+        fmt: "console" or "json" (None = FUZZER_LOG_FORMAT or console)
+        stream: Stream for output (defaults to stdout)
+        filepath: Write to this file instead of a stream (None = FUZZER_LOG_FILE, if set)
+
+    Returns:
+        The project root logger
+    """
+    if level is None:
+        level = os.environ.get("FUZZER_LOG_LEVEL", "INFO")
+    if fmt is None:
+        fmt = os.environ.get("FUZZER_LOG_FORMAT", "console")
+    if filepath is None and stream is None:
+        filepath = os.environ.get("FUZZER_LOG_FILE") or None
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    if filepath:
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        handler: logging.Handler = logging.FileHandler(filepath, encoding='utf-8')
+    else:
+        handler = logging.StreamHandler(stream or sys.stdout)
+
+    handler.setFormatter(JsonLinesFormatter() if fmt == "json" else ConsoleFormatter())
+    handler.addFilter(JobContextFilter())
+
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    root.setLevel(level)
+    root.addHandler(handler)
+    root.propagate = False
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a project logger.
+
+    Does not configure logging (see configure_logging()).
+
+    Args:
+        name: Module name (usually __name__)
+
+    Returns:
+        Logger under the "fuzzer" namespace
+    """
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
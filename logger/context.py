@@ -0,0 +1,59 @@
+"""
+Job Logging Context
+===================
+Per-job context attached to every log record emitted while a job runs.
+
+The context lives in a ContextVar, so it follows the job across function
+calls (and asyncio tasks) without being passed around explicitly.
+
+Usage:
+    with job_context(job_id="a1b2", attack="XSS_DOM"):
+        log.info("Sending query")    # record carries job_id and attack
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator
+import logging
+
+
+_job_context: ContextVar[Dict[str, Any]] = ContextVar("job_context", default={})
+
+
+@contextmanager
+def job_context(**fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Add fields to the logging context for the duration of the block.
+
+    Nested contexts inherit and may override outer fields.
+
+    Args:
+        **fields: Context fields (e.g., job_id="a1b2", browser="comet")
+
+    Yields:
+        The merged context dictionary
+    """
+    merged = {**_job_context.get(), **fields}
+    token = _job_context.set(merged)
+    try:
+        yield merged
+    finally:
+        _job_context.reset(token)
+
+
+def get_job_context() -> Dict[str, Any]:
+    """
+    Get the current job context.
+
+    Returns:
+        Dictionary of context fields (empty outside any job)
+    """
+    return _job_context.get()
+
+
+class JobContextFilter(logging.Filter):
+    """Attaches the current job context to each record as `record.job`."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.job = _job_context.get()
+        return True
@@ -13,6 +13,7 @@ import time
 from pathlib import Path
 from browser import BrowserFactory, BrowserType
 from pipeline import PipelineConfig
+from logger import configure_logging
 
 # ==================== Configuration ====================
 BROWSER_TYPE = BrowserType.COMET
@@ -26,6 +27,7 @@ USE_CONVERSION = True  # True = use new conversion module, False = use legacy na
 SUBMIT_QUERY = True  # True to submit, False to just type
 READ_RESPONSE = True  # True to read the assistant's response
 SAVE_TEXT = "output/response.txt"   # Path to save plain text, or None to skip
+RESPONSE_CACHE = None  # e.g. "output/conversations.db": re-asking the same query is answered from it
 
 # MODE 2: Conversation (multi-turn mode - full conversation with assistant)
 # CONVERSATION = [
@@ -35,6 +37,20 @@ SAVE_TEXT = "output/response.txt"   # Path to save plain text, or None to skip
 # ]
 CONVERSATION = None  # Set to None to disable conversation mode
 
+# Attach to a Comet already running on the debug port (same profile) instead of
+# killing and relaunching it - fast interactive iterations
+REUSE_BROWSER = False
+
+# Logging configuration
+LOG_LEVEL = "INFO"  # "DEBUG" shows per-strategy/per-poll traces and response previews
+LOG_FORMAT = "console"  # "console" or "json" (one JSON object per line)
+LOG_FILE = None  # Path to write logs to, or None for stdout
+
+# Daemon mode: keep the browser warm and accept jobs over a local JSON API
+# (POST http://127.0.0.1:<port>/jobs) instead of running QUERY once
+DAEMON_MODE = False
+DAEMON_PORT = 8765
+
 
 def main():
     """
@@ -44,6 +60,15 @@ def main():
     1. Single query: Send one question (with optional response reading)
     2. Conversation: Multi-turn conversation with the assistant
     """
+    configure_logging(level=LOG_LEVEL, fmt=LOG_FORMAT, filepath=LOG_FILE)
+    
+    if DAEMON_MODE:
+        from daemon import PoolConfig, run_daemon
+        exit_code = run_daemon(PoolConfig(browser_type=BROWSER_TYPE, target_url=SIDECAR_URL,
+                                          response_cache=RESPONSE_CACHE),
+                               port=DAEMON_PORT)
+        return exit_code == 0
+    
     print("=" * 60)
     print("COMET BROWSER - PERPLEXITY SIDECAR ASSISTANT")
     print("=" * 60)
@@ -63,14 +88,18 @@ def main():
         print(f"Read Response: {READ_RESPONSE}")
         if SAVE_TEXT:
             print(f"Save Text: {SAVE_TEXT}")
+        if RESPONSE_CACHE:
+            print(f"Response Cache: {RESPONSE_CACHE}")
     else:
         print(f"\n👁 MODE: Just open Sidecar (no interaction)")
     
     print("=" * 60)
     
+    response_cache = None
     try:
         # Create browser facade (bundles launcher, navigator, pipeline)
         browser = BrowserFactory.create(BROWSER_TYPE)
+        browser.reuse_existing = REUSE_BROWSER
         
         # Configure pipeline
         config = PipelineConfig(
@@ -98,6 +127,10 @@ def main():
             pipeline_kwargs['use_conversion'] = USE_CONVERSION  # NEW!
             if SAVE_TEXT:
                 pipeline_kwargs['save_text'] = SAVE_TEXT  # NEW!
+            if RESPONSE_CACHE:
+                from conversion import ResponseCache
+                response_cache = ResponseCache(RESPONSE_CACHE)
+                pipeline_kwargs['response_cache'] = response_cache
         
         # Run the pipeline
         result = browser.run_pipeline(config, **pipeline_kwargs)
@@ -152,6 +185,10 @@ def main():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        if response_cache is not None:
+            print(f"[INFO] Response cache: {response_cache.stats()}")
+            response_cache.close()
 
 
 if __name__ == "__main__":
@@ -67,7 +67,10 @@ class Navigator(ABC):
         folder_path: Path,
         pattern: str = "*.html",
         new_tabs: bool = True,
-        wait_per_page: float = 0.5
+        wait_per_page: float = 0.5,
+        recursive: bool = False,
+        shard: int = 0,
+        num_shards: int = 1
     ) -> List[str]:
         """
         Open multiple local HTML files.
@@ -77,6 +80,9 @@ class Navigator(ABC):
             pattern: Glob pattern for file matching
             new_tabs: Open in new tabs (True) or replace current page (False)
             wait_per_page: Seconds to wait between opening files
+            recursive: Also open files in subdirectories
+            shard: Shard of the files to open (with num_shards, for parallel workers)
+            num_shards: Number of shards (1 = all files)
         
         Returns:
             List of file:// URLs that were opened
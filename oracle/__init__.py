@@ -0,0 +1,46 @@
+"""
+Oracle Module
+=============
+Automatic verdicts for test cases, replacing reading output/response.txt
+by hand.
+
+Components:
+- PromptInjectionOracle: Did the assistant answer follow the page's injected
+  instruction? (canaries, exfil URLs, injection phrases; incremental)
+- PatternSet / StreamScanner: All patterns in one compiled matcher
+- Indicator / register_rule: Per-attack-name rule registry
+- XSSOracle / XSSTab: Script execution seen through CDP events (binding,
+  dialogs, console), decided in milliseconds instead of sleep-and-inspect
+
+Usage:
+    from oracle import PromptInjectionOracle, classify_response
+
+    result = classify_response(case, response_text)
+    if result.verdict == OracleVerdict.INJECTED:
+        ...
+"""
+
+from .matcher import Match, PatternSet, StreamScanner, compile_patterns
+from .prompt import OracleResult, OracleVerdict, PromptInjectionOracle, case_canaries, classify_response
+from .rules import Indicator, register_rule, rules_for
+from .xss import XSS_ATTACKS, ExecutionEvent, XSSOracle, XSSResult, XSSTab
+
+__all__ = [
+    'ExecutionEvent',
+    'Indicator',
+    'Match',
+    'OracleResult',
+    'OracleVerdict',
+    'PatternSet',
+    'PromptInjectionOracle',
+    'StreamScanner',
+    'XSSOracle',
+    'XSSResult',
+    'XSSTab',
+    'XSS_ATTACKS',
+    'case_canaries',
+    'classify_response',
+    'compile_patterns',
+    'register_rule',
+    'rules_for',
+]
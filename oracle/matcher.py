@@ -0,0 +1,222 @@
+"""
+Multi-Pattern Matcher
+=====================
+All of an oracle's patterns compiled into ONE regular expression, scanned
+once over the text, plus an incremental scanner for streamed text.
+
+- Literals (canaries, fixed phrases) are merged into a trie-shaped
+  alternation: common prefixes are factored out, so the regex engine
+  follows one branch per character, as an Aho-Corasick automaton would,
+  instead of trying every literal at every position.
+- Regex indicators are further alternatives of the same pattern. A
+  lookahead over the alternation of all of them finds candidate positions
+  in one pass; there, every indicator has its own optional named
+  lookahead, so indicators that start at the same position (the literal
+  "http" and the exfil_url regex) are all reported, and an indicator
+  inside another one's match (a canary inside an exfil URL) is too.
+- StreamScanner re-scans only the new text plus a short overlap, so
+  matches that straddle two chunks are found once and a 10 KB answer
+  polled 40 times costs about one pass, not 40. A match that grows with
+  later text (a URL still being streamed) is updated, so streamed and
+  one-shot scans report the same evidence.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import re
+
+from .rules import Indicator
+
+DEFAULT_WINDOW = 256  # Overlap kept between chunks for regex indicators
+
+
+def trie_pattern(literals: Iterable[str]) -> str:
+    """
+    Regex matching any of the literals, factored by common prefixes.
+
+    Args:
+        literals: Non-empty strings
+
+    Returns:
+        Pattern source (no capture groups)
+    """
+    trie: Dict[str, dict] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End of a literal
+
+    def emit(node: Dict[str, dict]) -> str:
+        ends = '' in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends:
+            # Longest match first: a literal that is a prefix of another must not end the match early
+            return '(?:' + body + ')?' if len(branches) > 1 or len(body) > 1 else body + '?'
+        return body
+
+    return emit(trie)
+
+
+@dataclass(frozen=True)
+class Match:
+    """One indicator occurrence."""
+    indicator: str
+    text: str
+    start: int  # Offset in the whole (streamed) text
+    end: int
+    decisive: bool
+
+
+class PatternSet:
+    """
+    Indicators compiled into one pattern.
+    """
+
+    def __init__(self, indicators: Iterable[Indicator], window: int = DEFAULT_WINDOW):
+        """
+        Compile indicators.
+
+        Args:
+            indicators: Literal and regex indicators (duplicate names are merged)
+            window: Longest match expected from a regex indicator (stream overlap)
+        """
+        self.indicators: Dict[str, Indicator] = {}
+        for indicator in indicators:
+            self.indicators.setdefault(indicator.name, indicator)
+
+        alternatives: List[Tuple[str, str]] = []  # (group, pattern)
+        self._group_names: Dict[str, str] = {}
+        self._literals: Dict[Tuple[bool, bool], Dict[str, str]] = {}  # (ignore_case, decisive) -> text -> name
+        for indicator in self.indicators.values():
+            if indicator.regex:
+                group = f"r{len(alternatives)}"
+                flags = '(?i:' if indicator.ignore_case else '(?:'
+                alternatives.append((group, f"{flags}{indicator.pattern})"))
+                self._group_names[group] = indicator.name
+            else:
+                key = (indicator.ignore_case, indicator.decisive)
+                text = indicator.pattern.lower() if indicator.ignore_case else indicator.pattern
+                self._literals.setdefault(key, {})[text] = indicator.name
+
+        for (ignore_case, decisive), literals in self._literals.items():
+            group = f"l{int(ignore_case)}{int(decisive)}"
+            flags = '(?i:' if ignore_case else '(?:'
+            alternatives.insert(0, (group, f"{flags}{trie_pattern(literals)})"))  # Literals first: cheapest
+
+        self._groups = [group for group, _ in alternatives]
+        self.pattern = None
+        if alternatives:
+            # Candidate positions come from one alternation; each indicator then gets its own
+            # optional lookahead, so several indicators starting at one position are all captured
+            candidates = '(?=' + '|'.join(body for _, body in alternatives) + ')'
+            captures = ''.join(f"(?:(?=(?P<{group}>{body})))?" for group, body in alternatives)
+            self.pattern = re.compile(candidates + captures)
+        longest_literal = max((len(i.pattern) for i in self.indicators.values() if not i.regex), default=0)
+        has_regex = any(i.regex for i in self.indicators.values())
+        self.overlap = max(longest_literal, window if has_regex else 0)
+
+    def _indicator_for(self, group: str, text: str) -> Indicator:
+        if group[0] == 'r':
+            return self.indicators[self._group_names[group]]
+        literals = self._literals[(group[1] == '1', group[2] == '1')]
+        return self.indicators[literals[text.lower() if group[1] == '1' else text]]
+
+    def finditer(self, text: str, pos: int = 0, offset: int = 0) -> Iterator[Match]:
+        """
+        All indicator matches in text.
+
+        Args:
+            text: Text to scan
+            pos: Where to start scanning in text
+            offset: Added to reported positions (position of text in the stream)
+
+        Yields:
+            Match
+        """
+        if self.pattern is None:
+            return
+        for m in self.pattern.finditer(text, pos):
+            for group in self._groups:
+                found = m.group(group)
+                if found is None:
+                    continue
+                indicator = self._indicator_for(group, found)
+                yield Match(indicator.name, found, offset + m.start(group), offset + m.end(group),
+                            indicator.decisive)
+
+
+@lru_cache(maxsize=256)
+def compile_patterns(indicators: Tuple[Indicator, ...], window: int = DEFAULT_WINDOW) -> PatternSet:
+    """Cached PatternSet for a tuple of indicators (rules are shared by many cases)."""
+    return PatternSet(indicators, window)
+
+
+class StreamScanner:
+    """
+    Incremental scanning of text that arrives in chunks or growing snapshots.
+    """
+
+    def __init__(self, patterns: PatternSet):
+        """
+        Initialize scanner.
+
+        Args:
+            patterns: Compiled indicators
+        """
+        self.patterns = patterns
+        self.length = 0  # Characters seen so far
+        self._tail = ""  # Last `overlap` characters seen
+        self._seen: Dict[Tuple[str, int], int] = {}  # (indicator, start) -> index in matches
+        self.matches: List[Match] = []  # Everything found so far, with the longest text seen
+
+    def feed(self, chunk: str) -> List[Match]:
+        """
+        Scan a new chunk.
+
+        Args:
+            chunk: Text following everything fed before
+
+        Returns:
+            New matches (including ones that started in earlier chunks) and
+            earlier matches whose text grew with this chunk
+        """
+        if not chunk:
+            return []
+        text = self._tail + chunk
+        offset = self.length - len(self._tail)
+        matches = []
+        for match in self.patterns.finditer(text, offset=offset):
+            if match.end <= self.length:
+                continue  # Entirely inside text scanned before
+            key = (match.indicator, match.start)
+            index: Optional[int] = self._seen.get(key)
+            if index is None:
+                self._seen[key] = len(self.matches)
+                self.matches.append(match)
+                matches.append(match)
+            elif match.end > self.matches[index].end:
+                self.matches[index] = match  # e.g. a URL that was still being streamed
+                matches.append(match)
+        self.length += len(chunk)
+        overlap = self.patterns.overlap
+        self._tail = text[-overlap:] if overlap else ""
+        return matches
+
+    def feed_snapshot(self, text: str) -> List[Match]:
+        """
+        Scan a growing snapshot (e.g. the answer text at each poll).
+
+        Args:
+            text: Whole text so far; only the part beyond what was seen is new
+
+        Returns:
+            New or grown matches
+        """
+        if len(text) < self.length:
+            return []  # Answer re-rendered shorter; keep what was seen
+        return self.feed(text[self.length:])
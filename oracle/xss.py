@@ -0,0 +1,389 @@
+"""
+XSS / Dialog Oracle
+===================
+Event-driven detection of script execution in a test page, for the XSS_*
+and *_XSS attacks.
+
+Instead of loading a case, sleeping and inspecting the DOM, the oracle
+subscribes to the tab's CDP events and decides as soon as one arrives:
+
+- Runtime.bindingCalled: __fuzzSignal(canary) is routed to a CDP binding
+  (Runtime.addBinding + a script evaluated on every new document; the
+  generator's PRELUDE keeps an existing __fuzzSignal)
+- Page.javascriptDialogOpening: alert/confirm/prompt (dismissed at once so
+  the tab never blocks)
+- Runtime.consoleAPICalled: console output containing the canary
+- Runtime.exceptionThrown: kept as evidence, not decisive
+
+A case without execution is declared clean once its load event fired and
+a short quiet period (`settle`) passed, so tabs are recycled immediately.
+
+Usage:
+    conn = CDPConnection.from_port(9222)
+    tab = XSSTab(conn)
+    tab.open()
+    result = tab.run(case)          # XSSResult(verdict='executed', events=[...])
+"""
+
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+import threading
+import time
+
+from cdp import CDPConnection, CDPConnectionClosed, CDPError
+from corpus.case import ATTACK_CATEGORIES, TestCase
+from logger import get_logger
+
+from .prompt import OracleVerdict, case_canaries
+
+log = get_logger(__name__)
+
+BINDING_NAME = "__fuzzBinding"
+
+# Installed before any page script runs, in every frame
+SIGNAL_HOOK = (
+    "window.__fuzzSignal = function (c) {"
+    " try { window." + BINDING_NAME + "(String(c)); } catch (e) {}"
+    " document.title = 'FUZZ:' + c;"
+    " };"
+)
+
+# XSS_* and *_XSS attack names
+XSS_ATTACKS = tuple(
+    attack
+    for attacks in ATTACK_CATEGORIES.values()
+    for attack in attacks
+    if attack.startswith("XSS_") or attack.endswith("_XSS")
+)
+
+
+@dataclass
+class ExecutionEvent:
+    """One CDP event attributed to the case."""
+    kind: str  # 'binding', 'dialog', 'console' or 'exception'
+    detail: str
+    canary: Optional[str] = None
+    elapsed_ms: float = 0.0  # Since the oracle was armed
+
+
+@dataclass
+class XSSResult:
+    """Verdict with the events that led to it."""
+    verdict: str  # OracleVerdict.EXECUTED, SUSPICIOUS or CLEAN
+    attack: Optional[str]
+    canary: Optional[str]
+    events: List[ExecutionEvent] = field(default_factory=list)
+    loaded: bool = False
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary."""
+        return asdict(self)
+
+
+class XSSOracle:
+    """
+    Execution oracle bound to one page session.
+    """
+
+    def __init__(self, conn: CDPConnection, session_id: str, settle: float = 0.25):
+        """
+        Initialize oracle.
+
+        Args:
+            conn: Browser-level CDP connection
+            session_id: Flat-mode session of the page
+            settle: Quiet period after the load event before declaring a case clean (seconds)
+        """
+        self.conn = conn
+        self.session_id = session_id
+        self.settle = settle
+        self.installed = False
+        self._lock = threading.Lock()
+        self._executed = threading.Event()
+        self._wake = threading.Event()
+        self._handlers = {
+            "Runtime.bindingCalled": self._on_binding,
+            "Runtime.consoleAPICalled": self._on_console,
+            "Runtime.exceptionThrown": self._on_exception,
+            "Page.javascriptDialogOpening": self._on_dialog,
+            "Page.lifecycleEvent": self._on_lifecycle,
+        }
+        self._reset(None, None, None)
+
+    @classmethod
+    def for_driver(cls, driver: Any, debug_port: int, **kwargs) -> "XSSOracle":
+        """
+        Oracle for the page a WebDriver controls (a second CDP client on its target).
+
+        Args:
+            driver: Chromium-based WebDriver
+            debug_port: Browser remote debugging port
+            **kwargs: Passed to the constructor
+
+        Returns:
+            Installed XSSOracle (close() also closes its connection)
+        """
+        target_id = driver.execute_cdp_cmd("Target.getTargetInfo", {})['targetInfo']['targetId']
+        conn = CDPConnection.from_port(debug_port)
+        oracle = cls(conn, conn.attach(target_id), **kwargs)
+        oracle._owns_connection = True
+        oracle.install()
+        return oracle
+
+    # ==================== Setup ====================
+
+    def install(self):
+        """Enable the domains, add the binding and the signal hook, subscribe to events."""
+        send = self._send
+        send("Runtime.enable")
+        send("Page.enable")
+        send("Page.setLifecycleEventsEnabled", {'enabled': True})
+        send("Runtime.addBinding", {'name': BINDING_NAME})
+        send("Page.addScriptToEvaluateOnNewDocument", {'source': SIGNAL_HOOK})
+        for event, handler in self._handlers.items():
+            self.conn.on(event, handler, session_id=self.session_id)
+        self.installed = True
+
+    def close(self):
+        """Unsubscribe (and close the connection if for_driver() opened it)."""
+        for event, handler in self._handlers.items():
+            self.conn.off(event, handler, session_id=self.session_id)
+        self.installed = False
+        if getattr(self, '_owns_connection', False):
+            self.conn.close()
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.conn.send(method, params, session_id=self.session_id)
+
+    # ==================== Running ====================
+
+    def _reset(self, canary: Optional[str], attack: Optional[str], loader_id: Optional[str]):
+        with self._lock:
+            self.canary = canary
+            self.attack = attack
+            self.loader_id = loader_id
+            self.events: List[ExecutionEvent] = []
+            self._armed_at = time.perf_counter()
+            self._loaded_at: Optional[float] = None
+            self._load_times: Dict[str, float] = {}  # loaderId -> load event time
+            self._executed.clear()
+            self._wake.clear()
+
+    def arm(self, canary: Optional[str] = None, attack: Optional[str] = None):
+        """
+        Start attributing events to a new case (call before navigating).
+
+        Args:
+            canary: The case's canary (None: any binding call counts)
+            attack: Attack name (reported in the result)
+        """
+        self._reset(canary, attack, None)
+
+    def run(self, url: str, canary: Optional[str] = None, attack: Optional[str] = None,
+            timeout: float = 10.0) -> XSSResult:
+        """
+        Navigate the page to a case and wait for the verdict.
+
+        Args:
+            url: Case URL
+            canary: The case's canary
+            attack: Attack name
+            timeout: Maximum time for load plus settle (seconds)
+
+        Returns:
+            XSSResult
+        """
+        self._reset(canary, attack, "")  # "" = navigation pending, ignore older loads
+        try:
+            result = self._send("Page.navigate", {'url': url})
+        except (CDPError, TimeoutError) as e:
+            return self._result(error=str(e))
+        if result.get('errorText'):
+            return self._result(error=result['errorText'])
+        with self._lock:
+            self.loader_id = result.get('loaderId')
+            # The load event may have been dispatched before the navigate response was handled here
+            if self.loader_id in self._load_times:
+                self._loaded_at = self._load_times[self.loader_id]
+        return self.wait(timeout)
+
+    def wait(self, timeout: float = 10.0, loaded: bool = False) -> XSSResult:
+        """
+        Wait until execution is seen, or the page loaded and stayed quiet for `settle`.
+
+        Args:
+            timeout: Maximum wait (seconds)
+            loaded: The caller already waited for the load event (e.g. WebDriver.get)
+
+        Returns:
+            XSSResult
+        """
+        if loaded:
+            with self._lock:
+                if self._loaded_at is None:
+                    self._loaded_at = time.perf_counter()
+        deadline = time.monotonic() + timeout
+        while not self._executed.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._loaded_at is not None:
+                quiet = self._loaded_at + self.settle - time.perf_counter()
+                self._executed.wait(max(0.0, min(remaining, quiet)))
+                break
+            self._wake.wait(remaining)
+            self._wake.clear()
+        return self._result()
+
+    def _result(self, error: Optional[str] = None) -> XSSResult:
+        with self._lock:
+            events = list(self.events)
+            loaded = self._loaded_at is not None
+        if self._executed.is_set():
+            verdict = OracleVerdict.EXECUTED
+        elif any(event.kind == 'binding' for event in events):
+            verdict = OracleVerdict.SUSPICIOUS  # Signal with another case's canary
+        else:
+            verdict = OracleVerdict.CLEAN
+        return XSSResult(
+            verdict=verdict, attack=self.attack, canary=self.canary, events=events,
+            loaded=loaded, elapsed_ms=(time.perf_counter() - self._armed_at) * 1000, error=error,
+        )
+
+    # ==================== Events (reader thread) ====================
+
+    def _on_binding(self, params: Dict[str, Any], session_id: Optional[str]):
+        if params['name'] != BINDING_NAME:
+            return
+        payload = params.get('payload', "")
+        self._record('binding', payload, canary=payload,
+                     decisive=self.canary is None or payload == self.canary)
+
+    def _on_console(self, params: Dict[str, Any], session_id: Optional[str]):
+        if not self.canary:
+            return
+        text = " ".join(str(arg.get('value', arg.get('description', ""))) for arg in params.get('args', []))
+        if self.canary in text:
+            self._record('console', text[:500], canary=self.canary, decisive=True)
+
+    def _on_exception(self, params: Dict[str, Any], session_id: Optional[str]):
+        details = params.get('exceptionDetails', {})
+        text = (details.get('exception') or {}).get('description') or details.get('text', "")
+        self._record('exception', text[:500])
+
+    def _on_dialog(self, params: Dict[str, Any], session_id: Optional[str]):
+        message = params.get('message', "")
+        self._record('dialog', f"{params.get('type')}: {message}"[:500],
+                     canary=self.canary if self.canary and self.canary in message else None,
+                     decisive=True)
+        # Commands cannot be sent from the reader thread (their response is read here)
+        threading.Thread(target=self._dismiss_dialog, daemon=True).start()
+
+    def _dismiss_dialog(self):
+        try:
+            self._send("Page.handleJavaScriptDialog", {'accept': False})
+        except (CDPError, CDPConnectionClosed, TimeoutError):
+            pass
+
+    def _on_lifecycle(self, params: Dict[str, Any], session_id: Optional[str]):
+        if params.get('name') != 'load':
+            return
+        with self._lock:
+            self._load_times[params['loaderId']] = time.perf_counter()
+            if self.loader_id == "" or (self.loader_id and params['loaderId'] != self.loader_id):
+                return  # Navigation pending or load of an earlier document
+            if self._loaded_at is None:
+                self._loaded_at = self._load_times[params['loaderId']]
+        self._wake.set()
+
+    def _record(self, kind: str, detail: str, canary: Optional[str] = None, decisive: bool = False):
+        event = ExecutionEvent(kind, detail, canary, (time.perf_counter() - self._armed_at) * 1000)
+        with self._lock:
+            self.events.append(event)
+        if decisive:
+            log.debug("[XSS] %s: %s", kind, detail)
+            self._executed.set()
+            self._wake.set()
+
+
+class XSSTab:
+    """
+    A background page with an XSSOracle, reused case after case.
+    """
+
+    def __init__(self, conn: CDPConnection, index: int = 0, settle: float = 0.25):
+        """
+        Initialize tab.
+
+        Args:
+            conn: Browser-level CDP connection (shared by many tabs)
+            index: Tab number (for logs)
+            settle: See XSSOracle
+        """
+        self.conn = conn
+        self.index = index
+        self.settle = settle
+        self.target_id: Optional[str] = None
+        self.session_id: Optional[str] = None
+        self.oracle: Optional[XSSOracle] = None
+        self.crashed = threading.Event()
+        self.cases_run = 0
+
+    def open(self):
+        """Create the page target, attach and install the oracle."""
+        self.crashed.clear()
+        self.target_id = self.conn.send(
+            "Target.createTarget", {'url': "about:blank", 'background': True}
+        )['targetId']
+        self.session_id = self.conn.attach(self.target_id)
+        self.conn.on("Inspector.targetCrashed", self._on_crashed, session_id=self.session_id)
+        self.conn.send("Inspector.enable", session_id=self.session_id)
+        self.oracle = XSSOracle(self.conn, self.session_id, settle=self.settle)
+        self.oracle.install()
+
+    def close(self):
+        """Close the page target (ignores errors for a gone browser)."""
+        if self.oracle:
+            self.oracle.close()
+            self.oracle = None
+        if self.session_id:
+            self.conn.off("Inspector.targetCrashed", self._on_crashed, session_id=self.session_id)
+        if self.target_id:
+            try:
+                self.conn.send("Target.closeTarget", {'targetId': self.target_id})
+            except (CDPError, CDPConnectionClosed, TimeoutError):
+                pass
+        self.target_id = None
+        self.session_id = None
+
+    def reopen(self):
+        """Replace a crashed page with a fresh one."""
+        log.info("[XSS] Reopening tab %s", self.index)
+        self.close()
+        self.open()
+
+    def _on_crashed(self, params: Dict[str, Any], session_id: Optional[str]):
+        log.error("[XSS] ✗ Tab %s renderer crashed", self.index)
+        self.crashed.set()
+
+    def run(self, case: TestCase, timeout: float = 10.0) -> XSSResult:
+        """
+        Load a case and return the oracle's verdict.
+
+        Args:
+            case: Case with a file on disk
+            timeout: Maximum time for load plus settle (seconds)
+
+        Returns:
+            XSSResult (error "Browser crashed: ..." if the renderer died)
+        """
+        if self.crashed.is_set() or self.oracle is None:
+            self.reopen()
+        canaries = case_canaries(case)
+        result = self.oracle.run(case.url, canaries[0] if canaries else None, case.attack, timeout)
+        if self.crashed.is_set():
+            result.error = "Browser crashed: renderer"
+        self.cases_run += 1
+        return result
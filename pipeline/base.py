@@ -8,9 +8,15 @@ Each browser type can have its own pipeline implementation with custom steps.
 
 from abc import ABC, abstractmethod
 from typing import Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from profiling.timer import StepTimer, TimingHook
+from profiling.driver_proxy import get_command_recorder
+from logger import get_logger
+
+log = get_logger(__name__)
+
 
 @dataclass
 class PipelineConfig:
@@ -20,6 +26,7 @@ class PipelineConfig:
     stability_wait_time: int = 2
     keep_open: bool = False
     activate_features: bool = True  # e.g., click Assistant button
+    timing_hooks: list[TimingHook] = field(default_factory=list)  # Called with each StepTiming
     
 
 @dataclass
@@ -30,12 +37,15 @@ class PipelineResult:
     driver: Optional[WebDriver] = None
     steps_completed: list[str] = None
     metadata: dict = None
+    timings: dict[str, int] = None  # Step name -> total duration (perf_counter_ns)
     
     def __post_init__(self):
         if self.steps_completed is None:
             self.steps_completed = []
         if self.metadata is None:
             self.metadata = {}
+        if self.timings is None:
+            self.timings = {}
 
 
 class BasePipeline(ABC):
@@ -79,6 +89,10 @@ class BasePipeline(ABC):
         self.extra_params = kwargs
         self._steps_completed = []
         self.metadata = {}  # Initialize metadata dictionary
+        # Browser facade replaces this with its own timer so launch phases
+        # and workflow phases end up in the same PipelineResult
+        self.timer = StepTimer(hooks=config.timing_hooks)
+        self.watchdog = None  # Set by the Browser facade when crash detection is enabled
     
     def run(self) -> PipelineResult:
         """
@@ -97,46 +111,56 @@ class BasePipeline(ABC):
         Returns:
             PipelineResult with success status and details
         """
-        print("=" * 60)
-        print(f"PIPELINE WORKFLOW - {self.get_browser_name()}")
-        print("=" * 60)
-        print(f"Current URL: {self.navigator.get_current_url()}")
-        print("=" * 60)
+        log.info('=' * 60)
+        log.info("PIPELINE WORKFLOW - %s", self.get_browser_name())
+        log.info('=' * 60)
+        log.info("Current URL: %s", self.navigator.get_current_url())
+        log.info('=' * 60)
         
         try:
             # Step 1: Pre-workflow steps (browser-specific)
-            print("\n[PIPELINE] Step 1: Pre-workflow steps...")
-            pre_result = self.pre_workflow_steps()
+            log.info("\n[PIPELINE] Step 1: Pre-workflow steps...")
+            with self.timer.measure("pre_workflow"):
+                pre_result = self.pre_workflow_steps()
             if not pre_result:
                 return PipelineResult(
                     success=False,
                     message="Pre-workflow steps failed",
                     driver=self.driver,
-                    steps_completed=self._steps_completed
+                    steps_completed=self._steps_completed,
+                    timings=self.timer.totals()
                 )
             self._steps_completed.append("Pre-workflow steps")
             
             # Step 2: Execute main workflow
-            print("\n[PIPELINE] Step 2: Executing main workflow...")
-            workflow_result = self.execute_workflow()
+            log.info("\n[PIPELINE] Step 2: Executing main workflow...")
+            with self.timer.measure("workflow"):
+                workflow_result = self.execute_workflow()
             if not workflow_result:
                 return PipelineResult(
                     success=False,
                     message="Workflow execution failed",
                     driver=self.driver,
-                    steps_completed=self._steps_completed
+                    steps_completed=self._steps_completed,
+                    timings=self.timer.totals()
                 )
             self._steps_completed.append("Main workflow")
             
             # Step 3: Post-workflow steps
-            print("\n[PIPELINE] Step 3: Post-workflow steps...")
-            post_result = self.post_workflow_steps()
+            log.info("\n[PIPELINE] Step 3: Post-workflow steps...")
+            with self.timer.measure("post_workflow"):
+                post_result = self.post_workflow_steps()
             if not post_result:
                 # Don't fail pipeline for optional post-workflow steps
-                print("[WARNING] Post-workflow steps had issues")
+                log.warning("Post-workflow steps had issues")
             else:
                 self._steps_completed.append("Post-workflow steps")
             
+            # Attach WebDriver round-trip budget if the driver is instrumented
+            recorder = get_command_recorder(self.driver)
+            if recorder:
+                self.metadata['webdriver_commands'] = recorder.summary()
+            
             # Success!
             self.print_success_summary()
             
@@ -145,18 +169,18 @@ class BasePipeline(ABC):
                 message="Pipeline workflow completed successfully",
                 driver=self.driver,
                 steps_completed=self._steps_completed,
-                metadata=self.metadata  # Include metadata
+                metadata=self.metadata,  # Include metadata
+                timings=self.timer.totals()
             )
             
         except Exception as e:
-            print(f"[PIPELINE ERROR] Workflow failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[PIPELINE ERROR] Workflow failed: %s", e, exc_info=True)
             return PipelineResult(
                 success=False,
                 message=f"Pipeline error: {e}",
                 driver=self.driver,
-                steps_completed=self._steps_completed
+                steps_completed=self._steps_completed,
+                timings=self.timer.totals()
             )
     
     # ==================== Abstract Methods (subclasses must implement) ====================
@@ -220,10 +244,18 @@ class BasePipeline(ABC):
     
     def print_success_summary(self):
         """Print success summary after pipeline completion."""
-        print("\n" + "=" * 60)
-        print(f"✓ {self.get_browser_name().upper()} PIPELINE COMPLETED SUCCESSFULLY")
-        print("=" * 60)
-        print(f"Steps completed: {len(self._steps_completed)}")
+        log.info('\n' + '=' * 60)
+        log.info("✓ %s PIPELINE COMPLETED SUCCESSFULLY", self.get_browser_name().upper())
+        log.info('=' * 60)
+        log.info("Steps completed: %s", len(self._steps_completed))
         for i, step in enumerate(self._steps_completed, 1):
-            print(f"  {i}. {step}")
-        print("=" * 60)
+            log.info("  %s. %s", i, step)
+        timings = self.timer.totals()
+        if timings:
+            log.info("Step timings:")
+            for step, duration_ns in timings.items():
+                log.info("  %s: %.1f ms", step, duration_ns / 1000000)
+        recorder = get_command_recorder(self.driver)
+        if recorder:
+            log.info(recorder.format_summary())
+        log.info('=' * 60)
@@ -16,6 +16,9 @@ Usage:
 from enum import Enum
 from typing import Dict, Type, Callable
 from .base import BasePipeline, PipelineConfig
+from logger import get_logger
+
+log = get_logger(__name__)
 
 
 class PipelineType(Enum):
@@ -138,7 +141,7 @@ class PipelineFactory:
             )
         
         _PIPELINE_CLASSES[pipeline_type] = pipeline_class
-        print(f"[INFO] Registered pipeline: {pipeline_type.value} -> {pipeline_class.__name__}")
+        log.debug("Registered pipeline: %s -> %s", pipeline_type.value, pipeline_class.__name__)
     
     @staticmethod
     def get_supported_types() -> list[PipelineType]:
@@ -0,0 +1,46 @@
+"""
+Profiling Module
+================
+Timing and instrumentation helpers for browser automation runs.
+
+Usage:
+    from profiling import StepTimer
+    from pipeline import PipelineConfig
+
+    durations = []
+    config = PipelineConfig(
+        target_url="https://www.perplexity.ai/sidecar?copilot=true",
+        timing_hooks=[lambda t: durations.append((t.name, t.duration_ms))]
+    )
+    result = browser.run_pipeline(config, query="What is Python?")
+
+    for step, ns in result.timings.items():
+        print(f"{step}: {ns / 1e6:.1f} ms")
+
+    # Count and time every WebDriver command per step
+    browser.instrument_driver = True
+    result = browser.run_pipeline(config, query="What is Python?")
+    print(result.metadata['webdriver_commands'])
+"""
+
+from .timer import StepTimer, StepTiming, TimingHook, current_step
+from .driver_proxy import (
+    InstrumentedDriver,
+    CommandRecorder,
+    CommandStats,
+    get_command_recorder,
+)
+
+__all__ = [
+    # Step timing
+    'StepTimer',
+    'StepTiming',
+    'TimingHook',
+    'current_step',
+    
+    # WebDriver command instrumentation
+    'InstrumentedDriver',
+    'CommandRecorder',
+    'CommandStats',
+    'get_command_recorder',
+]
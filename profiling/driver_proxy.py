@@ -0,0 +1,312 @@
+"""
+Instrumented WebDriver
+======================
+Transparent proxy around a Selenium WebDriver that counts and times every
+WebDriver command.
+
+Each command (execute_script, find_elements, element .text, switch_to.window,
+current_url, ...) is one HTTP round trip to chromedriver. The proxy records
+count and duration per command, grouped by the pipeline step that was active
+when the command ran (see profiling.timer.current_step), so the round-trip
+budget of send_query and capture_response can be read directly from the
+summary.
+
+Usage:
+    driver = InstrumentedDriver(launcher.attach_selenium())
+    navigator = CometNavigator(driver)
+    ...
+    print(driver.command_recorder.format_summary())
+"""
+
+from dataclasses import dataclass
+from inspect import getattr_static
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import json
+import threading
+import time
+
+from .timer import current_step
+
+try:
+    from selenium.webdriver.remote.webelement import WebElement
+    from selenium.webdriver.remote.switch_to import SwitchTo
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    WebElement = None
+    SwitchTo = None
+    SELENIUM_AVAILABLE = False
+
+
+UNSCOPED_STEP = "(no step)"
+
+
+@dataclass
+class CommandStats:
+    """Aggregated statistics for one command within one step."""
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    errors: int = 0
+
+    def add(self, duration_ns: int, failed: bool = False):
+        """Add one command execution."""
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        if failed:
+            self.errors += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dictionary (milliseconds)."""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total_ns / 1_000_000, 3),
+            'mean_ms': round(self.total_ns / self.count / 1_000_000, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ns / 1_000_000, 3),
+        }
+
+
+class CommandRecorder:
+    """
+    Thread-safe store of per-step WebDriver command statistics.
+    """
+
+    def __init__(self):
+        """Initialize empty recorder."""
+        self._stats: Dict[Tuple[str, str], CommandStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, command: str, duration_ns: int, failed: bool = False):
+        """
+        Record one command execution under the currently active step.
+
+        Args:
+            command: Command name (e.g., "execute_script", "element.text")
+            duration_ns: Round-trip duration in nanoseconds
+            failed: Whether the command raised
+        """
+        key = (current_step.get() or UNSCOPED_STEP, command)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CommandStats()
+            stats.add(duration_ns, failed)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Build a per-step summary.
+
+        Returns:
+            {step: {"commands": {command: stats}, "count": n, "total_ms": ms}}
+        """
+        with self._lock:
+            items = [(step, command, CommandStats(**vars(stats)))
+                     for (step, command), stats in self._stats.items()]
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for step, command, stats in items:
+            entry = summary.setdefault(step, {'commands': {}, 'count': 0, 'total_ms': 0.0})
+            entry['commands'][command] = stats.as_dict()
+            entry['count'] += stats.count
+            entry['total_ms'] = round(entry['total_ms'] + stats.total_ns / 1_000_000, 3)
+
+        return summary
+
+    def format_summary(self) -> str:
+        """
+        Format the summary as a human-readable table.
+
+        Returns:
+            Multi-line string
+        """
+        lines = ["=" * 60, "WEBDRIVER COMMAND SUMMARY", "=" * 60]
+        for step, entry in self.summary().items():
+            lines.append(f"{step}: {entry['count']} commands, {entry['total_ms']:.1f} ms")
+            commands = sorted(entry['commands'].items(), key=lambda kv: -kv[1]['total_ms'])
+            for command, stats in commands:
+                lines.append(
+                    f"  {command:<32} x{stats['count']:<5} "
+                    f"total {stats['total_ms']:>9.1f} ms  mean {stats['mean_ms']:>7.2f} ms"
+                )
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+    def export_json(self, filepath: str) -> Path:
+        """
+        Write the summary to a JSON file.
+
+        Args:
+            filepath: Destination path
+
+        Returns:
+            Path of the written file
+        """
+        output_path = Path(filepath)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.summary(), indent=2), encoding='utf-8')
+        return output_path
+
+    def reset(self):
+        """Discard all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+def _unwrap(value: Any) -> Any:
+    """Replace proxies (also inside lists/tuples/dicts) with the wrapped objects."""
+    if isinstance(value, _InstrumentedProxy):
+        return object.__getattribute__(value, '_target')
+    if isinstance(value, list):
+        return [_unwrap(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _unwrap(v) for k, v in value.items()}
+    return value
+
+
+class _InstrumentedProxy:
+    """
+    Generic timing proxy.
+
+    Method calls are timed when invoked; properties that hit the remote end
+    (current_url, window_handles, element.text, ...) are timed on access.
+    WebElements and SwitchTo objects returned by commands are wrapped as well,
+    so element-level round trips are counted too. The proxy reports the
+    wrapped object's class, so isinstance(proxy, WebElement) still holds.
+    """
+
+    __slots__ = ('_target', '_recorder', '_prefix')
+
+    # Property-ness per (class, attribute), shared by all proxies
+    _property_cache: Dict[Tuple[type, str], bool] = {}
+
+    def __init__(self, target: Any, recorder: CommandRecorder, prefix: str = ""):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_recorder', recorder)
+        object.__setattr__(self, '_prefix', prefix)
+
+    @property
+    def __class__(self):
+        return type(object.__getattribute__(self, '_target'))
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, '_target')
+        recorder = object.__getattribute__(self, '_recorder')
+        prefix = object.__getattribute__(self, '_prefix')
+
+        if name.startswith('_'):
+            return getattr(target, name)
+
+        command = prefix + name
+
+        if _InstrumentedProxy._is_property(type(target), name):
+            start = time.perf_counter_ns()
+            failed = True
+            try:
+                value = getattr(target, name)
+                failed = False
+            finally:
+                duration_ns = time.perf_counter_ns() - start
+                # switch_to is a local accessor, not a round trip
+                if name != 'switch_to':
+                    recorder.record(command, duration_ns, failed)
+            return self._wrap(value, recorder)
+
+        value = getattr(target, name)
+        if not callable(value):
+            return value
+
+        def instrumented(*args, **kwargs):
+            start = time.perf_counter_ns()
+            failed = True
+            try:
+                result = value(*_unwrap(args), **_unwrap(kwargs))
+                failed = False
+            finally:
+                recorder.record(command, time.perf_counter_ns() - start, failed)
+            return self._wrap(result, recorder)
+
+        return instrumented
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(object.__getattribute__(self, '_target'), name, value)
+
+    def __eq__(self, other: Any) -> bool:
+        return object.__getattribute__(self, '_target') == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, '_target'))
+
+    def __repr__(self) -> str:
+        return f"<Instrumented {object.__getattribute__(self, '_target')!r}>"
+
+    @classmethod
+    def _is_property(cls, target_type: type, name: str) -> bool:
+        key = (target_type, name)
+        cached = cls._property_cache.get(key)
+        if cached is None:
+            cached = isinstance(getattr_static(target_type, name, None), property)
+            cls._property_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _wrap(value: Any, recorder: CommandRecorder) -> Any:
+        if not SELENIUM_AVAILABLE:
+            return value
+        if isinstance(value, WebElement):
+            return _InstrumentedProxy(value, recorder, prefix="element.")
+        if isinstance(value, SwitchTo):
+            return _InstrumentedProxy(value, recorder, prefix="switch_to.")
+        if isinstance(value, list) and value and isinstance(value[0], WebElement):
+            return [_InstrumentedProxy(v, recorder, prefix="element.") for v in value]
+        return value
+
+
+class InstrumentedDriver(_InstrumentedProxy):
+    """
+    WebDriver proxy that records every command in a CommandRecorder.
+
+    Behaves like the wrapped driver for all callers (navigators, conversions,
+    WebDriverWait, expected_conditions).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, driver: Any, recorder: Optional[CommandRecorder] = None):
+        """
+        Wrap a WebDriver.
+
+        Args:
+            driver: Selenium WebDriver instance
+            recorder: Recorder to use (a new one is created if not provided)
+        """
+        super().__init__(driver, recorder or CommandRecorder())
+
+    @property
+    def command_recorder(self) -> CommandRecorder:
+        """The recorder collecting command statistics."""
+        return object.__getattribute__(self, '_recorder')
+
+    @property
+    def wrapped_driver(self) -> Any:
+        """The underlying WebDriver."""
+        return object.__getattribute__(self, '_target')
+
+
+def get_command_recorder(driver: Any) -> Optional[CommandRecorder]:
+    """
+    Get the command recorder of an instrumented driver.
+
+    Args:
+        driver: Any WebDriver (instrumented or not)
+
+    Returns:
+        CommandRecorder, or None if the driver is not instrumented
+    """
+    if type(driver) is InstrumentedDriver:
+        return driver.command_recorder
+    return None
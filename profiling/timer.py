@@ -0,0 +1,142 @@
+"""
+Step Timer
+==========
+Per-phase timing for browser automation runs.
+
+Every phase of a run (launch, DevTools wait, driver attach, navigation,
+editor lookup, send, first token, completion, save) is measured with
+time.perf_counter_ns() and recorded on a StepTimer. Hook callbacks receive
+each measurement as soon as it is recorded, so latency histograms or
+exporters can be plugged in without touching the pipeline code.
+
+Usage:
+    timer = StepTimer(hooks=[lambda t: print(t.name, t.duration_ms)])
+
+    with timer.measure("navigation"):
+        navigator.navigate_to_url(url)
+
+    print(timer.totals())   # {"navigation": 5012345678}
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+import time
+
+from logger import get_logger
+
+log = get_logger(__name__)
+
+
+# Name of the innermost step currently being measured (None outside any step).
+# Other instrumentation (e.g. WebDriver command counters) uses this to
+# attribute its work to the pipeline step that caused it.
+current_step: ContextVar[Optional[str]] = ContextVar("current_step", default=None)
+
+
+@dataclass
+class StepTiming:
+    """A single timed step."""
+    name: str
+    duration_ns: int
+    started_ns: int
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds."""
+        return self.duration_ns / 1_000_000
+
+
+TimingHook = Callable[[StepTiming], None]
+
+
+class StepTimer:
+    """
+    Records named step durations and forwards them to hook callbacks.
+
+    A single timer is shared by the browser facade, launcher, pipeline and
+    conversion of one run, so all phases end up in the same place.
+    """
+
+    def __init__(self, hooks: Optional[List[TimingHook]] = None):
+        """
+        Initialize timer.
+
+        Args:
+            hooks: Callbacks invoked with each StepTiming as it is recorded
+        """
+        self.records: List[StepTiming] = []
+        self.hooks: List[TimingHook] = list(hooks or [])
+
+    def add_hook(self, hook: TimingHook):
+        """
+        Register a hook callback.
+
+        Args:
+            hook: Callable receiving a StepTiming
+        """
+        self.hooks.append(hook)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as step `name`.
+
+        The step is recorded even if the block raises.
+
+        Args:
+            name: Step name (e.g., "navigation", "send")
+        """
+        token = current_step.set(name)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            current_step.reset(token)
+            self.record(name, end - start, started_ns=start)
+
+    def record(self, name: str, duration_ns: int, started_ns: Optional[int] = None) -> StepTiming:
+        """
+        Record a step measured elsewhere.
+
+        Args:
+            name: Step name
+            duration_ns: Duration in nanoseconds
+            started_ns: perf_counter_ns() value at step start (defaults to now - duration)
+
+        Returns:
+            The recorded StepTiming
+        """
+        if started_ns is None:
+            started_ns = time.perf_counter_ns() - duration_ns
+
+        timing = StepTiming(name=name, duration_ns=duration_ns, started_ns=started_ns)
+        self.records.append(timing)
+
+        for hook in self.hooks:
+            try:
+                hook(timing)
+            except Exception as e:
+                log.warning("Timing hook %r failed: %s", hook, e)
+
+        return timing
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Get total duration per step name, in nanoseconds.
+
+        Steps that ran more than once are summed. Order follows first occurrence.
+
+        Returns:
+            Dictionary mapping step name to total nanoseconds
+        """
+        totals: Dict[str, int] = {}
+        for timing in self.records:
+            totals[timing.name] = totals.get(timing.name, 0) + timing.duration_ns
+        return totals
+
+    def reset(self):
+        """Discard all recorded timings (hooks are kept)."""
+        self.records.clear()